@@ -0,0 +1,240 @@
+"""
+수집 변경 피드 (CDC) — 패스마다 새로 생긴·바뀐·사라진 행
+
+`--changes FILE`(NDJSON, 크기 회전) 그리고/또는 `--changes-table`(테이블 `crawl_changes`)이면 크롤러가 쓴
+변경을 한 줄(행)씩 남긴다. 알림·프론트 캐시·분석은 테이블 전체를 다시 읽지 않고 이 피드만 이어 읽으면 된다.
+
+  {"cycle", "at", "table", "source", "key", "op", "changed", "values"}
+
+- op: insert(새 행) · update(목록 값·본문이 바뀐 행) · remove(순회에서 빠짐 — `missing_since` 표시) · restore(다시 나타남).
+- changed: 바뀐 컬럼 이름 (insert 는 값이 있는 컬럼 전부). values: 그중 짧은 값의 새 값 — 본문·검색 토큰처럼 큰
+  값은 이름만 싣는다 (`OMIT_VALUES`, `MAX_VALUE_CHARS`). 전체 값이 필요하면 행을 다시 읽는다.
+- cycle: 수집 패스 하나의 id (`"{출처}@{KST 시작 시각}"`, 작업 큐 모드는 큐 사이클 id). 스레드마다 따로 잡힌다.
+- 테이블 소비자는 `id`(증가)로 어디까지 읽었는지 기억하면 된다. `RETENTION_DAYS`일 지난 행은 크롤러가 지운다.
+
+대상: contests(위비티·요즘것들 — 사라짐·다시 나타남은 `--liveness` 순회 기록이 있을 때만), startup_business·
+startup_announcement(K-Startup — 사라짐은 추적하지 않음). D-day 갱신 순회(`--dday-refresh`·`--dday-only`)는
+기존 값을 읽지 않는 갱신 전용 경로라 싣지 않는다.
+"""
+
+from __future__ import annotations
+
+import atexit
+import contextvars
+import json
+import logging
+import os
+import threading
+import time
+from collections import Counter
+from datetime import datetime, timezone
+from logging.handlers import RotatingFileHandler
+from zoneinfo import ZoneInfo
+
+logger = logging.getLogger("allyoung.changes")
+
+OPS = ("insert", "update", "remove", "restore")
+OMIT_VALUES = frozenset({"content", "content_key", "content_hash", "search_tokens"})
+MAX_VALUE_CHARS = 500
+FLUSH_ROWS = 500
+RETENTION_DAYS = 30
+PRUNE_INTERVAL_S = 6 * 3600.0
+FILE_MAX_BYTES = 50 * 1024 * 1024
+FILE_BACKUP_COUNT = 10
+
+_KST = ZoneInfo("Asia/Seoul")
+_cycle_var: contextvars.ContextVar[str | None] = contextvars.ContextVar("change_feed_cycle", default=None)
+
+
+def begin_cycle(label: str, cycle_id: str | None = None) -> str:
+    """이 스레드의 이후 변경을 새 패스로 묶는다. cycle_id 를 주면 그대로(예: 작업 큐 사이클), 없으면 시작 시각."""
+    cid = f"{label}@{cycle_id or datetime.now(_KST).isoformat(timespec='seconds')}"
+    _cycle_var.set(cid)
+    return cid
+
+
+def current_cycle() -> str:
+    return _cycle_var.get() or begin_cycle("-")
+
+
+def _norm(v):
+    return "" if v is None else v
+
+
+def _short(v) -> bool:
+    return not isinstance(v, str) or len(v) <= MAX_VALUE_CHARS
+
+
+class ChangeFeed:
+    def __init__(self, path: str | None = None, client=None) -> None:
+        self.path = path
+        self.client = client
+        self._writer: logging.Logger | None = None
+        if path:
+            handler = RotatingFileHandler(path, maxBytes=FILE_MAX_BYTES, backupCount=FILE_BACKUP_COUNT, encoding="utf-8")
+            handler.setFormatter(logging.Formatter("%(message)s"))
+            w = logging.getLogger("allyoung.changes.records")
+            w.handlers[:] = [handler]
+            w.setLevel(logging.INFO)
+            w.propagate = False
+            self._writer = w
+        self._lock = threading.Lock()
+        self._pending: list[dict] = []
+        self._last_prune = 0.0
+        self.counts: Counter = Counter()
+        self.table_rows = 0
+
+    def record(
+        self,
+        table: str,
+        op: str,
+        key: str,
+        changed=(),
+        values: dict | None = None,
+        source: str | None = None,
+    ) -> None:
+        event = {
+            "cycle": current_cycle(),
+            "at": datetime.now(timezone.utc).isoformat(),
+            "table": table,
+            "source": source,
+            "key": str(key),
+            "op": op,
+            "changed": list(changed),
+            "values": {k: v for k, v in (values or {}).items() if k not in OMIT_VALUES and _short(v)},
+        }
+        if self._writer is not None:
+            self._writer.info(json.dumps(event, ensure_ascii=False, separators=(",", ":")))
+        with self._lock:
+            self.counts[(table, op)] += 1
+            if self.client is None:
+                return
+            self._pending.append(event)
+            due = len(self._pending) >= FLUSH_ROWS
+        if due:
+            self.flush()
+
+    def diff(
+        self,
+        table: str,
+        key: str,
+        old: dict | None,
+        new: dict,
+        source: str | None = None,
+        also_changed=(),
+    ) -> str | None:
+        """old(기존 행, 없으면 None) → new(쓴 값) 비교해 insert/update 를 남긴다 → op (바뀐 것 없으면 None).
+        None 과 빈 문자열은 같은 값으로 본다. also_changed: 호출 측이 따로 판단한 바뀐 컬럼 (예: 본문 채움)."""
+        if old is None:
+            changed = [c for c, v in new.items() if _norm(v) != ""]
+        else:
+            changed = [c for c, v in new.items() if _norm(old.get(c)) != _norm(v)]
+        changed += [c for c in also_changed if c not in changed]
+        if old is not None and not changed:
+            return None
+        op = "insert" if old is None else "update"
+        self.record(table, op, key, changed, {c: new[c] for c in changed if c in new}, source)
+        return op
+
+    def flush(self) -> None:
+        if self._writer is not None:
+            for h in self._writer.handlers:
+                h.flush()
+        if self.client is None:
+            return
+        with self._lock:
+            pending, self._pending = self._pending, []
+            prune = time.monotonic() - self._last_prune >= PRUNE_INTERVAL_S
+            if prune:
+                self._last_prune = time.monotonic()
+        for i in range(0, len(pending), FLUSH_ROWS):
+            chunk = pending[i : i + FLUSH_ROWS]
+            try:
+                self.client.table("crawl_changes").insert(
+                    [
+                        {
+                            "cycle_id": e["cycle"],
+                            "changed_at": e["at"],
+                            "table_name": e["table"],
+                            "source": e["source"],
+                            "row_key": e["key"],
+                            "op": e["op"],
+                            "changed": e["changed"],
+                            "new_values": e["values"],
+                        }
+                        for e in chunk
+                    ]
+                ).execute()
+            except Exception as ex:
+                logger.warning("crawl_changes 쓰기 실패 (%s건 버림): %s", len(chunk), ex)
+                continue
+            with self._lock:
+                self.table_rows += len(chunk)
+        if prune:
+            try:
+                self.client.rpc("prune_crawl_changes", {"p_days": RETENTION_DAYS}).execute()
+            except Exception as ex:
+                logger.warning("crawl_changes 오래된 행 정리 실패: %s", ex)
+
+    def reset(self) -> None:
+        with self._lock:
+            self.counts.clear()
+            self.table_rows = 0
+
+    def summary(self) -> str:
+        with self._lock:
+            counts = dict(self.counts)
+            table_rows = self.table_rows
+        by_table: dict[str, list[str]] = {}
+        labels = {"insert": "신규", "update": "변경", "remove": "사라짐", "restore": "다시 나타남"}
+        for (table, op), n in sorted(counts.items(), key=lambda kv: (kv[0][0], OPS.index(kv[0][1]))):
+            by_table.setdefault(table, []).append(f"{labels[op]} {n}")
+        bits = "; ".join(f"{t} " + "·".join(v) for t, v in by_table.items()) or "변경 없음"
+        sinks = [s for s in (self.path, f"crawl_changes {table_rows}행" if self.client is not None else None) if s]
+        return f"변경 피드 ({', '.join(sinks)}): {bits}"
+
+
+_feed: ChangeFeed | None = None
+
+
+def enable(path: str | None = None, client=None) -> ChangeFeed:
+    global _feed
+    if _feed is not None:
+        _feed.flush()
+    _feed = ChangeFeed(path, client)
+    logger.info(
+        "변경 피드 기록: %s",
+        ", ".join(s for s in (path, "crawl_changes 테이블" if client is not None else None) if s),
+    )
+    return _feed
+
+
+def enable_from_env(client) -> ChangeFeed | None:
+    path = os.getenv("CRAWL_CHANGES_FILE", "").strip() or None
+    table = os.getenv("CRAWL_CHANGES_TABLE", "").strip().lower() in ("1", "true", "yes", "on")
+    if path or table:
+        return enable(path, client if table else None)
+    return None
+
+
+def active() -> ChangeFeed | None:
+    return _feed
+
+
+def record_sweep(source: str, result: dict | None) -> None:
+    """순회 생존 기록 결과(`record_contest_sweep`)의 빠진·다시 나타난 id → remove/restore."""
+    feed = _feed
+    if feed is None or not isinstance(result, dict) or result.get("skipped"):
+        return
+    for cid in result.get("vanished_ids") or []:
+        feed.record("contests", "remove", cid, ("missing_since",), source=source)
+    for cid in result.get("returned_ids") or []:
+        feed.record("contests", "restore", cid, ("missing_since",), source=source)
+
+
+def _flush_at_exit() -> None:
+    if _feed is not None:
+        _feed.flush()
+
+
+atexit.register(_flush_at_exit)
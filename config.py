@@ -2,8 +2,10 @@
 환경 변수 및 Supabase 설정
 """
 
+import atexit
 import logging
 import os
+import threading
 from pathlib import Path
 
 from dotenv import load_dotenv
@@ -28,25 +30,158 @@ DATABASE_URL = os.getenv("VITE_NTP_DATABASE_URL")
 DATABASE_DIRECT_URL = os.getenv("VITE_NTP_DATABASE_DIRECT_URL")
 
 
+def _env_int(name: str, default: int) -> int:
+    try:
+        return int(os.getenv(name, str(default)).strip())
+    except ValueError:
+        return default
+
+
+def _env_float(name: str, default: float) -> float:
+    try:
+        return float(os.getenv(name, str(default)).strip())
+    except ValueError:
+        return default
+
+
+# PostgREST·Storage 공용 HTTP 연결 풀 (스레드 간 공유). D-day 갱신 워커(15개)보다 크게 둔다.
+SUPABASE_HTTP2 = os.getenv("SUPABASE_HTTP2", "1").strip().lower() not in ("0", "false", "no", "off")
+SUPABASE_MAX_CONNECTIONS = _env_int("SUPABASE_MAX_CONNECTIONS", 20)
+SUPABASE_MAX_KEEPALIVE = _env_int("SUPABASE_MAX_KEEPALIVE", 20)
+SUPABASE_KEEPALIVE_EXPIRY = _env_float("SUPABASE_KEEPALIVE_EXPIRY", 30.0)
+SUPABASE_HTTP_TIMEOUT = _env_float("SUPABASE_HTTP_TIMEOUT", 120.0)
+# 이보다 큰 PostgREST 요청 본문은 gzip (0=끔). 게이트웨이가 Content-Encoding: gzip 요청을 풀어 줄 때만 (`upsert_batch`)
+SUPABASE_GZIP_MIN_KB = _env_int("SUPABASE_GZIP_MIN_KB", 0)
+
+_client_lock = threading.Lock()
+_http_client = None
+_clients: dict[tuple[str, str], object] = {}
+
+
+def _json_client_class():
+    """`json=` 요청 본문을 `records.dumps`(orjson, 없으면 표준 json)로 만드는 httpx 클라이언트 클래스.
+
+    `SUPABASE_GZIP_MIN_KB`보다 큰 본문은 gzip 으로 압축해 `Content-Encoding: gzip`으로 보낸다.
+    """
+    import gzip
+
+    import httpx
+
+    import records
+
+    gzip_min = SUPABASE_GZIP_MIN_KB * 1024
+
+    class JSONClient(httpx.Client):
+        def build_request(self, method, url, *, json=None, **kwargs):
+            if json is None:
+                return super().build_request(method, url, **kwargs)
+            headers = httpx.Headers(kwargs.pop("headers", None))
+            headers.setdefault("Content-Type", "application/json")
+            body = records.dumps(json)
+            if gzip_min and len(body) >= gzip_min:
+                body = gzip.compress(body, compresslevel=5)
+                headers["Content-Encoding"] = "gzip"
+            kwargs["content"] = body
+            return super().build_request(method, url, headers=headers, **kwargs)
+
+    return JSONClient
+
+
+def get_shared_http_client():
+    """모든 Supabase 클라이언트가 함께 쓰는 httpx 연결 풀 (HTTP/2 keep-alive, 프로세스당 1개).
+
+    `SUPABASE_HTTP2=0`이면 HTTP/1.1. `h2` 패키지가 없으면 HTTP/1.1로 내려간다.
+    연결 수는 `SUPABASE_MAX_CONNECTIONS` / `SUPABASE_MAX_KEEPALIVE` / `SUPABASE_KEEPALIVE_EXPIRY`(초).
+    PostgREST 요청 본문 JSON 은 `records.dumps`로 인코딩한다 (orjson 이 있으면 그것으로, `SUPABASE_GZIP_MIN_KB` 이상은 gzip).
+    """
+    global _http_client
+    with _client_lock:
+        if _http_client is None:
+            import httpx
+
+            http2 = SUPABASE_HTTP2
+            if http2:
+                try:
+                    import h2  # noqa: F401
+                except ImportError:
+                    logger.warning("h2 패키지 없음 — Supabase 연결은 HTTP/1.1 keep-alive로 사용")
+                    http2 = False
+            _http_client = _json_client_class()(
+                http2=http2,
+                follow_redirects=True,
+                timeout=httpx.Timeout(SUPABASE_HTTP_TIMEOUT, connect=10.0),
+                limits=httpx.Limits(
+                    max_connections=SUPABASE_MAX_CONNECTIONS,
+                    max_keepalive_connections=SUPABASE_MAX_KEEPALIVE,
+                    keepalive_expiry=SUPABASE_KEEPALIVE_EXPIRY,
+                ),
+            )
+            logger.debug(
+                "Supabase HTTP 풀: http2=%s, max_connections=%s, keepalive=%s",
+                http2,
+                SUPABASE_MAX_CONNECTIONS,
+                SUPABASE_MAX_KEEPALIVE,
+            )
+        return _http_client
+
+
+def _create_client(key: str):
+    """공용 연결 풀을 쓰는 새 클라이언트. `httpx_client` 옵션이 없는 구버전 supabase면 기본 생성."""
+    from supabase import create_client
+
+    try:
+        from supabase import ClientOptions
+
+        options = ClientOptions(httpx_client=get_shared_http_client())
+    except (ImportError, TypeError):
+        return create_client(SUPABASE_URL, key)
+    return create_client(SUPABASE_URL, key, options=options)
+
+
+def _cached_client(role: str, key: str):
+    """역할·키별로 1개만 만들어 스레드 간 공유한다 (세션을 바꾸지 않는 서버 작업 전용)."""
+    cache_key = (role, key)
+    client = _clients.get(cache_key)
+    if client is not None:
+        return client
+    client = _create_client(key)
+    # postgrest 하위 클라이언트는 첫 접근 시 만들어지므로 공유 전에 미리 생성
+    client.postgrest
+    with _client_lock:
+        return _clients.setdefault(cache_key, client)
+
+
+def close_supabase_clients() -> None:
+    """캐시된 클라이언트와 공용 연결 풀 정리 (프로세스 종료 시 자동 호출)."""
+    global _http_client
+    with _client_lock:
+        _clients.clear()
+        if _http_client is not None:
+            _http_client.close()
+            _http_client = None
+
+
+atexit.register(close_supabase_clients)
+
+
 def get_supabase_client():
-    """Supabase 클라이언트 생성"""
+    """Supabase 클라이언트 (anon 키, 프로세스 내 공유)"""
     if not SUPABASE_URL or not SUPABASE_ANON_KEY:
         logger.error("Supabase 미설정: URL=%s, KEY=%s", bool(SUPABASE_URL), bool(SUPABASE_ANON_KEY))
         raise ValueError("VITE_NTP_SUPABASE_URL, VITE_NTP_SUPABASE_ANON_KEY가 .env에 설정되어야 합니다.")
     logger.debug("Supabase URL: %s...", (SUPABASE_URL or "")[:40])
-    from supabase import create_client
-    return create_client(SUPABASE_URL, SUPABASE_ANON_KEY)
+    return _cached_client("anon", SUPABASE_ANON_KEY)
 
 
 def get_supabase_admin_client():
-    """서버 사이드용 Supabase 클라이언트 (RLS 우회, presence 등)"""
+    """서버 사이드용 Supabase 클라이언트 (RLS 우회, presence 등). 프로세스 내 공유 — 여러 번 불러도 같은 객체."""
     if not SUPABASE_URL or not (SUPABASE_SERVICE_ROLE_KEY or SUPABASE_ANON_KEY):
         raise ValueError(
             "SUPABASE_URL과 SUPABASE_SERVICE_ROLE_KEY(또는 VITE_SERVICE_ROLE) 또는 VITE_NTP_SUPABASE_ANON_KEY가 .env에 필요합니다."
         )
-    from supabase import create_client
-    key = SUPABASE_SERVICE_ROLE_KEY or SUPABASE_ANON_KEY
-    return create_client(SUPABASE_URL, key)
+    if SUPABASE_SERVICE_ROLE_KEY:
+        return _cached_client("service_role", SUPABASE_SERVICE_ROLE_KEY)
+    return _cached_client("anon", SUPABASE_ANON_KEY)
 
 
 def get_supabase_storage_client():
@@ -55,9 +190,11 @@ def get_supabase_storage_client():
 
 
 def get_supabase_client_with_auth(access_token: str, refresh_token: str = ""):
-    """사용자 JWT로 Supabase 클라이언트 생성 (RLS 정책 auth.role()='authenticated' 만족)"""
-    from supabase import create_client
-    client = create_client(SUPABASE_URL, SUPABASE_ANON_KEY)
+    """사용자 JWT로 Supabase 클라이언트 생성 (RLS 정책 auth.role()='authenticated' 만족).
+
+    세션 상태를 가지므로 캐시하지 않고 매번 새로 만든다 (연결 풀만 공유).
+    """
+    client = _create_client(SUPABASE_ANON_KEY)
     client.auth.set_session(access_token, refresh_token or "")
     return client
 
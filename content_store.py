@@ -0,0 +1,106 @@
+"""
+상세 본문 HTML 을 Supabase Storage 에 내용 주소(content-addressed)로 저장
+
+`--content-storage`(또는 환경변수 `CRAWL_CONTENT_STORAGE=1`)일 때만 쓰인다.
+본문은 `sha256(본문)` 을 키로 버킷(`CONTEST_CONTENT_BUCKET`, 기본 `contest-content`)에 한 번만 올리고,
+`contests` 행에는 `content_key` / `content_hash`만 남긴다 (`content`는 빈 문자열).
+같은 본문(여러 공모전·재수집)은 같은 객체를 가리키므로 중복 업로드가 없다.
+
+객체 키:  <hash 앞 2자>/<hash>.html   — 내용이 바뀌면 키도 바뀌므로 장기 캐시(immutable) 가능
+프론트는 `getPublicUrl(content_key)`로 상세를 열 때만 받아 온다 (공개 버킷 + CDN).
+
+prune 등으로 행이 지워져도 객체는 남는다 (다른 행이 같은 객체를 가리킬 수 있음). 정리는 별도 작업.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import logging
+import os
+import threading
+
+logger = logging.getLogger("allyoung.content_store")
+
+CONTEST_CONTENT_BUCKET = os.getenv("CONTEST_CONTENT_BUCKET", "contest-content").strip() or "contest-content"
+_CACHE_CONTROL = "31536000"
+
+
+def content_hash(html: str) -> str:
+    return hashlib.sha256(html.encode("utf-8")).hexdigest()
+
+
+def content_key(digest: str) -> str:
+    return f"{digest[:2]}/{digest}.html"
+
+
+def _is_duplicate_error(exc: Exception) -> bool:
+    text = str(exc).lower()
+    return "duplicate" in text or "already exists" in text or "409" in text
+
+
+class ContentStore:
+    """본문 업로드기. 이번 프로세스에서 올렸거나 이미 있던 키는 기억해 다시 올리지 않는다."""
+
+    def __init__(self, client, bucket: str = CONTEST_CONTENT_BUCKET) -> None:
+        self.client = client
+        self.bucket = bucket
+        self._known: set[str] = set()
+        self._lock = threading.Lock()
+        self.uploaded = 0
+        self.deduplicated = 0
+        self.failed = 0
+
+    def put(self, html: str) -> tuple[str, str] | None:
+        """본문 저장 → (content_key, content_hash). 업로드 실패 시 None (호출 측이 인라인 저장으로 대체)."""
+        digest = content_hash(html)
+        key = content_key(digest)
+        with self._lock:
+            if key in self._known:
+                self.deduplicated += 1
+                return key, digest
+        try:
+            self.client.storage.from_(self.bucket).upload(
+                key,
+                html.encode("utf-8"),
+                {
+                    "content-type": "text/html; charset=utf-8",
+                    "cache-control": _CACHE_CONTROL,
+                    "upsert": "false",
+                },
+            )
+            counter = "uploaded"
+        except Exception as e:
+            if not _is_duplicate_error(e):
+                with self._lock:
+                    self.failed += 1
+                logger.warning("본문 Storage 업로드 실패 %s: %s", key, e)
+                return None
+            counter = "deduplicated"
+        with self._lock:
+            self._known.add(key)
+            setattr(self, counter, getattr(self, counter) + 1)
+        return key, digest
+
+    def summary(self) -> str:
+        return f"본문 Storage: 업로드 {self.uploaded}건, 중복 재사용 {self.deduplicated}건, 실패 {self.failed}건"
+
+
+_store: ContentStore | None = None
+
+
+def enable(client, bucket: str = CONTEST_CONTENT_BUCKET) -> ContentStore:
+    global _store
+    _store = ContentStore(client, bucket)
+    logger.info("상세 본문 Storage 저장 모드 (버킷 %s)", bucket)
+    return _store
+
+
+def enable_from_env(client) -> ContentStore | None:
+    """`CRAWL_CONTENT_STORAGE=1`이면 켠다."""
+    if os.getenv("CRAWL_CONTENT_STORAGE", "").strip().lower() in ("1", "true", "yes", "on"):
+        return enable(client)
+    return None
+
+
+def active() -> ContentStore | None:
+    return _store
@@ -0,0 +1,244 @@
+"""
+출처 간 중복 공모전 색인 (제목+주최 MinHash / LSH)
+
+같은 공모전이 위비티·요즘것들에 함께 올라오면 `contests`에 두 행이 생긴다.
+`--dedup`(또는 `CRAWL_DEDUP=1`)일 때 수집 시점에 두 행을 같은 `canonical_group_id`로 묶는다.
+
+- 정규화: NFKC·소문자, 기호·공백 제거, 흔한 꼬리말(공모전·모집 등)·법인 표기 제거
+- 특징: 제목 글자 3-gram + 주최 3-gram(`h:` 접두)
+- MinHash 64개 → LSH 16밴드×4행. 밴드 키는 `contest_dedup_bands`에 저장하고,
+  후보 조회는 배치의 밴드 키로 RPC `find_contest_dedup_candidates` 1회 (테이블 크기와 무관하게 인덱스 조회)
+- 후보는 서명으로 유사도(일치 비율)를 다시 재고 `MATCH_THRESHOLD` 이상, 제목 속 숫자(연도·회차)가
+  한쪽이 다른 쪽에 포함될 때만 같은 그룹으로 본다. 그룹 id 는 먼저 본 행의 `source:id`.
+- 묶인 상대가 본문을 이미 가지고 있으면 상세 요청 없이 그 본문을 재사용한다 (`shared_content`).
+"""
+
+from __future__ import annotations
+
+import hashlib
+import logging
+import os
+import re
+import unicodedata
+from dataclasses import dataclass
+
+logger = logging.getLogger("allyoung.dedup")
+
+NUM_PERM = 64
+BANDS = 16
+ROWS_PER_BAND = NUM_PERM // BANDS
+MATCH_THRESHOLD = 0.6
+SHINGLE = 3
+_RPC_KEY_CHUNK = 400
+
+_MERSENNE = (1 << 61) - 1
+
+_TITLE_NOISE_RE = re.compile(r"(공모전|공모|모집|안내|대회|접수)")
+_HOST_NOISE_RE = re.compile(r"(주식회사|\(주\)|㈜|재단법인|사단법인|\(재\)|\(사\))")
+_NON_WORD_RE = re.compile(r"[\W_]+", re.UNICODE)
+_NUM_RE = re.compile(r"\d+")
+
+
+def _perm_params(seed: int = 20261019) -> list[tuple[int, int]]:
+    """고정 시드의 (a, b) — 프로세스·배포가 달라도 같은 서명이 나와야 한다."""
+    out = []
+    for i in range(NUM_PERM):
+        d = hashlib.blake2b(f"{seed}:{i}".encode(), digest_size=16).digest()
+        a = int.from_bytes(d[:8], "big") % (_MERSENNE - 1) + 1
+        b = int.from_bytes(d[8:], "big") % _MERSENNE
+        out.append((a, b))
+    return out
+
+
+_PERMS = _perm_params()
+
+
+def normalize_title(text: str) -> str:
+    t = unicodedata.normalize("NFKC", text or "").lower()
+    t = _TITLE_NOISE_RE.sub(" ", t)
+    return _NON_WORD_RE.sub("", t)
+
+
+def normalize_host(text: str) -> str:
+    t = unicodedata.normalize("NFKC", text or "").lower()
+    t = _HOST_NOISE_RE.sub(" ", t)
+    return _NON_WORD_RE.sub("", t)
+
+
+def title_numbers(text: str) -> frozenset[str]:
+    """제목 속 숫자(연도·회차). 한쪽이 다른 쪽을 포함하지 않으면 다른 공모전 (예: 제3회 vs 제4회)."""
+    return frozenset(n.lstrip("0") or "0" for n in _NUM_RE.findall(unicodedata.normalize("NFKC", text or "")))
+
+
+def _shingles(text: str, prefix: str = "") -> set[str]:
+    if not text:
+        return set()
+    if len(text) <= SHINGLE:
+        return {prefix + text}
+    return {prefix + text[i : i + SHINGLE] for i in range(len(text) - SHINGLE + 1)}
+
+
+def _hash64(s: str) -> int:
+    return int.from_bytes(hashlib.blake2b(s.encode("utf-8"), digest_size=8).digest(), "big")
+
+
+def signature(title: str, host: str = "") -> list[int] | None:
+    """MinHash 서명 (NUM_PERM 개, 각 61비트 — Postgres bigint 에 들어감). 특징이 없으면 None."""
+    feats = _shingles(normalize_title(title)) | _shingles(normalize_host(host), "h:")
+    if not feats:
+        return None
+    hashes = [_hash64(f) for f in feats]
+    return [min((a * h + b) % _MERSENNE for h in hashes) for a, b in _PERMS]
+
+
+def band_keys(sig: list[int]) -> list[str]:
+    out = []
+    for band in range(BANDS):
+        chunk = sig[band * ROWS_PER_BAND : (band + 1) * ROWS_PER_BAND]
+        digest = hashlib.blake2b(",".join(map(str, chunk)).encode(), digest_size=8).hexdigest()
+        out.append(f"{band:02d}{digest}")
+    return out
+
+
+def similarity(a: list[int], b: list[int]) -> float:
+    """서명 일치 비율 = Jaccard 유사도 추정."""
+    if not a or not b or len(a) != len(b):
+        return 0.0
+    return sum(1 for x, y in zip(a, b) if x == y) / len(a)
+
+
+def group_id(source: str, contest_id: str) -> str:
+    return f"{source}:{contest_id}"
+
+
+@dataclass
+class DedupMatch:
+    """한 행의 색인 결과. `canonical`은 묶인 상대 (없으면 None → 자기 자신이 그룹 대표)."""
+
+    group_id: str
+    signature: list[int] | None
+    canonical: tuple[str, str] | None = None
+    canonical_has_content: bool = False
+    score: float = 0.0
+
+
+class DedupIndex:
+    """배치 단위 조회·기록. 호출 측은 upsert 전에 `assign`, upsert 후에 `record`."""
+
+    def __init__(self, client) -> None:
+        self.client = client
+        self.linked = 0
+        self.reused = 0
+
+    def _candidates(self, keys: list[str]) -> list[dict]:
+        out: dict[tuple[str, str], dict] = {}
+        for i in range(0, len(keys), _RPC_KEY_CHUNK):
+            res = self.client.rpc("find_contest_dedup_candidates", {"p_band_keys": keys[i : i + _RPC_KEY_CHUNK]}).execute()
+            for row in res.data or []:
+                out[(row["source"], row["contest_id"])] = row
+        return list(out.values())
+
+    def assign(self, source: str, rows: list[dict]) -> dict[str, DedupMatch]:
+        """rows(id·title·host) → {id: DedupMatch}. 다른 출처의 유사 행이 있으면 그 그룹에 합류."""
+        sigs = {r["id"]: signature(r.get("title") or "", r.get("host") or "") for r in rows}
+        keys = sorted({k for s in sigs.values() if s for k in band_keys(s)})
+        try:
+            candidates = self._candidates(keys) if keys else []
+        except Exception as e:
+            logger.warning("중복 후보 조회 실패 — 이번 배치는 묶지 않음: %s", e)
+            candidates = []
+        out: dict[str, DedupMatch] = {}
+        for r in rows:
+            rid = r["id"]
+            sig = sigs[rid]
+            match = DedupMatch(group_id=group_id(source, rid), signature=sig)
+            if sig:
+                nums = title_numbers(r.get("title") or "")
+                for c in candidates:
+                    if c["source"] == source:
+                        continue
+                    score = similarity(sig, c.get("dedup_signature") or [])
+                    if score < MATCH_THRESHOLD or score <= match.score:
+                        continue
+                    c_nums = title_numbers(c.get("title") or "")
+                    if nums and c_nums and not (nums <= c_nums or c_nums <= nums):
+                        continue
+                    match = DedupMatch(
+                        group_id=c.get("canonical_group_id") or group_id(c["source"], c["contest_id"]),
+                        signature=sig,
+                        canonical=(c["source"], c["contest_id"]),
+                        canonical_has_content=bool(c.get("has_content")),
+                        score=score,
+                    )
+            if match.canonical:
+                self.linked += 1
+            out[rid] = match
+        return out
+
+    def shared_content(self, match: DedupMatch | None) -> dict | None:
+        """묶인 상대의 본문 필드(content, content_key, content_hash). 없으면 None."""
+        if not match or not match.canonical or not match.canonical_has_content:
+            return None
+        src, cid = match.canonical
+        try:
+            res = (
+                self.client.table("contests")
+                .select("content, content_key, content_hash")
+                .eq("source", src)
+                .eq("id", cid)
+                .limit(1)
+                .execute()
+            )
+        except Exception as e:
+            logger.warning("중복 그룹 본문 조회 실패 %s/%s: %s", src, cid, e)
+            return None
+        row = (res.data or [None])[0]
+        if not row or not (str(row.get("content") or "").strip() or row.get("content_key")):
+            return None
+        self.reused += 1
+        return row
+
+    def record(self, source: str, matches: dict[str, DedupMatch]) -> None:
+        """upsert 된 행들의 밴드 키 기록 (이미 있으면 무시)."""
+        band_rows = [
+            {"band_key": k, "source": source, "contest_id": rid}
+            for rid, m in matches.items()
+            if m.signature
+            for k in band_keys(m.signature)
+        ]
+        if not band_rows:
+            return
+        try:
+            self.client.table("contest_dedup_bands").upsert(
+                band_rows, on_conflict="band_key,source,contest_id", ignore_duplicates=True
+            ).execute()
+        except Exception as e:
+            logger.warning("중복 색인 밴드 기록 실패: %s", e)
+
+    def summary(self) -> str:
+        return f"중복 색인: 다른 출처와 묶음 {self.linked}건, 본문 재사용 {self.reused}건"
+
+
+def row_fields(match: DedupMatch) -> dict:
+    """contests upsert 에 넣을 색인 컬럼."""
+    return {"canonical_group_id": match.group_id, "dedup_signature": match.signature}
+
+
+_index: DedupIndex | None = None
+
+
+def enable(client) -> DedupIndex:
+    global _index
+    _index = DedupIndex(client)
+    logger.info("출처 간 중복 색인 사용 (MinHash %s, LSH %s밴드×%s행)", NUM_PERM, BANDS, ROWS_PER_BAND)
+    return _index
+
+
+def enable_from_env(client) -> DedupIndex | None:
+    if os.getenv("CRAWL_DEDUP", "").strip().lower() in ("1", "true", "yes", "on"):
+        return enable(client)
+    return None
+
+
+def active() -> DedupIndex | None:
+    return _index
@@ -0,0 +1,109 @@
+"""
+공모전 목록 생존(liveness) 기록 — 매 사이클 `updated_at` 재기록 대신 집합 차이
+
+`--liveness`(또는 `CRAWL_LIVENESS=1`)일 때:
+
+- 크롤러는 한 번의 전체 순회(sweep) 동안 목록에서 본 id 를 모으고, 순회가 끝까지 돌았을 때만
+  RPC `record_contest_sweep(source, ids)`를 한 번 부른다.
+- DB 는 (이 출처의 목록에 있던 행) − (이번에 본 id) 에 `missing_since`를 찍고, 다시 나타난 행은 지운다.
+  상태가 바뀐 행만 쓰이므로 목록에 그대로 있는 행은 건드리지 않는다.
+- 목록 내용(제목·D-day 등)이 바뀌지 않은 행은 upsert 하지 않는다 (`crawl_server.write_contest_batch`).
+- `prune_stale_contests`는 최근 순회가 기록된 출처는 `missing_since` 기준으로, 아니면 예전처럼 `updated_at` 기준으로 지운다.
+
+순회 도중 오류·중단이면 기록하지 않는다 (일부만 본 집합으로 차이를 내면 멀쩡한 행이 사라진 것으로 보임).
+본 id 수가 현재 목록 행 수의 `MIN_SWEEP_RATIO` 미만이면 DB 가 기록을 거절한다 (차단·구조 변경 의심).
+"""
+
+from __future__ import annotations
+
+import logging
+import os
+import threading
+
+import change_feed
+
+logger = logging.getLogger("allyoung.liveness")
+
+MIN_SWEEP_RATIO = 0.5
+
+
+class Sweep:
+    """출처 하나의 순회 중 본 id 집합."""
+
+    def __init__(self, tracker: "LivenessTracker", source: str) -> None:
+        self.tracker = tracker
+        self.source = source
+        self.ids: set[str] = set()
+        self._lock = threading.Lock()
+
+    def add(self, ids) -> None:
+        with self._lock:
+            self.ids.update(str(i) for i in ids)
+
+    def complete(self) -> dict | None:
+        return self.tracker.complete(self)
+
+
+class LivenessTracker:
+    def __init__(self, client, min_ratio: float = MIN_SWEEP_RATIO) -> None:
+        self.client = client
+        self.min_ratio = min_ratio
+
+    def start(self, source: str) -> Sweep:
+        return Sweep(self, source)
+
+    def complete(self, sweep: Sweep) -> dict | None:
+        """순회 결과 기록 → {seen, live, vanished, returned, skipped}. 실패 시 None."""
+        with sweep._lock:
+            ids = sorted(sweep.ids)
+        try:
+            res = self.client.rpc(
+                "record_contest_sweep",
+                {"p_source": sweep.source, "p_seen_ids": ids, "p_min_ratio": self.min_ratio},
+            ).execute()
+        except Exception as e:
+            logger.warning("%s 순회 생존 기록 실패: %s", sweep.source, e)
+            return None
+        data = res.data
+        if isinstance(data, list):
+            data = data[0] if data else None
+        if not isinstance(data, dict):
+            return None
+        if data.get("skipped"):
+            logger.warning(
+                "%s 순회 생존 기록 거절 — 본 id %s건이 목록 행 %s건의 %.0f%% 미만 (차단·구조 변경 확인)",
+                sweep.source,
+                data.get("seen"),
+                data.get("live"),
+                self.min_ratio * 100,
+            )
+        else:
+            logger.info(
+                "%s 순회 생존 기록: 본 id %s건, 사라짐 %s건, 다시 나타남 %s건",
+                sweep.source,
+                data.get("seen"),
+                data.get("vanished"),
+                data.get("returned"),
+            )
+            change_feed.record_sweep(sweep.source, data)
+        return data
+
+
+_tracker: LivenessTracker | None = None
+
+
+def enable(client) -> LivenessTracker:
+    global _tracker
+    _tracker = LivenessTracker(client)
+    logger.info("목록 생존 기록 모드 — 바뀐 행만 upsert, 사라진 행은 순회 집합 차이로 표시")
+    return _tracker
+
+
+def enable_from_env(client) -> LivenessTracker | None:
+    if os.getenv("CRAWL_LIVENESS", "").strip().lower() in ("1", "true", "yes", "on"):
+        return enable(client)
+    return None
+
+
+def active() -> LivenessTracker | None:
+    return _tracker
@@ -0,0 +1,108 @@
+"""
+크롤러 HTTP 세션 공통 계층
+
+대상 사이트(위비티·요즘것들·K-Startup) 요청은 모두 `new_session()`으로 만든 `requests.Session`을 쓴다.
+트레이스(`crawl_trace`) 같은 전역 옵션은 여기서 어댑터를 감싸 붙이므로 호출 측은 바뀌지 않는다.
+
+- 출처 대체(origin override): `www.wevity.com` 등 호스트 요청을 다른 base URL(로컬 가짜 서버 등)로 보낸다.
+  `set_origin_overrides({...})` 또는 환경변수 `CRAWL_ORIGIN_OVERRIDE="www.wevity.com=http://127.0.0.1:8765,..."`.
+  원래 호스트는 `X-Forwarded-Host` 헤더로 전달.
+- 기록/재생(`crawl_replay`): `--record DIR`이면 응답을 남기고, `--replay DIR`이면 네트워크 대신 기록을 돌려준다.
+- 프록시 풀(`proxy_pool`): `--proxy URL` / `CRAWL_PROXIES`이면 위비티 요청을 상태 점수가 가장 좋은 프록시로 보내고
+  차단·연결 실패가 이어지는 프록시는 격리했다가 다시 시험한다.
+- 재시도·브레이커(`crawl_retry`): 위비티·요즘것들 요청의 일시 오류는 지터 지수 백오프로 다시 보내고,
+  실패가 이어지는 호스트는 잠시 멈췄다가 이어 간다 (기본 켜짐, `--http-retries 0`으로 끔).
+- 예의상 대기(`polite_sleep`): 상세 요청 전 0.5초 등 봇 완화용 고정 대기. 환경변수
+  `CRAWL_POLITE_DELAY_SCALE`(기본 1)로 배율 조정 — 로컬 벤치에서만 0으로 둔다.
+"""
+
+from __future__ import annotations
+
+import os
+import time
+from urllib.parse import urlsplit, urlunsplit
+
+import requests
+from requests.adapters import BaseAdapter, HTTPAdapter
+
+import crawl_replay
+import crawl_retry
+import crawl_trace
+import proxy_pool
+
+
+def _env_float(name: str, default: float) -> float:
+    try:
+        return float(os.environ.get(name, str(default)).strip())
+    except ValueError:
+        return default
+
+
+POLITE_DELAY_SCALE = _env_float("CRAWL_POLITE_DELAY_SCALE", 1.0)
+
+
+def polite_sleep(seconds: float) -> None:
+    """대상 사이트 부담 완화용 고정 대기 (`POLITE_DELAY_SCALE` 배율 적용)."""
+    delay = seconds * POLITE_DELAY_SCALE
+    if delay > 0:
+        time.sleep(delay)
+
+
+def _parse_overrides(raw: str) -> dict[str, str]:
+    out: dict[str, str] = {}
+    for part in raw.split(","):
+        host, sep, base = part.partition("=")
+        if sep and host.strip() and base.strip():
+            out[host.strip().lower()] = base.strip().rstrip("/")
+    return out
+
+
+_origin_overrides: dict[str, str] = _parse_overrides(os.environ.get("CRAWL_ORIGIN_OVERRIDE", ""))
+
+
+def set_origin_overrides(overrides: dict[str, str]) -> None:
+    """호스트 → base URL 대체 표 교체. 이후 만드는 세션부터 적용 (빈 dict면 해제)."""
+    global _origin_overrides
+    _origin_overrides = {h.lower(): b.rstrip("/") for h, b in overrides.items()}
+
+
+class OriginOverrideAdapter(BaseAdapter):
+    """대체 표에 있는 호스트 요청의 scheme·host를 바꿔 내부 어댑터로 넘긴다."""
+
+    def __init__(self, inner: BaseAdapter, overrides: dict[str, str]) -> None:
+        super().__init__()
+        self.inner = inner
+        self.overrides = overrides
+
+    def send(self, request, **kwargs):
+        parts = urlsplit(request.url)
+        base = self.overrides.get((parts.hostname or "").lower())
+        if base:
+            b = urlsplit(base)
+            request.url = urlunsplit((b.scheme, b.netloc, parts.path, parts.query, parts.fragment))
+            request.headers["X-Forwarded-Host"] = parts.hostname or ""
+        return self.inner.send(request, **kwargs)
+
+    def close(self) -> None:
+        self.inner.close()
+
+
+def new_session(headers: dict | None = None) -> requests.Session:
+    """기본 헤더를 얹은 세션. 켜진 옵션에 따라 어댑터 체인을 구성한다."""
+    session = requests.Session()
+    if headers:
+        session.headers.update(headers)
+    adapter = crawl_replay.base_adapter()
+    if adapter is None:
+        adapter = HTTPAdapter()
+        if _origin_overrides:
+            adapter = OriginOverrideAdapter(adapter, dict(_origin_overrides))
+        # 프록시는 출처 대체 바깥에서 골라야 원래 호스트(www.wevity.com 등)로 적용 여부를 판단한다
+        adapter = proxy_pool.wrap_adapter(adapter)
+    adapter = crawl_replay.wrap_adapter(adapter)
+    adapter = crawl_trace.wrap_adapter(adapter)
+    # 재시도는 가장 바깥 — 시도마다 트레이스·기록이 한 줄씩 남는다
+    adapter = crawl_retry.wrap_adapter(adapter)
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
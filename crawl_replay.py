@@ -0,0 +1,232 @@
+"""
+크롤 사이클 기록/재생 (`--record DIR` / `--replay DIR`)
+
+기록: `crawl_http.new_session()` 세션이 받은 대상 사이트 응답을 DIR에 모두 남긴다.
+  DIR/index.ndjson   요청 1건당 1줄 {seq, key, url, status, headers, encoding, elapsed_ms, body}
+  DIR/bodies/<sha256>  본문(디코딩된 바이트, 같은 본문은 1개만 저장)
+재생: 같은 요청(메서드 + URL, `ServiceKey` 등 키 값 제외)에 기록된 응답을 순서대로 돌려준다.
+  같은 키가 기록보다 많이 요청되면 마지막 응답을 반복, 기록에 없는 요청은 ConnectionError.
+  `--replay-speed 1`(기본)은 원래 응답 시간만큼 대기, 0이면 지연 없이 즉시 반환 (2면 2배 빠르게).
+
+Supabase(DB) 호출은 대상이 아니며 그대로 나간다. 재생 중에는 대상 사이트·K-Startup 일일 할당량을 쓰지 않는다.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import threading
+import time
+from collections import defaultdict, deque
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+
+import requests
+from requests.adapters import BaseAdapter
+from requests.structures import CaseInsensitiveDict
+
+from crawl_trace import redact_url
+
+logger = logging.getLogger("allyoung.replay")
+
+# 본문을 디코딩된 상태로 저장하므로 전송 관련 헤더는 남기지 않는다
+_DROP_HEADERS = frozenset({"content-encoding", "transfer-encoding", "content-length", "connection", "set-cookie"})
+
+
+def request_key(method: str, url: str) -> str:
+    return f"{method.upper()} {redact_url(url)}"
+
+
+class CycleRecorder:
+    """응답 기록기 (스레드 안전, 한 줄씩 바로 flush)."""
+
+    def __init__(self, directory: str | Path) -> None:
+        self.dir = Path(directory)
+        (self.dir / "bodies").mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._seq = 0
+        self._index = open(self.dir / "index.ndjson", "a", encoding="utf-8")
+        logger.info("HTTP 응답 기록: %s", self.dir)
+
+    def record(self, request, resp: requests.Response, elapsed_ms: float) -> None:
+        body = resp.content or b""
+        digest = hashlib.sha256(body).hexdigest()
+        path = self.dir / "bodies" / digest
+        headers = {k: v for k, v in resp.headers.items() if k.lower() not in _DROP_HEADERS}
+        with self._lock:
+            if not path.exists():
+                path.write_bytes(body)
+            self._seq += 1
+            line = {
+                "seq": self._seq,
+                "ts": datetime.now(timezone.utc).isoformat(timespec="milliseconds"),
+                "key": request_key(request.method, request.url),
+                "url": redact_url(resp.url or request.url),
+                "status": resp.status_code,
+                "reason": resp.reason,
+                "headers": headers,
+                "encoding": resp.encoding,
+                "elapsed_ms": round(elapsed_ms, 1),
+                "body": digest,
+            }
+            self._index.write(json.dumps(line, ensure_ascii=False) + "\n")
+            self._index.flush()
+
+    def close(self) -> None:
+        with self._lock:
+            self._index.close()
+
+
+class RecordingAdapter(BaseAdapter):
+    def __init__(self, inner: BaseAdapter, recorder: CycleRecorder) -> None:
+        super().__init__()
+        self.inner = inner
+        self.recorder = recorder
+
+    def send(self, request, **kwargs):
+        method, url = request.method, request.url
+        t0 = time.perf_counter()
+        resp = self.inner.send(request, **kwargs)
+        elapsed_ms = (time.perf_counter() - t0) * 1000.0
+        # 출처 대체 어댑터가 request.url을 바꿨을 수 있어 원래 키로 기록
+        keyed = requests.Request(method, url).prepare()
+        try:
+            self.recorder.record(keyed, resp, elapsed_ms)
+        except OSError as e:
+            logger.warning("응답 기록 실패 %s: %s", url, e)
+        return resp
+
+    def close(self) -> None:
+        self.inner.close()
+
+
+class CycleReplay:
+    """기록 디렉터리를 읽어 키별 응답 큐를 만든다."""
+
+    def __init__(self, directory: str | Path, speed: float = 1.0) -> None:
+        self.dir = Path(directory)
+        self.speed = speed
+        self._lock = threading.Lock()
+        self._queues: dict[str, deque[dict]] = defaultdict(deque)
+        self._last: dict[str, dict] = {}
+        n = 0
+        with open(self.dir / "index.ndjson", encoding="utf-8") as f:
+            for line in f:
+                line = line.strip()
+                if not line:
+                    continue
+                entry = json.loads(line)
+                self._queues[entry["key"]].append(entry)
+                n += 1
+        self.misses = 0
+        logger.info("HTTP 응답 재생: %s (%s건, 키 %s개, 속도 %s)", self.dir, n, len(self._queues), speed)
+
+    def next_entry(self, key: str) -> dict | None:
+        with self._lock:
+            q = self._queues.get(key)
+            if q:
+                entry = q.popleft()
+                self._last[key] = entry
+                return entry
+            entry = self._last.get(key)
+            if entry is None:
+                self.misses += 1
+            return entry
+
+    def body(self, digest: str) -> bytes:
+        return (self.dir / "bodies" / digest).read_bytes()
+
+
+class ReplayAdapter(BaseAdapter):
+    """네트워크 대신 기록된 응답을 돌려주는 종단 어댑터."""
+
+    def __init__(self, replay: CycleReplay) -> None:
+        super().__init__()
+        self.replay = replay
+
+    def send(self, request, **kwargs):
+        key = request_key(request.method, request.url)
+        entry = self.replay.next_entry(key)
+        if entry is None:
+            raise requests.ConnectionError(f"재생 기록에 없는 요청: {key}", request=request)
+        if self.replay.speed > 0 and entry.get("elapsed_ms"):
+            time.sleep(entry["elapsed_ms"] / 1000.0 / self.replay.speed)
+        resp = requests.Response()
+        resp.status_code = int(entry["status"])
+        resp.reason = entry.get("reason") or ""
+        resp.headers = CaseInsensitiveDict(entry.get("headers") or {})
+        resp._content = self.replay.body(entry["body"])
+        resp.encoding = entry.get("encoding")
+        resp.url = request.url
+        resp.request = request
+        resp.elapsed = timedelta(milliseconds=float(entry.get("elapsed_ms") or 0.0))
+        return resp
+
+    def close(self) -> None:
+        pass
+
+
+_recorder: CycleRecorder | None = None
+_replay: CycleReplay | None = None
+
+
+def start_recording(directory: str | Path) -> None:
+    global _recorder
+    if _replay is not None:
+        raise ValueError("--record 와 --replay 는 함께 쓸 수 없습니다.")
+    _recorder = CycleRecorder(directory)
+
+
+def start_replay(directory: str | Path, speed: float = 1.0) -> None:
+    global _replay
+    if _recorder is not None:
+        raise ValueError("--record 와 --replay 는 함께 쓸 수 없습니다.")
+    _replay = CycleReplay(directory, speed)
+
+
+def replaying() -> bool:
+    return _replay is not None
+
+
+def base_adapter() -> BaseAdapter | None:
+    """재생 중이면 종단 어댑터, 아니면 None (호출 측이 HTTPAdapter 사용)."""
+    return ReplayAdapter(_replay) if _replay is not None else None
+
+
+def wrap_adapter(adapter: BaseAdapter) -> BaseAdapter:
+    """기록 중이면 `RecordingAdapter`로 감싼다."""
+    return RecordingAdapter(adapter, _recorder) if _recorder is not None else adapter
+
+
+def add_cli_arguments(parser) -> None:
+    parser.add_argument(
+        "--record",
+        metavar="DIR",
+        default=None,
+        help="대상 사이트 HTTP 응답을 DIR에 모두 기록 (나중에 --replay 로 재생)",
+    )
+    parser.add_argument(
+        "--replay",
+        metavar="DIR",
+        default=None,
+        help="대상 사이트 대신 DIR에 기록된 응답을 재생 (네트워크·K-Startup 할당량 미사용)",
+    )
+    parser.add_argument(
+        "--replay-speed",
+        type=float,
+        default=1.0,
+        metavar="X",
+        help="재생 속도 배율 (기본 1 = 원래 응답 시간, 0 = 지연 없음)",
+    )
+
+
+def apply_cli_arguments(parser, args) -> None:
+    if args.record and args.replay:
+        parser.error("--record 와 --replay 는 함께 쓸 수 없습니다.")
+    if args.replay_speed < 0:
+        parser.error("--replay-speed 는 0 이상이어야 합니다.")
+    if args.record:
+        start_recording(args.record)
+    elif args.replay:
+        start_replay(args.replay, args.replay_speed)
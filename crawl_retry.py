@@ -0,0 +1,260 @@
+"""
+대상 사이트 요청 재시도(지터 지수 백오프) + 호스트별 서킷 브레이커
+
+위비티·요즘것들 요청(`crawl_http.new_session()` 세션)에 어댑터로 붙는다. 호출 측 코드는 바뀌지 않는다.
+
+- 재시도: 연결 오류·타임아웃, HTTP 403·429·5xx 는 `backoff(n) = uniform(0, min(CAP_S, BASE_S × 2^n))`
+  (full jitter) 만큼 쉬고 다시 보낸다. `Retry-After`가 있으면 그보다 짧게 쉬지 않는다. GET/HEAD 만.
+  위비티 403 은 IP 차단일 때가 많지만 짧은 버스트도 있어 재시도 대상에 넣고, 이어지면 브레이커가 끊는다.
+  단 프록시 풀(`proxy_pool`)이 맡은 호스트의 403 은 풀이 이미 다른 프록시로 다시 보냈으므로 재시도하지 않는다
+  (겹치면 차단 한 번이 (1+재시도)×프록시 수만큼 불어나고 브레이커·격리에 모두 실패로 쌓인다).
+- 브레이커: 한 호스트에서 실패가 `BREAKER_THRESHOLD`번 연속되면 열림(open) — `BREAKER_OPEN_S`(열릴 때마다 두 배,
+  최대 `BREAKER_MAX_OPEN_S`) 동안 그 호스트 요청은 보내지 않고 **기다렸다가** 이어 간다 (포기하지 않음).
+  기다림이 끝나면 요청 하나만 시험(half-open)으로 보내 성공하면 닫고, 실패하면 더 길게 연다.
+- 로컬 상태 저장소(`--state-db`)가 있으면 열린 브레이커를 저장해 두었다가 재시작 후에도 이어 간다.
+- 종료 시그널(`interrupt()`)이 오면 백오프·브레이커 대기를 바로 끝내고 마지막 결과(또는 `CircuitOpenError`)를 돌려준다.
+
+K-Startup 공공 API 는 `kstartup_crawler.fetch_api`가 자체 재시도를 하므로 대상 호스트에 넣지 않는다.
+재시도 횟수는 `--http-retries N`(기본 3, 0=끔) 또는 `CRAWL_HTTP_RETRIES`.
+"""
+
+from __future__ import annotations
+
+import logging
+import os
+import random
+import threading
+import time
+from email.utils import parsedate_to_datetime
+from urllib.parse import urlsplit
+
+import requests
+from requests.adapters import BaseAdapter
+
+import crawl_state_store
+import crawl_trace
+import proxy_pool
+
+logger = logging.getLogger("allyoung.retry")
+
+DEFAULT_HOSTS = ("www.wevity.com", "www.allforyoung.com", "api.allforyoung.com")
+RETRY_STATUSES = frozenset({403, 429, 500, 502, 503, 504})
+RETRY_METHODS = frozenset({"GET", "HEAD"})
+BASE_S = 1.0
+CAP_S = 30.0
+BREAKER_THRESHOLD = 5
+BREAKER_OPEN_S = 30.0
+BREAKER_MAX_OPEN_S = 300.0
+
+
+class CircuitOpenError(requests.ConnectionError):
+    """브레이커가 열린 채 종료 시그널을 받아 요청을 보내지 않았다."""
+
+
+_interrupt = threading.Event()
+
+
+def interrupt() -> None:
+    """진행 중인 백오프·브레이커 대기를 깨운다 (종료 시그널)."""
+    _interrupt.set()
+
+
+def backoff(attempt: int) -> float:
+    return random.uniform(0.0, min(CAP_S, BASE_S * (2**attempt)))
+
+
+def _retry_after(resp: requests.Response) -> float | None:
+    raw = resp.headers.get("Retry-After")
+    if not raw:
+        return None
+    try:
+        return max(0.0, float(raw))
+    except ValueError:
+        pass
+    try:
+        return max(0.0, parsedate_to_datetime(raw).timestamp() - time.time())
+    except (TypeError, ValueError):
+        return None
+
+
+def _discard(resp: requests.Response) -> None:
+    """버릴 응답은 본문까지 읽고 닫아 연결을 풀에 돌려준다 (읽지 않고 닫으면 연결이 끊김)."""
+    try:
+        resp.content
+    except (requests.RequestException, OSError):
+        pass
+    resp.close()
+
+
+class HostBreaker:
+    """호스트 하나의 브레이커 상태 (closed → open → half-open)."""
+
+    def __init__(self, host: str) -> None:
+        self.host = host
+        self.failures = 0
+        self.open_s = 0.0
+        self.open_until = 0.0
+        self.trial = False
+        self.opened = 0
+        self._cond = threading.Condition()
+
+    def acquire(self) -> bool:
+        """요청을 보내도 되면 True. 열려 있으면 닫히거나 시험 차례가 올 때까지 기다린다 (중단 시 False)."""
+        with self._cond:
+            while True:
+                if _interrupt.is_set():
+                    return False
+                now = time.monotonic()
+                if not self.open_s:
+                    return True
+                if now >= self.open_until and not self.trial:
+                    self.trial = True
+                    logger.info("%s 브레이커 반열림 — 시험 요청", self.host)
+                    return True
+                wait = self.open_until - now if now < self.open_until else 1.0
+                self._cond.wait(min(wait, 1.0))
+
+    def restore(self, saved: dict) -> None:
+        """재시작 전에 열려 있던 브레이커 (`crawl_state_store`). 열림 시간이 지났어도 시험 요청부터 보낸다."""
+        with self._cond:
+            self.open_s = float(saved.get("open_s") or BREAKER_OPEN_S)
+            self.open_until = time.monotonic() + max(0.0, float(saved.get("until", 0)) - time.time())
+            logger.info("%s 브레이커 열림 상태 이어 받음 — %.0f초 뒤 시험 요청", self.host, self.open_until - time.monotonic())
+
+    def success(self) -> None:
+        with self._cond:
+            if self.open_s:
+                logger.info("%s 브레이커 닫힘 (시험 요청 성공)", self.host)
+                store = crawl_state_store.active()
+                if store:
+                    store.delete(crawl_state_store.NS_BREAKER, self.host)
+            self.failures = 0
+            self.open_s = 0.0
+            self.trial = False
+            self._cond.notify_all()
+
+    def failure(self) -> None:
+        with self._cond:
+            self.failures += 1
+            if self.trial or (not self.open_s and self.failures >= BREAKER_THRESHOLD):
+                self.open_s = min(BREAKER_MAX_OPEN_S, max(BREAKER_OPEN_S, self.open_s * 2))
+                self.open_until = time.monotonic() + self.open_s
+                self.trial = False
+                self.opened += 1
+                logger.warning("%s 브레이커 열림 — 연속 실패 %s건, %.0f초 뒤 재개", self.host, self.failures, self.open_s)
+                store = crawl_state_store.active()
+                if store:
+                    store.put(crawl_state_store.NS_BREAKER, self.host, {"open_s": self.open_s, "until": time.time() + self.open_s})
+            self._cond.notify_all()
+
+
+class RetryPolicy:
+    def __init__(self, retries: int, hosts: tuple[str, ...] = DEFAULT_HOSTS) -> None:
+        self.retries = max(0, retries)
+        self.hosts = frozenset(h.lower() for h in hosts)
+        self._breakers: dict[str, HostBreaker] = {}
+        self._lock = threading.Lock()
+        self.retried = 0
+
+    def breaker(self, host: str) -> HostBreaker:
+        with self._lock:
+            b = self._breakers.get(host)
+            if b is None:
+                b = self._breakers[host] = HostBreaker(host)
+                store = crawl_state_store.active()
+                saved = store.get(crawl_state_store.NS_BREAKER, host) if store else None
+                if saved:
+                    b.restore(saved)
+            return b
+
+    def count_retry(self) -> None:
+        with self._lock:
+            self.retried += 1
+
+    def summary(self) -> str:
+        with self._lock:
+            opened = {h: b.opened for h, b in self._breakers.items() if b.opened}
+            retried = self.retried
+        bits = ", ".join(f"{h} {n}회" for h, n in sorted(opened.items()))
+        return f"HTTP 재시도 {retried}건" + (f", 브레이커 열림: {bits}" if bits else "")
+
+
+def _pool_handles_block(host: str, status: int) -> bool:
+    """403 을 프록시 풀이 이미 다른 프록시로 돌려 본 호스트면 True — 여기서 다시 보내지 않는다."""
+    pool = proxy_pool.active()
+    return status == 403 and pool is not None and pool.applies(host)
+
+
+class RetryAdapter(BaseAdapter):
+    def __init__(self, inner: BaseAdapter, policy: RetryPolicy) -> None:
+        super().__init__()
+        self.inner = inner
+        self.policy = policy
+
+    def send(self, request, **kwargs):
+        host = (urlsplit(request.url).hostname or "").lower()
+        if host not in self.policy.hosts or request.method not in RETRY_METHODS:
+            return self.inner.send(request, **kwargs)
+        breaker = self.policy.breaker(host)
+        stage_name = crawl_trace.current_stage()
+        attempt = 0
+        while True:
+            if not breaker.acquire():
+                raise CircuitOpenError(f"{host} 브레이커 대기 중 중단")
+            resp = None
+            try:
+                with crawl_trace.stage(stage_name, retries=attempt):
+                    resp = self.inner.send(request.copy(), **kwargs)
+            except (requests.ConnectionError, requests.Timeout) as e:
+                breaker.failure()
+                if attempt >= self.policy.retries or _interrupt.is_set():
+                    raise
+                wait = backoff(attempt)
+                logger.warning("%s 요청 오류 %s (시도 %s/%s) → %.1f초 후 재시도", host, type(e).__name__, attempt + 1, self.policy.retries + 1, wait)
+            except Exception:
+                # 재시도 대상이 아닌 오류 — 시험 요청이었다면 차례를 풀어 다른 요청이 멈추지 않게 한다
+                breaker.failure()
+                raise
+            else:
+                if resp.status_code not in RETRY_STATUSES:
+                    breaker.success()
+                    return resp
+                breaker.failure()
+                if attempt >= self.policy.retries or _interrupt.is_set() or _pool_handles_block(host, resp.status_code):
+                    return resp
+                wait = max(backoff(attempt), min(CAP_S, _retry_after(resp) or 0.0))
+                logger.warning("%s HTTP %s (시도 %s/%s) → %.1f초 후 재시도", host, resp.status_code, attempt + 1, self.policy.retries + 1, wait)
+                _discard(resp)
+            attempt += 1
+            self.policy.count_retry()
+            if _interrupt.wait(wait):
+                raise CircuitOpenError(f"{host} 재시도 대기 중 중단")
+
+    def close(self) -> None:
+        self.inner.close()
+
+
+def _env_retries() -> int:
+    try:
+        return int(os.environ.get("CRAWL_HTTP_RETRIES", "3").strip())
+    except ValueError:
+        return 3
+
+
+_policy: RetryPolicy | None = RetryPolicy(_env_retries()) if _env_retries() > 0 else None
+
+
+def configure(retries: int) -> RetryPolicy | None:
+    """재시도 횟수 설정 (0 이면 끔). 이후 만드는 세션부터 적용."""
+    global _policy
+    _policy = RetryPolicy(retries) if retries > 0 else None
+    return _policy
+
+
+def active() -> RetryPolicy | None:
+    return _policy
+
+
+def wrap_adapter(adapter: BaseAdapter) -> BaseAdapter:
+    policy = _policy
+    return RetryAdapter(adapter, policy) if policy is not None else adapter
@@ -0,0 +1,455 @@
+"""
+여러 출처를 한 프로세스에서 각자 주기로 돌리는 크롤 스케줄러.
+
+`crawl_server.py`(요즘것들+K-Startup 한 사이클 후 통째 대기)와 `crawl_wevity_only_loop.py`(위비티 N시간 대기)를
+합친 상주 프로세스. 작업마다 다음 실행 시각을 따로 잡으므로 한 출처가 끝나길 기다리며 다른 출처가 놀지 않는다.
+
+작업 (기본값, 옵션으로 변경):
+  wevity        8시간마다       위비티 목록·상세 → contests, 알림
+  allforyoung   3시간마다       요즘것들 목록·상세 → contests, 알림
+  kstartup      매일 06:00 KST  K-Startup 공공 API (crawl_logs `kstartup_crawl` 와 공유 — Actions 가 이미 돌렸으면 스킵)
+  dday          매일 00:10 KST  위비티·요즘것들 목록만 돌며 D-day 갱신 (crawl_logs `dday_refresh`)
+                                그날 위비티·요즘것들 작업이 목록 전체를 이미 돌았으면 그 출처는 생략
+
+- 주기 작업은 `--jitter` 비율만큼 무작위로 앞뒤로 흔든다 (매번 같은 시각에 몰리지 않게).
+- `--window NAME=HH:MM-HH:MM`(KST): 그 시간대에만 시작 (자정 넘김 가능, 예: 22:00-06:00).
+- 같은 사이트를 쓰는 작업(예: allforyoung 과 dday)은 동시에 돌지 않고, 서로 다른 사이트 작업은 병렬로 돈다.
+- 상태(마지막 실행·다음 예정)는 `--state` JSON 에 남는다. 재시작 시 예정 시각이 지났으면 한 번만 바로 실행
+  (놓친 횟수만큼 몰아서 돌지 않음). 매일 작업은 오늘 예정 시각이 지났는데 오늘 실행 기록이 없으면 바로 실행.
+- 실패하면 `min(주기/4, 30분)` 뒤 재시도.
+- 대기는 다음 예정 시각(또는 작업 종료·종료 시그널)까지 한 번에 — 분 단위로 깨어나지 않는다.
+- `--run-once`: 모든 작업을 지금 한 번씩 돌리고 종료 (점검용).
+
+  python crawl_scheduler.py
+  python crawl_scheduler.py --interval wevity=6h --interval allforyoung=90m --jitter 0.1
+  python crawl_scheduler.py --window wevity=01:00-07:00 --daily kstartup=05:30 --only wevity --only kstartup
+  python crawl_scheduler.py --liveness --dedup --search-index     # crawl_server 와 같은 수집 옵션
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import logging
+import os
+import random
+import re
+import signal
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from datetime import datetime, time as dtime, timedelta, timezone
+from pathlib import Path
+from typing import Callable
+
+from config import K_START_UP_SERVICE
+from crawl_replay import replaying
+from crawl_server import (
+    JOB_DDAY_REFRESH,
+    JOB_KSTARTUP_CRAWL,
+    _KST,
+    _crawl_log_has_success,
+    _crawl_log_upsert,
+    _signal_handler,
+    _stop,
+    add_feature_arguments,
+    apply_feature_arguments,
+    kstartup_calendar_date_kst,
+    kstartup_should_skip_daily_public_api,
+    log_content_size_summary,
+    notify_contest_cycle_summary,
+    run_allforyoung,
+    run_dday_refresh,
+    run_kstartup,
+    run_wevity,
+)
+from crawler import SOURCE_ALLFORYOUNG, SOURCE_WEVITY
+
+logging.basicConfig(
+    level=logging.INFO,
+    format="%(asctime)s [%(levelname)s] %(message)s",
+)
+log = logging.getLogger("crawl_scheduler")
+
+for _logger_name in ("httpx", "httpcore", "hpack"):
+    logging.getLogger(_logger_name).setLevel(logging.WARNING)
+
+MAX_RETRY_DELAY = timedelta(minutes=30)
+
+_DURATION_RE = re.compile(r"^\s*(\d+(?:\.\d+)?)\s*([smhd]?)\s*$", re.IGNORECASE)
+_DURATION_UNITS = {"s": 1, "m": 60, "h": 3600, "d": 86400, "": 60}
+
+
+def parse_duration(text: str) -> timedelta:
+    """'90m' / '3h' / '1d' / '45s' / '30'(분) → timedelta."""
+    m = _DURATION_RE.match(text or "")
+    if not m:
+        raise ValueError(f"기간 형식 오류: {text!r} (예: 90m, 3h, 1d)")
+    return timedelta(seconds=float(m.group(1)) * _DURATION_UNITS[m.group(2).lower()])
+
+
+def parse_hhmm(text: str) -> dtime:
+    h, _, mi = (text or "").strip().partition(":")
+    return dtime(int(h), int(mi or 0))
+
+
+@dataclass(frozen=True)
+class Window:
+    """KST 시작 허용 시간대. start > end 이면 자정을 넘기는 구간."""
+
+    start: dtime
+    end: dtime
+
+    @classmethod
+    def parse(cls, text: str) -> "Window":
+        a, sep, b = text.partition("-")
+        if not sep:
+            raise ValueError(f"시간대 형식 오류: {text!r} (예: 01:00-07:00)")
+        return cls(parse_hhmm(a), parse_hhmm(b))
+
+    def contains(self, at: datetime) -> bool:
+        t = at.astimezone(_KST).time()
+        if self.start <= self.end:
+            return self.start <= t < self.end
+        return t >= self.start or t < self.end
+
+    def next_open(self, at: datetime) -> datetime:
+        """at 이후(포함) 처음으로 시간대 안에 드는 시각."""
+        if self.contains(at):
+            return at
+        local = at.astimezone(_KST)
+        opening = local.replace(hour=self.start.hour, minute=self.start.minute, second=0, microsecond=0)
+        if opening <= local:
+            opening += timedelta(days=1)
+        return opening.astimezone(timezone.utc)
+
+
+class JobSkipped(Exception):
+    """작업이 할 일 없이 건너뜀 (설정 없음·이미 수집됨). 성공이 아니므로 crawl_logs 에 남기지 않는다."""
+
+
+@dataclass
+class Job:
+    name: str
+    run: Callable[[], str | None]
+    sites: tuple[str, ...]
+    interval: timedelta | None = None
+    daily_at: dtime | None = None
+    window: Window | None = None
+    crawl_log_name: str | None = None
+    state: dict = field(default_factory=dict)
+
+    def first_due(self, now: datetime, jitter: float) -> datetime:
+        """재시작 직후 예정 시각. 지난 예정은 지금(한 번만 catch-up)."""
+        if self.daily_at is not None:
+            last = _parse_iso(self.state.get("last_success"))
+            slot = _latest_daily_slot(self.daily_at, now)
+            if last is None or last < slot:
+                return now
+            return _next_daily_slot(self.daily_at, now)
+        due = _parse_iso(self.state.get("next_due"))
+        if due is None:
+            return now
+        return min(max(due, now), now + self.interval * (1 + jitter))
+
+    def next_due_after(self, finished: datetime, ok: bool, jitter: float) -> datetime:
+        if not ok:
+            base = self.interval if self.interval is not None else timedelta(days=1)
+            return finished + min(base / 4, MAX_RETRY_DELAY)
+        if self.daily_at is not None:
+            return _next_daily_slot(self.daily_at, finished)
+        factor = 1 + random.uniform(-jitter, jitter) if jitter > 0 else 1
+        return finished + self.interval * factor
+
+
+def _parse_iso(value) -> datetime | None:
+    if not value:
+        return None
+    try:
+        dt = datetime.fromisoformat(str(value))
+    except ValueError:
+        return None
+    return dt if dt.tzinfo else dt.replace(tzinfo=timezone.utc)
+
+
+def _latest_daily_slot(at_time: dtime, now: datetime) -> datetime:
+    local = now.astimezone(_KST)
+    slot = local.replace(hour=at_time.hour, minute=at_time.minute, second=0, microsecond=0)
+    if slot > local:
+        slot -= timedelta(days=1)
+    return slot.astimezone(timezone.utc)
+
+
+def _next_daily_slot(at_time: dtime, now: datetime) -> datetime:
+    return _latest_daily_slot(at_time, now) + timedelta(days=1)
+
+
+class StateFile:
+    """작업별 마지막 실행·다음 예정 (JSON, 원자적 교체 저장)."""
+
+    def __init__(self, path: str | None) -> None:
+        self.path = Path(path) if path else None
+        self._lock = threading.Lock()
+        self.data: dict[str, dict] = {}
+        if self.path and self.path.exists():
+            try:
+                self.data = json.loads(self.path.read_text(encoding="utf-8")).get("jobs", {})
+            except (OSError, ValueError) as e:
+                log.warning("스케줄 상태 파일 읽기 실패 — 새로 시작: %s", e)
+
+    def job(self, name: str) -> dict:
+        return self.data.setdefault(name, {})
+
+    def save(self) -> None:
+        if not self.path:
+            return
+        with self._lock:
+            tmp = self.path.with_suffix(self.path.suffix + ".tmp")
+            tmp.write_text(json.dumps({"jobs": self.data}, ensure_ascii=False, indent=2), encoding="utf-8")
+            os.replace(tmp, self.path)
+
+
+def build_jobs(client, args: argparse.Namespace) -> list[Job]:
+    pb, so, se = args.page_batch_size, args.sleep_batch_odd, args.sleep_batch_even
+    kpb, kso, kse = args.kstartup_page_batch_size, args.kstartup_sleep_batch_odd, args.kstartup_sleep_batch_even
+
+    def new_client():
+        return client
+
+    def wevity() -> str:
+        ins, upd = run_wevity(client, pb, so, se)
+        log_content_size_summary()
+        if not _stop.is_set():
+            notify_contest_cycle_summary(client, ins, upd, 0, 0)
+        return f"신규 {ins}, 갱신 {upd}"
+
+    def allforyoung() -> str:
+        ins, upd = run_allforyoung(client, pb, so, se)
+        log_content_size_summary()
+        if not _stop.is_set():
+            notify_contest_cycle_summary(client, 0, 0, ins, upd)
+        return f"신규 {ins}, 갱신 {upd}"
+
+    def kstartup() -> str:
+        service_key = K_START_UP_SERVICE or ("replay" if replaying() else "")
+        if not service_key:
+            raise JobSkipped("K_START_UP_SERVICE 미설정 — 건너뜀")
+        if kstartup_should_skip_daily_public_api(client):
+            raise JobSkipped("kstartup_crawl_state 가 오늘 갱신됨 — 건너뜀")
+        run_kstartup(client, service_key, kpb, kso, kse)
+        return "완료"
+
+    def dday() -> str:
+        # 오늘 위비티·요즘것들 작업이 목록 전체를 이미 돌았으면 그 출처는 목록을 다시 받지 않는다
+        run_dday_refresh(new_client, (SOURCE_WEVITY, SOURCE_ALLFORYOUNG), pb, so, se)
+        return "완료"
+
+    jobs = [
+        Job("wevity", wevity, ("wevity",), interval=timedelta(hours=8)),
+        Job("allforyoung", allforyoung, ("allforyoung",), interval=timedelta(hours=3)),
+        Job("kstartup", kstartup, ("kstartup",), daily_at=dtime(6, 0), crawl_log_name=JOB_KSTARTUP_CRAWL),
+        Job("dday", dday, ("wevity", "allforyoung"), daily_at=dtime(0, 10), crawl_log_name=JOB_DDAY_REFRESH),
+    ]
+    by_name = {j.name: j for j in jobs}
+    for name, value in args.interval:
+        by_name[name].interval, by_name[name].daily_at = parse_duration(value), None
+    for name, value in args.daily:
+        by_name[name].daily_at, by_name[name].interval = parse_hhmm(value), None
+    for name, value in args.window:
+        by_name[name].window = Window.parse(value)
+    if args.only:
+        jobs = [j for j in jobs if j.name in set(args.only)]
+    return jobs
+
+
+class Scheduler:
+    def __init__(self, client, jobs: list[Job], state: StateFile, jitter: float, run_once: bool = False) -> None:
+        self.client = client
+        self.jobs = jobs
+        self.state = state
+        self.jitter = jitter
+        self.run_once = run_once
+        self._due: dict[str, datetime] = {}
+        self._running: set[str] = set()
+        self._busy_sites: set[str] = set()
+        self._lock = threading.Lock()
+        self._wake = threading.Event()
+        self._done_once: set[str] = set()
+
+    def _set_due(self, job: Job, due: datetime) -> None:
+        if job.window is not None:
+            due = job.window.next_open(due)
+        self._due[job.name] = due
+        job.state["next_due"] = due.isoformat()
+
+    def _daily_already_done(self, job: Job) -> bool:
+        """매일 작업: 다른 실행기(Actions `--single-cycle` 등)가 오늘 성공을 남겼으면 True."""
+        if job.daily_at is None or not job.crawl_log_name:
+            return False
+        return _crawl_log_has_success(self.client, job.crawl_log_name, kstartup_calendar_date_kst())
+
+    def _execute(self, job: Job) -> None:
+        started = datetime.now(timezone.utc)
+        with self._lock:
+            job.state["last_started"] = started.isoformat()
+        log.info("[%s] 시작", job.name)
+        ok = True
+        skipped = False
+        message: str | None = None
+        try:
+            if self._daily_already_done(job):
+                message = "crawl_logs 에 오늘 success 있음 — 건너뜀"
+            else:
+                message = job.run()
+                if job.crawl_log_name and not _stop.is_set():
+                    _crawl_log_upsert(
+                        self.client, job.crawl_log_name, kstartup_calendar_date_kst(), "success", None, started.isoformat()
+                    )
+        except JobSkipped as e:
+            skipped = True
+            message = str(e)
+            log.warning("[%s] %s", job.name, message)
+        except Exception as e:
+            ok = False
+            message = str(e)
+            log.exception("[%s] 실패", job.name)
+            if job.crawl_log_name and not _stop.is_set():
+                try:
+                    _crawl_log_upsert(
+                        self.client, job.crawl_log_name, kstartup_calendar_date_kst(), "fail", message, started.isoformat()
+                    )
+                except Exception as log_err:
+                    log.warning("[%s] crawl_logs 기록 실패: %s", job.name, log_err)
+        finished = datetime.now(timezone.utc)
+        with self._lock:
+            job.state.update(
+                last_finished=finished.isoformat(),
+                last_status="skipped" if skipped else ("ok" if ok else "fail"),
+                last_message=(message or "")[:500],
+            )
+            if ok and not skipped:
+                job.state["last_success"] = finished.isoformat()
+            self._set_due(job, job.next_due_after(finished, ok, self.jitter))
+            self._running.discard(job.name)
+            self._busy_sites.difference_update(job.sites)
+            self._done_once.add(job.name)
+            self.state.save()
+        log.info(
+            "[%s] 종료 (%s, %.0f초) %s — 다음 예정 %s KST",
+            job.name,
+            "건너뜀" if skipped else ("성공" if ok else "실패"),
+            (finished - started).total_seconds(),
+            message or "",
+            self._due[job.name].astimezone(_KST).strftime("%m-%d %H:%M"),
+        )
+        self._wake.set()
+
+    def run(self) -> None:
+        now = datetime.now(timezone.utc)
+        for job in self.jobs:
+            job.state = self.state.job(job.name)
+            self._set_due(job, now if self.run_once else job.first_due(now, self.jitter))
+            log.info(
+                "[%s] %s — 첫 실행 %s KST%s",
+                job.name,
+                f"매일 {job.daily_at:%H:%M} KST" if job.daily_at else f"{job.interval} 주기",
+                self._due[job.name].astimezone(_KST).strftime("%m-%d %H:%M"),
+                f", 시간대 {job.window.start:%H:%M}-{job.window.end:%H:%M}" if job.window else "",
+            )
+        self.state.save()
+        # 종료 시그널(_stop)이 오면 대기 중인 루프도 바로 깨운다
+        threading.Thread(target=lambda: (_stop.wait(), self._wake.set()), daemon=True).start()
+
+        with ThreadPoolExecutor(max_workers=max(1, len(self.jobs)), thread_name_prefix="job") as pool:
+            while not _stop.is_set():
+                now = datetime.now(timezone.utc)
+                with self._lock:
+                    if self.run_once and len(self._done_once) == len(self.jobs) and not self._running:
+                        break
+                    for job in self.jobs:
+                        if job.name in self._running or (self.run_once and job.name in self._done_once):
+                            continue
+                        if self._due[job.name] > now or self._busy_sites.intersection(job.sites):
+                            continue
+                        self._running.add(job.name)
+                        self._busy_sites.update(job.sites)
+                        pool.submit(self._execute, job)
+                    waiting = [
+                        self._due[j.name]
+                        for j in self.jobs
+                        if j.name not in self._running and not (self.run_once and j.name in self._done_once)
+                    ]
+                timeout = max(1.0, (min(waiting) - now).total_seconds()) if waiting else None
+                # 다음 예정 시각 또는 작업 종료(사이트 점유 해제)·종료 시그널까지 한 번에 대기
+                self._wake.wait(timeout)
+                self._wake.clear()
+        log.info("스케줄러 종료 — 진행 중인 작업이 끝나길 기다렸습니다")
+        self.state.save()
+
+
+def _name_value(text: str) -> tuple[str, str]:
+    name, sep, value = text.partition("=")
+    if not sep or name.strip() not in JOB_NAMES:
+        raise argparse.ArgumentTypeError(f"NAME=VALUE 형식, NAME 은 {', '.join(JOB_NAMES)} 중 하나: {text!r}")
+    return name.strip(), value.strip()
+
+
+JOB_NAMES = ("wevity", "allforyoung", "kstartup", "dday")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="출처별 주기로 도는 크롤 스케줄러 (위비티·요즘것들·K-Startup·D-day)")
+    parser.add_argument(
+        "--interval", type=_name_value, action="append", default=[], metavar="NAME=DUR",
+        help="작업 주기 (예: wevity=8h, allforyoung=90m). 매일 작업에 주면 주기 작업으로 바뀜",
+    )
+    parser.add_argument(
+        "--daily", type=_name_value, action="append", default=[], metavar="NAME=HH:MM",
+        help="매일 KST 실행 시각 (예: kstartup=06:00, dday=00:10)",
+    )
+    parser.add_argument(
+        "--window", type=_name_value, action="append", default=[], metavar="NAME=HH:MM-HH:MM",
+        help="KST 시작 허용 시간대 (예: wevity=01:00-07:00, 자정 넘김 가능)",
+    )
+    parser.add_argument("--jitter", type=float, default=0.1, metavar="F", help="주기 작업 무작위 흔들림 비율 (기본 0.1 = ±10%%)")
+    parser.add_argument("--only", action="append", choices=JOB_NAMES, help="이 작업만 (여러 번 지정 가능)")
+    parser.add_argument(
+        "--state", default=".crawl_scheduler_state.json", metavar="FILE",
+        help="마지막 실행·다음 예정 상태 JSON (재시작 시 catch-up 기준). 빈 문자열이면 저장 안 함",
+    )
+    parser.add_argument("--run-once", action="store_true", help="모든 작업을 지금 한 번씩 돌리고 종료 (점검용, 같은 사이트 작업은 차례로)")
+    parser.add_argument("--page-batch-size", type=int, default=1, metavar="N", help="목록 페이지 N개 묶은 뒤 대기 1회")
+    parser.add_argument("--sleep-batch-odd", type=int, default=10, metavar="SEC", help="배치 1·3·5… 처리 후 대기 초")
+    parser.add_argument("--sleep-batch-even", type=int, default=20, metavar="SEC", help="배치 2·4·6… 처리 후 대기 초")
+    parser.add_argument("--kstartup-page-batch-size", type=int, default=5, metavar="N", help="K-Startup 배치 크기")
+    parser.add_argument("--kstartup-sleep-batch-odd", type=int, default=1, metavar="SEC")
+    parser.add_argument("--kstartup-sleep-batch-even", type=int, default=2, metavar="SEC")
+    add_feature_arguments(parser)
+    args = parser.parse_args()
+    if args.page_batch_size < 1 or args.kstartup_page_batch_size < 1:
+        parser.error("--page-batch-size / --kstartup-page-batch-size 는 1 이상이어야 합니다.")
+    if not 0 <= args.jitter < 1:
+        parser.error("--jitter 는 0 이상 1 미만이어야 합니다.")
+    try:
+        for _, v in args.interval:
+            if parse_duration(v) <= timedelta(0):
+                raise ValueError(f"주기는 0보다 커야 합니다: {v}")
+        for _, v in args.daily:
+            parse_hhmm(v)
+        for _, v in args.window:
+            Window.parse(v)
+    except ValueError as e:
+        parser.error(str(e))
+
+    signal.signal(signal.SIGINT, _signal_handler)
+    signal.signal(signal.SIGTERM, _signal_handler)
+
+    client = apply_feature_arguments(parser, args)
+    jobs = build_jobs(client, args)
+    if not jobs:
+        parser.error("실행할 작업이 없습니다 (--only 확인).")
+    Scheduler(client, jobs, StateFile(args.state or None), args.jitter, run_once=args.run_once).run()
+
+
+if __name__ == "__main__":
+    main()
@@ -1,6 +1,7 @@
 """
 로컬 Python 크롤 서버: 요즘것들 공모전 → K-Startup 순으로 수집·upsert 후 반복.
-(위비티 전용 반복은 `crawl_wevity_only_loop.py` — `run_wevity` 등은 이 모듈에 남아 재사용.)
+(위비티 전용 반복은 `crawl_wevity_only_loop.py` — `run_wevity` 등은 이 모듈에 남아 재사용.
+ 출처별 주기로 한 프로세스에서 돌리려면 `crawl_scheduler.py`.)
 
 엣지 함수(`supabase/functions/*`)와 동일한 DB 반영·알림 규칙을 따른다.
 
@@ -20,14 +21,32 @@ DB `crawl_logs`에 오늘(KST) `status=success`가 있으면 해당 작업은 
 실행:  python crawl_server.py
 옵션:  --single-cycle  위 한 사이클만 (Actions 일일 스케줄)
        --force-daily   --single-cycle 과 함께: crawl_logs 당일 성공이 있어도 재실행
-       --dday-refresh  사이클 끝에 요즘것들 목록만 돌며 D-day만 갱신 (refresh-allforyoung-dday 엣지와 유사)
+       --time-budget MINUTES  --single-cycle 시간 예산 — 배치 경계에서 멈추고 crawl_logs partial·체크포인트 (`cycle_budget`)
+       --dday-refresh  사이클 끝에 요즘것들 목록만 돌며 D-day만 갱신 (refresh-allforyoung-dday 엣지와 유사).
+                       본 수집이 오늘 목록 전체를 돌았으면 그 upsert 에 d_day 가 이미 들어 있어 생략한다
+       --dday-only     본 수집 없이 위비티·요즘것들 D-day 갱신만 한 번 (목록 페이지는 출처당 한 번씩만 요청)
        --page-batch-size, --sleep-batch-odd, --sleep-batch-even
+       --trace FILE    대상 사이트 HTTP 요청마다 NDJSON 트레이스 1줄 (`crawl_trace`, 요약: scripts/trace_summary.py)
+       --content-storage  상세 본문을 Storage 에 내용 해시 키로 저장, contests 에는 content_key/content_hash 만 (`content_store`)
+       --search-index  contests·K-Startup 행에 검색 토큰 search_tokens(한국어 2-gram) 채움 → GIN 인덱스 검색 (`search_doc`)
+       --liveness      바뀐 행만 upsert, 사라진 공고는 순회 id 집합 차이로 missing_since 표시 (`contest_liveness`)
+       --dedup         출처 간 중복 공모전 색인(MinHash/LSH) → canonical_group_id, 상대 본문 재사용 (`contest_dedup`)
+       --changes FILE / --changes-table  패스마다 신규·변경·사라진 행 변경 피드 (NDJSON / crawl_changes, `change_feed`)
+       --state-db PATH  실행 간 로컬 상태(SQLite WAL) — 상세 실패 백오프·브레이커·프록시 상태·D-day 반영일 (`crawl_state_store`)
+       --http-retries N  위비티·요즘것들 요청 일시 오류 재시도 (기본 3, 지터 백오프·호스트별 브레이커 — `crawl_retry`)
+       --proxy URL     위비티 요청을 프록시 풀로 (여러 번, 상태 점수·격리·재시험 — `proxy_pool`, --proxy-hosts)
+       --allforyoung-list-workers N  요즘것들 목록 총 건수·최대 size 계획 후 페이지 N장씩 동시 요청 (기본 4, 0=순차)
+       --parse-workers N  HTML 파싱을 워커 프로세스 N개로 (`parse_pool`) — 파싱이 요청·DB 를 막지 않고, 상세는 파싱 중에 다음 상세를 요청
+       --work-queue    DB 작업 큐(임대)로 여러 인스턴스가 한 사이클을 나눠 처리 (`work_queue`, --queue-cycle/--queue-cycle-hours)
+       --record DIR    대상 사이트 응답을 DIR에 기록 / --replay DIR 기록 재생 (`crawl_replay`, --replay-speed 0 = 지연 없음)
 """
 
 from __future__ import annotations
 
 import argparse
 import logging
+import os
+import queue
 import signal
 import threading
 import time
@@ -35,17 +54,36 @@ from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timezone
 from zoneinfo import ZoneInfo
 
-import requests
-
+import change_feed
+import content_store
+import contest_dedup
+import contest_liveness
+import crawl_replay
+import crawl_retry
+import crawl_state_store
+import crawl_trace
+import cycle_budget
+import parse_pool
+import proxy_pool
+import search_doc
+import upsert_batch
+import work_queue
 from config import K_START_UP_SERVICE, get_supabase_admin_client
+from crawl_http import new_session, polite_sleep
 from crawler import (
+    ALLFORYOUNG_LIST_PAGE_SIZE,
+    ALLFORYOUNG_LIST_WORKERS,
+    CONTENT_STATS,
     SOURCE_ALLFORYOUNG,
     SOURCE_WEVITY,
     WEVITY_HEADERS,
-    crawl_post_detail_html,
-    crawl_wevity_detail_html,
     fetch_allforyoung_contest_page,
+    fetch_allforyoung_pages,
     fetch_wevity_list_page,
+    plan_allforyoung_list,
+    request_post_detail_html,
+    request_wevity_detail_html,
+    request_wevity_list_page,
 )
 from kstartup_crawler import (
     SOURCE_KSTARTUP,
@@ -54,6 +92,7 @@ from kstartup_crawler import (
     get_kstartup_num_of_rows,
     probe_last_pages,
 )
+from records import AnnouncementRecord, BusinessRecord, ContestRecord, Record
 
 logging.basicConfig(
     level=logging.INFO,
@@ -69,15 +108,26 @@ ID_CHUNK = 100
 WEVITY_MAX_PAGES = 100
 ALLFORYOUNG_MAX_PAGES = 50
 DDAY_REFRESH_WORKERS = 15
+# D-day 갱신 쓰기 대기 행 상한 — 넘치면 목록 요청이 쓰기를 기다린다 (메모리 고정)
+DDAY_QUEUE_ROWS = 200
+# 재시도 후에도 실패한 목록 페이지가 이만큼 이어지면 그 출처는 이번 사이클을 멈춘다
+MAX_CONSECUTIVE_PAGE_FAILURES = 3
 
 JOB_CONTEST_CRAWL = "contest_crawl"
 JOB_KSTARTUP_CRAWL = "kstartup_crawl"
+JOB_DDAY_REFRESH = "dday_refresh"
 
 _stop = threading.Event()
+# 출처 → 목록 전체를 건너뛴 페이지 없이 돈 본 수집의 시작 날짜(KST). D-day 는 날짜로만 바뀌므로
+# 같은 날 본 수집이 이미 목록 행 전부의 d_day 를 썼다면 D-day 갱신 순회가 목록을 다시 받을 필요가 없다.
+_dday_written_on: dict[str, str] = {}
+# 요즘것들 목록 동시 요청 상한 (`--allforyoung-list-workers`, 0 이면 목록 계획 없이 기본 size 순차 요청)
+_allforyoung_list_workers = ALLFORYOUNG_LIST_WORKERS
 
 
 def _signal_handler(_signum, _frame) -> None:
     _stop.set()
+    crawl_retry.interrupt()
     log.info("종료 시그널 수신 — 현재 단계가 끝나면 루프를 멈춥니다.")
 
 
@@ -129,7 +179,10 @@ def _crawl_log_upsert(
     status: str,
     message: str | None,
     started_iso: str,
+    checkpoint: dict | None = None,
 ) -> None:
+    """status: success · fail · partial(시간 예산으로 멈춤). checkpoint 컬럼은 시간 예산 모드에서만 쓴다
+    (성공이면 비움) — 마이그레이션 전 DB 에서도 기본 실행은 그대로 돈다."""
     finished = iso_now()
     row = {
         "job_name": job_name,
@@ -139,9 +192,41 @@ def _crawl_log_upsert(
         "started_at": started_iso,
         "finished_at": finished,
     }
+    if cycle_budget.active():
+        row["checkpoint"] = checkpoint
     client.table("crawl_logs").upsert(row, on_conflict="job_name,run_date").execute()
 
 
+def _crawl_log_checkpoint(client, job_name: str, run_date: str) -> dict | None:
+    """해당 일(KST) 앞선 실행이 시간 예산으로 멈춰 남긴 체크포인트 (status=partial). 없으면 None."""
+    try:
+        res = (
+            client.table("crawl_logs")
+            .select("status,checkpoint")
+            .eq("job_name", job_name)
+            .eq("run_date", run_date)
+            .limit(1)
+            .execute()
+        )
+    except Exception as e:
+        log.warning("crawl_logs 체크포인트 조회 실패(처음부터 수집): %s", e)
+        return None
+    row = (res.data or [None])[0]
+    if not row or row.get("status") != "partial":
+        return None
+    return row.get("checkpoint")
+
+
+def _crawl_log_finish(client, job_name: str, budget_job: str, run_date: str, started_iso: str) -> None:
+    """작업 정상 종료 기록. 시간 예산으로 멈췄으면 partial + 다음 페이지 체크포인트."""
+    budget = cycle_budget.active()
+    checkpoint = budget.checkpoint(budget_job) if budget else None
+    if checkpoint:
+        _crawl_log_upsert(client, job_name, run_date, "partial", budget.summary(), started_iso, checkpoint)
+    else:
+        _crawl_log_upsert(client, job_name, run_date, "success", None, started_iso)
+
+
 def kstartup_should_skip_daily_public_api(client) -> bool:
     """`kstartup_crawl_state.updated_at`이 오늘(KST)이면 이미 일일 수집된 것으로 보고 True."""
     today_kst = kstartup_calendar_date_kst()
@@ -213,10 +298,15 @@ def chunked(xs: list[str], n: int):
 def fetch_existing_contests(client, source: str, ids: list[str]) -> dict:
     out: dict = {}
     uniq = list(dict.fromkeys(ids))
+    cols = "id, created_at, first_seen_at, content"
+    if contest_liveness.active() or change_feed.active():
+        cols += ", " + ", ".join(LISTING_FIELDS)
+    if content_store.active():
+        cols += ", content_key, content_hash"
     for batch in chunked(uniq, ID_CHUNK):
         res = (
             client.table("contests")
-            .select("id, created_at, first_seen_at, content")
+            .select(cols)
             .eq("source", source)
             .in_("id", batch)
             .execute()
@@ -250,6 +340,266 @@ def _notify_members_all_profiles(client, notification_id: str) -> None:
     client.table("notification_user_state").insert(rows).execute()
 
 
+def log_content_size_summary() -> None:
+    """이번 사이클 상세 HTML 정규화 전후 크기를 남기고 누적값 초기화."""
+    if CONTENT_STATS.documents:
+        log.info(CONTENT_STATS.summary())
+    CONTENT_STATS.reset()
+    store = content_store.active()
+    if store:
+        log.info(store.summary())
+    dedup = contest_dedup.active()
+    if dedup:
+        log.info(dedup.summary())
+    queue = work_queue.active()
+    if queue:
+        log.info(queue.summary())
+    pool = parse_pool.active()
+    if pool:
+        log.info(pool.summary())
+    proxies = proxy_pool.active()
+    if proxies:
+        log.info(proxies.summary())
+    retry = crawl_retry.active()
+    if retry and retry.retried:
+        log.info(retry.summary())
+    state = crawl_state_store.active()
+    if state:
+        state.flush()
+        log.info(state.summary())
+    if upsert_batch.STATS.requests:
+        log.info(upsert_batch.STATS.summary())
+    upsert_batch.STATS.reset()
+    budget = cycle_budget.active()
+    if budget:
+        log.info(budget.summary())
+    _log_change_feed()
+
+
+def _log_change_feed() -> None:
+    """변경 피드를 보내고 이번 패스 건수를 남긴 뒤 초기화."""
+    feed = change_feed.active()
+    if feed:
+        feed.flush()
+        log.info(feed.summary())
+        feed.reset()
+
+
+def _has_content(ex: dict | None) -> bool:
+    return bool(ex) and bool(str(ex.get("content") or "").strip() or ex.get("content_key"))
+
+
+def contest_content_fields(ex: dict | None, fetch_html, shared=None, search_parts=None) -> dict:
+    """contests 행의 본문 필드. 기존 본문(인라인 또는 Storage 키)이 있으면 상세 요청 없이 재사용.
+
+    Storage 모드(`content_store`)에서는 새 본문을 올리고 키·해시만 넣는다. 한 upsert 안의 행들이
+    같은 컬럼을 갖도록 모드가 켜져 있으면 content_key/content_hash 를 항상 포함한다.
+    shared: 본문이 없을 때 호출하는 대체 본문 조회(중복 그룹 상대의 본문 행, `contest_dedup`).
+    search_parts: 제목·주최 등. 주어지면 새 본문을 넣는 행에 `search_tokens`(`search_doc`)를 붙인다
+    (기존 본문 재사용 행은 컬럼을 빼서 그대로 둔다 — `upsert_rows`가 컬럼 구성별로 나눠 보냄).
+    fetch_html 이 None 이면 상세를 받지 않고 빈 본문 필드를 돌려준다.
+    """
+    store = content_store.active()
+    fields = None
+    if not _has_content(ex) and shared is not None:
+        other = shared()
+        # Storage 키만 있는 본문은 Storage 모드에서만 옮길 수 있다 (키 컬럼을 함께 써야 하므로)
+        if other and (store or str(other.get("content") or "").strip()):
+            fields = {"content": other.get("content") or ""}
+            if store:
+                fields["content_key"] = other.get("content_key")
+                fields["content_hash"] = other.get("content_hash")
+            if search_parts is not None and fields["content"]:
+                fields["search_tokens"] = search_doc.search_tokens(*search_parts, html=fields["content"])
+            return fields
+    if _has_content(ex):
+        fields = {"content": ex.get("content") or ""}
+        if store:
+            fields["content_key"] = ex.get("content_key")
+            fields["content_hash"] = ex.get("content_hash")
+        return fields
+    if fetch_html is None:
+        # 작업 큐 모드: 상세는 detail 항목으로 미뤄 두고 빈 본문으로 먼저 쓴다 (`work_queue`)
+        html = ""
+    else:
+        html = fetch_html() or ""
+        polite_sleep(0.3)
+    if not store:
+        fields = {"content": html}
+    else:
+        stored = store.put(html) if html else None
+        if stored is None:
+            fields = {"content": html, "content_key": None, "content_hash": None}
+        else:
+            key, digest = stored
+            fields = {"content": "", "content_key": key, "content_hash": digest}
+    if search_parts is not None:
+        fields["search_tokens"] = search_doc.search_tokens(*search_parts, html=html)
+    return fields
+
+
+def upsert_rows(client, table: str, rows: list[dict | Record], on_conflict: str) -> None:
+    """컬럼 구성이 같은 행끼리 묶어 upsert. PostgREST 일괄 upsert 는 빠진 컬럼을 NULL 로 채우므로
+    일부 행에만 있는 컬럼(예: search_tokens)은 따로 보내야 나머지 행의 기존 값이 지워지지 않는다.
+    요청은 바이트·행 수 기준으로 나눠 보낸다 (`upsert_batch.BatchingWriter`)."""
+    with upsert_batch.BatchingWriter(client, table, on_conflict) as writer:
+        writer.add(rows)
+
+
+LISTING_FIELDS = ("title", "d_day", "host", "url", "category")
+
+
+def _listing_changed(ex: dict | None, r: dict) -> bool:
+    """목록에서 읽은 값이 DB 행과 다르거나 본문이 아직 없으면 True (생존 기록 모드에서 upsert 대상)."""
+    if not ex or not _has_content(ex):
+        return True
+    return any((ex.get(f) or "") != (r.get(f) or "") for f in LISTING_FIELDS)
+
+
+def _budget_allows_batch(
+    budget, job: str, next_page: int, pages: int, pages_left: int, page_size: int | None = None
+) -> bool:
+    """시간 예산(`cycle_budget`)이 다음 배치(목록 pages장)를 허락하면 True. 아니면 job 을 next_page 에서 멈추고 False."""
+    if budget is None or budget.allows(f"{job}.page", pages):
+        return True
+    budget.stop(job, next_page, pages_left, f"{job}.page", page_size)
+    return False
+
+
+def _detail_fetcher(source: str, request_detail_html, contest_id: str):
+    """상세 요청 함수. 로컬 상태 저장소(`crawl_state_store`)가 연속 실패로 쉬게 한 상세면 None — 요청·대기 없이 빈 본문.
+
+    request_detail_html 은 요청·HTTP 오류면 None, 아니면 파싱 결과(`parse_pool.PendingParse`)를 돌려준다.
+    실패로 세는 것은 요청·HTTP 오류뿐이다 — 본문이 비어 추출 결과가 None 인 상세는 정상 응답으로 친다.
+    """
+    if not crawl_state_store.detail_due(source, contest_id):
+        return None
+
+    def fetch():
+        t0 = time.monotonic()
+        pending = request_detail_html(contest_id)
+        html = pending.result() if pending else None
+        crawl_state_store.record_detail(source, contest_id, pending is not None)
+        budget = cycle_budget.active()
+        if budget:
+            budget.observe(f"{source}.detail", time.monotonic() - t0)
+        return html
+
+    return fetch
+
+
+class _DetailLookahead:
+    """상세를 한 건 앞서 요청한다 — 이번 본문이 파싱 워커에서 파싱되는 동안 다음 행 상세를 요청해 둔다
+    (`parse_pool.submit`). `request`는 감싼 request_detail_html 과 같은 값을 돌려준다."""
+
+    def __init__(self, request_detail_html, next_ids: dict[str, str]) -> None:
+        self.request_detail_html = request_detail_html
+        self.next_ids = next_ids
+        self.ahead: tuple[str, object] | None = None
+
+    def request(self, contest_id: str):
+        if self.ahead and self.ahead[0] == contest_id:
+            pending, self.ahead = self.ahead[1], None
+        else:
+            pending = self.request_detail_html(contest_id)
+        next_id = self.next_ids.get(contest_id)
+        if next_id:
+            self.ahead = (next_id, self.request_detail_html(next_id))
+        return pending
+
+
+def write_contest_batch(
+    client,
+    source: str,
+    ordered_rows: list[dict],
+    request_detail_html,
+    defer_details: list[dict] | None = None,
+) -> tuple[int, int]:
+    """목록 한 배치를 contests 에 반영 → (신규, 갱신). 위비티·요즘것들 공통.
+
+    생존 기록 모드(`contest_liveness`)에서는 목록 값이 바뀐 행만 쓰고 `updated_at`도 그 행만 갱신한다.
+    defer_details 리스트를 주면 본문이 없는 행은 상세를 받지 않고 작업 큐 detail 항목
+    (`{key: id, payload: {title, host, category}}`)으로 덧붙인다.
+    시간 예산(`cycle_budget`)이 있으면 상세를 새 공모전 → 마감 임박 → 나머지 순으로 받고, 남은 시간으로
+    상세 한 건을 마칠 수 없으면 빈 본문으로 쓴다 (다음 실행에서 다시 받음).
+    request_detail_html 은 요청만 하고 파싱은 `parse_pool.submit`에 넘기는 상세 함수(`_detail_fetcher`). 파싱 워커가
+    켜져 있으면 본문이 없는 다음 행의 상세를 한 건 앞서 요청한다. 중복 묶기(`contest_dedup`)가 켜져 있으면 다음 행이 상대 본문으로
+    채워질 수 있어 앞서 요청하지 않는다.
+    """
+    ids = [r["id"] for r in ordered_rows]
+    existing_before = fetch_existing_contests(client, source, ids)
+    if contest_liveness.active():
+        ordered_rows = [r for r in ordered_rows if _listing_changed(existing_before.get(r["id"]), r)]
+        if not ordered_rows:
+            return 0, 0
+    budget = cycle_budget.active() if defer_details is None else None
+    if budget:
+        ordered_rows = cycle_budget.by_value(ordered_rows, existing_before)
+    dedup = contest_dedup.active()
+    matches = dedup.assign(source, ordered_rows) if dedup else {}
+    if defer_details is None and not dedup and parse_pool.active():
+        need = [
+            r["id"]
+            for r in ordered_rows
+            if not _has_content(existing_before.get(r["id"])) and crawl_state_store.detail_due(source, r["id"])
+        ]
+        request_detail_html = _DetailLookahead(request_detail_html, dict(zip(need, need[1:]))).request
+    now = iso_now()
+    to_upsert = []
+    filled: set[str] = set()
+    for r in ordered_rows:
+        ex = existing_before.get(r["id"])
+        m = matches.get(r["id"])
+        fetch = None if defer_details is not None else _detail_fetcher(source, request_detail_html, r["id"])
+        if budget and fetch is not None and not _has_content(ex) and not budget.allows(f"{source}.detail"):
+            budget.defer_detail()
+            fetch = None
+        content_fields = contest_content_fields(
+            ex,
+            fetch,
+            shared=(lambda m=m: dedup.shared_content(m)) if dedup else None,
+            search_parts=(r["title"], r.get("host"), r.get("category")) if search_doc.active() else None,
+        )
+        if not _has_content(ex) and _has_content(content_fields):
+            filled.add(r["id"])
+        if defer_details is not None and not _has_content(content_fields):
+            defer_details.append(
+                {"key": r["id"], "payload": {"title": r["title"], "host": r.get("host"), "category": r.get("category")}}
+            )
+        to_upsert.append(
+            ContestRecord(
+                source=source,
+                id=r["id"],
+                title=r["title"],
+                d_day=r["d_day"],
+                host=r["host"],
+                url=r["url"],
+                category=r["category"],
+                created_at=ex.get("created_at") if ex else now,
+                first_seen_at=ex.get("first_seen_at") if ex else now,
+                updated_at=now,
+                **content_fields,
+                **(contest_dedup.row_fields(m) if m else {}),
+            )
+        )
+    upsert_rows(client, "contests", to_upsert, "source,id")
+    if dedup:
+        dedup.record(source, matches)
+    feed = change_feed.active()
+    if feed:
+        for r in ordered_rows:
+            feed.diff(
+                "contests",
+                r["id"],
+                existing_before.get(r["id"]),
+                {f: r.get(f) for f in LISTING_FIELDS},
+                source,
+                ("content",) if r["id"] in filled else (),
+            )
+    inserted = sum(1 for r in ordered_rows if r["id"] not in existing_before)
+    return inserted, len(ordered_rows) - inserted
+
+
 def notify_contest_cycle_summary(
     client,
     wevity_inserted: int,
@@ -300,39 +650,257 @@ def notify_contest_cycle_summary(
         log.warning("공모전 사이클 알림 생성 실패: %s", e)
 
 
+def _fill_deferred_details(client, cycle, request_detail_html, label: str) -> int:
+    """작업 큐의 detail 항목을 나눠 받아 본문을 채운다 → 채운 행 수."""
+    filled = 0
+    while not _stop.is_set():
+        items = cycle.claim("detail", work_queue.DETAIL_CLAIM_BATCH)
+        if not items:
+            break
+        claimed_at = time.monotonic()
+        existing = fetch_existing_contests(client, cycle.source, [i["item_key"] for i in items])
+        for n, item in enumerate(items):
+            if _stop.is_set():
+                # 남은 항목은 임대 만료 후 다른 워커가 가져간다
+                return filled
+            rid = item["item_key"]
+            ex = existing.get(rid)
+            if not ex or _has_content(ex):
+                # 이미 다른 경로(중복 그룹 본문·다음 사이클)로 채워졌거나 행이 지워짐
+                cycle.complete(item)
+                continue
+            fetch = _detail_fetcher(cycle.source, request_detail_html, rid)
+            if fetch is None:
+                cycle.complete(item, result={"skipped": "detail_backoff"})
+                continue
+            payload = item.get("payload") or {}
+            try:
+                fields = contest_content_fields(
+                    ex,
+                    fetch,
+                    search_parts=(payload.get("title"), payload.get("host"), payload.get("category"))
+                    if search_doc.active()
+                    else None,
+                )
+                client.table("contests").update(fields).eq("source", cycle.source).eq("id", rid).execute()
+            except Exception as e:
+                log.warning("%s 상세 %s 채우기 실패: %s", label, rid, e)
+                cycle.complete(item, ok=False, result={"error": str(e)[:500]})
+                continue
+            feed = change_feed.active()
+            if feed and _has_content(fields):
+                feed.record("contests", "update", rid, list(fields), source=cycle.source)
+            cycle.complete(item)
+            filled += 1
+            if time.monotonic() - claimed_at > work_queue.LEASE_SECONDS / 2:
+                cycle.renew(items[n + 1 :])
+                claimed_at = time.monotonic()
+    return filled
+
+
+def run_contest_source_queued(
+    client,
+    source: str,
+    label: str,
+    fetch_list_page,
+    request_detail_html,
+    max_pages: int,
+    page_batch_size: int,
+    sleep_batch_odd: int,
+    sleep_batch_even: int,
+) -> tuple[int, int]:
+    """작업 큐 모드의 위비티·요즘것들 수집 (`work_queue`). 여러 인스턴스가 같은 사이클을 나눠 처리한다.
+
+    목록 구간(list)을 가져가 처리하고 본문이 없는 행은 detail 항목으로 등록 → 목록이 떨어지면 detail 을 채운다.
+    반환값은 사이클 합계 (신규, 갱신) — 사이클을 마무리한 워커만 0 이 아닌 값을 돌려주므로
+    호출 측 `notify_contest_cycle_summary`가 워커 수와 무관하게 1번만 알린다.
+    """
+    cycle = work_queue.active().start(source)
+    change_feed.begin_cycle(source, cycle.cycle_id)
+    cycle.ensure_list_ranges(max_pages, page_batch_size)
+    batch_idx = 0
+    while not _stop.is_set():
+        items = cycle.claim("list")
+        if not items:
+            break
+        item = items[0]
+        p_first, p_last = int(item["payload"]["from"]), int(item["payload"]["to"])
+        batch_idx += 1
+        ordered_rows: list[dict] = []
+        seen_ids: set[str] = set()
+        last_page = p_last
+        try:
+            for page in range(p_first, p_last + 1):
+                if _stop.is_set():
+                    break
+                rows = fetch_list_page(page)
+                if not rows:
+                    log.warning("%s 페이지 %s — 파싱된 목록 0건, 이후 구간 건너뜀", label, page)
+                    last_page = page - 1
+                    cycle.skip_list_after(last_page)
+                    break
+                for r in rows:
+                    if r["id"] not in seen_ids:
+                        seen_ids.add(r["id"])
+                        ordered_rows.append(r)
+            if _stop.is_set():
+                # 보고하지 않은 구간은 임대 만료 후 다른 워커가 다시 처리
+                break
+            details: list[dict] = []
+            inserted, updated = (
+                write_contest_batch(client, source, ordered_rows, request_detail_html, defer_details=details)
+                if ordered_rows
+                else (0, 0)
+            )
+            cycle.enqueue("detail", details)
+        except Exception as e:
+            log.exception("%s 목록 구간 %s~%s 오류: %s", label, p_first, p_last, e)
+            cycle.complete(item, ok=False, result={"error": str(e)[:500]})
+            continue
+        cycle.complete(item, result={"ids": sorted(seen_ids), "inserted": inserted, "updated": updated})
+        if not ordered_rows:
+            continue
+        log.info(
+            "%s 페이지 %s~%s (작업 큐): 목록 %s건 중 contests 테이블 %s건 반영 (신규 %s, 기존 id 갱신 %s), 상세 대기 %s건",
+            label,
+            p_first,
+            last_page,
+            len(ordered_rows),
+            inserted + updated,
+            inserted,
+            updated,
+            len(details),
+        )
+        if not _stop.is_set():
+            sleep_after_batch(batch_idx, sleep_batch_odd, sleep_batch_even, label, p_first, last_page)
+
+    filled = _fill_deferred_details(client, cycle, request_detail_html, label)
+    if filled:
+        log.info("%s 상세 본문 %s건 채움 (작업 큐)", label, filled)
+    if _stop.is_set():
+        return 0, 0
+    liveness = contest_liveness.active()
+    summary = cycle.finish(
+        record_sweep=bool(liveness),
+        min_ratio=liveness.min_ratio if liveness else contest_liveness.MIN_SWEEP_RATIO,
+    )
+    if summary is None:
+        log.info("%s 사이클 %s — 다른 워커가 마무리하거나 남은 목록 구간 있음", label, cycle.cycle_id)
+        return 0, 0
+    log.info(
+        "%s 사이클 %s 마무리: 신규 %s, 갱신 %s, 본 id %s건, 실패 구간 %s건",
+        label,
+        cycle.cycle_id,
+        summary.get("inserted"),
+        summary.get("updated"),
+        summary.get("seen"),
+        summary.get("failed_items"),
+    )
+    sweep = summary.get("sweep")
+    if isinstance(sweep, dict) and sweep.get("skipped"):
+        log.warning("%s 순회 생존 기록 거절 — 본 id %s건 / 목록 행 %s건", label, sweep.get("seen"), sweep.get("live"))
+    change_feed.record_sweep(source, sweep)
+    return int(summary.get("inserted") or 0), int(summary.get("updated") or 0)
+
+
+def _resolve_list_page(page: int, pending) -> tuple[int, list[dict] | Exception]:
+    if isinstance(pending, Exception):
+        return page, pending
+    try:
+        return page, pending.result()
+    except Exception as e:
+        return page, e
+
+
+def _pipelined_list_pages(request_page, pages):
+    """목록 페이지 번호들 → (page, 행 목록 | 예외)를 순서대로.
+
+    request_page 는 요청만 하고 파싱은 `parse_pool.submit`에 넘긴다. 파싱 워커가 켜져 있으면 앞 페이지가
+    파싱되는 동안 다음 페이지를 요청한다 — 소비 쪽이 중간에 멈추면 앞서 보낸 요청 하나는 버려진다.
+    """
+    ahead = parse_pool.active() is not None
+    pending = None
+    for p in pages:
+        if _stop.is_set():
+            break
+        try:
+            req = (p, request_page(p))
+        except Exception as e:
+            req = (p, e)
+        if pending is not None:
+            yield _resolve_list_page(*pending)
+        if ahead:
+            pending = req
+        else:
+            yield _resolve_list_page(*req)
+    if pending is not None:
+        yield _resolve_list_page(*pending)
+
+
 def run_wevity(
     client,
     page_batch_size: int,
     sleep_batch_odd: int,
     sleep_batch_even: int,
 ) -> tuple[int, int]:
-    session = requests.Session()
-    session.headers.update(WEVITY_HEADERS)
-    page = 1
+    session = new_session(WEVITY_HEADERS)
+    change_feed.begin_cycle(SOURCE_WEVITY)
+    if work_queue.active():
+        return run_contest_source_queued(
+            client,
+            SOURCE_WEVITY,
+            "위비티",
+            lambda page: fetch_wevity_list_page(session, page),
+            request_wevity_detail_html,
+            WEVITY_MAX_PAGES,
+            page_batch_size,
+            sleep_batch_odd,
+            sleep_batch_even,
+        )
+    liveness = contest_liveness.active()
+    sweep = liveness.start(SOURCE_WEVITY) if liveness else None
+    started_on = kstartup_calendar_date_kst()
+    budget = cycle_budget.active()
+    page = first_page = budget.resume_page(SOURCE_WEVITY) if budget else 1
     batch_idx = 0
     sum_inserted = sum_updated = 0
+    failed_pages = consecutive_failures = 0
     while page <= WEVITY_MAX_PAGES and not _stop.is_set():
+        if not _budget_allows_batch(budget, SOURCE_WEVITY, page, page_batch_size, WEVITY_MAX_PAGES - page + 1):
+            break
         batch_idx += 1
+        batch_t0 = time.monotonic()
         batch_pages: list[tuple[int, list[dict]]] = []
-        for _ in range(page_batch_size):
-            if page > WEVITY_MAX_PAGES or _stop.is_set():
-                break
-            try:
-                rows = fetch_wevity_list_page(session, page)
-            except Exception as e:
-                log.exception("위비티 목록 페이지 %s 오류: %s", page, e)
-                return sum_inserted, sum_updated
+        ended = aborted = False
+        batch_range = range(page, min(page + page_batch_size, WEVITY_MAX_PAGES + 1))
+        for p, rows in _pipelined_list_pages(lambda page: request_wevity_list_page(session, page), batch_range):
+            if isinstance(rows, Exception):
+                # 요청 재시도·브레이커(`crawl_retry`)를 거친 뒤에도 실패 — 이 페이지만 건너뛴다
+                failed_pages += 1
+                consecutive_failures += 1
+                log.warning("위비티 목록 페이지 %s 오류 (재시도 후), 건너뜀: %s", p, rows)
+                page = p + 1
+                if consecutive_failures >= MAX_CONSECUTIVE_PAGE_FAILURES:
+                    aborted = True
+                    break
+                continue
+            consecutive_failures = 0
             if not rows:
                 log.warning(
                     "위비티 페이지 %s — 파싱된 목록 0건, 여기서 중단 (사이트 구조·차단·응답 확인 필요)",
-                    page,
+                    p,
                 )
+                ended = True
                 break
-            batch_pages.append((page, rows))
-            page += 1
+            batch_pages.append((p, rows))
+            page = p + 1
 
+        if aborted:
+            log.error("위비티 목록 페이지 %s번 연속 실패 — 이번 사이클 위비티 수집 중단", consecutive_failures)
         if not batch_pages:
-            break
+            if ended or aborted:
+                break
+            continue
 
         ordered_rows: list[dict] = []
         seen_ids: set[str] = set()
@@ -344,47 +912,25 @@ def run_wevity(
                 seen_ids.add(rid)
                 ordered_rows.append(r)
 
-        ids = [r["id"] for r in ordered_rows]
-        existing_before = fetch_existing_contests(client, SOURCE_WEVITY, ids)
-        now = iso_now()
-        to_upsert = []
-        for r in ordered_rows:
-            ex = existing_before.get(r["id"])
-            if not ex or not str(ex.get("content") or "").strip():
-                html = crawl_wevity_detail_html(r["id"])
-                content_val = html if html else ""
-                time.sleep(0.3)
-            else:
-                content_val = ex["content"]
-            to_upsert.append(
-                {
-                    "source": SOURCE_WEVITY,
-                    "id": r["id"],
-                    "title": r["title"],
-                    "d_day": r["d_day"],
-                    "host": r["host"],
-                    "url": r["url"],
-                    "category": r["category"],
-                    "content": content_val,
-                    "created_at": ex.get("created_at") if ex else now,
-                    "first_seen_at": ex.get("first_seen_at") if ex else now,
-                    "updated_at": now,
-                }
-            )
-        client.table("contests").upsert(to_upsert, on_conflict="source,id").execute()
-        inserted = sum(1 for r in ordered_rows if r["id"] not in existing_before)
-        updated = len(ordered_rows) - inserted
+        if sweep:
+            sweep.add(r["id"] for r in ordered_rows)
+        inserted, updated = write_contest_batch(client, SOURCE_WEVITY, ordered_rows, request_wevity_detail_html)
+        if budget:
+            budget.observe(f"{SOURCE_WEVITY}.page", time.monotonic() - batch_t0, len(batch_pages))
         sum_inserted += inserted
         sum_updated += updated
         p_first, p_last = batch_pages[0][0], batch_pages[-1][0]
         log.info(
-            "위비티 페이지 %s~%s: contests 테이블 %s건 반영 (신규 %s, 기존 id 갱신 %s)",
+            "위비티 페이지 %s~%s: 목록 %s건 중 contests 테이블 %s건 반영 (신규 %s, 기존 id 갱신 %s)",
             p_first,
             p_last,
             len(ordered_rows),
+            inserted + updated,
             inserted,
             updated,
         )
+        if ended or aborted:
+            break
         if not _stop.is_set():
             sleep_after_batch(
                 batch_idx,
@@ -394,17 +940,44 @@ def run_wevity(
                 p_first,
                 p_last,
             )
+    # 건너뛴 페이지가 있거나 중단 요청·시간 예산으로 멈췄거나 중간부터 이어 받았으면 기록하지 않는다 (일부만 본 집합)
+    if not _stop.is_set() and not failed_pages and first_page == 1 and not (budget and SOURCE_WEVITY in budget.stopped):
+        _mark_dday_written(SOURCE_WEVITY, started_on)
+        if sweep:
+            sweep.complete()
     return sum_inserted, sum_updated
 
 
+def _prefetch_allforyoung_window(
+    session, budget, prefetched: dict, page: int, page_batch_size: int, max_pages: int, page_size: int
+) -> dict[int, list[dict] | Exception]:
+    """계획된 요즘것들 목록에서 이번 배치에 없는 페이지를 동시 요청 한 창(window)으로 받는다.
+
+    창은 배치 페이지와 `_allforyoung_list_workers` 중 큰 쪽이라 `--page-batch-size 1`(기본)에서도 워커 수만큼
+    함께 받고, 남는 페이지는 다음 배치가 쓴다. 시간 예산이 있으면 예산이 허락하는 페이지 수까지만 넓힌다 —
+    멈춘 뒤의 페이지는 최대 창 하나만큼만 받아 둔다.
+    """
+    batch = range(page, min(page + page_batch_size, max_pages + 1))
+    missing = [p for p in batch if p not in prefetched]
+    if not missing:
+        return {}
+    start = missing[0]
+    n = max(page_batch_size, _allforyoung_list_workers)
+    if budget:
+        kind = f"{SOURCE_ALLFORYOUNG}.page"
+        while n > page_batch_size and not budget.allows(kind, n):
+            n -= 1
+    window = [p for p in range(start, min(start + n, max_pages + 1)) if p not in prefetched]
+    return fetch_allforyoung_pages(session, window, page_size, _allforyoung_list_workers)
+
+
 def run_allforyoung(
     client,
     page_batch_size: int,
     sleep_batch_odd: int,
     sleep_batch_even: int,
 ) -> tuple[int, int]:
-    session = requests.Session()
-    session.headers.update(
+    session = new_session(
         {
             "User-Agent": (
                 "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 "
@@ -415,31 +988,82 @@ def run_allforyoung(
             "Accept-Encoding": "gzip, deflate",
         }
     )
-    page = 1
+    change_feed.begin_cycle(SOURCE_ALLFORYOUNG)
+    if work_queue.active():
+        return run_contest_source_queued(
+            client,
+            SOURCE_ALLFORYOUNG,
+            "요즘것들",
+            lambda page: fetch_allforyoung_contest_page(session, page),
+            request_post_detail_html,
+            ALLFORYOUNG_MAX_PAGES,
+            page_batch_size,
+            sleep_batch_odd,
+            sleep_batch_even,
+        )
+    liveness = contest_liveness.active()
+    sweep = liveness.start(SOURCE_ALLFORYOUNG) if liveness else None
+    started_on = kstartup_calendar_date_kst()
+    budget = cycle_budget.active()
+    # 목록 계획: 총 건수·최대 size 를 알면 워커 수만큼 페이지를 묶어 동시 요청, 모르면 기본 size 로 빈 페이지까지 순차
+    plan = None
+    if _allforyoung_list_workers > 0:
+        plan = plan_allforyoung_list(session, ALLFORYOUNG_MAX_PAGES * ALLFORYOUNG_LIST_PAGE_SIZE)
+    page_size = plan["size"] if plan else ALLFORYOUNG_LIST_PAGE_SIZE
+    max_pages = plan["pages"] if plan else ALLFORYOUNG_MAX_PAGES
+    page = first_page = budget.resume_page(SOURCE_ALLFORYOUNG, page_size) if budget else 1
+    prefetched: dict[int, list[dict] | Exception] = {1: plan["first_rows"]} if plan and page == 1 else {}
     batch_idx = 0
     sum_inserted = sum_updated = 0
-    while page <= ALLFORYOUNG_MAX_PAGES and not _stop.is_set():
+    failed_pages = consecutive_failures = 0
+    while page <= max_pages and not _stop.is_set():
+        if not _budget_allows_batch(
+            budget, SOURCE_ALLFORYOUNG, page, page_batch_size, max_pages - page + 1, page_size
+        ):
+            break
         batch_idx += 1
+        batch_t0 = time.monotonic()
         batch_pages: list[tuple[int, list[dict]]] = []
+        ended = aborted = False
+        if plan:
+            prefetched.update(_prefetch_allforyoung_window(session, budget, prefetched, page, page_batch_size, max_pages, page_size))
         for _ in range(page_batch_size):
-            if page > ALLFORYOUNG_MAX_PAGES or _stop.is_set():
+            if page > max_pages or _stop.is_set():
                 break
             try:
-                rows = fetch_allforyoung_contest_page(session, page)
+                if plan:
+                    rows = prefetched.pop(page)
+                    if isinstance(rows, Exception):
+                        raise rows
+                else:
+                    rows = fetch_allforyoung_contest_page(session, page)
             except Exception as e:
-                log.exception("요즘것들 목록 페이지 %s 오류: %s", page, e)
-                return sum_inserted, sum_updated
+                # 요청 재시도·브레이커(`crawl_retry`)를 거친 뒤에도 실패 — 이 페이지만 건너뛴다
+                failed_pages += 1
+                consecutive_failures += 1
+                log.warning("요즘것들 목록 페이지 %s 오류 (재시도 후), 건너뜀: %s", page, e)
+                page += 1
+                if consecutive_failures >= MAX_CONSECUTIVE_PAGE_FAILURES:
+                    aborted = True
+                    break
+                continue
+            consecutive_failures = 0
             if not rows:
                 log.warning(
                     "요즘것들 페이지 %s — 파싱된 목록 0건, 여기서 중단 (사이트 구조·차단·응답 확인 필요)",
                     page,
                 )
+                ended = True
                 break
             batch_pages.append((page, rows))
             page += 1
 
+        if aborted:
+            log.error("요즘것들 목록 페이지 %s번 연속 실패 — 이번 사이클 요즘것들 수집 중단", consecutive_failures)
         if not batch_pages:
-            break
+            if ended or aborted:
+                break
+            continue
 
         ordered_rows: list[dict] = []
         seen_ids: set[str] = set()
@@ -451,47 +1075,25 @@ def run_allforyoung(
                 seen_ids.add(rid)
                 ordered_rows.append(r)
 
-        ids = [r["id"] for r in ordered_rows]
-        existing_before = fetch_existing_contests(client, SOURCE_ALLFORYOUNG, ids)
-        now = iso_now()
-        to_upsert = []
-        for r in ordered_rows:
-            ex = existing_before.get(r["id"])
-            if not ex or not str(ex.get("content") or "").strip():
-                html = crawl_post_detail_html(r["id"])
-                content_val = html if html else ""
-                time.sleep(0.3)
-            else:
-                content_val = ex["content"]
-            to_upsert.append(
-                {
-                    "source": SOURCE_ALLFORYOUNG,
-                    "id": r["id"],
-                    "title": r["title"],
-                    "d_day": r["d_day"],
-                    "host": r["host"],
-                    "url": r["url"],
-                    "category": r["category"],
-                    "content": content_val,
-                    "created_at": ex.get("created_at") if ex else now,
-                    "first_seen_at": ex.get("first_seen_at") if ex else now,
-                    "updated_at": now,
-                }
-            )
-        client.table("contests").upsert(to_upsert, on_conflict="source,id").execute()
-        inserted = sum(1 for r in ordered_rows if r["id"] not in existing_before)
-        updated = len(ordered_rows) - inserted
+        if sweep:
+            sweep.add(r["id"] for r in ordered_rows)
+        inserted, updated = write_contest_batch(client, SOURCE_ALLFORYOUNG, ordered_rows, request_post_detail_html)
+        if budget:
+            budget.observe(f"{SOURCE_ALLFORYOUNG}.page", time.monotonic() - batch_t0, len(batch_pages))
         sum_inserted += inserted
         sum_updated += updated
         p_first, p_last = batch_pages[0][0], batch_pages[-1][0]
         log.info(
-            "요즘것들 페이지 %s~%s: contests 테이블 %s건 반영 (신규 %s, 기존 id 갱신 %s)",
+            "요즘것들 페이지 %s~%s: 목록 %s건 중 contests 테이블 %s건 반영 (신규 %s, 기존 id 갱신 %s)",
             p_first,
             p_last,
             len(ordered_rows),
+            inserted + updated,
             inserted,
             updated,
         )
+        if ended or aborted:
+            break
         if not _stop.is_set():
             sleep_after_batch(
                 batch_idx,
@@ -501,6 +1103,11 @@ def run_allforyoung(
                 p_first,
                 p_last,
             )
+    # 건너뛴 페이지가 있거나 중단 요청·시간 예산으로 멈췄거나 중간부터 이어 받았으면 기록하지 않는다 (일부만 본 집합)
+    if not _stop.is_set() and not failed_pages and first_page == 1 and not (budget and SOURCE_ALLFORYOUNG in budget.stopped):
+        _mark_dday_written(SOURCE_ALLFORYOUNG, started_on)
+        if sweep:
+            sweep.complete()
     return sum_inserted, sum_updated
 
 
@@ -514,6 +1121,40 @@ def _fetch_existing_ids(client, table: str, id_col: str, ids: list[str]) -> set[
     return found
 
 
+def _fetch_existing_rows(client, table: str, id_col: str, ids: list[str], columns: tuple[str, ...]) -> dict[str, dict]:
+    """변경 피드(`change_feed`)용: 기존 행의 비교 컬럼까지 읽는다 → {id: 행}."""
+    found: dict[str, dict] = {}
+    for batch in chunked(list(dict.fromkeys(ids)), ID_CHUNK):
+        res = client.table(table).select(", ".join(columns)).in_(id_col, batch).execute()
+        for row in res.data or []:
+            found[str(row[id_col])] = row
+    return found
+
+
+def _kstartup_existing(client, table: str, id_col: str, ids: list[str], columns: tuple[str, ...]) -> tuple[set[str], dict]:
+    """K-Startup 기존 id 집합과 (변경 피드가 켜져 있으면) 비교용 기존 행."""
+    if not change_feed.active():
+        return _fetch_existing_ids(client, table, id_col, ids), {}
+    rows = _fetch_existing_rows(client, table, id_col, ids, columns)
+    return set(rows), rows
+
+
+# 변경 피드에서 비교하는 K-Startup 컬럼 (갱신 시각·검색 토큰은 매번 다시 쓰므로 제외)
+BUSINESS_FEED_COLUMNS = tuple(c for c in BusinessRecord.COLUMNS if c not in ("updated_at", "search_tokens"))
+ANNOUNCEMENT_FEED_COLUMNS = tuple(c for c in AnnouncementRecord.COLUMNS if c not in ("updated_at", "search_tokens"))
+# search_tokens 에 넣는 K-Startup 컬럼 (제목 → 본문 순, 토큰 수 상한이 있으므로 앞쪽 우선)
+BUSINESS_SEARCH_COLUMNS = ("supt_biz_titl_nm", "supt_biz_intrd_info", "biz_supt_trgt_info", "biz_supt_ctnt")
+ANNOUNCEMENT_SEARCH_COLUMNS = (
+    "biz_pbanc_nm",
+    "intg_pbanc_biz_nm",
+    "pbanc_ntrp_nm",
+    "supt_biz_clsfc",
+    "supt_regin",
+    "pbanc_ctnt",
+    "aply_trgt_ctnt",
+)
+
+
 def run_kstartup(
     client,
     service_key: str,
@@ -521,6 +1162,7 @@ def run_kstartup(
     sleep_batch_odd: int,
     sleep_batch_even: int,
 ) -> None:
+    change_feed.begin_cycle("kstartup")
     rows_per_page = get_kstartup_num_of_rows()
     biz_last, ann_last = probe_last_pages(service_key)
     biz_range = f"1~{biz_last}" if biz_last else "범위 조회 실패(스킵)"
@@ -538,10 +1180,16 @@ def run_kstartup(
     biz_new_total = ann_new_total = 0
     biz_upd_total = ann_upd_total = 0
 
-    p = 1
+    budget = cycle_budget.active()
+    p = budget.resume_page(JOB_KSTARTUP_CRAWL) if budget else 1
     batch_idx = 0
+    stopped = False
     while p <= max_p and not _stop.is_set():
+        if not _budget_allows_batch(budget, JOB_KSTARTUP_CRAWL, p, min(page_batch_size, max_p - p + 1), max_p - p + 1):
+            stopped = True
+            break
         batch_idx += 1
+        batch_t0 = time.monotonic()
         pages_in_batch: list[int] = []
         for _ in range(page_batch_size):
             if p > max_p or _stop.is_set():
@@ -555,6 +1203,10 @@ def run_kstartup(
 
         batch_biz_rows = batch_ann_rows = 0
         batch_biz_new = batch_biz_upd = batch_ann_new = batch_ann_upd = 0
+        # 페이지마다 작은 upsert 를 보내지 않고 배치 안 페이지를 모아 크기 기준으로 보낸다
+        biz_writer = upsert_batch.BatchingWriter(client, "startup_business", "id")
+        ann_writer = upsert_batch.BatchingWriter(client, "startup_announcement", "pbanc_sn")
+        batch_changes: list[tuple] = []
 
         for pg in pages_in_batch:
             if _stop.is_set():
@@ -580,14 +1232,20 @@ def run_kstartup(
                     log.exception("K-Startup 공고 page %s: %s", pg, e)
 
             if biz_rows:
-                ids = [r["id"] for r in biz_rows]
-                existed = _fetch_existing_ids(client, "startup_business", "id", ids)
+                ids = [r.id for r in biz_rows]
+                existed, biz_before = _kstartup_existing(client, "startup_business", "id", ids, BUSINESS_FEED_COLUMNS)
                 biz_new_pg = sum(1 for i in ids if i not in existed)
                 biz_upd_pg = len(biz_rows) - biz_new_pg
                 ts = iso_now()
                 for r in biz_rows:
-                    r["updated_at"] = ts
-                client.table("startup_business").upsert(biz_rows, on_conflict="id").execute()
+                    r.updated_at = ts
+                    if search_doc.active():
+                        r.search_tokens = search_doc.search_tokens(*(getattr(r, c) for c in BUSINESS_SEARCH_COLUMNS))
+                biz_writer.add(biz_rows)
+                if change_feed.active():
+                    batch_changes.extend(
+                        ("startup_business", r.id, biz_before.get(r.id), r, BUSINESS_FEED_COLUMNS) for r in biz_rows
+                    )
                 biz_new_total += biz_new_pg
                 biz_upd_total += biz_upd_pg
                 batch_biz_rows += len(biz_rows)
@@ -595,19 +1253,37 @@ def run_kstartup(
                 batch_biz_upd += biz_upd_pg
 
             if ann_rows:
-                sns = [r["pbanc_sn"] for r in ann_rows]
-                existed = _fetch_existing_ids(client, "startup_announcement", "pbanc_sn", sns)
+                sns = [r.pbanc_sn for r in ann_rows]
+                existed, ann_before = _kstartup_existing(
+                    client, "startup_announcement", "pbanc_sn", sns, ANNOUNCEMENT_FEED_COLUMNS
+                )
                 ann_new_pg = sum(1 for s in sns if s not in existed)
                 ann_upd_pg = len(ann_rows) - ann_new_pg
                 ts_ann = iso_now()
                 for r in ann_rows:
-                    r["updated_at"] = ts_ann
-                client.table("startup_announcement").upsert(ann_rows, on_conflict="pbanc_sn").execute()
+                    r.updated_at = ts_ann
+                    if search_doc.active():
+                        r.search_tokens = search_doc.search_tokens(*(getattr(r, c) for c in ANNOUNCEMENT_SEARCH_COLUMNS))
+                ann_writer.add(ann_rows)
+                if change_feed.active():
+                    batch_changes.extend(
+                        ("startup_announcement", r.pbanc_sn, ann_before.get(r.pbanc_sn), r, ANNOUNCEMENT_FEED_COLUMNS)
+                        for r in ann_rows
+                    )
                 ann_new_total += ann_new_pg
                 ann_upd_total += ann_upd_pg
                 batch_ann_rows += len(ann_rows)
                 batch_ann_new += ann_new_pg
                 batch_ann_upd += ann_upd_pg
+        biz_writer.flush()
+        ann_writer.flush()
+        feed = change_feed.active()
+        if feed:
+            # 배치의 upsert 가 모두 끝난 뒤에 싣는다 (실패로 예외가 나면 이 배치 변경은 남기지 않음)
+            for table, key, before, r, cols in batch_changes:
+                feed.diff(table, key, before, {c: getattr(r, c) for c in cols})
+        if budget:
+            budget.observe(f"{JOB_KSTARTUP_CRAWL}.page", time.monotonic() - batch_t0, len(pages_in_batch))
 
         biz_part = (
             f"통합지원 {batch_biz_rows}건 upsert (신규 {batch_biz_new}, 기존행 갱신 {batch_biz_upd})"
@@ -642,15 +1318,18 @@ def run_kstartup(
                 p_last,
             )
 
-    client.table("kstartup_crawl_state").upsert(
-        {
-            "id": 1,
-            "business_next_page": 1,
-            "announcement_next_page": 1,
-            "updated_at": iso_now(),
-        },
-        on_conflict="id",
-    ).execute()
+    # 시간 예산으로 멈췄으면 멈춘 페이지는 crawl_logs 체크포인트로 남긴다 — kstartup_crawl_state 를 오늘로 쓰면
+    # 같은 날 이어 받지 못한다. 이미 쓴 배치의 합계·변경 피드·알림은 아래에서 그대로 보낸다 (이어 받는 실행은 남은 페이지만 셈)
+    if not stopped:
+        client.table("kstartup_crawl_state").upsert(
+            {
+                "id": 1,
+                "business_next_page": 1,
+                "announcement_next_page": 1,
+                "updated_at": iso_now(),
+            },
+            on_conflict="id",
+        ).execute()
 
     log.info(
         "K-Startup 이번 구간 합계: 통합지원 신규 %s·갱신 %s (총 %s건), 공고 신규 %s·갱신 %s (총 %s건)",
@@ -661,6 +1340,7 @@ def run_kstartup(
         ann_upd_total,
         ann_new_total + ann_upd_total,
     )
+    _log_change_feed()
 
     total_new = biz_new_total + ann_new_total
     total_upsert = biz_new_total + biz_upd_total + ann_new_total + ann_upd_total
@@ -704,24 +1384,118 @@ def run_kstartup(
         log.warning("K-Startup 알림 생성 실패: %s", e)
 
 
+class DdayRefreshStream:
+    """D-day 갱신 쓰기 단계. 목록 페이지를 받는 대로 행을 `put` 하면 워커 스레드가 바로 DB 에 쓴다.
+
+    큐는 `DDAY_QUEUE_ROWS`행까지만 담고 넘치면 `put`이 기다리므로, 메모리는 목록 길이와 무관하고
+    목록 요청과 DB 쓰기가 겹쳐 전체 시간이 대략 max(요청, 쓰기)가 된다.
+    """
+
+    _DONE = object()
+
+    def __init__(self, client_factory, source: str, workers: int = DDAY_REFRESH_WORKERS) -> None:
+        self.source = source
+        self.workers = max(1, workers)
+        self.now = iso_now()
+        self.written = 0
+        self.failed = 0
+        self._lock = threading.Lock()
+        self._q: queue.Queue = queue.Queue(maxsize=DDAY_QUEUE_ROWS)
+        self._ex = ThreadPoolExecutor(max_workers=self.workers)
+        # 클라이언트는 여기서 만든다 — 워커 안에서 실패하면 put 이 비지 않는 큐에서 멈춘다
+        clients = [client_factory() for _ in range(self.workers)]
+        self._futures = [self._ex.submit(self._worker, c) for c in clients]
+
+    def _worker(self, c) -> None:
+        while True:
+            r = self._q.get()
+            if r is self._DONE:
+                return
+            try:
+                c.table("contests").update({"d_day": r["d_day"], "updated_at": self.now}).eq("source", self.source).eq(
+                    "id", r["id"]
+                ).execute()
+            except Exception as e:
+                log.warning("%s D-day 갱신 실패 (id=%s): %s", self.source, r.get("id"), e)
+                with self._lock:
+                    self.failed += 1
+            else:
+                with self._lock:
+                    self.written += 1
+
+    def put(self, row: dict) -> None:
+        self._q.put(row)
+
+    def close(self) -> None:
+        for _ in self._futures:
+            self._q.put(self._DONE)
+        for f in self._futures:
+            f.result()
+        self._ex.shutdown()
+
+    def __enter__(self) -> "DdayRefreshStream":
+        return self
+
+    def __exit__(self, *_exc) -> None:
+        self.close()
+
+
 def _refresh_dday_pool(client_factory, source: str, all_rows: list[dict]) -> None:
+    """이미 모은 행 목록의 D-day 갱신 (`DdayRefreshStream`에 그대로 흘려 보냄)."""
     if not all_rows:
         return
-    n = DDAY_REFRESH_WORKERS
-    chunks = [all_rows[i::n] for i in range(n)]
-    now = iso_now()
+    with DdayRefreshStream(client_factory, source) as stream:
+        for r in all_rows:
+            stream.put(r)
 
-    def worker(chunk: list[dict]) -> None:
-        if not chunk:
-            return
-        c = client_factory()
-        for r in chunk:
-            c.table("contests").update({"d_day": r["d_day"], "updated_at": now}).eq("source", source).eq(
-                "id", r["id"]
-            ).execute()
 
-    with ThreadPoolExecutor(max_workers=n) as ex:
-        list(ex.map(worker, chunks))
+def _run_dday_refresh(
+    client_factory,
+    source: str,
+    label: str,
+    session,
+    fetch_page,
+    max_pages: int,
+    page_batch_size: int,
+    sleep_batch_odd: int,
+    sleep_batch_even: int,
+) -> None:
+    """목록 페이지를 받는 대로 `DdayRefreshStream`에 넘긴다 (페이지를 모아 두지 않음)."""
+    listed = 0
+    page = 1
+    batch_idx = 0
+    with DdayRefreshStream(client_factory, source) as stream:
+        while page <= max_pages and not _stop.is_set():
+            batch_idx += 1
+            batch_first = page
+            got_any = False
+            for _ in range(page_batch_size):
+                if page > max_pages or _stop.is_set():
+                    break
+                try:
+                    rows = fetch_page(session, page)
+                except Exception as e:
+                    log.exception("%s 목록 %s: %s", label, page, e)
+                    page = max_pages + 1
+                    break
+                if not rows:
+                    page = max_pages + 1
+                    break
+                for r in rows:
+                    stream.put(r)
+                listed += len(rows)
+                got_any = True
+                page += 1
+            if got_any and not _stop.is_set():
+                sleep_after_batch(
+                    batch_idx,
+                    sleep_batch_odd,
+                    sleep_batch_even,
+                    label,
+                    batch_first,
+                    page - 1,
+                )
+    log.info("%s 갱신: 목록 %s건 중 %s건 업데이트 (실패 %s건)", label, listed, stream.written, stream.failed)
 
 
 def run_refresh_wevity_dday(
@@ -730,41 +1504,18 @@ def run_refresh_wevity_dday(
     sleep_batch_odd: int,
     sleep_batch_even: int,
 ) -> None:
-    session = requests.Session()
-    session.headers.update(WEVITY_HEADERS)
-    all_rows: list[dict] = []
-    page = 1
-    batch_idx = 0
-    while page <= WEVITY_MAX_PAGES and not _stop.is_set():
-        batch_idx += 1
-        batch_first = page
-        got_any = False
-        for _ in range(page_batch_size):
-            if page > WEVITY_MAX_PAGES or _stop.is_set():
-                break
-            try:
-                rows = fetch_wevity_list_page(session, page)
-            except Exception as e:
-                log.exception("위비티 D-day 목록 %s: %s", page, e)
-                page = WEVITY_MAX_PAGES + 1
-                break
-            if not rows:
-                page = WEVITY_MAX_PAGES + 1
-                break
-            all_rows.extend(rows)
-            got_any = True
-            page += 1
-        if got_any and not _stop.is_set():
-            sleep_after_batch(
-                batch_idx,
-                sleep_batch_odd,
-                sleep_batch_even,
-                "위비티 D-day",
-                batch_first,
-                page - 1,
-            )
-    log.info("위비티 D-day 갱신: 목록 %s건 병렬 업데이트", len(all_rows))
-    _refresh_dday_pool(client_factory, SOURCE_WEVITY, all_rows)
+    session = new_session(WEVITY_HEADERS)
+    _run_dday_refresh(
+        client_factory,
+        SOURCE_WEVITY,
+        "위비티 D-day",
+        session,
+        fetch_wevity_list_page,
+        WEVITY_MAX_PAGES,
+        page_batch_size,
+        sleep_batch_odd,
+        sleep_batch_even,
+    )
 
 
 def run_refresh_allforyoung_dday(
@@ -773,8 +1524,7 @@ def run_refresh_allforyoung_dday(
     sleep_batch_odd: int,
     sleep_batch_even: int,
 ) -> None:
-    session = requests.Session()
-    session.headers.update(
+    session = new_session(
         {
             "User-Agent": (
                 "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 "
@@ -785,39 +1535,75 @@ def run_refresh_allforyoung_dday(
             "Accept-Encoding": "gzip, deflate",
         }
     )
-    all_rows: list[dict] = []
-    page = 1
-    batch_idx = 0
-    while page <= ALLFORYOUNG_MAX_PAGES and not _stop.is_set():
-        batch_idx += 1
-        batch_first = page
-        got_any = False
-        for _ in range(page_batch_size):
-            if page > ALLFORYOUNG_MAX_PAGES or _stop.is_set():
-                break
-            try:
-                rows = fetch_allforyoung_contest_page(session, page)
-            except Exception as e:
-                log.exception("요즘것들 D-day 목록 %s: %s", page, e)
-                page = ALLFORYOUNG_MAX_PAGES + 1
-                break
-            if not rows:
-                page = ALLFORYOUNG_MAX_PAGES + 1
-                break
-            all_rows.extend(rows)
-            got_any = True
-            page += 1
-        if got_any and not _stop.is_set():
-            sleep_after_batch(
-                batch_idx,
-                sleep_batch_odd,
-                sleep_batch_even,
-                "요즘것들 D-day",
-                batch_first,
-                page - 1,
-            )
-    log.info("요즘것들 D-day 갱신: 목록 %s건 병렬 업데이트", len(all_rows))
-    _refresh_dday_pool(client_factory, SOURCE_ALLFORYOUNG, all_rows)
+    _run_dday_refresh(
+        client_factory,
+        SOURCE_ALLFORYOUNG,
+        "요즘것들 D-day",
+        session,
+        fetch_allforyoung_contest_page,
+        ALLFORYOUNG_MAX_PAGES,
+        page_batch_size,
+        sleep_batch_odd,
+        sleep_batch_even,
+    )
+
+
+def _mark_dday_written(source: str, day: str) -> None:
+    _dday_written_on[source] = day
+    store = crawl_state_store.active()
+    if store:
+        store.put(crawl_state_store.NS_DDAY, source, day)
+
+
+def dday_current(source: str) -> bool:
+    """오늘(KST) 시작한 본 수집이 이 출처 목록 전체의 d_day 를 이미 반영했으면 True (재시작 전 기록은 로컬 상태 저장소)."""
+    day = _dday_written_on.get(source)
+    store = crawl_state_store.active()
+    if day is None and store:
+        day = store.get(crawl_state_store.NS_DDAY, source)
+    return day == kstartup_calendar_date_kst()
+
+
+def run_dday_refresh(
+    client_factory,
+    sources: tuple[str, ...],
+    page_batch_size: int,
+    sleep_batch_odd: int,
+    sleep_batch_even: int,
+) -> None:
+    """D-day 갱신 순회. 오늘 본 수집이 이미 목록 전체를 돈 출처는 목록을 다시 받지 않고 건너뛴다."""
+    runners = {SOURCE_WEVITY: run_refresh_wevity_dday, SOURCE_ALLFORYOUNG: run_refresh_allforyoung_dday}
+    for source in sources:
+        if _stop.is_set():
+            return
+        if dday_current(source):
+            log.info("%s D-day — 오늘 본 수집 목록에서 이미 갱신됨, 목록 재요청 생략", source)
+            continue
+        runners[source](client_factory, page_batch_size, sleep_batch_odd, sleep_batch_even)
+
+
+def run_dday_only(client, client_factory, args: argparse.Namespace) -> None:
+    """`--dday-only`: 본 수집 없이 위비티·요즘것들 목록을 한 번씩만 돌며 D-day 갱신 (crawl_logs `dday_refresh`)."""
+    today_kst = kstartup_calendar_date_kst()
+    if not args.force_daily and _crawl_log_has_success(client, JOB_DDAY_REFRESH, today_kst):
+        log.info("dday_refresh — crawl_logs 에 오늘(KST %s) success 있음 — 스킵", today_kst)
+        return
+    started = iso_now()
+    try:
+        run_dday_refresh(
+            client_factory,
+            (SOURCE_WEVITY, SOURCE_ALLFORYOUNG),
+            args.page_batch_size,
+            args.sleep_batch_odd,
+            args.sleep_batch_even,
+        )
+        if not _stop.is_set():
+            _crawl_log_upsert(client, JOB_DDAY_REFRESH, today_kst, "success", None, started)
+    except Exception as e:
+        log.exception("D-day 갱신 중 오류")
+        if not _stop.is_set():
+            _crawl_log_upsert(client, JOB_DDAY_REFRESH, today_kst, "fail", str(e), started)
+        raise
 
 
 def run_one_cycle(client, new_client, args: argparse.Namespace) -> None:
@@ -829,10 +1615,12 @@ def run_one_cycle(client, new_client, args: argparse.Namespace) -> None:
     sk = args.single_cycle
     force = args.force_daily
     today_kst = kstartup_calendar_date_kst()
+    budget = cycle_budget.active()
 
     def _contest_pipeline() -> None:
         log.info("요즘것들 공모전 크롤링 시작")
         a_ins, a_upd = run_allforyoung(client, pb, so, se)
+        log_content_size_summary()
         if _stop.is_set():
             return
         notify_contest_cycle_summary(client, 0, 0, a_ins, a_upd)
@@ -844,10 +1632,12 @@ def run_one_cycle(client, new_client, args: argparse.Namespace) -> None:
         )
     elif sk:
         started = iso_now()
+        if budget:
+            budget.resume(SOURCE_ALLFORYOUNG, _crawl_log_checkpoint(client, JOB_CONTEST_CRAWL, today_kst))
         try:
             _contest_pipeline()
             if not _stop.is_set():
-                _crawl_log_upsert(client, JOB_CONTEST_CRAWL, today_kst, "success", None, started)
+                _crawl_log_finish(client, JOB_CONTEST_CRAWL, SOURCE_ALLFORYOUNG, today_kst, started)
         except Exception as e:
             log.exception("공모전 수집 중 오류")
             if not _stop.is_set():
@@ -858,9 +1648,15 @@ def run_one_cycle(client, new_client, args: argparse.Namespace) -> None:
 
     if _stop.is_set():
         return
+    if budget and budget.exhausted:
+        # 공모전이 예산으로 멈췄으면 K-Startup 은 시작하지 않는다 (crawl_logs 행 없음 → 다음 실행에서 수행)
+        log.info("시간 예산 소진 — K-Startup 은 다음 실행으로 넘김")
+        return
 
     log.info("K-Startup 창업 크롤링 시작")
-    if not K_START_UP_SERVICE:
+    # 재생 중에는 키 값이 요청 매칭에 쓰이지 않으므로 미설정이어도 진행
+    service_key = K_START_UP_SERVICE or ("replay" if crawl_replay.replaying() else "")
+    if not service_key:
         log.warning("K_START_UP_SERVICE 미설정 — 창업 단계 건너뜀 (.env에 추가)")
     elif sk and not force and _crawl_log_has_success(client, JOB_KSTARTUP_CRAWL, today_kst):
         log.info(
@@ -874,12 +1670,12 @@ def run_one_cycle(client, new_client, args: argparse.Namespace) -> None:
         )
     elif sk:
         started_k = iso_now()
+        if budget:
+            budget.resume(JOB_KSTARTUP_CRAWL, _crawl_log_checkpoint(client, JOB_KSTARTUP_CRAWL, today_kst))
         try:
-            run_kstartup(client, K_START_UP_SERVICE, kpb, kso, kse)
+            run_kstartup(client, service_key, kpb, kso, kse)
             if not _stop.is_set():
-                _crawl_log_upsert(
-                    client, JOB_KSTARTUP_CRAWL, today_kst, "success", None, started_k
-                )
+                _crawl_log_finish(client, JOB_KSTARTUP_CRAWL, JOB_KSTARTUP_CRAWL, today_kst, started_k)
         except Exception as e:
             log.exception("K-Startup 수집 중 오류")
             if not _stop.is_set():
@@ -888,7 +1684,177 @@ def run_one_cycle(client, new_client, args: argparse.Namespace) -> None:
                 )
             raise
     else:
-        run_kstartup(client, K_START_UP_SERVICE, kpb, kso, kse)
+        run_kstartup(client, service_key, kpb, kso, kse)
+
+
+def add_feature_arguments(parser: argparse.ArgumentParser) -> None:
+    """수집 동작 옵션 (트레이스·기록/재생·로컬 상태·재시도·프록시 풀·목록 동시 요청·파싱 프로세스·본문 Storage·검색 토큰·생존 기록·중복 색인·변경 피드·작업 큐).
+    crawl_wevity_only_loop·crawl_scheduler 도 같은 옵션을 쓴다."""
+    parser.add_argument(
+        "--trace",
+        metavar="FILE",
+        default=None,
+        help="대상 사이트 HTTP 요청 트레이스를 FILE(NDJSON, 크기 회전)에 기록. 환경변수 CRAWL_TRACE_FILE 과 동일",
+    )
+    crawl_replay.add_cli_arguments(parser)
+    parser.add_argument(
+        "--content-storage",
+        action="store_true",
+        help="상세 본문을 Storage(contest-content 버킷)에 해시 키로 올리고 contests 에는 키만 저장. CRAWL_CONTENT_STORAGE=1 과 동일",
+    )
+    parser.add_argument(
+        "--search-index",
+        action="store_true",
+        help="행을 쓸 때 검색용 search_tokens(한국어 2-gram) 생성 (`search_doc`, CRAWL_SEARCH_INDEX=1)",
+    )
+    parser.add_argument(
+        "--liveness",
+        action="store_true",
+        help="목록 값이 바뀐 행만 upsert 하고, 사라진 공고는 전체 순회 id 집합 차이로 표시 (`contest_liveness`, CRAWL_LIVENESS=1)",
+    )
+    parser.add_argument(
+        "--dedup",
+        action="store_true",
+        help="위비티·요즘것들 간 같은 공모전을 canonical_group_id 로 묶고 상대 본문 재사용 (`contest_dedup`, CRAWL_DEDUP=1)",
+    )
+    parser.add_argument(
+        "--changes",
+        metavar="FILE",
+        default=None,
+        help="패스마다 새로 생긴·바뀐·사라진 행을 FILE(NDJSON, 크기 회전)에 기록 (`change_feed`, CRAWL_CHANGES_FILE)",
+    )
+    parser.add_argument(
+        "--changes-table",
+        action="store_true",
+        help="변경 피드를 crawl_changes 테이블에도 기록 (`change_feed`, CRAWL_CHANGES_TABLE=1)",
+    )
+    parser.add_argument(
+        "--http-retries",
+        type=int,
+        default=None,
+        metavar="N",
+        help="위비티·요즘것들 요청 일시 오류 재시도 횟수 (지터 지수 백오프 + 호스트별 브레이커, `crawl_retry`). 기본 3, 0=끔, CRAWL_HTTP_RETRIES",
+    )
+    parser.add_argument(
+        "--proxy",
+        action="append",
+        metavar="URL",
+        default=None,
+        help="위비티 요청용 출구 프록시 (여러 번 지정, `direct`=직접). 상태 점수로 고르고 막힌 프록시는 격리 (`proxy_pool`, CRAWL_PROXIES)",
+    )
+    parser.add_argument(
+        "--proxy-hosts",
+        metavar="HOSTS",
+        default=None,
+        help="프록시 풀을 쓸 호스트 (쉼표 구분, 기본 www.wevity.com, CRAWL_PROXY_HOSTS)",
+    )
+    parser.add_argument(
+        "--parse-workers",
+        type=int,
+        default=None,
+        metavar="N",
+        help="HTML 파싱(위비티 목록·상세, 요즘것들 상세)을 워커 프로세스 N개에서 (`parse_pool`, CRAWL_PARSE_WORKERS=N). 0=끔",
+    )
+    parser.add_argument(
+        "--allforyoung-list-workers",
+        type=int,
+        default=None,
+        metavar="N",
+        help=(
+            "요즘것들 목록: 첫 페이지로 총 건수·최대 size 를 알아낸 뒤 페이지를 N장씩(배치가 더 크면 배치만큼) 동시 요청 "
+            f"(기본 {ALLFORYOUNG_LIST_WORKERS}, 0=기본 size {ALLFORYOUNG_LIST_PAGE_SIZE}로 빈 페이지까지 순차, CRAWL_ALLFORYOUNG_LIST_WORKERS)"
+        ),
+    )
+    parser.add_argument(
+        "--state-db",
+        metavar="PATH",
+        default=None,
+        help="실행 간 로컬 상태(상세 실패 백오프·브레이커·프록시 상태·D-day 반영일)를 SQLite PATH 에 유지 (`crawl_state_store`, CRAWL_STATE_DB)",
+    )
+    parser.add_argument(
+        "--work-queue",
+        action="store_true",
+        help="위비티·요즘것들 사이클을 DB 작업 큐(임대)로 나눠 여러 인스턴스가 함께 처리 (`work_queue`, CRAWL_WORK_QUEUE=1)",
+    )
+    parser.add_argument(
+        "--queue-cycle",
+        metavar="ID",
+        default=None,
+        help="작업 큐 사이클 id 고정 (같은 id 로 뜬 워커끼리 나눔, 단일 사이클용). 기본: KST --queue-cycle-hours 구간",
+    )
+    parser.add_argument(
+        "--queue-cycle-hours",
+        type=int,
+        default=3,
+        metavar="H",
+        help="--queue-cycle 미지정 시 사이클 id 를 KST H시간 구간 시작으로 (기본 3 — 같은 구간에 뜬 워커끼리 나눔)",
+    )
+
+
+def apply_feature_arguments(parser: argparse.ArgumentParser, args: argparse.Namespace):
+    """`add_feature_arguments` 옵션(또는 같은 뜻의 환경변수)을 켜고 관리자 Supabase 클라이언트를 돌려준다."""
+    global _allforyoung_list_workers
+    if args.trace:
+        crawl_trace.enable(args.trace)
+    else:
+        crawl_trace.enable_from_env()
+    crawl_replay.apply_cli_arguments(parser, args)
+    # 브레이커·프록시 풀이 시작할 때 저장된 상태를 읽으므로 먼저 연다
+    if args.state_db:
+        crawl_state_store.enable(args.state_db)
+    else:
+        crawl_state_store.enable_from_env()
+    if args.http_retries is not None:
+        if args.http_retries < 0:
+            parser.error("--http-retries 는 0 이상이어야 합니다.")
+        crawl_retry.configure(args.http_retries)
+    if args.proxy:
+        hosts = tuple(h for h in (args.proxy_hosts or "").split(",") if h.strip()) or proxy_pool.DEFAULT_HOSTS
+        proxy_pool.enable([p for raw in args.proxy for p in raw.split(",")], hosts)
+    else:
+        proxy_pool.enable_from_env()
+    list_workers = args.allforyoung_list_workers
+    if list_workers is None:
+        try:
+            list_workers = int(os.getenv("CRAWL_ALLFORYOUNG_LIST_WORKERS", str(ALLFORYOUNG_LIST_WORKERS)).strip())
+        except ValueError:
+            list_workers = ALLFORYOUNG_LIST_WORKERS
+    if list_workers < 0:
+        parser.error("--allforyoung-list-workers 는 0 이상이어야 합니다.")
+    _allforyoung_list_workers = list_workers
+    if args.parse_workers is not None and args.parse_workers < 0:
+        parser.error("--parse-workers 는 0 이상이어야 합니다.")
+    if args.parse_workers:
+        parse_pool.enable(args.parse_workers)
+    elif args.parse_workers is None:
+        parse_pool.enable_from_env()
+
+    client = get_supabase_admin_client()
+    if args.content_storage:
+        content_store.enable(client)
+    else:
+        content_store.enable_from_env(client)
+    if args.dedup:
+        contest_dedup.enable(client)
+    else:
+        contest_dedup.enable_from_env(client)
+    if args.search_index:
+        search_doc.enable()
+    else:
+        search_doc.enable_from_env()
+    if args.liveness:
+        contest_liveness.enable(client)
+    else:
+        contest_liveness.enable_from_env(client)
+    if args.changes or args.changes_table:
+        change_feed.enable(args.changes, client if args.changes_table else None)
+    else:
+        change_feed.enable_from_env(client)
+    if args.work_queue:
+        work_queue.enable(client, args.queue_cycle_hours, args.queue_cycle)
+    else:
+        work_queue.enable_from_env(client, args.queue_cycle_hours, args.queue_cycle)
+    return client
 
 
 def main() -> None:
@@ -906,7 +1872,29 @@ def main() -> None:
     parser.add_argument(
         "--dday-refresh",
         action="store_true",
-        help="각 사이클 끝에 refresh-* 엣지와 같이 목록만 돌며 d_day 갱신",
+        help="각 사이클 끝에 refresh-* 엣지와 같이 목록만 돌며 d_day 갱신 (오늘 본 수집이 목록 전체를 돌았으면 생략)",
+    )
+    parser.add_argument(
+        "--dday-only",
+        action="store_true",
+        help="본 수집 없이 위비티·요즘것들 목록을 한 번씩 돌며 d_day 만 갱신하고 종료 (crawl_logs dday_refresh, --force-daily)",
+    )
+    parser.add_argument(
+        "--time-budget",
+        type=float,
+        default=None,
+        metavar="MINUTES",
+        help=(
+            "--single-cycle 시간 예산. 잰 페이지·상세 비용으로 다음 배치를 마칠 수 없으면 배치 경계에서 멈추고 "
+            "crawl_logs 에 partial·체크포인트를 남김 (같은 날 다음 실행이 이어 감, `cycle_budget`)"
+        ),
+    )
+    parser.add_argument(
+        "--time-budget-reserve",
+        type=float,
+        default=cycle_budget.DEFAULT_RESERVE_S / 60,
+        metavar="MINUTES",
+        help="시간 예산 중 마지막 기록·알림용으로 남길 분 (기본 10)",
     )
     parser.add_argument(
         "--page-batch-size",
@@ -963,6 +1951,7 @@ def main() -> None:
         metavar="M",
         help="한 사이클(공모전·K-Startup·선택 D-day) 종료 후 다음 사이클까지 대기 분 (기본 180=3시간). 0이면 바로 반복",
     )
+    add_feature_arguments(parser)
     args = parser.parse_args()
     if args.page_batch_size < 1:
         parser.error("--page-batch-size 는 1 이상이어야 합니다.")
@@ -970,15 +1959,26 @@ def main() -> None:
         parser.error("--kstartup-page-batch-size 는 1 이상이어야 합니다.")
     if args.cycle_wait_minutes < 0:
         parser.error("--cycle-wait-minutes 는 0 이상이어야 합니다.")
-    if args.force_daily and not args.single_cycle:
-        parser.error("--force-daily 는 --single-cycle 과 함께만 사용할 수 있습니다.")
+    if args.force_daily and not (args.single_cycle or args.dday_only):
+        parser.error("--force-daily 는 --single-cycle 또는 --dday-only 와 함께만 사용할 수 있습니다.")
+    if args.time_budget is not None:
+        if not args.single_cycle:
+            parser.error("--time-budget 은 --single-cycle 과 함께만 사용할 수 있습니다.")
+        if args.time_budget <= 0 or args.time_budget_reserve < 0:
+            parser.error("--time-budget 은 0 보다, --time-budget-reserve 는 0 이상이어야 합니다.")
+        if args.time_budget_reserve >= args.time_budget:
+            parser.error("--time-budget-reserve 는 --time-budget 보다 작아야 합니다.")
 
     signal.signal(signal.SIGINT, _signal_handler)
     signal.signal(signal.SIGTERM, _signal_handler)
 
-    client = get_supabase_admin_client()
+    if args.time_budget is not None:
+        # 프로세스 시작 직후부터 잰다 — Actions 잡의 체크아웃·설치 시간은 --time-budget 값에서 미리 빼 둔다
+        cycle_budget.enable(args.time_budget * 60, args.time_budget_reserve * 60)
+    client = apply_feature_arguments(parser, args)
 
     def new_client():
+        # 캐시된 같은 클라이언트 — D-day 워커들이 공용 HTTP/2 연결 풀을 함께 쓴다 (config.get_shared_http_client)
         return get_supabase_admin_client()
 
     pb = args.page_batch_size
@@ -991,12 +1991,20 @@ def main() -> None:
             se,
         )
 
+    if args.dday_only:
+        log.info("========== D-day 갱신만 (위비티·요즘것들) ==========")
+        run_dday_only(client, new_client, args)
+        return
+
     if args.single_cycle:
         log.info("========== 단일 크롤링 사이클 (crawl_logs / GitHub Actions) ==========")
         run_one_cycle(client, new_client, args)
-        if not _stop.is_set() and args.dday_refresh:
+        budget = cycle_budget.active()
+        if budget and budget.exhausted and args.dday_refresh:
+            log.info("시간 예산 소진 — D-day 갱신 생략")
+        elif not _stop.is_set() and args.dday_refresh:
             log.info("========== D-day 갱신 (요즘것들) ==========")
-            run_refresh_allforyoung_dday(new_client, pb, so, se)
+            run_dday_refresh(new_client, (SOURCE_ALLFORYOUNG,), pb, so, se)
         log.info("단일 사이클 종료")
         return
 
@@ -1009,7 +2017,7 @@ def main() -> None:
             break
         if args.dday_refresh:
             log.info("========== D-day 갱신 (요즘것들) ==========")
-            run_refresh_allforyoung_dday(new_client, pb, so, se)
+            run_dday_refresh(new_client, (SOURCE_ALLFORYOUNG,), pb, so, se)
         log.info("크롤링 종료")
         wait_between_cycles(args.cycle_wait_minutes)
 
@@ -0,0 +1,189 @@
+"""
+실행 간 로컬 크롤 상태 저장소 (SQLite, WAL, 묶음 쓰기)
+
+`--state-db PATH`(또는 `CRAWL_STATE_DB`)이면 재시작해도 아래 판단을 이어 간다. 없으면 지금처럼 매번 새로 알아낸다.
+
+- 상세 실패 (`detail_fail`): 상세 요청이 실패한(요청·HTTP 오류) 공고 id 별 연속 실패 수·다음 시도 시각. 실패가 이어지는 상세는
+  `DETAIL_BACKOFF_S`부터 두 배씩(최대 `DETAIL_BACKOFF_MAX_S`) 건너뛴다 — 매 사이클 같은 깨진 페이지를 다시 받지 않음.
+- 호스트 상태 (`breaker`): `crawl_retry` 브레이커가 열린 호스트와 열린 시각. 재시작 직후 막 막힌 호스트를 두드리지 않는다.
+- 프록시 상태 (`proxy`): `proxy_pool` 프록시별 성공률·응답 시간·격리 단계.
+- D-day 반영 날짜 (`dday`): 본 수집이 목록 전체를 돈 KST 날짜 (`crawl_server.dday_current`).
+
+값은 (ns, key) → JSON 한 행. 쓰기는 메모리에 모았다가 `FLUSH_ROWS`행이 쌓이거나 `FLUSH_INTERVAL_S`초가 지나면
+한 트랜잭션으로 넣고, 종료 시(`close`, atexit) 남은 것을 넣는다. 여러 스레드가 함께 쓴다.
+"""
+
+from __future__ import annotations
+
+import atexit
+import json
+import logging
+import os
+import sqlite3
+import threading
+import time
+from typing import Any
+
+logger = logging.getLogger("allyoung.state_store")
+
+FLUSH_ROWS = 200
+FLUSH_INTERVAL_S = 5.0
+DETAIL_BACKOFF_S = 3 * 3600.0
+DETAIL_BACKOFF_MAX_S = 7 * 86400.0
+
+NS_DETAIL_FAIL = "detail_fail"
+NS_BREAKER = "breaker"
+NS_PROXY = "proxy"
+NS_DDAY = "dday"
+
+_DELETE = object()
+
+
+class StateStore:
+    def __init__(self, path: str) -> None:
+        self.path = path
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False, isolation_level=None)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute("PRAGMA busy_timeout=5000")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS state ("
+            " ns TEXT NOT NULL, key TEXT NOT NULL, value TEXT NOT NULL, updated_at REAL NOT NULL,"
+            " PRIMARY KEY (ns, key)) WITHOUT ROWID"
+        )
+        self._pending: dict[tuple[str, str], Any] = {}
+        self._last_flush = time.monotonic()
+        self.flushes = 0
+        self.writes = 0
+
+    def get(self, ns: str, key: str, default: Any = None) -> Any:
+        with self._lock:
+            if (ns, key) in self._pending:
+                v = self._pending[(ns, key)]
+                return default if v is _DELETE else v
+            row = self._conn.execute("SELECT value FROM state WHERE ns = ? AND key = ?", (ns, key)).fetchone()
+        return json.loads(row[0]) if row else default
+
+    def items(self, ns: str) -> dict[str, Any]:
+        with self._lock:
+            out = {k: json.loads(v) for k, v in self._conn.execute("SELECT key, value FROM state WHERE ns = ?", (ns,))}
+            for (pns, key), v in self._pending.items():
+                if pns != ns:
+                    continue
+                if v is _DELETE:
+                    out.pop(key, None)
+                else:
+                    out[key] = v
+        return out
+
+    def put(self, ns: str, key: str, value: Any) -> None:
+        self._stage(ns, key, value)
+
+    def delete(self, ns: str, key: str) -> None:
+        self._stage(ns, key, _DELETE)
+
+    def _stage(self, ns: str, key: str, value: Any) -> None:
+        with self._lock:
+            self._pending[(ns, key)] = value
+            due = len(self._pending) >= FLUSH_ROWS or time.monotonic() - self._last_flush >= FLUSH_INTERVAL_S
+        if due:
+            self.flush()
+
+    def flush(self) -> None:
+        with self._lock:
+            pending, self._pending = self._pending, {}
+            self._last_flush = time.monotonic()
+            if not pending:
+                return
+            now = time.time()
+            upserts = [(ns, key, json.dumps(v, ensure_ascii=False), now) for (ns, key), v in pending.items() if v is not _DELETE]
+            deletes = [(ns, key) for (ns, key), v in pending.items() if v is _DELETE]
+            try:
+                self._conn.execute("BEGIN")
+                self._conn.executemany(
+                    "INSERT INTO state (ns, key, value, updated_at) VALUES (?, ?, ?, ?)"
+                    " ON CONFLICT (ns, key) DO UPDATE SET value = excluded.value, updated_at = excluded.updated_at",
+                    upserts,
+                )
+                self._conn.executemany("DELETE FROM state WHERE ns = ? AND key = ?", deletes)
+                self._conn.execute("COMMIT")
+            except sqlite3.Error as e:
+                self._conn.execute("ROLLBACK")
+                logger.warning("상태 저장소 쓰기 실패 (%s행 버림): %s", len(pending), e)
+                return
+            self.flushes += 1
+            self.writes += len(pending)
+
+    def prune(self, ns: str, older_than_s: float) -> int:
+        """오래 갱신되지 않은 값 삭제 (사라진 공고의 상세 실패 기록 등)."""
+        self.flush()
+        with self._lock:
+            cur = self._conn.execute("DELETE FROM state WHERE ns = ? AND updated_at < ?", (ns, time.time() - older_than_s))
+            return cur.rowcount
+
+    def close(self) -> None:
+        self.flush()
+        with self._lock:
+            self._conn.close()
+
+    def summary(self) -> str:
+        with self._lock:
+            counts = dict(self._conn.execute("SELECT ns, COUNT(*) FROM state GROUP BY ns").fetchall())
+        bits = ", ".join(f"{ns} {n}" for ns, n in sorted(counts.items()))
+        return f"로컬 상태 저장소 {self.path}: {bits or '비어 있음'} (묶음 쓰기 {self.flushes}회·{self.writes}건)"
+
+
+_store: StateStore | None = None
+
+
+def enable(path: str) -> StateStore:
+    global _store
+    if _store is not None:
+        _store.close()
+    _store = StateStore(path)
+    pruned = _store.prune(NS_DETAIL_FAIL, DETAIL_BACKOFF_MAX_S * 2)
+    logger.info("로컬 상태 저장소 %s 사용%s", path, f" (오래된 상세 실패 기록 {pruned}건 정리)" if pruned else "")
+    return _store
+
+
+def enable_from_env() -> StateStore | None:
+    path = os.getenv("CRAWL_STATE_DB", "").strip()
+    return enable(path) if path else None
+
+
+def active() -> StateStore | None:
+    return _store
+
+
+def _close_at_exit() -> None:
+    if _store is not None:
+        _store.close()
+
+
+atexit.register(_close_at_exit)
+
+
+def detail_due(source: str, contest_id: str) -> bool:
+    """이 상세를 지금 받아야 하면 True. 실패가 이어져 다음 시도 시각 전이면 False (저장소가 없으면 항상 True)."""
+    store = _store
+    if store is None:
+        return True
+    fail = store.get(NS_DETAIL_FAIL, f"{source}:{contest_id}")
+    return not fail or fail.get("next", 0) <= time.time()
+
+
+def record_detail(source: str, contest_id: str, ok: bool) -> None:
+    """상세 요청 결과. 실패면 연속 실패 수를 올리고 다음 시도 시각을 늦춘다."""
+    store = _store
+    if store is None:
+        return
+    key = f"{source}:{contest_id}"
+    fail = store.get(NS_DETAIL_FAIL, key)
+    if ok:
+        if fail:
+            store.delete(NS_DETAIL_FAIL, key)
+        return
+    n = (fail or {}).get("n", 0) + 1
+    wait = min(DETAIL_BACKOFF_MAX_S, DETAIL_BACKOFF_S * 2 ** (n - 1))
+    store.put(NS_DETAIL_FAIL, key, {"n": n, "next": time.time() + wait})
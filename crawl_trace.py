@@ -0,0 +1,277 @@
+"""
+크롤러 HTTP 요청 트레이스 (선택 기능, 오프라인 지연 분석용)
+
+켜 두면 `crawl_http.new_session()`으로 만든 세션의 요청마다 NDJSON 한 줄을 남긴다.
+  {"ts", "stage", "method", "host", "path", "status", "dns_ms", "connect_ms",
+   "ttfb_ms", "total_ms", "bytes", "retries", "error"}
+
+- 파일은 `RotatingFileHandler`로 크기 기준 회전 (기본 20MB × 5개).
+- `dns_ms` / `connect_ms`는 새 TCP 연결을 연 요청에만 채워지고, keep-alive 재사용이면 null.
+- `ttfb_ms`는 requests의 `resp.elapsed`(요청 송신 ~ 응답 헤더 파싱 완료).
+- `stage`는 호출 측이 `with crawl_trace.stage("wevity.list"):` 로 지정 (없으면 "-").
+- K-Startup `ServiceKey` 등 쿼리의 키 값은 기록하지 않는다.
+
+켜는 방법: `crawl_server.py --trace FILE` / `crawl_wevity_only_loop.py --trace FILE`
+또는 환경변수 `CRAWL_TRACE_FILE`. 요약: `python scripts/trace_summary.py FILE...`
+"""
+
+from __future__ import annotations
+
+import contextlib
+import contextvars
+import json
+import logging
+import math
+import os
+import socket
+import threading
+import time
+from datetime import datetime, timezone
+from logging.handlers import RotatingFileHandler
+from typing import Iterable, Iterator
+from urllib.parse import parse_qsl, urlencode, urlsplit
+
+from requests.adapters import BaseAdapter
+
+logger = logging.getLogger("allyoung.trace")
+
+TRACE_MAX_BYTES = 20 * 1024 * 1024
+TRACE_BACKUP_COUNT = 5
+
+# 트레이스 파일에 남기지 않을 쿼리 파라미터 (소문자 비교)
+_REDACT_PARAMS = frozenset({"servicekey", "apikey", "key", "token"})
+
+_stage_var: contextvars.ContextVar[tuple[str, int]] = contextvars.ContextVar(
+    "crawl_trace_stage", default=("-", 0)
+)
+_conn_timing = threading.local()
+
+_writer: logging.Logger | None = None
+_orig_create_connection = None
+
+
+def enabled() -> bool:
+    return _writer is not None
+
+
+def enable(path: str, max_bytes: int = TRACE_MAX_BYTES, backup_count: int = TRACE_BACKUP_COUNT) -> None:
+    """트레이스 켜기. 이미 켜져 있으면 무시."""
+    global _writer
+    if _writer is not None:
+        return
+    handler = RotatingFileHandler(path, maxBytes=max_bytes, backupCount=backup_count, encoding="utf-8")
+    handler.setFormatter(logging.Formatter("%(message)s"))
+    w = logging.getLogger("allyoung.trace.records")
+    w.handlers[:] = [handler]
+    w.setLevel(logging.INFO)
+    w.propagate = False
+    _writer = w
+    _install_connection_timing()
+    logger.info("HTTP 트레이스 기록: %s (회전 %sMB × %s)", path, max_bytes // (1024 * 1024), backup_count)
+
+
+def enable_from_env() -> None:
+    path = (os.environ.get("CRAWL_TRACE_FILE") or "").strip()
+    if path:
+        enable(path)
+
+
+@contextlib.contextmanager
+def stage(name: str, retries: int = 0) -> Iterator[None]:
+    """이 블록 안에서 나가는 요청의 stage·재시도 횟수를 지정."""
+    token = _stage_var.set((name, retries))
+    try:
+        yield
+    finally:
+        _stage_var.reset(token)
+
+
+def current_stage() -> str:
+    """지금 블록의 stage 이름 (재시도 어댑터가 시도 번호만 바꿔 다시 지정할 때)."""
+    return _stage_var.get()[0]
+
+
+def _install_connection_timing() -> None:
+    """urllib3 새 연결 생성 시 DNS·TCP connect 시간을 스레드 로컬에 남긴다."""
+    global _orig_create_connection
+    if _orig_create_connection is not None:
+        return
+    from urllib3.util import connection as u3conn
+
+    _orig_create_connection = u3conn.create_connection
+
+    def traced_create_connection(address, *args, **kwargs):
+        host, port = address
+        t0 = time.perf_counter()
+        try:
+            infos = socket.getaddrinfo(host, port, 0, socket.SOCK_STREAM)
+        except OSError:
+            infos = []
+        t1 = time.perf_counter()
+        targets = [(info[4][0], port) for info in infos] or [address]
+        last_err: OSError | None = None
+        for target in targets:
+            try:
+                sock = _orig_create_connection(target, *args, **kwargs)
+            except OSError as e:
+                last_err = e
+                continue
+            _conn_timing.value = ((t1 - t0) * 1000.0, (time.perf_counter() - t1) * 1000.0)
+            return sock
+        assert last_err is not None
+        raise last_err
+
+    u3conn.create_connection = traced_create_connection
+
+
+def redact_url(url: str) -> str:
+    """쿼리의 키 값(`ServiceKey` 등)을 *** 로 바꾼 URL."""
+    parts = urlsplit(url)
+    _, path = _redacted_path(url)
+    return f"{parts.scheme}://{parts.netloc}{path}"
+
+
+def _redacted_path(url: str) -> tuple[str, str]:
+    parts = urlsplit(url)
+    path = parts.path or "/"
+    if parts.query:
+        q = [
+            (k, "***" if k.lower() in _REDACT_PARAMS else v)
+            for k, v in parse_qsl(parts.query, keep_blank_values=True)
+        ]
+        path = f"{path}?{urlencode(q, safe='*')}"
+    return parts.hostname or "", path
+
+
+def _emit(record: dict) -> None:
+    if _writer is not None:
+        _writer.info(json.dumps(record, ensure_ascii=False, separators=(",", ":")))
+
+
+class TracingAdapter(BaseAdapter):
+    """다른 어댑터를 감싸 요청 1건당 트레이스 레코드 1줄을 쓴다."""
+
+    def __init__(self, inner: BaseAdapter) -> None:
+        super().__init__()
+        self.inner = inner
+
+    def send(self, request, **kwargs):
+        stage_name, retries = _stage_var.get()
+        _conn_timing.value = None
+        host, path = _redacted_path(request.url)
+        t0 = time.perf_counter()
+        resp = None
+        error = None
+        try:
+            resp = self.inner.send(request, **kwargs)
+            return resp
+        except Exception as e:
+            error = type(e).__name__
+            raise
+        finally:
+            dns_ms = connect_ms = None
+            if _conn_timing.value is not None:
+                dns_ms, connect_ms = _conn_timing.value
+            status = ttfb_ms = None
+            size = 0
+            if resp is not None:
+                status = resp.status_code
+                ttfb_ms = resp.elapsed.total_seconds() * 1000.0
+                if not kwargs.get("stream"):
+                    size = len(resp.content or b"")
+                hist = getattr(getattr(resp.raw, "retries", None), "history", None)
+                if hist:
+                    retries += len(hist)
+            _emit(
+                {
+                    "ts": datetime.now(timezone.utc).isoformat(timespec="milliseconds"),
+                    "stage": stage_name,
+                    "method": request.method,
+                    "host": host,
+                    "path": path,
+                    "status": status,
+                    "dns_ms": _round(dns_ms),
+                    "connect_ms": _round(connect_ms),
+                    "ttfb_ms": _round(ttfb_ms),
+                    "total_ms": _round((time.perf_counter() - t0) * 1000.0),
+                    "bytes": size,
+                    "retries": retries,
+                    "error": error,
+                }
+            )
+
+    def close(self) -> None:
+        self.inner.close()
+
+
+def _round(v: float | None) -> float | None:
+    return None if v is None else round(v, 1)
+
+
+def wrap_adapter(adapter: BaseAdapter) -> BaseAdapter:
+    """트레이스가 켜져 있으면 `TracingAdapter`로 감싸 반환."""
+    if _writer is None:
+        return adapter
+    return TracingAdapter(adapter)
+
+
+# --- 분석 ---
+
+
+def read_records(paths: Iterable[str]) -> Iterator[dict]:
+    for p in paths:
+        with open(p, encoding="utf-8") as f:
+            for line in f:
+                line = line.strip()
+                if not line:
+                    continue
+                try:
+                    yield json.loads(line)
+                except ValueError:
+                    continue
+
+
+def percentile(sorted_vals: list[float], q: float) -> float | None:
+    """최근접 순위 백분위 (q: 0~100). 빈 목록이면 None."""
+    if not sorted_vals:
+        return None
+    k = max(0, min(len(sorted_vals) - 1, math.ceil(q / 100.0 * len(sorted_vals)) - 1))
+    return sorted_vals[k]
+
+
+def summarize(records: Iterable[dict]) -> list[dict]:
+    """(host, stage)별 요청 수·상태 코드 분포·ttfb/total 백분위·바이트·재시도 합계."""
+    groups: dict[tuple[str, str], dict] = {}
+    for r in records:
+        key = (r.get("host") or "", r.get("stage") or "-")
+        g = groups.setdefault(
+            key,
+            {"host": key[0], "stage": key[1], "count": 0, "statuses": {}, "ttfb": [], "total": [],
+             "connect": [], "bytes": 0, "retries": 0, "errors": 0},
+        )
+        g["count"] += 1
+        st = str(r.get("status")) if r.get("status") is not None else (r.get("error") or "error")
+        g["statuses"][st] = g["statuses"].get(st, 0) + 1
+        if r.get("ttfb_ms") is not None:
+            g["ttfb"].append(float(r["ttfb_ms"]))
+        if r.get("total_ms") is not None:
+            g["total"].append(float(r["total_ms"]))
+        if r.get("connect_ms") is not None:
+            g["connect"].append(float(r["connect_ms"]))
+        g["bytes"] += int(r.get("bytes") or 0)
+        g["retries"] += int(r.get("retries") or 0)
+        if r.get("error"):
+            g["errors"] += 1
+
+    out: list[dict] = []
+    for key in sorted(groups):
+        g = groups[key]
+        row = {k: g[k] for k in ("host", "stage", "count", "statuses", "bytes", "retries", "errors")}
+        row["new_connections"] = len(g["connect"])
+        for name in ("ttfb", "total"):
+            vals = sorted(g[name])
+            for q in (50, 90, 99):
+                row[f"{name}_p{q}"] = percentile(vals, q)
+            row[f"{name}_max"] = vals[-1] if vals else None
+        out.append(row)
+    return out
@@ -8,6 +8,9 @@
   python crawl_wevity_only_loop.py --single-cycle          # 1회만 하고 종료
   python crawl_wevity_only_loop.py --sleep-hours 12      # 사이클 간 12시간 대기
   python crawl_wevity_only_loop.py --page-batch-size 2   # crawl_server 와 동일 옵션
+  python crawl_wevity_only_loop.py --trace wevity_trace.ndjson  # 요청별 트레이스 (scripts/trace_summary.py)
+  python crawl_wevity_only_loop.py --single-cycle --record rec/wevity   # 응답 기록
+  python crawl_wevity_only_loop.py --single-cycle --replay rec/wevity --replay-speed 0 --sleep-batch-odd 0 --sleep-batch-even 0
 """
 
 from __future__ import annotations
@@ -16,10 +19,12 @@ import argparse
 import logging
 import signal
 
-from config import get_supabase_admin_client
 from crawl_server import (
     _signal_handler,
     _stop,
+    add_feature_arguments,
+    apply_feature_arguments,
+    log_content_size_summary,
     notify_contest_cycle_summary,
     run_wevity,
     wait_between_cycles,
@@ -72,6 +77,7 @@ def main() -> None:
         metavar="SEC",
         help="배치 2·4·6… 처리 후 대기 초",
     )
+    add_feature_arguments(parser)
     args = parser.parse_args()
     if args.page_batch_size < 1:
         parser.error("--page-batch-size 는 1 이상이어야 합니다.")
@@ -81,7 +87,7 @@ def main() -> None:
     signal.signal(signal.SIGINT, _signal_handler)
     signal.signal(signal.SIGTERM, _signal_handler)
 
-    client = get_supabase_admin_client()
+    client = apply_feature_arguments(parser, args)
     pb, so, se = args.page_batch_size, args.sleep_batch_odd, args.sleep_batch_even
     wait_minutes = max(0, int(round(args.sleep_hours * 60)))
 
@@ -90,6 +96,7 @@ def main() -> None:
         cycle_n += 1
         log.info("========== 위비티 전용 크롤링 사이클 %s 시작 ==========", cycle_n)
         w_ins, w_upd = run_wevity(client, pb, so, se)
+        log_content_size_summary()
         if _stop.is_set():
             break
         # 요즘것들·K-Startup 은 건너뛰고, 알림만 위비티 건수로 합산(기존 함수 재사용)
@@ -2,15 +2,25 @@
 allforyoung.com 공모전/대외활동 크롤러
 - 목록: 공식 JSON API (`api.allforyoung.com/api/v2/posts`, category=공모전)
 - 상세 HTML: www HTML 파싱 (`crawl_post_*`)
+- 목록 계획: 첫 페이지 응답의 totalElements·size 로 필요한 페이지 수와 받아 주는 최대 size 를 알아낸 뒤
+  (`plan_allforyoung_list`) 페이지 여러 장을 호스트 동시 요청 상한 안에서 함께 받는다 (`fetch_allforyoung_pages`)
 """
 
 import logging
 import re
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
 from urllib.parse import urljoin
 
 import requests
-from bs4 import BeautifulSoup
+from bs4 import BeautifulSoup, CData, NavigableString, Tag
+
+import crawl_http
+import crawl_trace
+import parse_pool
+from crawl_http import new_session, polite_sleep
+from html_normalize import STATS as CONTENT_STATS, normalize_fragment
 
 logger = logging.getLogger("allyoung.crawler")
 
@@ -32,27 +42,205 @@ HEADERS = {
     "Cache-Control": "max-age=0",
 }
 
+_HOST_PREFIX_RE = re.compile(r"주최[/\s]*주관\s*")
+_BODY_CLASS_RE = re.compile(r"prose|markdown|content", re.I)
+_WEVITY_SPECIAL_RE = re.compile(r"\s+SPECIAL\s*$", re.I)
+_WEVITY_IDEA_RE = re.compile(r"\s+IDEA\s*$", re.I)
+_WEVITY_CATEGORY_RE = re.compile(r"분야\s*:\s*(.+)")
+_WEVITY_BODY_CLASS_RE = re.compile(r"view|content|body", re.I)
+_WEVITY_BLOCK_CLASS_RE = re.compile(r"ct|cont|body|text", re.I)
+_BLANK_LINES_RE = re.compile(r"\n{3,}")
+_WEVITY_LABEL_TAGS = frozenset(("th", "dt", "div"))
+_WEVITY_BODY_DIV_CLASSES = frozenset(("ct", "view-cont", "detail-cont"))
+_WEVITY_IMAGE_DIV_CLASSES = frozenset(("ct", "view-cont"))
+
+# 위비티 상세 순회 중 조상 표시 (CSS 하위 선택자 `table td` 등을 부모 플래그 상속으로 판정)
+_IN_TABLE = 1
+_IN_DL = 2
+_IN_VIEW_INFO = 4
+_IN_VIEW_TIT = 8
+_IN_BODY = 16
+
+# `Tag.get_text()` 기본값과 같이 주석·스크립트 문자열 등은 제외 (타입 정확히 일치)
+_TEXT_TYPES = (NavigableString, CData)
+
+
+def _attr_text(tag: Tag, name: str) -> str:
+    """속성 값을 CSS 속성 선택자와 같이 비교할 문자열로 (`rel` 등 다중 값은 공백 결합)."""
+    value = tag.get(name)
+    if value is None:
+        return ""
+    return value if isinstance(value, str) else " ".join(value)
+
+
+class _TextIndex:
+    """root 아래 모든 요소의 `get_text(strip=True)`를 한 번의 순회로 색인한다.
+
+    요소별 텍스트는 문서 순서 문자열 목록의 연속 구간이므로 길이는 O(1)로 알 수 있고,
+    문자열은 실제로 필요한 요소만 한 번 만들어 캐시한다. 중첩 div마다 `get_text`를 다시
+    부르던 방식(페이지 크기에 대해 제곱)을 대신한다. 트리를 수정하면 다시 만들어야 한다.
+    """
+
+    def __init__(self, root: Tag) -> None:
+        self.tags: list[Tag] = []  # root 제외, 문서 순서 (find_all 과 같은 순서)
+        self._strings: list[str] = []
+        self._offsets: list[int] = [0]
+        self._spans: dict[int, tuple[int, int]] = {}
+        self._ranges: dict[int, tuple[int, int]] = {}
+        self._memo: dict[int, str] = {}
+        starts = [(0, 0)]
+        stack = [iter(root.contents)]
+        nodes = [root]
+        while stack:
+            child = next(stack[-1], None)
+            if child is None:
+                stack.pop()
+                key = id(nodes.pop())
+                s_start, t_start = starts.pop()
+                self._spans[key] = (s_start, len(self._strings))
+                self._ranges[key] = (t_start, len(self.tags))
+            elif isinstance(child, Tag):
+                self.tags.append(child)
+                nodes.append(child)
+                starts.append((len(self._strings), len(self.tags)))
+                stack.append(iter(child.contents))
+            elif type(child) in _TEXT_TYPES:
+                text = child.strip()
+                if text:
+                    self._strings.append(text)
+                    self._offsets.append(self._offsets[-1] + len(text))
+
+    def descendants(self, tag: Tag) -> list[Tag]:
+        """tag 아래 요소들 (문서 순서, tag 자신 제외)."""
+        start, end = self._ranges[id(tag)]
+        return self.tags[start:end]
+
+    def length(self, tag: Tag) -> int:
+        start, end = self._spans[id(tag)]
+        return self._offsets[end] - self._offsets[start]
+
+    def text(self, tag: Tag) -> str:
+        key = id(tag)
+        cached = self._memo.get(key)
+        if cached is None:
+            start, end = self._spans[key]
+            cached = self._memo[key] = "".join(self._strings[start:end])
+        return cached
+
 
 def crawl_contest_page(page: int = 1, max_pages: int = 1) -> list[dict]:
     """
     공모전 목록 (요즘것들 API). `page` 인자는 무시되고 1..max_pages 를 순회합니다.
     """
     results = []
-    session = requests.Session()
-    session.headers.update(HEADERS)
+    session = new_session(HEADERS)
 
     for p in range(1, max_pages + 1):
         try:
             rows = fetch_allforyoung_contest_page(session, p)
             for r in rows:
                 results.append({**r, "source": "요즘것들"})
-            time.sleep(1)
+            polite_sleep(1)
         except requests.RequestException as e:
             results.append({"error": str(e), "page": p})
 
     return results
 
 
+def parse_post_detail_html(html: str, post_id: str) -> dict:
+    """요즘것들 상세 HTML → 구조화 필드 (id, url, title, host, category, apply_period, body, apply_url, images).
+
+    문서를 `_TextIndex`로 한 번 순회한 뒤 요소 목록만 훑는다 (요소별 `get_text`·CSS 선택 반복 없음).
+    """
+    url = f"{BASE_URL}/posts/{post_id}"
+    soup = BeautifulSoup(html, "html.parser")
+    index = _TextIndex(soup)
+
+    result = {
+        "id": post_id,
+        "url": url,
+        "title": "",
+        "host": "",
+        "category": "",
+        "apply_period": "",
+        "body": "",
+        "apply_url": "",
+        "images": [],
+    }
+
+    # 제목 (h1), 이미지 후보: preload 링크 전부 → img 순
+    h1 = None
+    preloads: list[str] = []
+    img_srcs: list[str] = []
+    for tag in index.tags:
+        name = tag.name
+        if name == "h1":
+            if h1 is None:
+                h1 = tag
+        elif name == "link":
+            if _attr_text(tag, "rel") == "preload" and _attr_text(tag, "as") == "image":
+                preloads.append(tag.get("href", "").strip())
+        elif name == "img" and tag.has_attr("src"):
+            img_srcs.append(tag.get("src", "").strip())
+    if h1:
+        result["title"] = index.text(h1)
+
+    # 이미지 추출
+    seen = set()
+    for href in preloads:
+        if href and href not in seen and ("cdn.allforyoung" in href or href.startswith("https://")):
+            seen.add(href)
+            result["images"].append(href)
+    for src in img_srcs:
+        if not src:
+            continue
+        full = urljoin(BASE_URL, src) if src.startswith("/") else src
+        if full not in seen and ("cdn.allforyoung" in full or full.startswith("https://")):
+            seen.add(full)
+            result["images"].append(full)
+
+    article = soup.find("article") or soup.find("main") or soup.body
+    if not article:
+        article = soup
+    article_tags = index.descendants(article)
+
+    # 주최/주관, 접수기간 — 둘 다 100자 미만 요소만 보므로 긴 컨테이너는 문자열을 만들지 않는다
+    for elem in article_tags:
+        if elem.name not in ("div", "span", "p") or index.length(elem) >= 100:
+            continue
+        txt = index.text(elem)
+        if "주최" in txt and "주관" in txt and len(txt) < 80:
+            result["host"] = _HOST_PREFIX_RE.sub("", txt).strip() or txt
+        if "접수기간" in txt:
+            p = txt.split("접수기간", 1)
+            if len(p) > 1:
+                result["apply_period"] = p[1].strip()
+
+    # 지원하기 링크
+    for a in article_tags:
+        if a.name == "a" and a.has_attr("href") and "지원" in a.get_text():
+            href = a.get("href", "")
+            result["apply_url"] = urljoin(BASE_URL, href) if href.startswith("/") else href
+            break
+
+    # 본문 - prose 등
+    prose = article.find(class_=_BODY_CLASS_RE)
+    if prose:
+        blocks = [index.text(e) for e in index.descendants(prose) if e.name in ("p", "h2", "h3", "h4", "li")]
+        result["body"] = "\n\n".join([t for t in blocks if t][:80])
+    else:
+        blocks = []
+        for tag in article_tags:
+            if tag.name not in ("p", "h2", "h3", "h4", "li", "div") or not 20 < index.length(tag) < 1200:
+                continue
+            t = index.text(tag)
+            if "AD" not in t and "©" not in t:
+                blocks.append(t)
+        result["body"] = "\n\n".join(blocks[:60]) if blocks else ""
+
+    return result
+
+
 def crawl_post_detail(post_id: str) -> dict | None:
     """
     상세 페이지 크롤링
@@ -61,11 +249,11 @@ def crawl_post_detail(post_id: str) -> dict | None:
     url = f"{BASE_URL}/posts/{post_id}"
     try:
         logger.info("크롤링 시작: %s", url)
-        session = requests.Session()
-        session.headers.update(HEADERS)
+        session = new_session(HEADERS)
         # 첫 요청 전 약간의 딜레이 (봇으로 보이지 않도록)
-        time.sleep(0.5)
-        resp = session.get(url, timeout=30, allow_redirects=True)
+        polite_sleep(0.5)
+        with crawl_trace.stage("allforyoung.detail"):
+            resp = session.get(url, timeout=30, allow_redirects=True)
         
         # 403 에러 체크
         if resp.status_code == 403:
@@ -74,74 +262,7 @@ def crawl_post_detail(post_id: str) -> dict | None:
             return None
         
         resp.raise_for_status()
-        soup = BeautifulSoup(resp.text, "html.parser")
-
-        result = {
-            "id": post_id,
-            "url": url,
-            "title": "",
-            "host": "",
-            "category": "",
-            "apply_period": "",
-            "body": "",
-            "apply_url": "",
-            "images": [],
-        }
-
-        # 제목 (h1)
-        h1 = soup.find("h1")
-        if h1:
-            result["title"] = h1.get_text(strip=True)
-
-        # 이미지 추출
-        seen = set()
-        for link in soup.select('link[rel="preload"][as="image"]'):
-            href = link.get("href", "").strip()
-            if href and href not in seen and ("cdn.allforyoung" in href or href.startswith("https://")):
-                seen.add(href)
-                result["images"].append(href)
-        for img in soup.select("img[src]"):
-            src = img.get("src", "").strip()
-            if not src:
-                continue
-            full = urljoin(BASE_URL, src) if src.startswith("/") else src
-            if full not in seen and ("cdn.allforyoung" in full or full.startswith("https://")):
-                seen.add(full)
-                result["images"].append(full)
-
-        article = soup.find("article") or soup.find("main") or soup.body
-        if not article:
-            article = soup
-
-        # 주최/주관, 접수기간
-        for elem in article.find_all(["div", "span", "p"]):
-            txt = elem.get_text(strip=True)
-            if "주최" in txt and "주관" in txt and len(txt) < 80:
-                result["host"] = re.sub(r"주최[/\s]*주관\s*", "", txt).strip() or txt
-            if "접수기간" in txt and len(txt) < 100:
-                p = txt.split("접수기간", 1)
-                if len(p) > 1:
-                    result["apply_period"] = p[1].strip()
-
-        # 지원하기 링크
-        for a in article.select('a[href]'):
-            href = a.get("href", "")
-            if "지원" in a.get_text():
-                result["apply_url"] = urljoin(BASE_URL, href) if href.startswith("/") else href
-                break
-
-        # 본문 - prose 등
-        prose = article.find(class_=re.compile(r"prose|markdown|content", re.I))
-        if prose:
-            blocks = [e.get_text(strip=True) for e in prose.find_all(["p", "h2", "h3", "h4", "li"]) if e.get_text(strip=True)]
-            result["body"] = "\n\n".join(blocks[:80])
-        else:
-            blocks = []
-            for tag in article.find_all(["p", "h2", "h3", "h4", "li", "div"]):
-                t = tag.get_text(strip=True)
-                if t and 20 < len(t) < 1200 and "AD" not in t and "©" not in t:
-                    blocks.append(t)
-            result["body"] = "\n\n".join(blocks[:60]) if blocks else ""
+        result = parse_pool.parse(parse_post_detail_html, resp, post_id)
 
         logger.info("크롤링 성공: %s", url)
         return result
@@ -166,6 +287,11 @@ SOURCE_ALLFORYOUNG = "요즘것들"
 ALLFORYOUNG_API_POSTS = "https://api.allforyoung.com/api/v2/posts"
 ALLFORYOUNG_LIST_CATEGORY = "공모전"
 ALLFORYOUNG_LIST_PAGE_SIZE = 24
+# 목록 계획 시 첫 페이지에 시험할 size (큰 것부터). 모두 거절되면 ALLFORYOUNG_LIST_PAGE_SIZE 로 순차 요청
+ALLFORYOUNG_LIST_PROBE_SIZES = (100, 50)
+# api.allforyoung.com 목록 동시 요청 상한과 요청 시작 간격(초, `CRAWL_POLITE_DELAY_SCALE` 배율 적용)
+ALLFORYOUNG_LIST_WORKERS = 4
+ALLFORYOUNG_LIST_INTERVAL_S = 0.35
 
 WEVITY_BASE = "https://www.wevity.com"
 # Chrome UA는 주기적으로 갱신 (오래된 UA만으로 WAF에 걸리는 경우 완화)
@@ -193,24 +319,161 @@ def _wevity_warmup_session(session: requests.Session) -> None:
     if getattr(session, "_wevity_warmup_done", False):
         return
     try:
-        time.sleep(0.35)
-        session.get(
-            f"{WEVITY_BASE}/",
-            timeout=30,
-            allow_redirects=True,
-            headers={
-                "Sec-Fetch-Site": "none",
-                "Sec-Fetch-Mode": "navigate",
-                "Sec-Fetch-Dest": "document",
-                "Sec-Fetch-User": "?1",
-            },
-        )
-        time.sleep(0.55)
+        polite_sleep(0.35)
+        with crawl_trace.stage("wevity.warmup"):
+            session.get(
+                f"{WEVITY_BASE}/",
+                timeout=30,
+                allow_redirects=True,
+                headers={
+                    "Sec-Fetch-Site": "none",
+                    "Sec-Fetch-Mode": "navigate",
+                    "Sec-Fetch-Dest": "document",
+                    "Sec-Fetch-User": "?1",
+                },
+            )
+        polite_sleep(0.55)
     except requests.RequestException as e:
         logger.warning("위비티 워밍업(/) 실패 — 목록 요청 계속: %s", e)
     setattr(session, "_wevity_warmup_done", True)
 
 
+def parse_wevity_detail_html(html: str, contest_id: str) -> dict:
+    """위비티 상세 HTML → 구조화 필드 (`parse_post_detail_html`과 같은 dict 형태).
+
+    한 번의 문서 순서 순회로 제목·메타 행·본문·이미지·링크 후보를 모은다. 메타 행의 라벨은
+    직전 th/dt/div(`find_previous`와 같은 요소)를 들고 가며 정하고, CSS 하위 선택자는 조상 플래그로 판정한다.
+    """
+    url = f"{WEVITY_BASE}/?c=find&s=1&gbn=view&ix={contest_id}"
+    soup = BeautifulSoup(html, "html.parser")
+    index = _TextIndex(soup)
+
+    result = {
+        "id": contest_id,
+        "url": url,
+        "title": "",
+        "host": "",
+        "category": "",
+        "apply_period": "",
+        "body": "",
+        "apply_url": "",
+        "images": [],
+    }
+
+    flags: dict[int, int] = {}
+    tit = sub = body_el = None
+    images: list[str] = []
+    links: list[Tag] = []
+    label_tag: Tag | None = None
+    label_of: Tag | None = None
+    label = ""
+    for tag in index.tags:
+        name = tag.name
+        classes = tag.get("class") or ()
+        inherited = flags.get(id(tag.parent), 0)
+        is_div = name == "div"
+        body_scope = tag.get("id") == "viewContents" or "board-cont" in classes
+        is_body = body_scope or (is_div and not _WEVITY_BODY_DIV_CLASSES.isdisjoint(classes))
+        own = inherited
+        if name == "table":
+            own |= _IN_TABLE
+        elif name == "dl":
+            own |= _IN_DL
+        elif is_div:
+            if "view-info" in classes:
+                own |= _IN_VIEW_INFO
+            if "view-tit" in classes:
+                own |= _IN_VIEW_TIT
+        if body_scope or (is_div and not _WEVITY_IMAGE_DIV_CLASSES.isdisjoint(classes)):
+            own |= _IN_BODY
+        if own:
+            flags[id(tag)] = own
+
+        # 제목 (div.tit, div.view-tit h2, h2.tit)
+        if tit is None and (
+            (is_div and "tit" in classes) or (name == "h2" and (inherited & _IN_VIEW_TIT or "tit" in classes))
+        ):
+            tit = tag
+        # 분야 보조 (div.sub-tit, .view-cate)
+        if sub is None and ((is_div and "sub-tit" in classes) or "view-cate" in classes):
+            sub = tag
+        # 본문 (div.ct, div.view-cont, #viewContents, div.detail-cont, .board-cont)
+        if body_el is None and is_body:
+            body_el = tag
+        if name == "img" and inherited & _IN_BODY:
+            images.append(tag.get("src", "").strip())
+        elif name == "a" and tag.has_attr("href"):
+            links.append(tag)
+
+        # 테이블 기반 메타 (주최, 분야, 접수기간 등): table td, div.view-info div, dl dd
+        is_row = (
+            (name == "td" and inherited & _IN_TABLE)
+            or (is_div and inherited & _IN_VIEW_INFO)
+            or (name == "dd" and inherited & _IN_DL)
+        )
+        if is_row:
+            if label_tag is not label_of:
+                label_of = label_tag
+                label = index.text(label_tag).lower() if label_tag is not None else ""
+            txt = index.text(tag)
+            if "주최" in label or "주관" in label:
+                result["host"] = txt[:200] if txt else ""
+            elif "분야" in label or "카테고리" in label:
+                result["category"] = txt[:200] if txt else ""
+            elif "접수" in label or "일정" in label:
+                result["apply_period"] = txt[:300] if txt else ""
+        if name in _WEVITY_LABEL_TAGS:
+            label_tag = tag
+
+    if tit:
+        result["title"] = _WEVITY_IDEA_RE.sub("", _WEVITY_SPECIAL_RE.sub("", index.text(tit)))
+
+    # sub-tit 등에서 분야 추출
+    if not result["category"] and sub:
+        m = _WEVITY_CATEGORY_RE.search(sub.get_text())
+        result["category"] = m.group(1).strip()[:200] if m else index.text(sub)[:200]
+
+    # 본문 - div.ct, div.view-cont, #viewContents 등
+    if body_el is None:
+        body_el = soup.find("div", class_=_WEVITY_BODY_CLASS_RE)
+    if body_el:
+        # 스크립트/스타일 제거 (문자열 색인에는 원래 포함되지 않으므로 이후 index.text 결과는 그대로)
+        for tag in index.descendants(body_el):
+            if tag.name in ("script", "style"):
+                tag.decompose()
+        body_text = body_el.get_text(separator="\n\n", strip=True)
+        result["body"] = _BLANK_LINES_RE.sub("\n\n", body_text)[:8000]
+    else:
+        blocks = []
+        for tag in soup.find_all(["p", "div"], class_=_WEVITY_BLOCK_CLASS_RE):
+            if not 30 < index.length(tag) < 3000:
+                continue
+            t = index.text(tag)
+            if "AD" not in t and "©" not in t:
+                blocks.append(t)
+        result["body"] = "\n\n".join(blocks[:40]) if blocks else ""
+
+    # 이미지
+    seen = set()
+    for src in images:
+        if not src:
+            continue
+        full = urljoin(WEVITY_BASE, src) if src.startswith("/") else src
+        if full not in seen and ("wevity" in full or full.startswith("https://")):
+            seen.add(full)
+            result["images"].append(full)
+
+    # 지원/신청 링크
+    for a in links:
+        t = index.text(a)
+        if "지원" in t or "신청" in t or "참가" in t:
+            href = a.get("href", "")
+            result["apply_url"] = urljoin(WEVITY_BASE, href) if href.startswith("/") or href.startswith("?") else href
+            break
+
+    return result
+
+
 def crawl_wevity_detail(contest_id: str) -> dict | None:
     """
     위비티 상세 페이지 크롤링
@@ -219,11 +482,11 @@ def crawl_wevity_detail(contest_id: str) -> dict | None:
     url = f"{WEVITY_BASE}/?c=find&s=1&gbn=view&ix={contest_id}"
     try:
         logger.info("크롤링 시작: %s", url)
-        session = requests.Session()
-        session.headers.update(WEVITY_HEADERS)
+        session = new_session(WEVITY_HEADERS)
         # 첫 요청 전 약간의 딜레이 (봇으로 보이지 않도록)
-        time.sleep(0.5)
-        resp = session.get(url, timeout=30, allow_redirects=True)
+        polite_sleep(0.5)
+        with crawl_trace.stage("wevity.detail"):
+            resp = session.get(url, timeout=30, allow_redirects=True)
         
         # 403 에러 체크
         if resp.status_code == 403:
@@ -232,82 +495,7 @@ def crawl_wevity_detail(contest_id: str) -> dict | None:
             return None
         
         resp.raise_for_status()
-        soup = BeautifulSoup(resp.text, "html.parser")
-
-        result = {
-            "id": contest_id,
-            "url": url,
-            "title": "",
-            "host": "",
-            "category": "",
-            "apply_period": "",
-            "body": "",
-            "apply_url": "",
-            "images": [],
-        }
-
-        # 제목 (div.tit 또는 h2)
-        tit = soup.select_one("div.tit, div.view-tit h2, h2.tit")
-        if tit:
-            result["title"] = re.sub(r"\s+SPECIAL\s*$", "", tit.get_text(strip=True), flags=re.I)
-            result["title"] = re.sub(r"\s+IDEA\s*$", "", result["title"], flags=re.I)
-
-        # 테이블 기반 메타 (주최, 분야, 접수기간 등)
-        for row in soup.select("table td, div.view-info div, dl dd"):
-            txt = row.get_text(strip=True)
-            prev = row.find_previous(["th", "dt", "div"])
-            label = (prev.get_text(strip=True) if prev else "").lower()
-            if "주최" in label or "주관" in label:
-                result["host"] = txt[:200] if txt else ""
-            elif "분야" in label or "카테고리" in label:
-                result["category"] = txt[:200] if txt else ""
-            elif "접수" in label or "일정" in label:
-                result["apply_period"] = txt[:300] if txt else ""
-
-        # sub-tit 등에서 분야 추출
-        if not result["category"]:
-            sub = soup.select_one("div.sub-tit, .view-cate")
-            if sub:
-                m = re.search(r"분야\s*:\s*(.+)", sub.get_text())
-                result["category"] = m.group(1).strip()[:200] if m else sub.get_text(strip=True)[:200]
-
-        # 본문 - div.ct, div.view-cont, #viewContents 등
-        body_el = (
-            soup.select_one("div.ct, div.view-cont, #viewContents, div.detail-cont, .board-cont")
-            or soup.find("div", class_=re.compile(r"view|content|body", re.I))
-        )
-        if body_el:
-            # 스크립트/스타일 제거
-            for tag in body_el.select("script, style"):
-                tag.decompose()
-            body_text = body_el.get_text(separator="\n\n", strip=True)
-            result["body"] = re.sub(r"\n{3,}", "\n\n", body_text)[:8000]
-        else:
-            blocks = []
-            for tag in soup.find_all(["p", "div"], class_=re.compile(r"ct|cont|body|text", re.I)):
-                t = tag.get_text(strip=True)
-                if t and 30 < len(t) < 3000 and "AD" not in t and "©" not in t:
-                    blocks.append(t)
-            result["body"] = "\n\n".join(blocks[:40]) if blocks else ""
-
-        # 이미지
-        seen = set()
-        for img in soup.select("div.ct img, div.view-cont img, #viewContents img, .board-cont img"):
-            src = img.get("src", "").strip()
-            if not src:
-                continue
-            full = urljoin(WEVITY_BASE, src) if src.startswith("/") else src
-            if full not in seen and ("wevity" in full or full.startswith("https://")):
-                seen.add(full)
-                result["images"].append(full)
-
-        # 지원/신청 링크
-        for a in soup.select('a[href]'):
-            t = a.get_text(strip=True)
-            if "지원" in t or "신청" in t or "참가" in t:
-                href = a.get("href", "")
-                result["apply_url"] = urljoin(WEVITY_BASE, href) if href.startswith("/") or href.startswith("?") else href
-                break
+        result = parse_pool.parse(parse_wevity_detail_html, resp, contest_id)
 
         logger.info("크롤링 성공: %s", url)
         return result
@@ -397,6 +585,11 @@ def parse_wevity_list_html(html: str) -> list[dict]:
 
 
 def fetch_wevity_list_page(session: requests.Session, page: int) -> list[dict]:
+    return request_wevity_list_page(session, page).result()
+
+
+def request_wevity_list_page(session: requests.Session, page: int) -> parse_pool.PendingParse:
+    """목록 페이지를 요청하고 파싱은 `parse_pool`에 넘긴다 — 파싱 워커가 있으면 결과를 기다리지 않고 돌아옴."""
     _wevity_warmup_session(session)
     url = f"{WEVITY_BASE}/?c=find&s=1&gbn=list&gp={page}"
     referer = f"{WEVITY_BASE}/" if page <= 1 else f"{WEVITY_BASE}/?c=find&s=1&gbn=list&gp={page - 1}"
@@ -404,7 +597,8 @@ def fetch_wevity_list_page(session: requests.Session, page: int) -> list[dict]:
         "Referer": referer,
         "Sec-Fetch-Site": "same-origin",
     }
-    resp = session.get(url, timeout=30, allow_redirects=True, headers=extra_headers)
+    with crawl_trace.stage("wevity.list"):
+        resp = session.get(url, timeout=30, allow_redirects=True, headers=extra_headers)
     if resp.status_code == 403:
         logger.error(
             "위비티 목록 403 — 사이트가 요청 IP를 막은 경우가 많습니다 "
@@ -413,39 +607,62 @@ def fetch_wevity_list_page(session: requests.Session, page: int) -> list[dict]:
             url,
         )
     resp.raise_for_status()
-    return parse_wevity_list_html(resp.text)
+    return parse_pool.submit(parse_wevity_list_html, resp)
+
+
+def _normalized_contents(el, base_url: str) -> str:
+    """본문 컨테이너 → 정규화된 내부 HTML (`html_normalize`). 전후 크기는 `CONTENT_STATS`에 누적."""
+    raw = el.decode_contents()
+    try:
+        out = normalize_fragment(el, base_url)
+    except RecursionError:
+        logger.warning("본문 HTML 중첩이 너무 깊어 정규화 생략")
+        return raw
+    CONTENT_STATS.add(len(raw.encode("utf-8")), len(out.encode("utf-8")))
+    return out
+
+
+def extract_wevity_detail_html(html: str) -> str | None:
+    """위비티 상세 페이지 전체 HTML → 정규화한 본문 컨테이너 HTML (최대 50k). 본문이 비면 None."""
+    soup = BeautifulSoup(html, "html.parser")
+    body_el = soup.select_one("div.ct, div.view-cont, #viewContents, div.detail-cont, .board-cont")
+    if not body_el:
+        for tag in soup.find_all("div", class_=re.compile(r"view|content|body", re.I)):
+            body_el = tag
+            break
+    if not body_el:
+        body_el = soup.body
+    if not body_el:
+        return None
+    for tag in body_el.select("script, style, nav, header, footer, aside"):
+        tag.decompose()
+    for tag in body_el.select(".ad, .ads, [class*='ad']"):
+        tag.decompose()
+    html_out = _normalized_contents(body_el, WEVITY_BASE + "/")
+    if not html_out or not html_out.strip():
+        return None
+    return html_out[:50000]
 
 
 def crawl_wevity_detail_html(contest_id: str) -> str | None:
     """엣지 `crawlWevityDetail`과 동일: 본문 HTML (최대 50k)."""
+    pending = request_wevity_detail_html(contest_id)
+    return pending.result() if pending else None
+
+
+def request_wevity_detail_html(contest_id: str) -> parse_pool.PendingParse | None:
+    """상세를 요청하고 본문 추출은 `parse_pool`에 넘긴다. 요청·HTTP 오류면 None."""
     url = f"{WEVITY_BASE}/?c=find&s=1&gbn=view&ix={contest_id}"
     try:
-        time.sleep(0.5)
-        session = requests.Session()
-        session.headers.update(WEVITY_HEADERS)
-        resp = session.get(url, timeout=30, allow_redirects=True)
+        polite_sleep(0.5)
+        session = new_session(WEVITY_HEADERS)
+        with crawl_trace.stage("wevity.detail_html"):
+            resp = session.get(url, timeout=30, allow_redirects=True)
         if resp.status_code == 403:
             logger.error("위비티 상세 403: %s", url)
             return None
         resp.raise_for_status()
-        soup = BeautifulSoup(resp.text, "html.parser")
-        body_el = soup.select_one("div.ct, div.view-cont, #viewContents, div.detail-cont, .board-cont")
-        if not body_el:
-            for tag in soup.find_all("div", class_=re.compile(r"view|content|body", re.I)):
-                body_el = tag
-                break
-        if not body_el:
-            body_el = soup.body
-        if not body_el:
-            return None
-        for tag in body_el.select("script, style, nav, header, footer, aside"):
-            tag.decompose()
-        for tag in body_el.select(".ad, .ads, [class*='ad']"):
-            tag.decompose()
-        html_out = body_el.decode_contents() if hasattr(body_el, "decode_contents") else str(body_el)
-        if not html_out or not html_out.strip():
-            return None
-        return html_out[:50000]
+        return parse_pool.submit(extract_wevity_detail_html, resp)
     except requests.RequestException as e:
         logger.error("위비티 상세 HTML 실패 %s: %s", contest_id, e)
         return None
@@ -499,21 +716,8 @@ def parse_allforyoung_contest_list_html(html: str) -> list[dict]:
     return results
 
 
-def fetch_allforyoung_contest_page(session: requests.Session, page: int) -> list[dict]:
-    """목록은 공식 v2 API. (www 초기 HTML에는 카드가 없어 BeautifulSoup만으로는 0건)"""
-    params = {
-        "page": page,
-        "size": ALLFORYOUNG_LIST_PAGE_SIZE,
-        "category": ALLFORYOUNG_LIST_CATEGORY,
-    }
-    headers = {
-        "User-Agent": session.headers.get("User-Agent") or HEADERS["User-Agent"],
-        "Accept": "application/json",
-        "Accept-Encoding": "gzip, deflate",
-    }
-    resp = session.get(ALLFORYOUNG_API_POSTS, params=params, headers=headers, timeout=30)
-    resp.raise_for_status()
-    body = resp.json()
+def parse_allforyoung_posts(body: dict) -> list[dict]:
+    """v2 posts API 응답(JSON) → 목록 행. `success`가 아니면 빈 목록."""
     if not body.get("success"):
         logger.warning("요즘것들 API 오류 응답: %s", str(body)[:500])
         return []
@@ -543,31 +747,164 @@ def fetch_allforyoung_contest_page(session: requests.Session, page: int) -> list
     return out
 
 
+def parse_allforyoung_pagination(body: dict) -> dict[str, int]:
+    """v2 posts API 응답의 페이지 정보 (없는 값은 0)."""
+
+    def grab(key: str) -> int:
+        try:
+            return max(0, int(body.get(key) or 0))
+        except (TypeError, ValueError):
+            return 0
+
+    return {
+        "total_count": grab("totalElements"),
+        "total_pages": grab("totalPages"),
+        "size": grab("size"),
+        "page": grab("page"),
+    }
+
+
+def fetch_allforyoung_posts(session: requests.Session, page: int, size: int = ALLFORYOUNG_LIST_PAGE_SIZE) -> dict:
+    """v2 posts API 목록 페이지 한 장 → 응답 JSON."""
+    params = {
+        "page": page,
+        "size": size,
+        "category": ALLFORYOUNG_LIST_CATEGORY,
+    }
+    headers = {
+        "User-Agent": session.headers.get("User-Agent") or HEADERS["User-Agent"],
+        "Accept": "application/json",
+        "Accept-Encoding": "gzip, deflate",
+    }
+    with crawl_trace.stage("allforyoung.list"):
+        resp = session.get(ALLFORYOUNG_API_POSTS, params=params, headers=headers, timeout=30)
+    resp.raise_for_status()
+    return resp.json()
+
+
+def fetch_allforyoung_contest_page(
+    session: requests.Session, page: int, size: int = ALLFORYOUNG_LIST_PAGE_SIZE
+) -> list[dict]:
+    """목록은 공식 v2 API. (www 초기 HTML에는 카드가 없어 BeautifulSoup만으로는 0건)"""
+    return parse_allforyoung_posts(fetch_allforyoung_posts(session, page, size))
+
+
+def plan_allforyoung_list(session: requests.Session, max_items: int) -> dict | None:
+    """첫 페이지를 큰 size 로 받아 목록 전체 크기를 알아낸다.
+
+    → {"size", "total_count", "pages", "first_rows"} — pages 는 max_items 건까지 받는 데 필요한 페이지 수,
+    first_rows 는 이미 받은 1페이지 행. 서버가 size 를 줄여 주면(응답 `size`, 또는 총 건수보다 적은 행) 그 값을 쓴다.
+    시험한 size 가 모두 거절되거나 총 건수가 없으면 None — 호출 측은 기본 size 로 빈 페이지까지 순차 요청한다.
+    """
+    for probe in ALLFORYOUNG_LIST_PROBE_SIZES:
+        try:
+            body = fetch_allforyoung_posts(session, 1, probe)
+        except requests.HTTPError as e:
+            status = getattr(e.response, "status_code", None)
+            if status is not None and 400 <= status < 500 and status not in (403, 429):
+                logger.info("요즘것들 목록 size=%s 거절 (HTTP %s) — 더 작은 size 시험", probe, status)
+                continue
+            logger.warning("요즘것들 목록 계획 실패 — 순차 요청으로: %s", e)
+            return None
+        except (requests.RequestException, ValueError) as e:
+            logger.warning("요즘것들 목록 계획 실패 — 순차 요청으로: %s", e)
+            return None
+        if not body.get("success"):
+            logger.info("요즘것들 목록 size=%s 오류 응답 — 더 작은 size 시험", probe)
+            continue
+        rows = parse_allforyoung_posts(body)
+        info = parse_allforyoung_pagination(body)
+        if not rows or not info["total_count"]:
+            return None
+        size = min(probe, info["size"] or probe)
+        if len(rows) < min(size, info["total_count"]):
+            size = len(rows)
+        pages = (min(info["total_count"], max_items) + size - 1) // size
+        logger.info(
+            "요즘것들 목록 계획 — 총 %s건, size %s × %s페이지 (기본 size %s면 %s페이지)",
+            info["total_count"],
+            size,
+            pages,
+            ALLFORYOUNG_LIST_PAGE_SIZE,
+            (min(info["total_count"], max_items) + ALLFORYOUNG_LIST_PAGE_SIZE - 1) // ALLFORYOUNG_LIST_PAGE_SIZE,
+        )
+        return {"size": size, "total_count": info["total_count"], "pages": pages, "first_rows": rows}
+    logger.warning("요즘것들 목록 시험 size %s 모두 거절 — 기본 size %s 순차 요청", ALLFORYOUNG_LIST_PROBE_SIZES, ALLFORYOUNG_LIST_PAGE_SIZE)
+    return None
+
+
+def fetch_allforyoung_pages(
+    session: requests.Session,
+    pages: list[int],
+    size: int,
+    workers: int = ALLFORYOUNG_LIST_WORKERS,
+) -> dict[int, list[dict] | Exception]:
+    """목록 페이지들을 동시에 받는다 → {페이지: 행 목록 또는 (재시도 후) 예외}.
+
+    같은 호스트에 동시 요청은 workers 개까지, 요청 시작은 `ALLFORYOUNG_LIST_INTERVAL_S` 간격으로 벌린다.
+    재시도·브레이커(`crawl_retry`)는 세션 어댑터가 그대로 맡는다.
+    """
+    interval = ALLFORYOUNG_LIST_INTERVAL_S * crawl_http.POLITE_DELAY_SCALE
+    lock = threading.Lock()
+    next_start = [time.monotonic()]
+
+    def one(page: int) -> list[dict] | Exception:
+        with lock:
+            now = time.monotonic()
+            at = max(now, next_start[0])
+            next_start[0] = at + interval
+        if at > now:
+            time.sleep(at - now)
+        try:
+            return fetch_allforyoung_contest_page(session, page, size)
+        except Exception as e:
+            return e
+
+    if not pages:
+        return {}
+    with ThreadPoolExecutor(max_workers=max(1, min(workers, len(pages))), thread_name_prefix="af-list") as pool:
+        return dict(zip(pages, pool.map(one, pages)))
+
+
+def extract_post_detail_html(html: str, page_url: str = "") -> str | None:
+    """요즘것들 상세 페이지 전체 HTML → 정규화한 article/prose HTML (최대 50k). 본문이 비면 None.
+
+    상대 URL 은 page_url(없으면 사이트 루트) 기준으로 절대화한다.
+    """
+    soup = BeautifulSoup(html, "html.parser")
+    article = soup.find("article") or soup.find("main") or soup.body
+    if not article:
+        return None
+    prose = article.select_one(".prose, .markdown, .content") or article
+    for tag in prose.select("script, style, nav, header, footer, aside"):
+        tag.decompose()
+    for tag in prose.select(".ad, .ads, [class*='ad']"):
+        tag.decompose()
+    html_out = _normalized_contents(prose, page_url or BASE_URL + "/")
+    if not html_out or not html_out.strip():
+        return None
+    return html_out[:50000]
+
+
 def crawl_post_detail_html(post_id: str) -> str | None:
     """엣지 `crawlPostDetail`과 동일: article/prose HTML (최대 50k)."""
+    pending = request_post_detail_html(post_id)
+    return pending.result() if pending else None
+
+
+def request_post_detail_html(post_id: str) -> parse_pool.PendingParse | None:
+    """상세를 요청하고 본문 추출은 `parse_pool`에 넘긴다. 요청·HTTP 오류면 None."""
     url = f"{BASE_URL}/posts/{post_id}"
     try:
-        time.sleep(0.5)
-        session = requests.Session()
-        session.headers.update(HEADERS)
-        resp = session.get(url, timeout=30, allow_redirects=True)
+        polite_sleep(0.5)
+        session = new_session(HEADERS)
+        with crawl_trace.stage("allforyoung.detail_html"):
+            resp = session.get(url, timeout=30, allow_redirects=True)
         if resp.status_code == 403:
             logger.error("요즘것들 상세 403: %s", url)
             return None
         resp.raise_for_status()
-        soup = BeautifulSoup(resp.text, "html.parser")
-        article = soup.find("article") or soup.find("main") or soup.body
-        if not article:
-            return None
-        prose = article.select_one(".prose, .markdown, .content") or article
-        for tag in prose.select("script, style, nav, header, footer, aside"):
-            tag.decompose()
-        for tag in prose.select(".ad, .ads, [class*='ad']"):
-            tag.decompose()
-        html_out = prose.decode_contents() if hasattr(prose, "decode_contents") else str(prose)
-        if not html_out or not html_out.strip():
-            return None
-        return html_out[:50000]
+        return parse_pool.submit(extract_post_detail_html, resp, url)
     except requests.RequestException as e:
         logger.error("요즘것들 상세 HTML 실패 %s: %s", post_id, e)
         return None
@@ -0,0 +1,188 @@
+"""
+단일 사이클 시간 예산 (GitHub Actions 6시간 제한 안에서 끝내기)
+
+`--single-cycle --time-budget MINUTES`이면 사이클이 잡 타임아웃(`timeout-minutes: 360`)에 배치 중간에서
+죽지 않고, 남은 시간으로 다음 배치를 마칠 수 없을 때 **배치 경계에서** 멈춘다.
+
+- 비용 추정: 목록 페이지 한 장(상세·DB 쓰기 포함)과 상세 한 건의 실제 소요 시간을 지수 이동 평균으로 잰다.
+  다음 배치 예상 = 페이지 수 × 페이지당 비용. 아직 잰 값이 없으면 `DEFAULT_COST_S`.
+- 가치 순서: 한 배치 안에서 상세 요청은 새 공모전 → 마감 임박(`CLOSING_SOON_DAYS`일 이내) → 나머지
+  (기존 행 재확인) 순으로 보낸다 (`by_value`). 예산이 모자라면 뒤쪽 상세를 미루고 빈 본문으로 쓴다 —
+  다음 실행에서 본문 없는 행으로 다시 받는다.
+- 멈춤: 작업별 다음 페이지를 체크포인트로 남기고(`stop`) `crawl_logs`에 `status=partial`·`checkpoint`로 쓴다.
+  같은 날(KST) 다음 실행은 그 페이지부터 이어 간다 (`resume`). 페이지 크기가 바뀌는 목록(요즘것들 목록 계획)은
+  `page_size`도 남겨, 다음 실행의 크기가 다르면 이미 본 건수 기준으로 페이지를 다시 계산한다. 목록 전체를 돌지 못한 패스는 D-day 반영일·
+  생존 기록 순회 완료를 남기지 않는다.
+- 예비 시간(`--time-budget-reserve`, 기본 10분)은 마지막 crawl_logs·알림 쓰기와 정리용으로 남긴다.
+
+작업 큐 모드(`--work-queue`)는 임대 단위로 나눠 처리하므로 예산을 보지 않는다.
+"""
+
+from __future__ import annotations
+
+import logging
+import re
+import threading
+import time
+
+logger = logging.getLogger("allyoung.budget")
+
+EWMA_ALPHA = 0.3
+CLOSING_SOON_DAYS = 7
+DEFAULT_RESERVE_S = 600.0
+# 잰 값이 없을 때 비용 (초) — 종류 이름의 마지막 부분으로 찾는다 ("allforyoung.page" → "page")
+DEFAULT_COST_S = {"page": 15.0, "detail": 2.0}
+
+_D_DAY = re.compile(r"D\s*-\s*(\d+)", re.I)
+
+
+def d_day_days(d_day: str | None) -> int | None:
+    """목록 D-day 표시 → 남은 일 수 ("D-3" → 3, "오늘 마감"·"D-day" → 0). 마감·알 수 없음은 None."""
+    s = (d_day or "").strip()
+    m = _D_DAY.search(s)
+    if m:
+        return int(m.group(1))
+    if "오늘" in s or s.upper().replace(" ", "") == "D-DAY":
+        return 0
+    return None
+
+
+def by_value(rows: list[dict], existing: dict) -> list[dict]:
+    """상세를 받을 순서: 새 공모전 → 마감 임박 기존 행 → 나머지. 같은 묶음 안에서는 마감이 가까운 순."""
+
+    def key(r: dict) -> tuple[int, int]:
+        days = d_day_days(r.get("d_day"))
+        near = days if days is not None else 10**6
+        if r["id"] not in existing:
+            return 0, near
+        return (1 if days is not None and days <= CLOSING_SOON_DAYS else 2), near
+
+    return sorted(rows, key=key)
+
+
+class CycleBudget:
+    def __init__(self, seconds: float, reserve_s: float = DEFAULT_RESERVE_S) -> None:
+        self.seconds = seconds
+        self.reserve_s = max(0.0, reserve_s)
+        self.started = time.monotonic()
+        self.deadline = self.started + seconds
+        self._lock = threading.Lock()
+        self._cost: dict[str, float] = {}
+        self._resume: dict[str, int] = {}
+        self._resume_size: dict[str, int] = {}
+        self.stopped: dict[str, int] = {}
+        self._stopped_size: dict[str, int] = {}
+        self.deferred_details = 0
+
+    def remaining(self) -> float:
+        return self.deadline - time.monotonic()
+
+    def observe(self, kind: str, seconds: float, n: int = 1) -> None:
+        """`kind` 작업 n건에 seconds 걸림."""
+        if n <= 0:
+            return
+        unit = max(0.0, seconds) / n
+        with self._lock:
+            prev = self._cost.get(kind)
+            self._cost[kind] = unit if prev is None else prev + EWMA_ALPHA * (unit - prev)
+
+    def cost(self, kind: str) -> float:
+        with self._lock:
+            c = self._cost.get(kind)
+        return c if c is not None else DEFAULT_COST_S.get(kind.rsplit(".", 1)[-1], 0.0)
+
+    def estimate(self, kind: str, n: int = 1) -> float:
+        return self.cost(kind) * n
+
+    def allows(self, kind: str, n: int = 1) -> bool:
+        """예비 시간을 빼고도 `kind` n건을 마칠 수 있으면 True."""
+        return self.remaining() - self.reserve_s >= self.estimate(kind, n)
+
+    def defer_detail(self) -> None:
+        with self._lock:
+            self.deferred_details += 1
+
+    def resume(self, job: str, checkpoint: dict | None) -> None:
+        """같은 날 앞선 실행이 남긴 체크포인트 (`crawl_logs.checkpoint`)."""
+        try:
+            page = int((checkpoint or {}).get("next_page") or 1)
+            size = int((checkpoint or {}).get("page_size") or 0)
+        except (TypeError, ValueError):
+            page, size = 1, 0
+        if page > 1:
+            self._resume[job] = page
+            if size > 0:
+                self._resume_size[job] = size
+            logger.info("%s — 앞선 실행 체크포인트: 페이지 %s부터 이어 감", job, page)
+
+    def resume_page(self, job: str, page_size: int | None = None) -> int:
+        """이어 갈 페이지. 체크포인트의 page_size 와 이번 page_size 가 다르면 이미 본 건수를 넘지 않는 페이지로 바꾼다."""
+        page = self._resume.get(job, 1)
+        saved = self._resume_size.get(job)
+        if page_size and saved and saved != page_size:
+            page = (page - 1) * saved // page_size + 1
+        return page
+
+    def stop(
+        self,
+        job: str,
+        next_page: int,
+        pages_left: int | None = None,
+        per_page_kind: str | None = None,
+        page_size: int | None = None,
+    ) -> None:
+        """남은 시간으로 다음 배치를 마칠 수 없어 job 을 next_page 앞에서 멈춘다."""
+        self.stopped[job] = next_page
+        if page_size:
+            self._stopped_size[job] = page_size
+        rest = ""
+        if pages_left and per_page_kind:
+            rest = f", 남은 최대 {pages_left}페이지 예상 {self.estimate(per_page_kind, pages_left) / 60:.0f}분"
+        logger.warning(
+            "시간 예산 — %s 페이지 %s 앞에서 멈춤 (남은 %.1f분, 예비 %.0f분%s). 다음 실행에서 이어 감",
+            job,
+            next_page,
+            max(0.0, self.remaining()) / 60,
+            self.reserve_s / 60,
+            rest,
+        )
+
+    def checkpoint(self, job: str) -> dict | None:
+        page = self.stopped.get(job)
+        if page is None:
+            return None
+        size = self._stopped_size.get(job)
+        return {"next_page": page, "page_size": size} if size else {"next_page": page}
+
+    @property
+    def exhausted(self) -> bool:
+        return bool(self.stopped)
+
+    def summary(self) -> str:
+        with self._lock:
+            costs = ", ".join(f"{k} {v:.1f}초" for k, v in sorted(self._cost.items()))
+            deferred = self.deferred_details
+        used = (time.monotonic() - self.started) / 60
+        head = f"시간 예산 {used:.1f}/{self.seconds / 60:.1f}분"
+        bits = []
+        if costs:
+            bits.append(f"건당 비용 {costs}")
+        if deferred:
+            bits.append(f"미룬 상세 {deferred}건")
+        if self.stopped:
+            bits.append("멈춤 " + ", ".join(f"{j} p.{p}" for j, p in sorted(self.stopped.items())))
+        return head + (" — " + ", ".join(bits) if bits else "")
+
+
+_budget: CycleBudget | None = None
+
+
+def enable(seconds: float, reserve_s: float = DEFAULT_RESERVE_S) -> CycleBudget:
+    global _budget
+    _budget = CycleBudget(seconds, reserve_s)
+    logger.info("시간 예산 %.0f분 (예비 %.0f분) — 배치 경계에서 멈추고 체크포인트를 남김", seconds / 60, reserve_s / 60)
+    return _budget
+
+
+def active() -> CycleBudget | None:
+    return _budget
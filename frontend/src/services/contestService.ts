@@ -936,6 +936,19 @@ export async function deleteContestParticipation(source: string, contestId: stri
   return { success: true as const }
 }
 
+const CONTEST_CONTENT_BUCKET = 'contest-content'
+
+/** Storage 로 옮긴 본문(`contests.content_key`)을 공개 URL(CDN)에서 받아 온다. 실패 시 빈 문자열. */
+async function fetchStoredContestContent(sb: SupabaseClient, key: string): Promise<string> {
+  const { data } = sb.storage.from(CONTEST_CONTENT_BUCKET).getPublicUrl(key)
+  try {
+    const res = await fetch(data.publicUrl)
+    return res.ok ? await res.text() : ''
+  } catch {
+    return ''
+  }
+}
+
 const ERR_DETAIL = '\uc0c1\uc138 \ub0b4\uc6a9\uc744 \uac00\uc838\uc62c \uc218 \uc5c6\uc2b5\ub2c8\ub2e4.'
 
 export async function fetchContestDetail(source: string, contestId: string) {
@@ -945,12 +958,15 @@ export async function fetchContestDetail(source: string, contestId: string) {
   } = await sb.auth.getSession()
   const { data: row, error } = await sb
     .from('contests')
-    .select('id, title, host, category, url, content, d_day')
+    .select('id, title, host, category, url, content, content_key, d_day')
     .eq('source', source)
     .eq('id', contestId)
     .maybeSingle()
   if (error || !row) return { success: false as const, error: ERR_DETAIL }
-  const content = String(row.content || '')
+  let content = String(row.content || '')
+  if (!content && row.content_key) {
+    content = await fetchStoredContestContent(sb, String(row.content_key))
+  }
   const detail = {
     id: String(row.id ?? contestId),
     url: String(row.url || ''),
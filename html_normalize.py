@@ -0,0 +1,239 @@
+"""
+상세 본문 HTML 정규화 (저장 전 압축)
+
+`extract_*_detail_html`이 잘라 낸 본문 컨테이너를 `contests.content`에 넣기 전에
+화면에 보이지 않는 부분만 걷어 낸다.
+
+- 주석·script/style/noscript/template/meta/link 제거
+- 속성 허용 목록 외 제거 (class, id, data-*, on*, 추적용 속성 등). `style`·`align` 등 표시에 쓰이는 속성은 유지
+- 속성 없는 span/font, 블록 하나만 감싼 속성 없는 div 는 풀어서 내용만 남김
+- 공백 연속은 1칸으로, 블록 요소 사이 공백 전용 텍스트는 삭제 (pre/textarea 안은 그대로)
+- 텍스트·미디어가 없는 빈 요소 삭제 (`&nbsp;`만 있는 문단은 줄 간격이라 유지)
+- img/source/a 의 상대 URL 을 원문 페이지 기준 절대 URL 로 (lazy-load `data-src` 도 src 로 승격)
+
+전후 크기는 `STATS`에 누적되며 크롤 사이클 끝에 로그로 남는다.
+"""
+
+from __future__ import annotations
+
+import logging
+import re
+import threading
+from dataclasses import dataclass, field
+from urllib.parse import urljoin
+
+from bs4 import BeautifulSoup, Comment, Declaration, Doctype, NavigableString, ProcessingInstruction, Tag
+
+logger = logging.getLogger("allyoung.html_normalize")
+
+_DROP_TAGS = frozenset({"script", "style", "noscript", "template", "meta", "link", "base"})
+_UNWRAP_TAGS = frozenset({"span", "font"})
+_PRESERVE_WS_TAGS = frozenset({"pre", "textarea", "code"})
+# 내용이 없어도 보이는(또는 자리를 차지하는) 요소
+_KEEP_EMPTY_TAGS = frozenset(
+    {
+        "img", "br", "hr", "iframe", "video", "audio", "source", "picture", "svg", "embed", "object",
+        "td", "th", "tr", "col", "colgroup", "input", "canvas",
+    }
+)
+_BLOCK_TAGS = frozenset(
+    {
+        "address", "article", "aside", "blockquote", "dd", "details", "div", "dl", "dt", "figcaption",
+        "figure", "footer", "form", "h1", "h2", "h3", "h4", "h5", "h6", "header", "hr", "li", "main",
+        "nav", "ol", "p", "pre", "section", "table", "tbody", "td", "tfoot", "th", "thead", "tr", "ul",
+        "caption", "colgroup", "br",
+    }
+)
+_GLOBAL_ATTRS = frozenset({"style", "align", "title", "dir", "lang"})
+_TAG_ATTRS: dict[str, frozenset[str]] = {
+    "a": frozenset({"href", "target", "rel"}),
+    "img": frozenset({"src", "srcset", "sizes", "alt", "width", "height"}),
+    "source": frozenset({"src", "srcset", "sizes", "type", "media"}),
+    "video": frozenset({"src", "poster", "controls", "width", "height"}),
+    "audio": frozenset({"src", "controls"}),
+    "iframe": frozenset({"src", "width", "height", "allow", "allowfullscreen", "frameborder"}),
+    "table": frozenset({"border", "cellpadding", "cellspacing", "width", "bgcolor"}),
+    "td": frozenset({"colspan", "rowspan", "width", "height", "valign", "bgcolor"}),
+    "th": frozenset({"colspan", "rowspan", "width", "height", "valign", "bgcolor", "scope"}),
+    "col": frozenset({"span", "width"}),
+    "colgroup": frozenset({"span", "width"}),
+    "ol": frozenset({"start", "type", "reversed"}),
+    "ul": frozenset({"type"}),
+    "li": frozenset({"value"}),
+    "font": frozenset({"color", "size", "face"}),
+}
+_LAZY_SRC_ATTRS = ("data-src", "data-original", "data-lazy-src")
+_URL_ATTRS = ("src", "href", "poster")
+_DROP_STRINGS = (Comment, Declaration, Doctype, ProcessingInstruction)
+_WS_RE = re.compile(r"[ \t\n\r\f]+")
+_ASCII_WS = " \t\n\r\f"
+_STYLE_SEP_RE = re.compile(r"\s*([:;])\s*")
+
+
+@dataclass
+class NormalizeStats:
+    """정규화 전후 크기 누적 (UTF-8 바이트, 스레드 안전)."""
+
+    documents: int = 0
+    bytes_in: int = 0
+    bytes_out: int = 0
+    _lock: threading.Lock = field(default_factory=threading.Lock, repr=False, compare=False)
+
+    def add(self, before: int, after: int) -> None:
+        with self._lock:
+            self.documents += 1
+            self.bytes_in += before
+            self.bytes_out += after
+
+    def merge(self, documents: int, bytes_in: int, bytes_out: int) -> None:
+        """다른 프로세스(`parse_pool` 워커)에서 센 값을 더한다."""
+        with self._lock:
+            self.documents += documents
+            self.bytes_in += bytes_in
+            self.bytes_out += bytes_out
+
+    def reset(self) -> None:
+        with self._lock:
+            self.documents = self.bytes_in = self.bytes_out = 0
+
+    def summary(self) -> str:
+        with self._lock:
+            if not self.documents:
+                return "상세 HTML 정규화 0건"
+            saved = 1.0 - self.bytes_out / self.bytes_in if self.bytes_in else 0.0
+            return (
+                f"상세 HTML 정규화 {self.documents}건: {self.bytes_in / 1024:.0f}KB → "
+                f"{self.bytes_out / 1024:.0f}KB (-{saved:.0%})"
+            )
+
+
+STATS = NormalizeStats()
+
+
+def _resolve(url: str, base_url: str) -> str:
+    u = url.strip()
+    if not u or u.startswith(("data:", "blob:", "#", "mailto:", "tel:")):
+        return u
+    return urljoin(base_url, u)
+
+
+def _resolve_srcset(value: str, base_url: str) -> str:
+    parts = []
+    for part in value.split(","):
+        t = part.strip()
+        if not t:
+            continue
+        url, _, desc = t.partition(" ")
+        parts.append(_resolve(url, base_url) + (" " + desc.strip() if desc.strip() else ""))
+    return ", ".join(parts)
+
+
+def _clean_attrs(tag: Tag, base_url: str) -> None:
+    name = tag.name
+    attrs = tag.attrs
+    if name == "img":
+        src = str(attrs.get("src") or "").strip()
+        if not src or src.startswith("data:"):
+            for lazy in _LAZY_SRC_ATTRS:
+                if attrs.get(lazy):
+                    attrs["src"] = attrs[lazy]
+                    break
+    allowed = _TAG_ATTRS.get(name, frozenset())
+    for key in list(attrs):
+        if key not in allowed and key not in _GLOBAL_ATTRS:
+            del attrs[key]
+    for key in _URL_ATTRS:
+        if key in attrs:
+            value = str(attrs[key])
+            if key == "href" and value.strip().lower().startswith("javascript:"):
+                del attrs[key]
+            else:
+                attrs[key] = _resolve(value, base_url)
+    if "srcset" in attrs:
+        attrs["srcset"] = _resolve_srcset(str(attrs["srcset"]), base_url)
+    style = attrs.get("style")
+    if style is not None:
+        style = _STYLE_SEP_RE.sub(r"\1", _WS_RE.sub(" ", str(style))).strip().rstrip(";")
+        if style:
+            attrs["style"] = style
+        else:
+            del attrs["style"]
+
+
+def _is_block(node) -> bool:
+    return isinstance(node, Tag) and node.name in _BLOCK_TAGS
+
+
+def _is_bare_wrapper(tag: Tag) -> bool:
+    """속성 없는 div 가 블록 요소 하나만 감싸면 풀어도 렌더링이 같다."""
+    if tag.name != "div":
+        return False
+    inner = [c for c in tag.contents if not (isinstance(c, NavigableString) and not c.strip(_ASCII_WS))]
+    return len(inner) == 1 and _is_block(inner[0])
+
+
+def _normalize_children(el: Tag, base_url: str, preserve_ws: bool) -> bool:
+    """el 의 자식을 제자리에서 정규화. 보이는 내용(텍스트·미디어)이 남았으면 True."""
+    has_content = False
+    for child in list(el.contents):
+        if isinstance(child, Tag):
+            if child.name in _DROP_TAGS:
+                child.decompose()
+                continue
+            _clean_attrs(child, base_url)
+            child_has = _normalize_children(child, base_url, preserve_ws or child.name in _PRESERVE_WS_TAGS)
+            if child.name in _KEEP_EMPTY_TAGS:
+                has_content = True
+            elif not child_has:
+                child.decompose()
+                continue
+            has_content = has_content or child_has
+            if not child.attrs and (child.name in _UNWRAP_TAGS or _is_bare_wrapper(child)):
+                child.unwrap()
+        elif isinstance(child, _DROP_STRINGS):
+            child.extract()
+        else:
+            if child.strip(_ASCII_WS):
+                has_content = True
+            if not preserve_ws:
+                text = _WS_RE.sub(" ", str(child))
+                if text != child:
+                    child.replace_with(type(child)(text))
+
+    if not preserve_ws:
+        _trim_block_whitespace(el)
+    return has_content
+
+
+def _trim_block_whitespace(el: Tag) -> None:
+    """블록 경계·연속 공백 텍스트 정리 (렌더링 결과는 같음)."""
+    contents = el.contents
+    for i in range(len(contents) - 1, -1, -1):
+        node = contents[i]
+        if not isinstance(node, NavigableString) or isinstance(node, _DROP_STRINGS):
+            continue
+        prev = contents[i - 1] if i > 0 else None
+        nxt = contents[i + 1] if i + 1 < len(contents) else None
+        at_start = prev is None and (el.name in _BLOCK_TAGS or el.parent is None)
+        at_end = nxt is None and (el.name in _BLOCK_TAGS or el.parent is None)
+        text = str(node)
+        if at_start or _is_block(prev) or (isinstance(prev, NavigableString) and str(prev).endswith(" ")):
+            text = text.lstrip(_ASCII_WS)
+        if at_end or _is_block(nxt):
+            text = text.rstrip(_ASCII_WS)
+        if not text:
+            node.extract()
+        elif text != node:
+            node.replace_with(type(node)(text))
+
+
+def normalize_fragment(el: Tag, base_url: str) -> str:
+    """요소를 제자리에서 정규화하고 내부 HTML(`decode_contents`)을 돌려준다."""
+    _normalize_children(el, base_url, el.name in _PRESERVE_WS_TAGS)
+    return el.decode_contents().strip(_ASCII_WS)
+
+
+def normalize_html(html: str, base_url: str) -> str:
+    """HTML 조각 문자열 → 정규화된 HTML 문자열."""
+    soup = BeautifulSoup(html, "html.parser")
+    return normalize_fragment(soup, base_url)
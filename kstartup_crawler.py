@@ -12,9 +12,10 @@ import logging
 import os
 import re
 import time
-from typing import Any
 
-import requests
+import crawl_trace
+from crawl_http import new_session
+from records import AnnouncementRecord, BusinessRecord
 
 logger = logging.getLogger("allyoung.kstartup")
 
@@ -117,11 +118,12 @@ def fetch_api(api_name: str, service_key: str, page_no: int, num_of_rows: int) -
             page_no,
             num_of_rows,
         )
-        res = requests.get(
-            url,
-            headers={"Accept": "application/xml, text/xml, */*"},
-            timeout=60,
-        )
+        with crawl_trace.stage(f"kstartup.{api_name}", retries=attempt):
+            res = new_session().get(
+                url,
+                headers={"Accept": "application/xml, text/xml, */*"},
+                timeout=60,
+            )
         body = res.text
         last_body_snip = body[:500]
         if res.ok:
@@ -154,7 +156,7 @@ def fetch_api(api_name: str, service_key: str, page_no: int, num_of_rows: int) -
         raise KStartupApiHttpError(api_name, res.status_code, last_body_snip)
 
 
-def map_business_item(col: dict[str, str]) -> dict[str, Any] | None:
+def map_business_item(col: dict[str, str]) -> BusinessRecord | None:
     detl_raw = col.get("detl_pg_url") or ""
     detl_pg_url = decode_xml_entities(detl_raw)
     id_from_url = extract_id_from_url(detl_pg_url)
@@ -163,85 +165,85 @@ def map_business_item(col: dict[str, str]) -> dict[str, Any] | None:
     url = detl_pg_url.strip()
     if url and not url.startswith("http"):
         url = f"https://{url}"
-    return {
-        "id": id_from_url,
-        "supt_biz_titl_nm": decode_xml_entities(col.get("supt_biz_titl_nm") or "") or None,
-        "biz_category_cd": decode_xml_entities(col.get("biz_category_cd") or "") or None,
-        "biz_yr": decode_xml_entities(col.get("biz_yr") or "") or None,
-        "biz_supt_trgt_info": decode_xml_entities(col.get("biz_supt_trgt_info") or "") or None,
-        "biz_supt_ctnt": decode_xml_entities(col.get("biz_supt_ctnt") or "") or None,
-        "biz_supt_bdgt_info": decode_xml_entities(col.get("biz_supt_bdgt_info") or "") or None,
-        "supt_biz_chrct": decode_xml_entities(col.get("supt_biz_chrct") or "") or None,
-        "supt_biz_intrd_info": decode_xml_entities(col.get("supt_biz_intrd_info") or "") or None,
-        "detl_pg_url": url or None,
-    }
+    return BusinessRecord(
+        id=id_from_url,
+        supt_biz_titl_nm=decode_xml_entities(col.get("supt_biz_titl_nm") or "") or None,
+        biz_category_cd=decode_xml_entities(col.get("biz_category_cd") or "") or None,
+        biz_yr=decode_xml_entities(col.get("biz_yr") or "") or None,
+        biz_supt_trgt_info=decode_xml_entities(col.get("biz_supt_trgt_info") or "") or None,
+        biz_supt_ctnt=decode_xml_entities(col.get("biz_supt_ctnt") or "") or None,
+        biz_supt_bdgt_info=decode_xml_entities(col.get("biz_supt_bdgt_info") or "") or None,
+        supt_biz_chrct=decode_xml_entities(col.get("supt_biz_chrct") or "") or None,
+        supt_biz_intrd_info=decode_xml_entities(col.get("supt_biz_intrd_info") or "") or None,
+        detl_pg_url=url or None,
+    )
 
 
-def map_announcement_item(col: dict[str, str]) -> dict[str, Any] | None:
+def map_announcement_item(col: dict[str, str]) -> AnnouncementRecord | None:
     pbanc_sn = (col.get("pbanc_sn") or "").strip()
     if not pbanc_sn:
         return None
-    return {
-        "pbanc_sn": pbanc_sn,
-        "biz_pbanc_nm": col.get("biz_pbanc_nm") or None,
-        "intg_pbanc_biz_nm": col.get("intg_pbanc_biz_nm") or None,
-        "pbanc_ntrp_nm": col.get("pbanc_ntrp_nm") or None,
-        "biz_prch_dprt_nm": col.get("biz_prch_dprt_nm") or None,
-        "prch_cnpl_no": col.get("prch_cnpl_no") or None,
-        "supt_regin": col.get("supt_regin") or None,
-        "supt_biz_clsfc": col.get("supt_biz_clsfc") or None,
-        "sprv_inst": col.get("sprv_inst") or None,
-        "pbanc_rcpt_bgng_dt": col.get("pbanc_rcpt_bgng_dt") or None,
-        "pbanc_rcpt_end_dt": col.get("pbanc_rcpt_end_dt") or None,
-        "rcrt_prgs_yn": col.get("rcrt_prgs_yn") or None,
-        "intg_pbanc_yn": col.get("intg_pbanc_yn") or None,
-        "pbanc_ctnt": col.get("pbanc_ctnt") or None,
-        "aply_trgt": col.get("aply_trgt") or None,
-        "aply_trgt_ctnt": col.get("aply_trgt_ctnt") or None,
-        "aply_excl_trgt_ctnt": col.get("aply_excl_trgt_ctnt") or None,
-        "biz_enyy": col.get("biz_enyy") or None,
-        "biz_trgt_age": col.get("biz_trgt_age") or None,
-        "detl_pg_url": col.get("detl_pg_url") or None,
-        "biz_aply_url": col.get("biz_aply_url") or None,
-        "biz_gdnc_url": col.get("biz_gdnc_url") or None,
-        "aply_mthd_onli_rcpt_istc": col.get("aply_mthd_onli_rcpt_istc") or None,
-        "aply_mthd_eml_rcpt_istc": col.get("aply_mthd_eml_rcpt_istc") or None,
-        "aply_mthd_fax_rcpt_istc": col.get("aply_mthd_fax_rcpt_istc") or None,
-        "aply_mthd_vst_rcpt_istc": col.get("aply_mthd_vst_rcpt_istc") or None,
-        "aply_mthd_pssr_rcpt_istc": col.get("aply_mthd_pssr_rcpt_istc") or None,
-        "aply_mthd_etc_istc": col.get("aply_mthd_etc_istc") or None,
-        "prfn_matr": col.get("prfn_matr") or None,
-    }
+    return AnnouncementRecord(
+        pbanc_sn=pbanc_sn,
+        biz_pbanc_nm=col.get("biz_pbanc_nm") or None,
+        intg_pbanc_biz_nm=col.get("intg_pbanc_biz_nm") or None,
+        pbanc_ntrp_nm=col.get("pbanc_ntrp_nm") or None,
+        biz_prch_dprt_nm=col.get("biz_prch_dprt_nm") or None,
+        prch_cnpl_no=col.get("prch_cnpl_no") or None,
+        supt_regin=col.get("supt_regin") or None,
+        supt_biz_clsfc=col.get("supt_biz_clsfc") or None,
+        sprv_inst=col.get("sprv_inst") or None,
+        pbanc_rcpt_bgng_dt=col.get("pbanc_rcpt_bgng_dt") or None,
+        pbanc_rcpt_end_dt=col.get("pbanc_rcpt_end_dt") or None,
+        rcrt_prgs_yn=col.get("rcrt_prgs_yn") or None,
+        intg_pbanc_yn=col.get("intg_pbanc_yn") or None,
+        pbanc_ctnt=col.get("pbanc_ctnt") or None,
+        aply_trgt=col.get("aply_trgt") or None,
+        aply_trgt_ctnt=col.get("aply_trgt_ctnt") or None,
+        aply_excl_trgt_ctnt=col.get("aply_excl_trgt_ctnt") or None,
+        biz_enyy=col.get("biz_enyy") or None,
+        biz_trgt_age=col.get("biz_trgt_age") or None,
+        detl_pg_url=col.get("detl_pg_url") or None,
+        biz_aply_url=col.get("biz_aply_url") or None,
+        biz_gdnc_url=col.get("biz_gdnc_url") or None,
+        aply_mthd_onli_rcpt_istc=col.get("aply_mthd_onli_rcpt_istc") or None,
+        aply_mthd_eml_rcpt_istc=col.get("aply_mthd_eml_rcpt_istc") or None,
+        aply_mthd_fax_rcpt_istc=col.get("aply_mthd_fax_rcpt_istc") or None,
+        aply_mthd_vst_rcpt_istc=col.get("aply_mthd_vst_rcpt_istc") or None,
+        aply_mthd_pssr_rcpt_istc=col.get("aply_mthd_pssr_rcpt_istc") or None,
+        aply_mthd_etc_istc=col.get("aply_mthd_etc_istc") or None,
+        prfn_matr=col.get("prfn_matr") or None,
+    )
 
 
-def fetch_business_page(service_key: str, page: int) -> tuple[list[dict[str, Any]], dict[str, int]]:
+def fetch_business_page(service_key: str, page: int) -> tuple[list[BusinessRecord], dict[str, int]]:
     n = get_kstartup_num_of_rows()
     xml = fetch_api("getBusinessInformation01", service_key, page, n)
     meta = parse_pagination(xml)
     if meta["current_count"] == 0:
         return [], meta
-    rows: list[dict[str, Any]] = []
+    rows: list[BusinessRecord] = []
     seen: set[str] = set()
     for col in parse_col_items(xml):
         row = map_business_item(col)
-        if row and row["id"] not in seen:
-            seen.add(row["id"])
+        if row and row.id not in seen:
+            seen.add(row.id)
             rows.append(row)
     return rows, meta
 
 
-def fetch_announcement_page(service_key: str, page: int) -> tuple[list[dict[str, Any]], dict[str, int]]:
+def fetch_announcement_page(service_key: str, page: int) -> tuple[list[AnnouncementRecord], dict[str, int]]:
     n = get_kstartup_num_of_rows()
     xml = fetch_api("getAnnouncementInformation01", service_key, page, n)
     meta = parse_pagination(xml)
     if meta["current_count"] == 0:
         return [], meta
-    rows: list[dict[str, Any]] = []
+    rows: list[AnnouncementRecord] = []
     seen: set[str] = set()
     for col in parse_col_items(xml):
         row = map_announcement_item(col)
-        if row and row["pbanc_sn"] not in seen:
-            seen.add(row["pbanc_sn"])
+        if row and row.pbanc_sn not in seen:
+            seen.add(row.pbanc_sn)
             rows.append(row)
     return rows, meta
 
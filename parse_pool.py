@@ -0,0 +1,171 @@
+"""
+HTML 파싱을 별도 프로세스로 넘기는 파싱 단계 (선택)
+
+`--parse-workers N`(또는 `CRAWL_PARSE_WORKERS=N`)이면 위비티 목록·상세, 요즘것들 상세의 BeautifulSoup 파싱을
+N개 워커 프로세스에서 한다. 응답 본문 바이트와 인코딩만 보내고, 돌아오는 것은 파싱된 행 목록이나
+정규화된 본문 HTML 같은 작은 결과다.
+
+파싱이 GIL 을 잡지 않으므로 같은 프로세스의 다른 스레드(스케줄러의 출처별 작업, `--work-queue` 워커,
+D-day DB 갱신 풀)가 그동안 요청·DB 쓰기를 계속한다. 순차 수집에서는 `submit`으로 파싱을 넘겨 두고 다음 요청을
+먼저 보낸다 — 위비티·요즘것들 상세는 한 건 앞서, 위비티 목록은 배치 안에서 다음 페이지를 요청하는 동안 앞 페이지가 파싱된다.
+풀이 꺼져 있으면 `submit`은 그 자리에서 파싱하고 끝난 결과를 돌려준다 (앞서 요청하지 않음).
+
+- 워커는 spawn 으로 띄운다 (스레드가 도는 프로세스에서 fork 하지 않도록).
+- 워커 안에서 쌓인 본문 정규화 통계(`html_normalize.STATS`)는 결과와 함께 돌아와 본 프로세스에 합쳐진다.
+- 워커 프로세스가 죽으면(BrokenProcessPool) 그 응답은 본 프로세스에서 파싱하고 풀을 새로 띄운다.
+"""
+
+from __future__ import annotations
+
+import logging
+import multiprocessing
+import os
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+
+import requests
+
+from html_normalize import STATS as CONTENT_STATS
+
+logger = logging.getLogger("allyoung.parse_pool")
+
+
+def _decode(body: bytes, encoding: str | None) -> str:
+    """`requests.Response.text`와 같은 규칙으로 본문 디코딩 (인코딩 미지정 시 추정)."""
+    if encoding is None:
+        encoding = requests.compat.chardet.detect(body)["encoding"] if requests.compat.chardet else None
+    try:
+        return str(body, encoding or "utf-8", errors="replace")
+    except (LookupError, TypeError):
+        return str(body, errors="replace")
+
+
+def _work(fn, body: bytes, encoding: str | None, args: tuple):
+    """워커 프로세스: 디코딩 → fn(text, *args). 이번 호출의 정규화 통계도 함께 돌려준다."""
+    CONTENT_STATS.reset()
+    result = fn(_decode(body, encoding), *args)
+    return result, (CONTENT_STATS.documents, CONTENT_STATS.bytes_in, CONTENT_STATS.bytes_out)
+
+
+class PendingParse:
+    """제출된 파싱 한 건. `result()`를 부른 스레드에서 정규화 통계를 합치고, 워커가 죽었으면 여기서 파싱한다."""
+
+    def __init__(
+        self, pool: ParsePool | None, executor, future, fn, body: bytes, encoding: str | None, args: tuple
+    ) -> None:
+        self._pool = pool
+        self._executor = executor
+        self._future = future
+        self._call = (fn, body, encoding, args)
+
+    @classmethod
+    def done(cls, value) -> PendingParse:
+        """풀 없이 이미 파싱한 결과."""
+        pending = cls(None, None, None, None, b"", None, ())
+        pending._value = value
+        return pending
+
+    def result(self):
+        if self._pool is None:
+            return self._value
+        pool, self._pool = self._pool, None
+        fn, body, encoding, args = self._call
+        self._call = None
+        try:
+            if self._future is None:
+                raise BrokenProcessPool
+            value, stats = self._future.result()
+        except BrokenProcessPool:
+            pool._replace_broken(self._executor)
+            value = fn(_decode(body, encoding), *args)
+        else:
+            CONTENT_STATS.merge(*stats)
+            with pool._lock:
+                pool.jobs += 1
+        self._value = value
+        return value
+
+
+class ParsePool:
+    def __init__(self, workers: int) -> None:
+        self.workers = max(1, workers)
+        self._lock = threading.Lock()
+        self._executor = self._new_executor()
+        self.jobs = 0
+        self.fallbacks = 0
+
+    def _new_executor(self) -> ProcessPoolExecutor:
+        return ProcessPoolExecutor(max_workers=self.workers, mp_context=multiprocessing.get_context("spawn"))
+
+    def submit(self, fn, body: bytes, encoding: str | None, args: tuple = ()) -> PendingParse:
+        """파싱을 워커에 넘기고 바로 돌아온다. 결과는 `PendingParse.result()`."""
+        with self._lock:
+            executor = self._executor
+        try:
+            future = executor.submit(_work, fn, body, encoding, args)
+        except BrokenProcessPool:
+            future = None
+        return PendingParse(self, executor, future, fn, body, encoding, args)
+
+    def run(self, fn, body: bytes, encoding: str | None, args: tuple = ()):
+        return self.submit(fn, body, encoding, args).result()
+
+    def _replace_broken(self, executor: ProcessPoolExecutor) -> None:
+        logger.warning("파싱 워커 프로세스 종료 — 이 응답은 본 프로세스에서 파싱하고 풀을 다시 띄움")
+        with self._lock:
+            if self._executor is executor:
+                self._executor = self._new_executor()
+            self.fallbacks += 1
+
+    def shutdown(self) -> None:
+        with self._lock:
+            self._executor.shutdown(wait=True, cancel_futures=True)
+
+    def summary(self) -> str:
+        return f"파싱 워커 {self.workers}개: {self.jobs}건 파싱, 본 프로세스 대체 {self.fallbacks}건"
+
+
+_pool: ParsePool | None = None
+
+
+def parse(fn, resp: requests.Response, *args):
+    """응답 → fn(resp.text, *args). 풀이 켜져 있으면 본문 바이트를 워커 프로세스로 보내 파싱.
+
+    fn 은 워커에서 이름으로 불러오므로 모듈 최상위 함수여야 한다 (예: `crawler.parse_wevity_list_html`).
+    """
+    pool = _pool
+    if pool is None:
+        return fn(resp.text, *args)
+    return pool.run(fn, resp.content, resp.encoding, args)
+
+
+def submit(fn, resp: requests.Response, *args) -> PendingParse:
+    """`parse`와 같되 기다리지 않는다 — 워커가 파싱하는 동안 다음 요청을 보낼 수 있다. 풀이 없으면 여기서 파싱."""
+    pool = _pool
+    if pool is None:
+        return PendingParse.done(fn(resp.text, *args))
+    return pool.submit(fn, resp.content, resp.encoding, args)
+
+
+def enable(workers: int) -> ParsePool:
+    global _pool
+    if _pool is not None:
+        _pool.shutdown()
+    _pool = ParsePool(workers)
+    logger.info("HTML 파싱 워커 프로세스 %s개 사용", _pool.workers)
+    return _pool
+
+
+def enable_from_env() -> ParsePool | None:
+    try:
+        workers = int(os.getenv("CRAWL_PARSE_WORKERS", "0").strip() or 0)
+    except ValueError:
+        workers = 0
+    if workers > 0:
+        return enable(workers)
+    return None
+
+
+def active() -> ParsePool | None:
+    return _pool
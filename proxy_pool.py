@@ -0,0 +1,293 @@
+"""
+대상 사이트 요청용 프록시 풀 (상태 점수·격리·재시험)
+
+위비티는 데이터센터 IP(GitHub 호스티드 러너 등)에 403 을 주므로, 여러 출구 프록시를 두고
+요청마다 가장 상태가 좋은 프록시로 보낸다. `--proxy URL`(여러 번) 또는 `CRAWL_PROXIES="http://a:3128,http://b:3128"`.
+`direct`는 프록시 없이 직접 나가는 출구다. 적용 호스트는 `--proxy-hosts`/`CRAWL_PROXY_HOSTS`
+(기본 `www.wevity.com`) — 다른 호스트 요청은 그대로 나간다.
+
+프록시별로 성공률(EWMA), 응답 시간(EWMA), 최근 403/429 시각, 연속 연결 실패 수를 둔다.
+
+- 점수 = 성공률 / (1 + 응답초) × 0.5^(최근 `BLOCK_WINDOW_S`초 안의 차단 수) − 동시 요청 수 × 0.1
+- 차단이 `BLOCK_THRESHOLD`번이거나 연결 실패가 `FAILURE_THRESHOLD`번 이어지면 격리
+  (`QUARANTINE_BASE_S`부터 두 배씩, 최대 `QUARANTINE_MAX_S`).
+- 격리가 끝난 프록시는 실제 요청 하나를 시험(probe)으로 보내 성공하면 복귀, 실패하면 더 길게 격리.
+- 한 요청이 차단·연결 실패면 다른 프록시로 최대 `MAX_ATTEMPTS`번까지 다시 보낸다
+  (마지막 응답·오류는 호출 측으로 — 403 처리는 기존과 같다).
+- 모든 프록시가 격리 중이면 격리가 가장 먼저 끝나는 것을 쓴다 (수집을 멈추지 않음).
+
+로컬 시험: `scripts/fake_proxy.py` (정상·차단·연결 끊김·지연 프록시), `scripts/bench_crawl_cycle.py --proxies ok,block,dead`.
+기록 재생(`--replay`) 중에는 쓰지 않는다. 로컬 상태 저장소(`--state-db`)가 있으면 프록시 상태를 재시작 후에도 이어 간다.
+"""
+
+from __future__ import annotations
+
+import logging
+import os
+import threading
+import time
+from collections import deque
+from dataclasses import dataclass, field
+from urllib.parse import urlsplit
+
+import requests
+from requests.adapters import BaseAdapter
+
+import crawl_state_store
+
+logger = logging.getLogger("allyoung.proxy_pool")
+
+DIRECT = "direct"
+DEFAULT_HOSTS = ("www.wevity.com",)
+EWMA_ALPHA = 0.2
+BLOCK_WINDOW_S = 300.0
+BLOCK_THRESHOLD = 2
+FAILURE_THRESHOLD = 3
+QUARANTINE_BASE_S = 60.0
+QUARANTINE_MAX_S = 1800.0
+MAX_ATTEMPTS = 3
+BLOCK_STATUSES = frozenset({403, 429})
+
+
+def _label(url: str | None) -> str:
+    """로그용 이름 (계정 정보 제외)."""
+    if url is None:
+        return DIRECT
+    parts = urlsplit(url)
+    return f"{parts.scheme}://{parts.hostname}" + (f":{parts.port}" if parts.port else "")
+
+
+@dataclass
+class ProxyState:
+    url: str | None
+    label: str
+    # 처음엔 중간값 — 성공이 쌓인 프록시가 시험 안 된 프록시보다 앞선다
+    success: float = 0.9
+    latency_ms: float | None = None
+    blocks: deque = field(default_factory=deque)
+    consecutive_failures: int = 0
+    quarantined_until: float = 0.0
+    quarantine_s: float = 0.0
+    probing: bool = False
+    inflight: int = 0
+    requests: int = 0
+    ok: int = 0
+    blocked: int = 0
+    errors: int = 0
+    quarantines: int = 0
+
+    def proxies(self) -> dict:
+        return {} if self.url is None else {"http": self.url, "https": self.url}
+
+    def score(self, now: float) -> float:
+        while self.blocks and now - self.blocks[0] > BLOCK_WINDOW_S:
+            self.blocks.popleft()
+        latency_s = (self.latency_ms or 0.0) / 1000.0
+        return self.success / (1.0 + latency_s) * (0.5 ** len(self.blocks)) - 0.1 * self.inflight
+
+
+class ProxyPool:
+    def __init__(self, proxies: list[str], hosts: tuple[str, ...] = DEFAULT_HOSTS) -> None:
+        urls = [None if p.strip().lower() == DIRECT else p.strip() for p in proxies if p.strip()]
+        self.members = [ProxyState(u, _label(u)) for u in dict.fromkeys(urls)]
+        self.hosts = frozenset(h.strip().lower() for h in hosts if h.strip())
+        self._lock = threading.Lock()
+        self._all_quarantined_logged = False
+        self._restore()
+
+    def _restore(self) -> None:
+        """재시작 전 프록시 상태 (`crawl_state_store`) — 성공률·응답 시간·격리 단계와 남은 격리 시간."""
+        store = crawl_state_store.active()
+        if store is None:
+            return
+        saved = store.items(crawl_state_store.NS_PROXY)
+        for m in self.members:
+            st = saved.get(m.label)
+            if not st:
+                continue
+            m.success = float(st.get("success", m.success))
+            m.latency_ms = st.get("latency_ms")
+            m.quarantine_s = float(st.get("quarantine_s") or 0.0)
+            if m.quarantine_s:
+                m.quarantined_until = time.monotonic() + max(0.0, float(st.get("until", 0)) - time.time())
+        restored = [m.label for m in self.members if m.label in saved]
+        if restored:
+            logger.info("프록시 상태 이어 받음: %s", ", ".join(restored))
+
+    def _save(self, m: ProxyState) -> None:
+        store = crawl_state_store.active()
+        if store is None:
+            return
+        until = time.time() + max(0.0, m.quarantined_until - time.monotonic()) if m.quarantine_s else 0.0
+        store.put(
+            crawl_state_store.NS_PROXY,
+            m.label,
+            {"success": m.success, "latency_ms": m.latency_ms, "quarantine_s": m.quarantine_s, "until": until},
+        )
+
+    def applies(self, host: str | None) -> bool:
+        return bool(self.members) and (host or "").lower() in self.hosts
+
+    def pick(self, exclude: set[str] = frozenset()) -> ProxyState | None:
+        """다음 요청을 보낼 프록시. 격리가 끝난 프록시가 있으면 그것을 시험으로 먼저 보낸다."""
+        now = time.monotonic()
+        with self._lock:
+            pool = [m for m in self.members if m.label not in exclude]
+            if not pool:
+                return None
+            chosen = next(
+                (m for m in pool if m.quarantine_s and not m.probing and m.quarantined_until <= now),
+                None,
+            )
+            if chosen is not None:
+                chosen.probing = True
+                logger.info("프록시 %s 격리 종료 — 시험 요청", chosen.label)
+            else:
+                ready = [m for m in pool if not m.quarantine_s]
+                if ready:
+                    chosen = max(ready, key=lambda m: m.score(now))
+                    self._all_quarantined_logged = False
+                else:
+                    waiting = [m for m in pool if not m.probing] or pool
+                    chosen = min(waiting, key=lambda m: m.quarantined_until)
+                    if not self._all_quarantined_logged:
+                        logger.warning("프록시가 모두 격리 중 — 격리가 가장 먼저 끝나는 %s 사용", chosen.label)
+                        self._all_quarantined_logged = True
+            chosen.inflight += 1
+            chosen.requests += 1
+            return chosen
+
+    def record(self, m: ProxyState, outcome: str, elapsed_ms: float) -> None:
+        """outcome: ok | blocked | error. 요청 하나의 결과로 상태를 갱신한다."""
+        now = time.monotonic()
+        with self._lock:
+            m.inflight = max(0, m.inflight - 1)
+            m.success = (1 - EWMA_ALPHA) * m.success + EWMA_ALPHA * (1.0 if outcome == "ok" else 0.0)
+            if outcome == "ok":
+                m.ok += 1
+                m.latency_ms = elapsed_ms if m.latency_ms is None else (1 - EWMA_ALPHA) * m.latency_ms + EWMA_ALPHA * elapsed_ms
+                m.consecutive_failures = 0
+                if m.quarantine_s:
+                    logger.info("프록시 %s 복귀 (시험 요청 성공)", m.label)
+                    m.quarantine_s = 0.0
+                    m.quarantined_until = 0.0
+                    m.success = max(m.success, 0.5)
+                m.probing = False
+                self._save(m)
+                return
+            if outcome == "blocked":
+                m.blocked += 1
+                m.blocks.append(now)
+                m.score(now)  # 창 밖 기록 정리
+                trip = len(m.blocks) >= BLOCK_THRESHOLD
+            else:
+                m.errors += 1
+                m.consecutive_failures += 1
+                trip = m.consecutive_failures >= FAILURE_THRESHOLD
+            # 격리 중인데 (모두 격리라) 그냥 쓰인 경우의 실패는 격리를 늘리지 않는다 — 시험 실패만 늘림
+            if m.probing or (trip and not m.quarantine_s):
+                m.quarantine_s = min(QUARANTINE_MAX_S, max(QUARANTINE_BASE_S, m.quarantine_s * 2))
+                m.quarantined_until = now + m.quarantine_s
+                m.quarantines += 1
+                m.probing = False
+                logger.warning(
+                    "프록시 %s 격리 %.0f초 (%s, 최근 차단 %s건, 연속 연결 실패 %s건)",
+                    m.label,
+                    m.quarantine_s,
+                    "차단" if outcome == "blocked" else "연결 실패",
+                    len(m.blocks),
+                    m.consecutive_failures,
+                )
+            self._save(m)
+
+    def summary(self) -> str:
+        with self._lock:
+            bits = []
+            for m in self.members:
+                lat = f"{m.latency_ms:.0f}ms" if m.latency_ms is not None else "-"
+                state = " 격리" if m.quarantine_s else ""
+                bits.append(
+                    f"{m.label} 요청 {m.requests}·성공 {m.ok}·차단 {m.blocked}·오류 {m.errors}·{lat}·격리 {m.quarantines}회{state}"
+                )
+        return "프록시 풀: " + "; ".join(bits)
+
+
+class ProxyPoolAdapter(BaseAdapter):
+    """풀 적용 호스트 요청에 프록시를 골라 붙이고, 차단·연결 실패면 다른 프록시로 다시 보낸다."""
+
+    def __init__(self, inner: BaseAdapter, pool: ProxyPool) -> None:
+        super().__init__()
+        self.inner = inner
+        self.pool = pool
+
+    def send(self, request, **kwargs):
+        if not self.pool.applies(urlsplit(request.url).hostname):
+            return self.inner.send(request, **kwargs)
+        tried: set[str] = set()
+        resp = None
+        last_exc: Exception | None = None
+        for _ in range(min(MAX_ATTEMPTS, len(self.pool.members))):
+            m = self.pool.pick(tried)
+            if m is None:
+                break
+            tried.add(m.label)
+            t0 = time.monotonic()
+            try:
+                attempt = self.inner.send(request, **{**kwargs, "proxies": m.proxies()})
+            except (requests.ConnectionError, requests.Timeout) as e:
+                self.pool.record(m, "error", (time.monotonic() - t0) * 1000)
+                last_exc = e
+                continue
+            except Exception:
+                # 다른 프록시로 넘길 오류는 아니어도 기록은 남긴다 — 안 하면 inflight·시험(probing) 표시가 풀리지 않는다
+                self.pool.record(m, "error", (time.monotonic() - t0) * 1000)
+                if resp is not None:
+                    resp.close()
+                raise
+            # 차단 응답은 다음 시도가 응답을 받을 때까지 남겨 둔다 (모두 실패하면 마지막 차단 응답을 돌려줌)
+            if resp is not None:
+                resp.close()
+            resp = attempt
+            blocked = resp.status_code in BLOCK_STATUSES
+            self.pool.record(m, "blocked" if blocked else "ok", (time.monotonic() - t0) * 1000)
+            if not blocked:
+                return resp
+        if resp is not None:
+            return resp
+        assert last_exc is not None
+        raise last_exc
+
+    def close(self) -> None:
+        self.inner.close()
+
+
+_pool: ProxyPool | None = None
+
+
+def enable(proxies: list[str], hosts: tuple[str, ...] = DEFAULT_HOSTS) -> ProxyPool:
+    global _pool
+    _pool = ProxyPool(proxies, hosts)
+    logger.info(
+        "프록시 풀 %s개 (%s) — 대상 호스트 %s",
+        len(_pool.members),
+        ", ".join(m.label for m in _pool.members),
+        ", ".join(sorted(_pool.hosts)),
+    )
+    return _pool
+
+
+def enable_from_env() -> ProxyPool | None:
+    raw = os.getenv("CRAWL_PROXIES", "").strip()
+    if not raw:
+        return None
+    hosts = tuple(h for h in os.getenv("CRAWL_PROXY_HOSTS", "").split(",") if h.strip()) or DEFAULT_HOSTS
+    return enable(raw.split(","), hosts)
+
+
+def active() -> ProxyPool | None:
+    return _pool
+
+
+def wrap_adapter(adapter: BaseAdapter) -> BaseAdapter:
+    pool = _pool
+    return ProxyPoolAdapter(adapter, pool) if pool is not None else adapter
@@ -0,0 +1,187 @@
+"""
+수집 행 레코드(`__slots__`)와 upsert 페이로드 JSON 인코더
+
+공모전·K-Startup 지원사업·공고 행을 dict 대신 slots 데이터클래스로 들고 다닌다. 행마다 `__dict__`
+(키 해시 테이블)가 없어 큰 배치의 메모리가 줄고, 컬럼 이름 오타는 행을 만들 때 바로 드러난다.
+
+값이 `UNSET`인 선택 컬럼(`updated_at`, `search_tokens`, 본문 Storage·중복 색인 컬럼)은 페이로드에서 빠진다.
+PostgREST 일괄 upsert 는 빠진 컬럼을 NULL 로 채우므로 `crawl_server.upsert_rows`가 `columns()` 구성별로 나눠 보낸다.
+
+`dumps()`는 orjson(requirements.txt)으로, 설치되지 않았으면 표준 json 으로 같은 JSON 을 만든다 (첫 호출 때 어느 쪽인지 로그).
+`config.get_shared_http_client()`의 httpx 클라이언트가 PostgREST 요청 본문(`json=`)을 이 인코더로 보낸다.
+벤치: `scripts/bench_encode.py`.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+from dataclasses import dataclass, fields
+from typing import Any
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - 선택 의존성
+    orjson = None
+
+logger = logging.getLogger("allyoung.records")
+_encoder_logged = False
+
+
+class _Unset:
+    __slots__ = ()
+
+    def __repr__(self) -> str:
+        return "UNSET"
+
+    def __bool__(self) -> bool:
+        return False
+
+
+UNSET: Any = _Unset()
+
+
+class Record:
+    """slots 레코드 공통 — 보낼 컬럼 구성과 JSON 페이로드."""
+
+    __slots__ = ()
+    COLUMNS: tuple[str, ...] = ()
+
+    def columns(self) -> tuple[str, ...]:
+        return tuple(c for c in self.COLUMNS if getattr(self, c) is not UNSET)
+
+    def to_payload(self) -> dict[str, Any]:
+        out = {}
+        for c in self.COLUMNS:
+            v = getattr(self, c)
+            if v is not UNSET:
+                out[c] = v
+        return out
+
+
+def _record(cls):
+    cls = dataclass(slots=True)(cls)
+    cls.COLUMNS = tuple(f.name for f in fields(cls))
+    return cls
+
+
+@_record
+class ContestRecord(Record):
+    """contests upsert 행 (위비티·요즘것들)."""
+
+    source: str
+    id: str
+    title: str
+    d_day: str | None
+    host: str | None
+    url: str | None
+    category: str | None
+    created_at: str | None
+    first_seen_at: str | None
+    updated_at: str | None
+    content: str | None = UNSET
+    content_key: str | None = UNSET
+    content_hash: str | None = UNSET
+    search_tokens: str | None = UNSET
+    canonical_group_id: str | None = UNSET
+    dedup_signature: str | None = UNSET
+
+
+@_record
+class BusinessRecord(Record):
+    """startup_business 행 (K-Startup 통합공고 지원사업)."""
+
+    id: str
+    supt_biz_titl_nm: str | None
+    biz_category_cd: str | None
+    biz_yr: str | None
+    biz_supt_trgt_info: str | None
+    biz_supt_ctnt: str | None
+    biz_supt_bdgt_info: str | None
+    supt_biz_chrct: str | None
+    supt_biz_intrd_info: str | None
+    detl_pg_url: str | None
+    updated_at: str | None = UNSET
+    search_tokens: str | None = UNSET
+
+
+@_record
+class AnnouncementRecord(Record):
+    """startup_announcement 행 (K-Startup 지원사업 공고)."""
+
+    pbanc_sn: str
+    biz_pbanc_nm: str | None
+    intg_pbanc_biz_nm: str | None
+    pbanc_ntrp_nm: str | None
+    biz_prch_dprt_nm: str | None
+    prch_cnpl_no: str | None
+    supt_regin: str | None
+    supt_biz_clsfc: str | None
+    sprv_inst: str | None
+    pbanc_rcpt_bgng_dt: str | None
+    pbanc_rcpt_end_dt: str | None
+    rcrt_prgs_yn: str | None
+    intg_pbanc_yn: str | None
+    pbanc_ctnt: str | None
+    aply_trgt: str | None
+    aply_trgt_ctnt: str | None
+    aply_excl_trgt_ctnt: str | None
+    biz_enyy: str | None
+    biz_trgt_age: str | None
+    detl_pg_url: str | None
+    biz_aply_url: str | None
+    biz_gdnc_url: str | None
+    aply_mthd_onli_rcpt_istc: str | None
+    aply_mthd_eml_rcpt_istc: str | None
+    aply_mthd_fax_rcpt_istc: str | None
+    aply_mthd_vst_rcpt_istc: str | None
+    aply_mthd_pssr_rcpt_istc: str | None
+    aply_mthd_etc_istc: str | None
+    prfn_matr: str | None
+    updated_at: str | None = UNSET
+    search_tokens: str | None = UNSET
+
+
+class EncodedRows(list):
+    """upsert 행(dict) 목록 + 행마다 한 번 인코딩해 둔 JSON 조각 (`upsert_batch.BatchingWriter`가 크기를 잴 때 만든 것).
+
+    `dumps()`는 조각을 이어 붙이기만 하고 다시 인코딩하지 않는다. 목록 자체는 PostgREST `columns` 계산·메모리 대역용.
+    """
+
+    __slots__ = ("parts",)
+
+    def __init__(self, rows: list, parts: list[bytes]) -> None:
+        super().__init__(rows)
+        self.parts = parts
+
+
+def _default(obj: Any) -> Any:
+    if isinstance(obj, Record):
+        return obj.to_payload()
+    raise TypeError(f"JSON 으로 보낼 수 없는 값: {type(obj).__name__}")
+
+
+def dumps(obj: Any) -> bytes:
+    """PostgREST 요청 본문 JSON (UTF-8, 공백 없음). 레코드는 `to_payload()`로 바꿔 넣는다."""
+    global _encoder_logged
+    if not _encoder_logged:
+        # 첫 요청 때 한 번 — 배포 환경에 orjson 휠이 빠지면 조용히 느린 경로로 가지 않게 드러낸다
+        _encoder_logged = True
+        if orjson is not None:
+            logger.info("PostgREST 페이로드 인코더: orjson %s", getattr(orjson, "__version__", ""))
+        else:
+            logger.warning("PostgREST 페이로드 인코더: 표준 json (orjson 미설치 — pip install orjson)")
+    if isinstance(obj, EncodedRows):
+        return b"[" + b",".join(obj.parts) + b"]"
+    if orjson is not None:
+        return orjson.dumps(obj, default=_default, option=orjson.OPT_PASSTHROUGH_DATACLASS)
+    return json.dumps(obj, default=_default, ensure_ascii=False, separators=(",", ":"), allow_nan=False).encode("utf-8")
+
+
+def to_payload(obj: Any) -> Any:
+    """레코드(또는 레코드 목록)를 dict 로 — 메모리 대역(`fake_supabase`)이 받는 값을 실제 전송 본문과 맞춘다."""
+    if isinstance(obj, Record):
+        return obj.to_payload()
+    if isinstance(obj, list):
+        return [o.to_payload() if isinstance(o, Record) else o for o in obj]
+    return obj
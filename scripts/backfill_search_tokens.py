@@ -0,0 +1,83 @@
+#!/usr/bin/env python3
+"""`search_tokens`가 비어 있는 기존 행을 채운다 (마이그레이션 20261019140000_search_tokens.sql 적용 후 1회).
+
+크롤러(`--search-index`)는 본문을 새로 받는 행에만 토큰을 넣으므로, 그 전에 수집된 행은 이 스크립트로 채운다.
+Storage 에만 본문이 있는 행(`content_key`)은 버킷에서 받아 온다.
+
+  python scripts/backfill_search_tokens.py                     # contests, startup_announcement, startup_business
+  python scripts/backfill_search_tokens.py --table contests --batch 100
+"""
+from __future__ import annotations
+
+import argparse
+import logging
+import sys
+from pathlib import Path
+
+_ROOT = Path(__file__).resolve().parent.parent
+if str(_ROOT) not in sys.path:
+    sys.path.insert(0, str(_ROOT))
+
+import search_doc
+from config import get_supabase_admin_client
+from content_store import CONTEST_CONTENT_BUCKET
+from crawl_server import ANNOUNCEMENT_SEARCH_COLUMNS, BUSINESS_SEARCH_COLUMNS
+
+log = logging.getLogger("allyoung.backfill_search")
+
+# 테이블 → (키 컬럼, 토큰 원천 컬럼)
+TABLES: dict[str, tuple[tuple[str, ...], tuple[str, ...]]] = {
+    "contests": (("source", "id"), ("title", "host", "category")),
+    "startup_announcement": (("pbanc_sn",), ANNOUNCEMENT_SEARCH_COLUMNS),
+    "startup_business": (("id",), BUSINESS_SEARCH_COLUMNS),
+}
+
+
+def _contest_html(client, row: dict) -> str:
+    html = row.get("content") or ""
+    if html.strip() or not row.get("content_key"):
+        return html
+    try:
+        return client.storage.from_(CONTEST_CONTENT_BUCKET).download(row["content_key"]).decode("utf-8")
+    except Exception as e:
+        log.warning("본문 다운로드 실패 %s: %s", row["content_key"], e)
+        return ""
+
+
+def backfill(client, table: str, batch: int) -> int:
+    keys, text_cols = TABLES[table]
+    cols = list(keys) + list(text_cols)
+    if table == "contests":
+        cols += ["content", "content_key"]
+    done = 0
+    while True:
+        res = client.table(table).select(",".join(cols)).is_("search_tokens", "null").limit(batch).execute()
+        rows = res.data or []
+        if not rows:
+            return done
+        for row in rows:
+            html = _contest_html(client, row) if table == "contests" else None
+            tokens = search_doc.search_tokens(*(row.get(c) for c in text_cols), html=html)
+            q = client.table(table).update({"search_tokens": tokens})
+            for k in keys:
+                q = q.eq(k, row[k])
+            q.execute()
+        done += len(rows)
+        log.info("%s: %s행 채움", table, done)
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="기존 행 search_tokens 채우기")
+    parser.add_argument("--table", choices=sorted(TABLES), action="append", help="대상 테이블 (여러 번 지정 가능, 기본 전체)")
+    parser.add_argument("--batch", type=int, default=200, help="한 번에 읽을 행 수")
+    args = parser.parse_args()
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s [%(levelname)s] %(message)s")
+
+    client = get_supabase_admin_client()
+    for table in args.table or list(TABLES):
+        log.info("%s 완료: %s행", table, backfill(client, table, max(1, args.batch)))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
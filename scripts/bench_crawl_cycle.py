@@ -0,0 +1,229 @@
+#!/usr/bin/env python3
+"""가짜 출처 서버(`fake_origin.py`)에 대해 크롤 한 사이클을 돌려 처리량을 잰다.
+
+실제 사이트·data.go.kr 할당량을 쓰지 않고 `run_wevity` / `run_allforyoung` / `run_kstartup`을
+같은 조건에서 반복 측정한다. 동시성·속도 제한 변경 전후 비교용.
+
+  python scripts/bench_crawl_cycle.py --source wevity --wevity-pages 10
+  python scripts/bench_crawl_cycle.py --source all --latency-ms 80 --jitter-ms 40 --error-rate 0.02
+  python scripts/bench_crawl_cycle.py --source wevity --burst-403-every 25 --burst-403-len 3
+  python scripts/bench_crawl_cycle.py --polite-delay-scale 1   # 운영과 같은 고정 대기 포함
+  python scripts/bench_crawl_cycle.py --content-storage        # 본문 Storage 저장 모드 (db KB 비교)
+  python scripts/bench_crawl_cycle.py --search-index           # search_tokens 생성 비용·행 크기
+  python scripts/bench_crawl_cycle.py --cycles 2 --liveness     # 2회차: 바뀐 행만 upsert + 순회 생존 기록
+  python scripts/bench_crawl_cycle.py --dedup                  # 출처 간 중복 색인 (RPC·밴드 upsert 왕복 포함)
+  python scripts/bench_crawl_cycle.py --work-queue --workers 3  # 작업 큐로 워커 3개가 한 사이클을 나눔 (가짜 RPC)
+  python scripts/bench_crawl_cycle.py --work-queue --workers 4 --parse-workers 4   # 파싱을 프로세스로 (GIL 해소)
+  python scripts/bench_crawl_cycle.py --source wevity --proxies ok,slow:200,flaky:0.5,block,dead   # 프록시 풀
+  python scripts/bench_crawl_cycle.py --error-rate 0.05 --http-retries 0   # 재시도 끔 (기본 3) 비교
+  python scripts/bench_crawl_cycle.py --error-rate 0.1 --http-retries 0 --cycles 2 --state-db /tmp/crawl_state.db   # 실패 상세 백오프
+  python scripts/bench_crawl_cycle.py --source allforyoung --allforyoung-pages 20 --latency-ms 100 --time-budget 40   # 시간 예산 멈춤
+  python scripts/bench_crawl_cycle.py --cycles 2 --liveness --changes /tmp/changes.ndjson --changes-table   # 변경 피드
+  python scripts/bench_crawl_cycle.py --source allforyoung --allforyoung-pages 10 --latency-ms 100 --allforyoung-list-workers 0   # 목록 순차 비교 (기본 4 = 계획·동시)
+
+배치 간 대기(`--sleep-batch-*`)와 예의상 대기(`CRAWL_POLITE_DELAY_SCALE`)는 기본 0 — 순수 처리량을 본다.
+DB는 `fake_supabase.FakeSupabase`(메모리) — 사이클별 PostgREST 왕복 수·페이로드 바이트도 함께 출력한다.
+`--seed-contests`로 기존 contests 규모를 키우면 갱신 위주 사이클도 잴 수 있다.
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import logging
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+_ROOT = Path(__file__).resolve().parent.parent
+_HERE = Path(__file__).resolve().parent
+for _p in (_ROOT, _HERE):
+    if str(_p) not in sys.path:
+        sys.path.insert(0, str(_p))
+
+import change_feed
+import content_store
+import contest_dedup
+import contest_liveness
+import crawl_http
+import crawl_retry
+import crawl_server
+import crawl_state_store
+import cycle_budget
+import parse_pool
+import proxy_pool
+import search_doc
+import work_queue
+from fake_origin import FakeOrigin, OriginConfig
+from fake_proxy import FakeProxy
+from fake_supabase import FakeSupabase, seed_synthetic
+
+
+def run_source(source: str, client, args: argparse.Namespace) -> dict:
+    pb, so, se = args.page_batch_size, args.sleep_batch_odd, args.sleep_batch_even
+    t0 = time.perf_counter()
+    ins = upd = 0
+    if source == "wevity":
+        ins, upd = crawl_server.run_wevity(client, pb, so, se)
+    elif source == "allforyoung":
+        ins, upd = crawl_server.run_allforyoung(client, pb, so, se)
+    elif source == "kstartup":
+        crawl_server.run_kstartup(client, "bench-service-key", args.kstartup_page_batch_size, so, se)
+    return {"seconds": time.perf_counter() - t0, "inserted": ins, "updated": upd}
+
+
+def run_workers(source: str, client, args: argparse.Namespace) -> dict:
+    """작업 큐 모드: 워커 스레드 N개가 같은 사이클을 나눠 처리. 합계는 마무리한 워커 1개만 돌려준다."""
+    t0 = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=max(1, args.workers)) as pool:
+        results = list(pool.map(lambda _: run_source(source, client, args), range(max(1, args.workers))))
+    return {
+        "seconds": time.perf_counter() - t0,
+        "inserted": sum(r["inserted"] for r in results),
+        "updated": sum(r["updated"] for r in results),
+    }
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="가짜 출처 서버 대상 크롤 사이클 처리량 벤치")
+    parser.add_argument("--source", choices=("wevity", "allforyoung", "kstartup", "all"), default="all")
+    parser.add_argument("--wevity-pages", type=int, default=10)
+    parser.add_argument("--allforyoung-pages", type=int, default=5)
+    parser.add_argument("--kstartup-pages", type=int, default=3)
+    parser.add_argument("--latency-ms", type=float, default=0.0)
+    parser.add_argument("--jitter-ms", type=float, default=0.0)
+    parser.add_argument("--error-rate", type=float, default=0.0)
+    parser.add_argument("--burst-403-every", type=int, default=0, help="위비티 요청 N번마다 403 버스트 시작")
+    parser.add_argument("--burst-403-len", type=int, default=0, help="403 버스트 길이(연속 요청 수)")
+    parser.add_argument("--page-batch-size", type=int, default=1)
+    parser.add_argument("--kstartup-page-batch-size", type=int, default=5)
+    parser.add_argument("--sleep-batch-odd", type=int, default=0)
+    parser.add_argument("--sleep-batch-even", type=int, default=0)
+    parser.add_argument("--polite-delay-scale", type=float, default=0.0, help="예의상 고정 대기 배율 (운영=1)")
+    parser.add_argument("--seed-contests", type=int, default=0, help="사전 적재할 합성 contests 수")
+    parser.add_argument("--seed-profiles", type=int, default=100, help="사전 적재할 합성 profiles 수")
+    parser.add_argument("--content-storage", action="store_true", help="상세 본문을 (가짜) Storage 에 해시 키로 저장")
+    parser.add_argument("--search-index", action="store_true", help="search_tokens 생성 (행 크기·시간 비교)")
+    parser.add_argument("--cycles", type=int, default=1, help="같은 DB 로 사이클 반복 (2회차부터는 기존 행 갱신 경로)")
+    parser.add_argument("--liveness", action="store_true", help="바뀐 행만 upsert + 순회 생존 기록 (--cycles 2 로 2회차 비교)")
+    parser.add_argument("--dedup", action="store_true", help="출처 간 중복 색인 사용 (가짜 RPC)")
+    parser.add_argument("--work-queue", action="store_true", help="작업 큐 모드 (가짜 RPC, 사이클마다 새 cycle id)")
+    parser.add_argument("--workers", type=int, default=1, help="--work-queue 와 함께: 같은 사이클을 나눌 워커 스레드 수")
+    parser.add_argument("--parse-workers", type=int, default=0, help="HTML 파싱 워커 프로세스 수 (0=본 프로세스)")
+    parser.add_argument(
+        "--proxies",
+        default="",
+        help="위비티 요청을 가짜 프록시 풀로 (예: ok,slow:200,flaky:0.5,block,dead — fake_proxy 모드, direct=직접)",
+    )
+    parser.add_argument("--http-retries", type=int, default=3, help="요청 재시도 횟수 (crawl_retry, 0=끔)")
+    parser.add_argument("--state-db", default="", metavar="PATH", help="로컬 상태 저장소 (상세 실패 백오프 등, crawl_state_store)")
+    parser.add_argument("--changes", default="", metavar="FILE", help="변경 피드 NDJSON 파일 (change_feed)")
+    parser.add_argument("--changes-table", action="store_true", help="변경 피드를 (가짜) crawl_changes 테이블에도")
+    parser.add_argument(
+        "--allforyoung-list-workers",
+        type=int,
+        default=crawl_server.ALLFORYOUNG_LIST_WORKERS,
+        metavar="N",
+        help="요즘것들 목록 계획 후 동시 요청 수 (0=기본 size 순차)",
+    )
+    parser.add_argument("--time-budget", type=float, default=0.0, metavar="SEC", help="시간 예산 초 (cycle_budget, 예비 0 — 배치 경계 멈춤)")
+    parser.add_argument("--json", action="store_true", help="결과를 JSON으로 출력")
+    parser.add_argument("-v", "--verbose", action="store_true", help="크롤러 INFO 로그 표시")
+    args = parser.parse_args()
+
+    if not args.verbose:
+        logging.getLogger().setLevel(logging.WARNING)
+    crawl_http.POLITE_DELAY_SCALE = args.polite_delay_scale
+    crawl_retry.configure(args.http_retries)
+    crawl_server._allforyoung_list_workers = args.allforyoung_list_workers
+    if args.state_db:
+        crawl_state_store.enable(args.state_db)
+    if args.time_budget > 0:
+        cycle_budget.enable(args.time_budget, 0)
+
+    cfg = OriginConfig(
+        wevity_pages=args.wevity_pages,
+        allforyoung_pages=args.allforyoung_pages,
+        kstartup_pages=args.kstartup_pages,
+        latency_ms=args.latency_ms,
+        jitter_ms=args.jitter_ms,
+        error_rate=args.error_rate,
+        burst_403_every=args.burst_403_every,
+        burst_403_len=args.burst_403_len,
+    )
+    sources = ["wevity", "allforyoung", "kstartup"] if args.source == "all" else [args.source]
+    client = FakeSupabase()
+    seed_synthetic(client, contests=args.seed_contests, profiles=args.seed_profiles, id_prefix="seed-")
+    if args.content_storage:
+        content_store.enable(client)
+    if args.dedup:
+        contest_dedup.enable(client)
+    if args.liveness:
+        contest_liveness.enable(client)
+    if args.search_index:
+        search_doc.enable()
+    if args.changes or args.changes_table:
+        change_feed.enable(args.changes or None, client if args.changes_table else None)
+    if args.parse_workers > 0:
+        parse_pool.enable(args.parse_workers)
+    queue = work_queue.enable(client, cycle_id="bench") if args.work_queue else None
+    specs = [p.strip() for p in args.proxies.split(",") if p.strip()]
+    fake_proxies = [FakeProxy.from_spec(p).start() for p in specs if p != proxy_pool.DIRECT]
+    if specs:
+        urls = iter(fp.url for fp in fake_proxies)
+        proxy_pool.enable([p if p == proxy_pool.DIRECT else next(urls) for p in specs])
+    report: dict[str, dict] = {}
+    with FakeOrigin(cfg) as origin:
+        crawl_http.set_origin_overrides(origin.overrides())
+        try:
+            for cycle in range(1, max(1, args.cycles) + 1):
+                for src in sources:
+                    before = origin.total_requests()
+                    client.reset_stats()
+                    if queue:
+                        queue.fixed_cycle_id = f"bench-{cycle}"
+                    r = run_workers(src, client, args) if queue and src != "kstartup" else run_source(src, client, args)
+                    r["requests"] = origin.total_requests() - before
+                    r["requests_per_s"] = r["requests"] / r["seconds"] if r["seconds"] > 0 else 0.0
+                    db = client.totals()
+                    r["db_round_trips"] = db.calls
+                    r["db_request_kb"] = db.request_bytes / 1024.0
+                    r["db_rows_sent"] = db.rows_sent
+                    r["db_ops"] = client.stats()
+                    report[src if args.cycles <= 1 else f"{src}#{cycle}"] = r
+        finally:
+            crawl_http.set_origin_overrides({})
+            if parse_pool.active():
+                parse_pool.active().shutdown()
+            for fp in fake_proxies:
+                fp.stop()
+        routes = origin.stats()
+
+    if args.json:
+        print(json.dumps({"sources": report, "routes": routes}, ensure_ascii=False, indent=2))
+        return 0
+    print(
+        f"{'source':<12} {'wall s':>8} {'requests':>9} {'req/s':>8} {'inserted':>9} {'updated':>8} "
+        f"{'db calls':>9} {'db KB':>8} {'db rows':>8}"
+    )
+    for src, r in report.items():
+        print(
+            f"{src:<12} {r['seconds']:>8.2f} {r['requests']:>9} {r['requests_per_s']:>8.1f} "
+            f"{r['inserted']:>9} {r['updated']:>8} {r['db_round_trips']:>9} {r['db_request_kb']:>8.0f} "
+            f"{r['db_rows_sent']:>8}"
+        )
+    print()
+    print("route                                  status counts")
+    for route, by_status in routes.items():
+        print(f"{route:<38} " + " ".join(f"{s}:{n}" for s, n in by_status.items()))
+    if proxy_pool.active():
+        print()
+        print(proxy_pool.active().summary().replace("; ", "\n  "))
+    if cycle_budget.active():
+        print()
+        print(cycle_budget.active().summary())
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,101 @@
+#!/usr/bin/env python3
+"""DB 쪽 왕복 벤치 — 메모리 PostgREST 대역(`fake_supabase.py`)에 합성 규모 데이터를 채우고
+크롤러의 쓰기 경로가 몇 번 왕복하는지, 페이로드가 얼마나 되는지 센다.
+
+  python scripts/bench_db_roundtrips.py                              # contests 10만·profiles 1만
+  python scripts/bench_db_roundtrips.py --contests 20000 --listed 2000 --profiles 500
+
+시나리오
+  dday_refresh   `_refresh_dday_pool` — 목록 N건 D-day 갱신
+  notify_fanout  `notify_contest_cycle_summary` — 알림 1건 + 회원 전체 notification_user_state
+  existing_check `fetch_existing_contests` — 목록 N건 기존 행 조회 (ID_CHUNK 단위)
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import logging
+import sys
+import time
+from pathlib import Path
+
+_ROOT = Path(__file__).resolve().parent.parent
+_HERE = Path(__file__).resolve().parent
+for _p in (_ROOT, _HERE):
+    if str(_p) not in sys.path:
+        sys.path.insert(0, str(_p))
+
+import crawl_server
+from crawler import SOURCE_WEVITY
+from fake_supabase import FakeSupabase, seed_synthetic
+
+
+def _listed_rows(db: FakeSupabase, n: int) -> list[dict]:
+    rows = [r for r in db.rows("contests") if r["source"] == SOURCE_WEVITY][:n]
+    return [{**r, "d_day": "D-1"} for r in rows]
+
+
+def scenarios(db: FakeSupabase, listed: list[dict]) -> dict:
+    ids = [r["id"] for r in listed]
+    return {
+        "dday_refresh": lambda: crawl_server._refresh_dday_pool(lambda: db, SOURCE_WEVITY, listed),
+        "notify_fanout": lambda: crawl_server.notify_contest_cycle_summary(db, 10, 5, 0, 0),
+        "existing_check": lambda: crawl_server.fetch_existing_contests(db, SOURCE_WEVITY, ids),
+    }
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="크롤러 DB 쓰기 경로 왕복 벤치 (메모리 PostgREST)")
+    parser.add_argument("--contests", type=int, default=100_000)
+    parser.add_argument("--profiles", type=int, default=10_000)
+    parser.add_argument("--listed", type=int, default=5_000, help="목록에서 본 것으로 칠 contests 수")
+    parser.add_argument("--content-bytes", type=int, default=2_000)
+    parser.add_argument("-k", dest="filter", default="", help="시나리오 이름 부분 문자열 필터")
+    parser.add_argument("--json", action="store_true")
+    args = parser.parse_args()
+    logging.getLogger().setLevel(logging.WARNING)
+
+    db = FakeSupabase()
+    t0 = time.perf_counter()
+    seed_synthetic(db, contests=args.contests, profiles=args.profiles, content_bytes=args.content_bytes)
+    seed_s = time.perf_counter() - t0
+    listed = _listed_rows(db, args.listed)
+
+    report: dict[str, dict] = {}
+    for name, fn in scenarios(db, listed).items():
+        if args.filter not in name:
+            continue
+        db.reset_stats()
+        t = time.perf_counter()
+        fn()
+        tot = db.totals()
+        report[name] = {
+            "seconds": time.perf_counter() - t,
+            "round_trips": tot.calls,
+            "request_kb": tot.request_bytes / 1024.0,
+            "response_kb": tot.response_bytes / 1024.0,
+            "rows_sent": tot.rows_sent,
+            "rows_returned": tot.rows_returned,
+            "ops": db.stats(),
+        }
+
+    if args.json:
+        print(json.dumps(report, ensure_ascii=False, indent=2))
+        return 0
+    print(
+        f"규모: contests {args.contests:,} · profiles {args.profiles:,} · 목록 {len(listed):,}건 "
+        f"(시드 {seed_s:.1f}s)"
+    )
+    print(f"{'scenario':<16} {'round trips':>11} {'req KB':>9} {'resp KB':>9} {'rows sent':>10} {'rows ret':>9}")
+    for name, r in report.items():
+        print(
+            f"{name:<16} {r['round_trips']:>11,} {r['request_kb']:>9.0f} {r['response_kb']:>9.0f} "
+            f"{r['rows_sent']:>10,} {r['rows_returned']:>9,}"
+        )
+        for op, s in r["ops"].items():
+            print(f"    {op:<38} calls {s['calls']:>7,}  req {s['request_bytes'] / 1024:>8.0f}KB")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,128 @@
+#!/usr/bin/env python3
+"""upsert 페이로드 인코딩 마이크로벤치 (네트워크·DB 없음).
+
+`scripts/fixtures/kstartup/` 공고·지원사업 XML 을 매핑한 행을 N건으로 불려, 한 배치를
+  - 메모리: dict 행 목록 vs slots 레코드(`records`) 목록으로 들고 있을 때 peak (tracemalloc)
+  - 인코딩: httpx 기본(표준 json) vs `records.dumps`(orjson, 없으면 표준 json) — 요청 1번 분량
+으로 잰다. 두 인코더 출력이 같은 JSON 인지도 확인한다 (다르면 종료 코드 1).
+
+  python scripts/bench_encode.py                       # 공고 1000건 배치
+  python scripts/bench_encode.py --rows 5000 --kind business
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+
+_ROOT = Path(__file__).resolve().parent.parent
+if str(_ROOT) not in sys.path:
+    sys.path.insert(0, str(_ROOT))
+
+import records
+from kstartup_crawler import map_announcement_item, map_business_item, parse_col_items
+
+FIXTURES = Path(__file__).resolve().parent / "fixtures" / "kstartup"
+KINDS = {
+    "announcement": ("announcement_*.xml", map_announcement_item),
+    "business": ("business_*.xml", map_business_item),
+}
+
+
+def _cols(kind: str) -> list[dict[str, str]]:
+    pattern, _ = KINDS[kind]
+    cols: list[dict[str, str]] = []
+    for p in sorted(FIXTURES.glob(pattern)):
+        cols.extend(parse_col_items(p.read_text(encoding="utf-8")))
+    return cols
+
+
+def _build(kind: str, cols: list[dict[str, str]], n: int, as_dict: bool) -> list:
+    """fixture 행을 돌려 쓰며 n건 — id 만 바꿔 서로 다른 행으로 만든다."""
+    _, mapper = KINDS[kind]
+    key = "pbanc_sn" if kind == "announcement" else "id"
+    out = []
+    i = 0
+    while len(out) < n:
+        r = mapper(cols[i % len(cols)])
+        i += 1
+        if r is None:
+            continue
+        setattr(r, key, f"{getattr(r, key)}-{i}")
+        r.updated_at = "2026-01-01T00:00:00+00:00"
+        out.append(r.to_payload() if as_dict else r)
+    return out
+
+
+def _peak_kb(fn) -> float:
+    tracemalloc.start()
+    held = fn()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del held
+    return peak / 1024.0
+
+
+def _httpx_default(obj) -> bytes:
+    """httpx 0.28 `json=` 기본 인코딩과 같은 설정."""
+    return json.dumps(obj, ensure_ascii=False, separators=(",", ":"), allow_nan=False).encode("utf-8")
+
+
+def _time_ms(fn, min_seconds: float) -> float:
+    runs = 0
+    t0 = time.perf_counter()
+    elapsed = 0.0
+    while elapsed < min_seconds or runs < 3:
+        fn()
+        runs += 1
+        elapsed = time.perf_counter() - t0
+    return elapsed * 1000.0 / runs
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="upsert 페이로드 인코딩·행 메모리 마이크로벤치")
+    parser.add_argument("--kind", choices=sorted(KINDS), default="announcement")
+    parser.add_argument("--rows", type=int, default=1000, help="한 배치 행 수")
+    parser.add_argument("--min-seconds", type=float, default=1.0, help="인코더당 최소 측정 시간")
+    parser.add_argument("--json", action="store_true", help="결과를 JSON으로 출력")
+    args = parser.parse_args()
+
+    cols = _cols(args.kind)
+    if not cols:
+        print(f"픽스처 없음: {FIXTURES}/{KINDS[args.kind][0]}")
+        return 1
+    n = max(1, args.rows)
+    dict_rows = _build(args.kind, cols, n, as_dict=True)
+    rec_rows = _build(args.kind, cols, n, as_dict=False)
+
+    same = json.loads(_httpx_default(dict_rows)) == json.loads(records.dumps(rec_rows))
+    result = {
+        "kind": args.kind,
+        "rows": n,
+        "encoder": "orjson" if records.orjson is not None else "json",
+        "payload_kb": len(records.dumps(rec_rows)) / 1024.0,
+        "dict_peak_kb": _peak_kb(lambda: _build(args.kind, cols, n, as_dict=True)),
+        "record_peak_kb": _peak_kb(lambda: _build(args.kind, cols, n, as_dict=False)),
+        "httpx_json_ms": _time_ms(lambda: _httpx_default(dict_rows), args.min_seconds),
+        "records_dumps_ms": _time_ms(lambda: records.dumps(dict_rows), args.min_seconds),
+        "records_payload_ms": _time_ms(lambda: records.dumps(records.to_payload(rec_rows)), args.min_seconds),
+        "same_json": same,
+    }
+
+    if args.json:
+        print(json.dumps(result, ensure_ascii=False, indent=2))
+    else:
+        print(f"{args.kind} {n}건 배치, 페이로드 {result['payload_kb']:.0f}KB, 인코더 {result['encoder']}")
+        print(f"  행 메모리 peak     dict {result['dict_peak_kb']:>8.0f}KB   레코드 {result['record_peak_kb']:>8.0f}KB")
+        print(f"  인코딩 (요청 1번)  httpx 기본 json {result['httpx_json_ms']:>7.2f}ms")
+        print(f"                     records.dumps   {result['records_dumps_ms']:>7.2f}ms")
+        print(f"                     레코드→payload→dumps {result['records_payload_ms']:>7.2f}ms (upsert_rows 경로)")
+        print("출력 JSON 일치" if same else "출력 JSON 불일치 — 인코더 동작이 다릅니다")
+    return 0 if same else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
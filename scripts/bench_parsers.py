@@ -0,0 +1,244 @@
+#!/usr/bin/env python3
+"""파서 오프라인 벤치마크 + 골든 출력 검증 (네트워크·DB 없음).
+
+`scripts/fixtures/` 의 위비티·요즘것들·K-Startup 응답 코퍼스를 각 파서에 반복 투입해
+pages/s, rows/s, 1회 통과 peak 메모리(tracemalloc)를 출력하고,
+출력이 `scripts/fixtures/golden/<parser>.json` 과 같은지 확인한다 (다르면 종료 코드 1).
+
+  python scripts/bench_parsers.py                     # 전체 벤치 + 골든 검증
+  python scripts/bench_parsers.py --check             # 골든 검증만 (빠름)
+  python scripts/bench_parsers.py -k wevity           # 이름에 wevity 가 들어간 파서만
+  python scripts/bench_parsers.py --update-golden     # 의도한 출력 변경 후 골든 갱신
+
+코퍼스는 각 사이트 응답 구조(목록·상세 선택자, v2 posts JSON, 공공 API XML)를 그대로 따르는 고정 샘플이다.
+실제 응답으로 교체·추가할 때는 같은 파일명 규칙(`detail_<id>.html` 등)으로 넣고 `--update-golden`.
+
+파서 최적화 PR은 `--check` 통과(동작 보존)와 벤치 수치를 함께 첨부한다.
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import sys
+import time
+import tracemalloc
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Callable
+
+_ROOT = Path(__file__).resolve().parent.parent
+if str(_ROOT) not in sys.path:
+    sys.path.insert(0, str(_ROOT))
+
+import records
+from crawler import (
+    extract_post_detail_html,
+    extract_wevity_detail_html,
+    parse_allforyoung_contest_list_html,
+    parse_allforyoung_posts,
+    parse_post_detail_html,
+    parse_wevity_detail_html,
+    parse_wevity_list_html,
+)
+from kstartup_crawler import (
+    map_announcement_item,
+    map_business_item,
+    parse_col_items,
+    parse_pagination,
+)
+
+FIXTURES = Path(__file__).resolve().parent / "fixtures"
+GOLDEN = FIXTURES / "golden"
+
+
+def _id_from_name(path: Path) -> str:
+    return path.stem.split("_", 1)[1]
+
+
+def _kstartup(mapper: Callable[[dict], Any]) -> Callable[[str, Path], list]:
+    def run(xml: str, _path: Path) -> list:
+        meta = parse_pagination(xml)
+        rows = [mapper(col) for col in parse_col_items(xml)]
+        return [meta, [r for r in rows if r]]
+
+    return run
+
+
+@dataclass(frozen=True)
+class ParserCase:
+    name: str
+    pattern: str
+    run: Callable[[str, Path], Any]
+    count_rows: Callable[[Any], int]
+
+
+CASES: list[ParserCase] = [
+    ParserCase("wevity.list", "wevity/list_*.html", lambda t, _p: parse_wevity_list_html(t), len),
+    ParserCase(
+        "wevity.detail",
+        "wevity/detail_*.html",
+        lambda t, p: parse_wevity_detail_html(t, _id_from_name(p)),
+        lambda _r: 1,
+    ),
+    ParserCase(
+        "wevity.detail_html",
+        "wevity/detail_*.html",
+        lambda t, _p: extract_wevity_detail_html(t),
+        lambda r: 1 if r else 0,
+    ),
+    ParserCase(
+        "allforyoung.list_api",
+        "allforyoung/posts_*.json",
+        lambda t, _p: parse_allforyoung_posts(json.loads(t)),
+        len,
+    ),
+    ParserCase(
+        "allforyoung.list_html",
+        "allforyoung/list_*.html",
+        lambda t, _p: parse_allforyoung_contest_list_html(t),
+        len,
+    ),
+    ParserCase(
+        "allforyoung.detail",
+        "allforyoung/detail_*.html",
+        lambda t, p: parse_post_detail_html(t, _id_from_name(p)),
+        lambda _r: 1,
+    ),
+    ParserCase(
+        "allforyoung.detail_html",
+        "allforyoung/detail_*.html",
+        lambda t, _p: extract_post_detail_html(t),
+        lambda r: 1 if r else 0,
+    ),
+    ParserCase("kstartup.business", "kstartup/business_*.xml", _kstartup(map_business_item), lambda r: len(r[1])),
+    ParserCase(
+        "kstartup.announcement",
+        "kstartup/announcement_*.xml",
+        _kstartup(map_announcement_item),
+        lambda r: len(r[1]),
+    ),
+]
+
+
+def _load_corpus(case: ParserCase) -> list[tuple[Path, str]]:
+    files = sorted(FIXTURES.glob(case.pattern))
+    return [(p, p.read_text(encoding="utf-8")) for p in files]
+
+
+def _run_once(case: ParserCase, corpus: list[tuple[Path, str]]) -> dict[str, Any]:
+    return {p.name: case.run(text, p) for p, text in corpus}
+
+
+def _normalize(obj: Any) -> Any:
+    """골든 비교용: JSON 왕복으로 tuple/list·레코드(`records`) 등 표현 차이를 없앤다 (DB 로 보내는 것과 같은 인코더)."""
+    return json.loads(records.dumps(obj))
+
+
+def check_golden(case: ParserCase, output: dict[str, Any], update: bool) -> bool:
+    path = GOLDEN / f"{case.name}.json"
+    got = _normalize(output)
+    if update:
+        GOLDEN.mkdir(parents=True, exist_ok=True)
+        path.write_text(json.dumps(got, ensure_ascii=False, indent=1) + "\n", encoding="utf-8")
+        return True
+    if not path.exists():
+        print(f"  [골든 없음] {path.relative_to(_ROOT)} — --update-golden 으로 생성")
+        return False
+    want = json.loads(path.read_text(encoding="utf-8"))
+    if got == want:
+        return True
+    for fname in sorted(set(want) | set(got)):
+        if want.get(fname) != got.get(fname):
+            print(f"  [골든 불일치] {case.name} / {fname}")
+            _print_first_diff(want.get(fname), got.get(fname), fname)
+    return False
+
+
+def _print_first_diff(want: Any, got: Any, where: str) -> None:
+    if isinstance(want, dict) and isinstance(got, dict):
+        for k in sorted(set(want) | set(got)):
+            if want.get(k) != got.get(k):
+                return _print_first_diff(want.get(k), got.get(k), f"{where}.{k}")
+    if isinstance(want, list) and isinstance(got, list):
+        if len(want) != len(got):
+            print(f"    {where}: 길이 {len(want)} → {len(got)}")
+            return
+        for i, (a, b) in enumerate(zip(want, got)):
+            if a != b:
+                return _print_first_diff(a, b, f"{where}[{i}]")
+    print(f"    {where}: 기대 {str(want)[:160]!r}")
+    print(f"    {' ' * len(where)}  실제 {str(got)[:160]!r}")
+
+
+def bench(case: ParserCase, corpus: list[tuple[Path, str]], min_seconds: float) -> dict[str, float]:
+    tracemalloc.start()
+    output = _run_once(case, corpus)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    rows_per_pass = sum(case.count_rows(v) for v in output.values())
+
+    passes = 0
+    t0 = time.perf_counter()
+    elapsed = 0.0
+    while elapsed < min_seconds or passes < 3:
+        _run_once(case, corpus)
+        passes += 1
+        elapsed = time.perf_counter() - t0
+    pages = passes * len(corpus)
+    return {
+        "pages": len(corpus),
+        "bytes": sum(len(t.encode("utf-8")) for _, t in corpus),
+        "rows": rows_per_pass,
+        "pages_per_s": pages / elapsed,
+        "rows_per_s": passes * rows_per_pass / elapsed,
+        "ms_per_page": elapsed * 1000.0 / pages,
+        "peak_kb": peak / 1024.0,
+    }
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="크롤러 파서 오프라인 벤치마크·골든 검증")
+    parser.add_argument("-k", dest="filter", default="", help="파서 이름 부분 문자열 필터")
+    parser.add_argument("--check", action="store_true", help="골든 검증만 하고 벤치는 생략")
+    parser.add_argument("--update-golden", action="store_true", help="현재 출력으로 골든 파일 갱신")
+    parser.add_argument("--min-seconds", type=float, default=1.0, help="파서당 최소 측정 시간 (기본 1초)")
+    parser.add_argument("--json", action="store_true", help="벤치 결과를 JSON으로 출력")
+    args = parser.parse_args()
+
+    cases = [c for c in CASES if args.filter in c.name]
+    ok = True
+    results: dict[str, dict[str, float]] = {}
+    for case in cases:
+        corpus = _load_corpus(case)
+        if not corpus:
+            print(f"{case.name}: 픽스처 없음 ({case.pattern})")
+            ok = False
+            continue
+        if not check_golden(case, _run_once(case, corpus), args.update_golden):
+            ok = False
+        if not args.check and not args.update_golden:
+            results[case.name] = bench(case, corpus, args.min_seconds)
+
+    if args.json:
+        print(json.dumps(results, ensure_ascii=False, indent=2))
+    elif results:
+        print(
+            f"{'parser':<26} {'pages':>5} {'rows':>5} {'KB':>7} {'pages/s':>9} {'rows/s':>10} "
+            f"{'ms/page':>8} {'peak KB':>8}"
+        )
+        for name, r in results.items():
+            print(
+                f"{name:<26} {r['pages']:>5} {r['rows']:>5} {r['bytes'] / 1024:>7.0f} "
+                f"{r['pages_per_s']:>9.1f} {r['rows_per_s']:>10.1f} {r['ms_per_page']:>8.2f} {r['peak_kb']:>8.0f}"
+            )
+    if args.update_golden:
+        print(f"골든 갱신: {len(cases)}개 파서 → {GOLDEN.relative_to(_ROOT)}")
+    elif ok:
+        print("골든 출력 일치" + ("" if args.check else " — 위 수치는 동작 보존 상태에서 측정"))
+    else:
+        print("골든 출력 불일치 또는 누락 — 파서 동작이 바뀌었습니다")
+    return 0 if ok else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
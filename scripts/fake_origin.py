@@ -0,0 +1,281 @@
+#!/usr/bin/env python3
+"""로컬 가짜 출처(origin) 서버 — 위비티·요즘것들·K-Startup 응답을 `scripts/fixtures/`로 흉내 낸다.
+
+크롤러는 `crawl_http.set_origin_overrides()`(또는 `CRAWL_ORIGIN_OVERRIDE`)로 실제 호스트 대신 이 서버에 붙는다.
+라우팅은 `X-Forwarded-Host`(없으면 경로)로 구분한다.
+
+  /?c=find&s=1&gbn=list&gp=N              위비티 목록 (N > wevity_pages 이면 빈 목록)
+  /?c=find&s=1&gbn=view&ix=ID             위비티 상세
+  /                                        위비티 워밍업
+  /api/v2/posts?page=&size=&category=      요즘것들 v2 posts API (totalElements/totalPages 포함)
+  /posts/ID                                요즘것들 상세
+  /B552735/kisedKstartupService01/<api>    K-Startup XML (page, numOfRows)
+
+목록 페이지마다 고유 id가 나오도록 픽스처의 id를 페이지 번호로 치환한다.
+지연(latency_ms ± jitter_ms), 무작위 5xx(error_rate), 위비티 403 버스트(burst_403_every / burst_403_len)를
+설정할 수 있고, 경로·상태별 요청 수는 `stats()`로 확인한다.
+
+단독 실행:  python scripts/fake_origin.py --port 8765 --wevity-pages 20
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import random
+import re
+import threading
+import time
+from collections import Counter
+from dataclasses import dataclass
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from urllib.parse import parse_qs, urlsplit
+
+FIXTURES = Path(__file__).resolve().parent / "fixtures"
+
+WEVITY_HOST = "www.wevity.com"
+ALLFORYOUNG_WWW_HOST = "www.allforyoung.com"
+ALLFORYOUNG_API_HOST = "api.allforyoung.com"
+KSTARTUP_HOST = "apis.data.go.kr"
+TARGET_HOSTS = (WEVITY_HOST, ALLFORYOUNG_WWW_HOST, ALLFORYOUNG_API_HOST, KSTARTUP_HOST)
+
+_IX_RE = re.compile(r"ix=(\d+)")
+_KSTARTUP_ID_RE = re.compile(r"(id=|pbancSn=|<col name=\"pbanc_sn\">)(\d+)")
+
+
+@dataclass
+class OriginConfig:
+    wevity_pages: int = 10
+    allforyoung_pages: int = 5
+    kstartup_pages: int = 3
+    latency_ms: float = 0.0
+    jitter_ms: float = 0.0
+    error_rate: float = 0.0
+    burst_403_every: int = 0
+    burst_403_len: int = 0
+    seed: int = 1
+
+
+def _read(rel: str) -> str:
+    return (FIXTURES / rel).read_text(encoding="utf-8")
+
+
+class FakeOrigin:
+    """`ThreadingHTTPServer`를 백그라운드 스레드로 띄우는 가짜 출처."""
+
+    def __init__(self, config: OriginConfig | None = None, host: str = "127.0.0.1", port: int = 0) -> None:
+        self.config = config or OriginConfig()
+        self._rng = random.Random(self.config.seed)
+        self._lock = threading.Lock()
+        self._counts: Counter[tuple[str, int]] = Counter()
+        self._wevity_seen = 0
+        self._burst_left = 0
+
+        self._wevity_list = [_read(f"wevity/list_p{i}.html") for i in (1, 2, 3)]
+        self._wevity_empty = _read("wevity/list_p4.html")
+        self._wevity_details = [p.read_text(encoding="utf-8") for p in sorted(FIXTURES.glob("wevity/detail_*.html"))]
+        posts = json.loads(_read("allforyoung/posts_p1.json"))
+        self._af_rows = [r for r in posts["data"] if isinstance(r, dict) and r.get("id") is not None]
+        self._af_details = [p.read_text(encoding="utf-8") for p in sorted(FIXTURES.glob("allforyoung/detail_*.html"))]
+        self._ks_business = _read("kstartup/business_p1.xml")
+        self._ks_announcement = _read("kstartup/announcement_p1.xml")
+        self._ks_empty = _read("kstartup/announcement_empty.xml")
+
+        self._server = ThreadingHTTPServer((host, port), self._handler_class())
+        self._server.daemon_threads = True
+        self._thread: threading.Thread | None = None
+
+    # --- 수명 ---
+
+    @property
+    def base_url(self) -> str:
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def overrides(self) -> dict[str, str]:
+        """`crawl_http.set_origin_overrides()`에 넘길 호스트 → base URL 표."""
+        return {h: self.base_url for h in TARGET_HOSTS}
+
+    def start(self) -> "FakeOrigin":
+        self._thread = threading.Thread(target=self._server.serve_forever, name="fake-origin", daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        self._server.shutdown()
+        self._server.server_close()
+
+    def __enter__(self) -> "FakeOrigin":
+        return self.start()
+
+    def __exit__(self, *_exc) -> None:
+        self.stop()
+
+    def stats(self) -> dict[str, dict[str, int]]:
+        """{route: {status: count}}"""
+        out: dict[str, dict[str, int]] = {}
+        with self._lock:
+            for (route, status), n in sorted(self._counts.items()):
+                out.setdefault(route, {})[str(status)] = n
+        return out
+
+    def total_requests(self) -> int:
+        with self._lock:
+            return sum(self._counts.values())
+
+    # --- 응답 생성 ---
+
+    def _wevity_list_page(self, page: int) -> str:
+        if page < 1 or page > self.config.wevity_pages:
+            return self._wevity_empty
+        tpl = self._wevity_list[(page - 1) % len(self._wevity_list)]
+        return _IX_RE.sub(lambda m: f"ix={page:04d}{m.group(1)}", tpl)
+
+    def _wevity_detail(self, contest_id: str) -> str:
+        return self._wevity_details[int(contest_id or 0) % len(self._wevity_details)]
+
+    def _allforyoung_posts(self, page: int, size: int) -> dict:
+        per_page = max(1, min(size, 100))
+        total = self.config.allforyoung_pages * len(self._af_rows)
+        start = (page - 1) * per_page
+        data = []
+        for i in range(start, min(start + per_page, total)):
+            src = self._af_rows[i % len(self._af_rows)]
+            data.append({**src, "id": 1_000_000 + i})
+        return {
+            "success": True,
+            "code": 200,
+            "message": "OK",
+            "data": data,
+            "totalElements": total,
+            "totalPages": (total + per_page - 1) // per_page,
+            "page": page,
+            "size": per_page,
+        }
+
+    def _kstartup_xml(self, api: str, page: int) -> str:
+        if page < 1 or page > self.config.kstartup_pages:
+            return self._ks_empty
+        tpl = self._ks_business if "Business" in api else self._ks_announcement
+        total = self.config.kstartup_pages * 100
+        xml = _KSTARTUP_ID_RE.sub(lambda m: f"{m.group(1)}{page:03d}{m.group(2)}", tpl)
+        xml = re.sub(r"<totalCount>\d+</totalCount>", f"<totalCount>{total}</totalCount>", xml)
+        return re.sub(r"<page>\d+</page>", f"<page>{page}</page>", xml)
+
+    def _route(self, host: str, path: str, query: dict[str, list[str]]) -> tuple[str, int, str, bytes]:
+        """(route 이름, 상태, content-type, 본문)"""
+        q = {k: v[0] for k, v in query.items()}
+        html = "text/html; charset=utf-8"
+        if path.startswith("/api/v2/posts") or host == ALLFORYOUNG_API_HOST:
+            body = self._allforyoung_posts(int(q.get("page", "1")), int(q.get("size", "24")))
+            return "allforyoung.list", 200, "application/json", json.dumps(body, ensure_ascii=False).encode()
+        if path.startswith("/posts/"):
+            pid = path.rsplit("/", 1)[-1]
+            detail = self._af_details[int(pid) % len(self._af_details)] if pid.isdigit() else "<html></html>"
+            return "allforyoung.detail", 200, html, detail.encode()
+        if path.startswith("/B552735/"):
+            api = path.rsplit("/", 1)[-1]
+            xml = self._kstartup_xml(api, int(q.get("page", "1")))
+            return f"kstartup.{api}", 200, "application/xml; charset=utf-8", xml.encode()
+        gbn = q.get("gbn")
+        if gbn == "list":
+            return "wevity.list", 200, html, self._wevity_list_page(int(q.get("gp", "1"))).encode()
+        if gbn == "view":
+            return "wevity.detail", 200, html, self._wevity_detail(q.get("ix", "0")).encode()
+        if path == "/":
+            return "wevity.warmup", 200, html, b"<html><body>wevity</body></html>"
+        return "unknown", 404, "text/plain", b"not found"
+
+    def _fault(self, route: str) -> int | None:
+        """지연 후 적용할 장애 상태 코드 (없으면 None)."""
+        cfg = self.config
+        with self._lock:
+            if route.startswith("wevity.") and cfg.burst_403_every > 0:
+                if self._burst_left > 0:
+                    self._burst_left -= 1
+                    return 403
+                self._wevity_seen += 1
+                if self._wevity_seen % cfg.burst_403_every == 0:
+                    self._burst_left = max(0, cfg.burst_403_len - 1)
+                    return 403
+            if cfg.error_rate > 0 and self._rng.random() < cfg.error_rate:
+                return self._rng.choice((500, 502, 503))
+        return None
+
+    def _delay(self) -> float:
+        cfg = self.config
+        if cfg.latency_ms <= 0 and cfg.jitter_ms <= 0:
+            return 0.0
+        with self._lock:
+            j = self._rng.uniform(-cfg.jitter_ms, cfg.jitter_ms)
+        return max(0.0, cfg.latency_ms + j) / 1000.0
+
+    def _handler_class(self):
+        origin = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def do_GET(self) -> None:  # noqa: N802
+                parts = urlsplit(self.path)
+                host = (self.headers.get("X-Forwarded-Host") or self.headers.get("Host") or "").split(":")[0]
+                route, status, ctype, body = origin._route(host, parts.path, parse_qs(parts.query))
+                delay = origin._delay()
+                if delay:
+                    time.sleep(delay)
+                fault = origin._fault(route)
+                if fault is not None:
+                    status, ctype, body = fault, "text/html", f"<html>{fault}</html>".encode()
+                with origin._lock:
+                    origin._counts[(route, status)] += 1
+                self.send_response(status)
+                self.send_header("Content-Type", ctype)
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, *_args) -> None:
+                pass
+
+        return Handler
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="크롤러용 로컬 가짜 출처 서버")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--wevity-pages", type=int, default=10)
+    parser.add_argument("--allforyoung-pages", type=int, default=5)
+    parser.add_argument("--kstartup-pages", type=int, default=3)
+    parser.add_argument("--latency-ms", type=float, default=0.0)
+    parser.add_argument("--jitter-ms", type=float, default=0.0)
+    parser.add_argument("--error-rate", type=float, default=0.0)
+    parser.add_argument("--burst-403-every", type=int, default=0)
+    parser.add_argument("--burst-403-len", type=int, default=0)
+    args = parser.parse_args()
+    cfg = OriginConfig(
+        wevity_pages=args.wevity_pages,
+        allforyoung_pages=args.allforyoung_pages,
+        kstartup_pages=args.kstartup_pages,
+        latency_ms=args.latency_ms,
+        jitter_ms=args.jitter_ms,
+        error_rate=args.error_rate,
+        burst_403_every=args.burst_403_every,
+        burst_403_len=args.burst_403_len,
+    )
+    origin = FakeOrigin(cfg, args.host, args.port)
+    overrides = ",".join(f"{h}={origin.base_url}" for h in TARGET_HOSTS)
+    print(f"가짜 출처 서버: {origin.base_url}")
+    print(f"크롤러 쪽:  CRAWL_ORIGIN_OVERRIDE='{overrides}'")
+    try:
+        origin.start()
+        while True:
+            time.sleep(3600)
+    except KeyboardInterrupt:
+        pass
+    finally:
+        origin.stop()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,168 @@
+#!/usr/bin/env python3
+"""로컬 가짜 출구 프록시 — `proxy_pool` 상태 점수·격리를 네트워크 없이 시험한다.
+
+평문 HTTP 프록시(절대 URI `GET http://host/path`)만 흉내 내며, 보통은 `fake_origin.py`와 함께 쓴다
+(크롤러 요청이 출처 대체로 `http://127.0.0.1:…`가 되므로 CONNECT 터널은 필요 없다).
+
+모드:
+  ok      요청을 그대로 전달
+  block   403 응답 (출구 IP 가 막힌 프록시)
+  flaky   block_rate 비율로 403, 나머지는 전달
+  dead    응답 없이 연결을 끊음 (죽은 프록시)
+  slow    latency_ms 만큼 늦게 전달 (다른 모드와 함께 지연만 주려면 latency_ms 설정)
+
+`spec` 문자열(`ok`, `slow:300`, `flaky:0.5`)로도 만든다: `FakeProxy.from_spec("flaky:0.3")`.
+
+단독 실행:  python scripts/fake_proxy.py --port 8766 --mode flaky --block-rate 0.3
+"""
+from __future__ import annotations
+
+import argparse
+import http.client
+import random
+import threading
+import time
+from collections import Counter
+from dataclasses import dataclass
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import urlsplit
+
+MODES = ("ok", "block", "flaky", "dead", "slow")
+_HOP_HEADERS = frozenset({"proxy-connection", "proxy-authorization", "connection", "keep-alive"})
+
+
+@dataclass
+class ProxyConfig:
+    mode: str = "ok"
+    latency_ms: float = 0.0
+    block_rate: float = 0.5
+    seed: int = 1
+
+
+class FakeProxy:
+    """`ThreadingHTTPServer`를 백그라운드 스레드로 띄우는 가짜 프록시."""
+
+    def __init__(self, config: ProxyConfig | None = None, host: str = "127.0.0.1", port: int = 0) -> None:
+        self.config = config or ProxyConfig()
+        if self.config.mode not in MODES:
+            raise ValueError(f"알 수 없는 모드: {self.config.mode}")
+        self._rng = random.Random(self.config.seed)
+        self._lock = threading.Lock()
+        self._counts: Counter[str] = Counter()
+        self._server = ThreadingHTTPServer((host, port), self._handler_class())
+        self._server.daemon_threads = True
+        self._thread: threading.Thread | None = None
+
+    @classmethod
+    def from_spec(cls, spec: str) -> "FakeProxy":
+        mode, _, arg = spec.partition(":")
+        cfg = ProxyConfig(mode=mode.strip())
+        if arg and cfg.mode == "slow":
+            cfg.latency_ms = float(arg)
+        elif arg and cfg.mode == "flaky":
+            cfg.block_rate = float(arg)
+        return cls(cfg)
+
+    @property
+    def url(self) -> str:
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def start(self) -> "FakeProxy":
+        self._thread = threading.Thread(target=self._server.serve_forever, name="fake-proxy", daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        self._server.shutdown()
+        self._server.server_close()
+
+    def __enter__(self) -> "FakeProxy":
+        return self.start()
+
+    def __exit__(self, *_exc) -> None:
+        self.stop()
+
+    def stats(self) -> dict[str, int]:
+        """{결과: 요청 수} — forwarded / blocked / dropped"""
+        with self._lock:
+            return dict(self._counts)
+
+    def _decide(self) -> str:
+        cfg = self.config
+        with self._lock:
+            if cfg.mode == "block" or (cfg.mode == "flaky" and self._rng.random() < cfg.block_rate):
+                outcome = "blocked"
+            elif cfg.mode == "dead":
+                outcome = "dropped"
+            else:
+                outcome = "forwarded"
+            self._counts[outcome] += 1
+        return outcome
+
+    def _handler_class(self):
+        proxy = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def do_GET(self) -> None:  # noqa: N802
+                outcome = proxy._decide()
+                if outcome == "dropped":
+                    self.close_connection = True
+                    return
+                if proxy.config.latency_ms > 0:
+                    time.sleep(proxy.config.latency_ms / 1000.0)
+                if outcome == "blocked":
+                    self._reply(403, "text/html", b"<html>403 Forbidden (proxy egress blocked)</html>")
+                    return
+                target = urlsplit(self.path)
+                conn = http.client.HTTPConnection(target.hostname, target.port or 80, timeout=30)
+                try:
+                    headers = {k: v for k, v in self.headers.items() if k.lower() not in _HOP_HEADERS}
+                    path = target.path + (f"?{target.query}" if target.query else "")
+                    conn.request("GET", path or "/", headers=headers)
+                    up = conn.getresponse()
+                    body = up.read()
+                    self._reply(up.status, up.getheader("Content-Type") or "text/html", body)
+                except OSError as e:
+                    self._reply(502, "text/plain", f"upstream error: {e}".encode())
+                finally:
+                    conn.close()
+
+            def _reply(self, status: int, ctype: str, body: bytes) -> None:
+                self.send_response(status)
+                self.send_header("Content-Type", ctype)
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, *_args) -> None:
+                pass
+
+        return Handler
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="proxy_pool 시험용 로컬 가짜 프록시")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8766)
+    parser.add_argument("--mode", choices=MODES, default="ok")
+    parser.add_argument("--latency-ms", type=float, default=0.0)
+    parser.add_argument("--block-rate", type=float, default=0.5)
+    args = parser.parse_args()
+    proxy = FakeProxy(ProxyConfig(args.mode, args.latency_ms, args.block_rate), args.host, args.port)
+    print(f"가짜 프록시({args.mode}): {proxy.url}")
+    print(f"크롤러 쪽:  CRAWL_PROXIES='{proxy.url}'")
+    try:
+        proxy.start()
+        while True:
+            time.sleep(3600)
+    except KeyboardInterrupt:
+        pass
+    finally:
+        proxy.stop()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,678 @@
+#!/usr/bin/env python3
+"""메모리 PostgREST 대역 — 크롤러가 쓰는 supabase-py 부분집합 + 왕복 계측.
+
+`client.table(t).select(...).eq(...).in_(...).limit(n).execute()`, `upsert(rows, on_conflict=...)`,
+`update(values).eq(...)`, `insert(rows)`, `delete().eq(...)`, `client.rpc(name, params)`를 흉내 낸다.
+`execute()` 1회 = PostgREST 왕복 1회로 보고 (table, op)별 호출 수·요청/응답 바이트·행 수를 센다.
+
+`seed_synthetic()`은 contests 10만 건·profiles 1만 건 같은 규모의 합성 데이터를 채운다.
+`_refresh_dday_pool`(행마다 update)이나 알림 팬아웃(profiles 전체 → notification_user_state) 같은
+N+1·대량 페이로드 패턴이 벤치에서 숫자로 드러난다 (`bench_db_roundtrips.py`).
+
+RPC는 `FakeSupabase.register_rpc(name, fn)`으로 파이썬 구현을 붙인다 (fn(db, params) → data).
+"""
+from __future__ import annotations
+
+import json
+import random
+import threading
+from collections import defaultdict
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta, timezone
+from typing import Any, Callable
+
+# on_conflict 미지정 upsert/insert 시 기본 키
+DEFAULT_KEYS: dict[str, tuple[str, ...]] = {
+    "contests": ("source", "id"),
+    "startup_business": ("id",),
+    "startup_announcement": ("pbanc_sn",),
+    "kstartup_crawl_state": ("id",),
+    "crawl_logs": ("job_name", "run_date"),
+    "profiles": ("id",),
+}
+# 서버가 채번하는 id 컬럼 (insert 시 없으면 자동 증가)
+SERIAL_TABLES = frozenset({"notifications", "crawl_logs", "notification_user_state", "crawl_changes"})
+
+
+def _nbytes(obj: Any) -> int:
+    return len(json.dumps(obj, ensure_ascii=False, separators=(",", ":"), default=str).encode("utf-8"))
+
+
+@dataclass
+class OpStats:
+    calls: int = 0
+    request_bytes: int = 0
+    response_bytes: int = 0
+    rows_sent: int = 0
+    rows_returned: int = 0
+
+
+@dataclass
+class Result:
+    data: list[dict] = field(default_factory=list)
+    count: int | None = None
+
+
+class _Table:
+    def __init__(self, name: str) -> None:
+        self.name = name
+        self.rows: dict[tuple, dict] = {}
+        self.serial = 0
+        # 컬럼 → 값 → 키 집합 (eq/in_ 조회용, 처음 조회한 컬럼부터 유지)
+        self.indexes: dict[str, dict[Any, set[tuple]]] = {}
+
+    def index_for(self, col: str) -> dict[Any, set[tuple]]:
+        idx = self.indexes.get(col)
+        if idx is None:
+            idx = defaultdict(set)
+            for k, row in self.rows.items():
+                idx[row.get(col)].add(k)
+            self.indexes[col] = idx
+        return idx
+
+    def put(self, key: tuple, row: dict) -> None:
+        old = self.rows.get(key)
+        for col, idx in self.indexes.items():
+            if old is not None:
+                idx[old.get(col)].discard(key)
+            idx[row.get(col)].add(key)
+        self.rows[key] = row
+
+    def remove(self, key: tuple) -> None:
+        old = self.rows.pop(key, None)
+        if old is None:
+            return
+        for col, idx in self.indexes.items():
+            idx[old.get(col)].discard(key)
+
+
+class Query:
+    def __init__(self, db: "FakeSupabase", table: str) -> None:
+        self._db = db
+        self._table = table
+        self._op = "select"
+        self._columns: list[str] | None = None
+        self._filters: list[tuple[str, str, Any]] = []
+        self._limit: int | None = None
+        self._order: tuple[str, bool] | None = None
+        self._payload: Any = None
+        self._on_conflict: tuple[str, ...] | None = None
+        self._count: str | None = None
+        self._range: tuple[int, int] | None = None
+
+    # --- 동사 ---
+    def select(self, columns: str = "*", count: str | None = None) -> "Query":
+        if self._op == "select":
+            cols = [c.strip() for c in columns.split(",") if c.strip()]
+            self._columns = None if cols == ["*"] else cols
+        self._count = count
+        return self
+
+    def upsert(self, rows, on_conflict: str = "", **_kw) -> "Query":
+        self._op = "upsert"
+        self._payload = rows
+        if on_conflict:
+            self._on_conflict = tuple(c.strip() for c in on_conflict.split(","))
+        return self
+
+    def insert(self, rows, **_kw) -> "Query":
+        self._op = "insert"
+        self._payload = rows
+        return self
+
+    def update(self, values: dict, **_kw) -> "Query":
+        self._op = "update"
+        self._payload = values
+        return self
+
+    def delete(self, **_kw) -> "Query":
+        self._op = "delete"
+        return self
+
+    # --- 필터 ---
+    def eq(self, col: str, value: Any) -> "Query":
+        self._filters.append(("eq", col, value))
+        return self
+
+    def neq(self, col: str, value: Any) -> "Query":
+        self._filters.append(("neq", col, value))
+        return self
+
+    def in_(self, col: str, values) -> "Query":
+        self._filters.append(("in", col, list(values)))
+        return self
+
+    def lt(self, col: str, value: Any) -> "Query":
+        self._filters.append(("lt", col, value))
+        return self
+
+    def gte(self, col: str, value: Any) -> "Query":
+        self._filters.append(("gte", col, value))
+        return self
+
+    def is_(self, col: str, value: Any) -> "Query":
+        self._filters.append(("is", col, None if value in (None, "null") else value))
+        return self
+
+    def limit(self, n: int) -> "Query":
+        self._limit = n
+        return self
+
+    def range(self, start: int, end: int) -> "Query":
+        self._range = (start, end)
+        return self
+
+    def order(self, col: str, desc: bool = False, **_kw) -> "Query":
+        self._order = (col, desc)
+        return self
+
+    def execute(self) -> Result:
+        return self._db._execute(self)
+
+
+class _Rpc:
+    def __init__(self, db: "FakeSupabase", name: str, params: dict) -> None:
+        self._db, self._name, self._params = db, name, params
+
+    def execute(self) -> Result:
+        return self._db._execute_rpc(self._name, self._params)
+
+
+class _Bucket:
+    def __init__(self, db: "FakeSupabase", name: str) -> None:
+        self._db, self._name = db, name
+
+    def upload(self, path: str, file: bytes, file_options: dict | None = None) -> dict:
+        upsert = str((file_options or {}).get("upsert", "false")).lower() == "true"
+        with self._db._lock:
+            objects = self._db._objects.setdefault(self._name, {})
+            st = self._db._stats[(f"storage:{self._name}", "upload")]
+            st.calls += 1
+            st.request_bytes += len(file)
+            if path in objects and not upsert:
+                raise RuntimeError("{'statusCode': 409, 'error': 'Duplicate', 'message': 'The resource already exists'}")
+            objects[path] = bytes(file)
+        return {"Key": f"{self._name}/{path}"}
+
+
+class _Storage:
+    def __init__(self, db: "FakeSupabase") -> None:
+        self._db = db
+
+    def from_(self, bucket: str) -> _Bucket:
+        return _Bucket(self._db, bucket)
+
+
+class FakeSupabase:
+    """스레드 안전 메모리 DB. `stats()`로 (table, op)별 왕복 계측을 본다.
+
+    `storage.from_(bucket).upload(path, bytes, opts)`도 흉내 낸다 (같은 경로 재업로드는 409).
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.RLock()
+        self._tables: dict[str, _Table] = {}
+        self._stats: dict[tuple[str, str], OpStats] = defaultdict(OpStats)
+        self._rpcs: dict[str, Callable[["FakeSupabase", dict], Any]] = {
+            "find_contest_dedup_candidates": _rpc_find_contest_dedup_candidates,
+            "record_contest_sweep": _rpc_record_contest_sweep,
+            "prune_crawl_changes": _rpc_prune_crawl_changes,
+            "enqueue_crawl_work": _rpc_enqueue_crawl_work,
+            "claim_crawl_work": _rpc_claim_crawl_work,
+            "renew_crawl_work": _rpc_renew_crawl_work,
+            "complete_crawl_work": _rpc_complete_crawl_work,
+            "skip_crawl_list_after": _rpc_skip_crawl_list_after,
+            "finish_crawl_cycle": _rpc_finish_crawl_cycle,
+        }
+        self._objects: dict[str, dict[str, bytes]] = {}
+        self.storage = _Storage(self)
+
+    # --- supabase-py 호환 진입점 ---
+    def table(self, name: str) -> Query:
+        return Query(self, name)
+
+    from_ = table
+
+    def rpc(self, name: str, params: dict | None = None) -> _Rpc:
+        return _Rpc(self, name, params or {})
+
+    def register_rpc(self, name: str, fn: Callable[["FakeSupabase", dict], Any]) -> None:
+        self._rpcs[name] = fn
+
+    # --- 직접 접근 (시드·검증용, 계측 안 함) ---
+    def rows(self, table: str) -> list[dict]:
+        with self._lock:
+            return list(self._t(table).rows.values())
+
+    def objects(self, bucket: str) -> dict[str, bytes]:
+        with self._lock:
+            return dict(self._objects.get(bucket, {}))
+
+    def load(self, table: str, rows: list[dict], key: tuple[str, ...] | None = None) -> None:
+        with self._lock:
+            t = self._t(table)
+            k = key or DEFAULT_KEYS.get(table, ("id",))
+            for r in rows:
+                t.put(tuple(r.get(c) for c in k), dict(r))
+
+    def stats(self) -> dict[str, dict]:
+        with self._lock:
+            return {f"{t}.{op}": vars(s).copy() for (t, op), s in sorted(self._stats.items())}
+
+    def totals(self) -> OpStats:
+        with self._lock:
+            out = OpStats()
+            for s in self._stats.values():
+                out.calls += s.calls
+                out.request_bytes += s.request_bytes
+                out.response_bytes += s.response_bytes
+                out.rows_sent += s.rows_sent
+                out.rows_returned += s.rows_returned
+            return out
+
+    def reset_stats(self) -> None:
+        with self._lock:
+            self._stats.clear()
+
+    # --- 내부 ---
+    def _t(self, name: str) -> _Table:
+        t = self._tables.get(name)
+        if t is None:
+            t = self._tables[name] = _Table(name)
+        return t
+
+    def _account(self, table: str, op: str, request: Any, response: list[dict], rows_sent: int) -> None:
+        s = self._stats[(table, op)]
+        s.calls += 1
+        s.request_bytes += _nbytes(request)
+        s.response_bytes += _nbytes(response)
+        s.rows_sent += rows_sent
+        s.rows_returned += len(response)
+
+    def _matching_keys(self, t: _Table, filters: list[tuple[str, str, Any]]) -> list[tuple]:
+        keys: set[tuple] | None = None
+        rest = []
+        for op, col, val in filters:
+            if op == "eq":
+                cand = set(t.index_for(col).get(val, ()))
+            elif op == "in":
+                idx = t.index_for(col)
+                cand = set()
+                for v in val:
+                    cand |= idx.get(v, set())
+            else:
+                rest.append((op, col, val))
+                continue
+            keys = cand if keys is None else keys & cand
+        pool = list(t.rows.keys()) if keys is None else list(keys)
+        if not rest:
+            return pool
+        out = []
+        for k in pool:
+            row = t.rows[k]
+            if all(_match(row, op, col, val) for op, col, val in rest):
+                out.append(k)
+        return out
+
+    def _execute(self, q: Query) -> Result:
+        with self._lock:
+            t = self._t(q._table)
+            filt_desc = [[op, col, val] for op, col, val in q._filters]
+            if q._op == "select":
+                keys = self._matching_keys(t, q._filters)
+                rows = [t.rows[k] for k in keys]
+                if q._order:
+                    col, desc = q._order
+                    rows.sort(key=lambda r: (r.get(col) is None, r.get(col)), reverse=desc)
+                total = len(rows)
+                if q._range:
+                    rows = rows[q._range[0] : q._range[1] + 1]
+                if q._limit is not None:
+                    rows = rows[: q._limit]
+                data = [_project(r, q._columns) for r in rows]
+                self._account(q._table, "select", {"select": q._columns, "filters": filt_desc}, data, 0)
+                return Result(data, total if q._count else None)
+
+            if q._op in ("upsert", "insert"):
+                payload = q._payload if isinstance(q._payload, list) else [q._payload]
+                key_cols = q._on_conflict or DEFAULT_KEYS.get(q._table, ("id",))
+                out = []
+                for row in payload:
+                    row = dict(row)
+                    if q._table in SERIAL_TABLES and row.get("id") is None and "id" in key_cols:
+                        t.serial += 1
+                        row["id"] = t.serial
+                    key = tuple(row.get(c) for c in key_cols)
+                    if q._op == "insert" and q._table in SERIAL_TABLES and key in t.rows:
+                        t.serial += 1
+                        row["id"] = t.serial
+                        key = tuple(row.get(c) for c in key_cols)
+                    if q._op == "upsert" and key in t.rows:
+                        merged = {**t.rows[key], **row}
+                    else:
+                        merged = row
+                    t.put(key, merged)
+                    out.append(merged)
+                self._account(q._table, q._op, payload, out, len(payload))
+                return Result(out)
+
+            if q._op == "update":
+                keys = self._matching_keys(t, q._filters)
+                out = []
+                for k in keys:
+                    merged = {**t.rows[k], **q._payload}
+                    t.put(k, merged)
+                    out.append(merged)
+                self._account(q._table, "update", {"set": q._payload, "filters": filt_desc}, out, 1)
+                return Result(out)
+
+            if q._op == "delete":
+                keys = self._matching_keys(t, q._filters)
+                out = [t.rows[k] for k in keys]
+                for k in keys:
+                    t.remove(k)
+                self._account(q._table, "delete", {"filters": filt_desc}, out, 0)
+                return Result(out)
+            raise ValueError(f"지원하지 않는 연산: {q._op}")
+
+    def _execute_rpc(self, name: str, params: dict) -> Result:
+        fn = self._rpcs.get(name)
+        if fn is None:
+            raise ValueError(f"등록되지 않은 RPC: {name}")
+        with self._lock:
+            data = fn(self, params)
+            if data is None:
+                data = []
+            elif not isinstance(data, list):
+                data = [data]
+            self._account(f"rpc:{name}", "rpc", params, data, 0)
+            return Result(data)
+
+
+def _project(row: dict, columns: list[str] | None) -> dict:
+    if columns is None:
+        return dict(row)
+    return {c: row.get(c) for c in columns}
+
+
+def _match(row: dict, op: str, col: str, val: Any) -> bool:
+    v = row.get(col)
+    if op == "neq":
+        return v != val
+    if op == "lt":
+        return v is not None and v < val
+    if op == "gte":
+        return v is not None and v >= val
+    if op == "is":
+        return v is val or v == val
+    return True
+
+
+def _rpc_find_contest_dedup_candidates(db: FakeSupabase, params: dict) -> list[dict]:
+    """migrations/20261019130000_contest_dedup.sql 의 같은 이름 RPC 흉내."""
+    keys = set(params.get("p_band_keys") or [])
+    contests = db._t("contests").rows
+    seen: set[tuple] = set()
+    out = []
+    for b in db._t("contest_dedup_bands").rows.values():
+        pk = (b["source"], b["contest_id"])
+        c = contests.get(pk)
+        if b["band_key"] not in keys or pk in seen or not c or not c.get("dedup_signature"):
+            continue
+        seen.add(pk)
+        out.append(
+            {
+                "source": c["source"],
+                "contest_id": c["id"],
+                "title": c.get("title"),
+                "canonical_group_id": c.get("canonical_group_id"),
+                "dedup_signature": c["dedup_signature"],
+                "has_content": bool(c.get("content") or c.get("content_key")),
+            }
+        )
+    return out
+
+
+def _rpc_record_contest_sweep(db: FakeSupabase, params: dict) -> dict:
+    """migrations/20261019150000_contests_liveness.sql 의 같은 이름 RPC 흉내 (20261019180000 의 id 목록 포함)."""
+    source = params["p_source"]
+    seen = set(params.get("p_seen_ids") or [])
+    t = db._t("contests")
+    rows = [(k, r) for k, r in t.rows.items() if r.get("source") == source and not r.get("manual_entry")]
+    live = sum(1 for _, r in rows if r.get("missing_since") is None)
+    if live and len(seen) < live * float(params.get("p_min_ratio") or 0.5):
+        return {"skipped": True, "seen": len(seen), "live": live}
+    now = datetime.now(timezone.utc).isoformat()
+    vanished: list[str] = []
+    returned: list[str] = []
+    for key, r in rows:
+        if r.get("missing_since") is None and r["id"] not in seen:
+            t.put(key, {**r, "missing_since": now})
+            vanished.append(r["id"])
+        elif r.get("missing_since") is not None and r["id"] in seen:
+            t.put(key, {**r, "missing_since": None})
+            returned.append(r["id"])
+    db._t("contest_sweeps").put(
+        (source,),
+        {
+            "source": source,
+            "completed_at": now,
+            "seen_count": len(seen),
+            "vanished_count": len(vanished),
+            "returned_count": len(returned),
+        },
+    )
+    return {
+        "skipped": False,
+        "seen": len(seen),
+        "live": live,
+        "vanished": len(vanished),
+        "returned": len(returned),
+        "vanished_ids": vanished,
+        "returned_ids": returned,
+    }
+
+
+def _rpc_prune_crawl_changes(db: FakeSupabase, params: dict) -> int:
+    """migrations/20261019180000_crawl_changes.sql 의 같은 이름 RPC 흉내."""
+    cutoff = (datetime.now(timezone.utc) - timedelta(days=max(1, int(params.get("p_days") or 30)))).isoformat()
+    t = db._t("crawl_changes")
+    old = [k for k, r in t.rows.items() if str(r.get("changed_at") or "") < cutoff]
+    for k in old:
+        t.remove(k)
+    return len(old)
+
+
+def _work_items(db: FakeSupabase, params: dict, kind: str | None = None) -> list[tuple[tuple, dict]]:
+    t = db._t("crawl_work_items")
+    return sorted(
+        (
+            (k, r)
+            for k, r in t.rows.items()
+            if r["cycle_id"] == params["p_cycle_id"]
+            and r["source"] == params["p_source"]
+            and (kind is None or r["kind"] == kind)
+        ),
+        key=lambda kr: kr[1]["id"],
+    )
+
+
+def _rpc_enqueue_crawl_work(db: FakeSupabase, params: dict) -> int:
+    """migrations/20261019160000_crawl_work_queue.sql 의 같은 이름 RPC 흉내 (이하 작업 큐 RPC 동일)."""
+    t = db._t("crawl_work_items")
+    have = {r["item_key"] for _, r in _work_items(db, params, params["p_kind"])}
+    n = 0
+    for e in params.get("p_items") or []:
+        if e["key"] in have:
+            continue
+        have.add(e["key"])
+        t.serial += 1
+        t.put(
+            (t.serial,),
+            {
+                "id": t.serial,
+                "cycle_id": params["p_cycle_id"],
+                "source": params["p_source"],
+                "kind": params["p_kind"],
+                "item_key": e["key"],
+                "payload": e.get("payload") or {},
+                "status": "pending",
+                "lease_owner": None,
+                "lease_expires_at": None,
+                "attempts": 0,
+                "result": None,
+            },
+        )
+        n += 1
+    return n
+
+
+def _fail_expired_crawl_work(db: FakeSupabase, params: dict) -> int:
+    """시도를 다 쓴 채 임대가 만료된 항목 → failed (`fail_expired_crawl_work`)."""
+    now = datetime.now(timezone.utc)
+    t = db._t("crawl_work_items")
+    n = 0
+    for k, r in _work_items(db, params):
+        if r["status"] == "leased" and r["lease_expires_at"] < now and r["attempts"] >= int(params.get("p_max_attempts") or 3):
+            t.put(k, {**r, "status": "failed", "lease_owner": None, "lease_expires_at": None})
+            n += 1
+    return n
+
+
+def _rpc_claim_crawl_work(db: FakeSupabase, params: dict) -> list[dict]:
+    _fail_expired_crawl_work(db, params)
+    now = datetime.now(timezone.utc)
+    t = db._t("crawl_work_items")
+    out = []
+    for k, r in _work_items(db, params, params["p_kind"]):
+        if len(out) >= max(1, int(params.get("p_limit") or 1)):
+            break
+        expired = r["status"] == "leased" and r["lease_expires_at"] < now
+        if (r["status"] == "pending" or expired) and r["attempts"] < int(params.get("p_max_attempts") or 3):
+            row = {
+                **r,
+                "status": "leased",
+                "lease_owner": params["p_owner"],
+                "lease_expires_at": now + timedelta(seconds=max(30, int(params.get("p_lease_seconds") or 600))),
+                "attempts": r["attempts"] + 1,
+            }
+            t.put(k, row)
+            out.append({**row, "lease_expires_at": row["lease_expires_at"].isoformat()})
+    return out
+
+
+def _rpc_renew_crawl_work(db: FakeSupabase, params: dict) -> int:
+    t = db._t("crawl_work_items")
+    until = datetime.now(timezone.utc) + timedelta(seconds=max(30, int(params.get("p_lease_seconds") or 600)))
+    n = 0
+    for i in params.get("p_ids") or []:
+        r = t.rows.get((i,))
+        if r and r["status"] == "leased" and r["lease_owner"] == params["p_owner"]:
+            t.put((i,), {**r, "lease_expires_at": until})
+            n += 1
+    return n
+
+
+def _rpc_complete_crawl_work(db: FakeSupabase, params: dict) -> bool:
+    t = db._t("crawl_work_items")
+    r = t.rows.get((params["p_id"],))
+    if not r or r["status"] != "leased" or r["lease_owner"] != params["p_owner"]:
+        return False
+    ok = bool(params.get("p_ok"))
+    status = "done" if ok else ("failed" if r["attempts"] >= int(params.get("p_max_attempts") or 3) else "pending")
+    t.put(
+        (r["id"],),
+        {
+            **r,
+            "status": status,
+            "result": params.get("p_result") if params.get("p_result") is not None else r["result"],
+            "lease_owner": None,
+            "lease_expires_at": None,
+        },
+    )
+    return True
+
+
+def _rpc_skip_crawl_list_after(db: FakeSupabase, params: dict) -> int:
+    t = db._t("crawl_work_items")
+    n = 0
+    for k, r in _work_items(db, params, "list"):
+        if r["status"] == "pending" and int(r["payload"]["from"]) > int(params["p_last_page"]):
+            t.put(k, {**r, "status": "skipped"})
+            n += 1
+    return n
+
+
+def _rpc_finish_crawl_cycle(db: FakeSupabase, params: dict) -> dict | None:
+    _fail_expired_crawl_work(db, params)
+    items = [r for _, r in _work_items(db, params, "list")]
+    if any(r["status"] in ("pending", "leased") for r in items):
+        return None
+    cycles = db._t("crawl_work_cycles")
+    key = (params["p_cycle_id"], params["p_source"])
+    if key in cycles.rows:
+        return None
+    done = [r for r in items if r["status"] == "done"]
+    failed = sum(1 for r in items if r["status"] == "failed")
+    ids = sorted({i for r in done for i in (r["result"] or {}).get("ids") or []})
+    sweep = None
+    if params.get("p_record_sweep") and not failed:
+        sweep = _rpc_record_contest_sweep(
+            db, {"p_source": params["p_source"], "p_seen_ids": ids, "p_min_ratio": params.get("p_min_ratio")}
+        )
+    summary = {
+        "inserted": sum(int((r["result"] or {}).get("inserted") or 0) for r in done),
+        "updated": sum(int((r["result"] or {}).get("updated") or 0) for r in done),
+        "seen": len(ids),
+        "failed_items": failed,
+        "sweep": sweep,
+    }
+    cycles.put(key, {"cycle_id": key[0], "source": key[1], "summary": summary})
+    return summary
+
+
+# --- 합성 데이터 ---
+
+_ORGS = ["한국관광공사", "서울특별시", "삼성전자", "카카오", "환경부", "중소벤처기업부", "한국콘텐츠진흥원", "네이버"]
+_TOPICS = ["AI 아이디어", "청년 창업", "환경 보호", "영상 콘텐츠", "UX/UI 디자인", "빅데이터", "지역 관광", "슬로건"]
+
+
+def synthetic_contest(source: str, cid: str, rng: random.Random, content_bytes: int, now: datetime) -> dict:
+    seen = (now - timedelta(days=rng.randint(0, 90))).isoformat()
+    return {
+        "source": source,
+        "id": cid,
+        "title": f"2026 {rng.choice(_ORGS)} {rng.choice(_TOPICS)} 공모전 {cid}",
+        "d_day": f"D-{rng.randint(0, 60)}",
+        "host": rng.choice(_ORGS),
+        "url": f"https://example.invalid/{source}/{cid}",
+        "category": "공모전",
+        "content": ("<p>" + "공모 안내 본문 " * max(1, content_bytes // 24) + "</p>") if content_bytes else "",
+        "created_at": seen,
+        "first_seen_at": seen,
+        "updated_at": now.isoformat(),
+    }
+
+
+def seed_synthetic(
+    db: FakeSupabase,
+    contests: int = 100_000,
+    profiles: int = 10_000,
+    sources: tuple[str, ...] = ("위비티", "요즘것들"),
+    content_bytes: int = 2_000,
+    seed: int = 7,
+    id_prefix: str = "",
+) -> None:
+    """contests(소스별 균등 분배, id = prefix + 일련번호)·profiles(10%는 admin)를 채운다."""
+    rng = random.Random(seed)
+    now = datetime.now(timezone.utc)
+    per_source = contests // max(1, len(sources))
+    for src in sources if per_source > 0 else ():
+        db.load(
+            "contests",
+            [synthetic_contest(src, f"{id_prefix}{i}", rng, content_bytes, now) for i in range(per_source)],
+        )
+    db.load(
+        "profiles",
+        [{"id": f"user-{i:06d}", "role": "admin" if i % 10 == 0 else "member"} for i in range(profiles)],
+    )
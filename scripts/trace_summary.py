@@ -0,0 +1,60 @@
+#!/usr/bin/env python3
+"""`crawl_trace` NDJSON 파일을 읽어 host·stage별 지연 백분위를 출력.
+
+  python scripts/trace_summary.py crawl_trace.ndjson crawl_trace.ndjson.1
+  python scripts/trace_summary.py --json crawl_trace.ndjson      # 기계 판독용
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import sys
+from pathlib import Path
+
+_ROOT = Path(__file__).resolve().parent.parent
+if str(_ROOT) not in sys.path:
+    sys.path.insert(0, str(_ROOT))
+
+from crawl_trace import read_records, summarize
+
+
+def _fmt(v: float | None) -> str:
+    return "-" if v is None else f"{v:.0f}"
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="크롤 HTTP 트레이스 요약 (host·stage별 백분위)")
+    parser.add_argument("files", nargs="+", help="트레이스 NDJSON 파일 (회전된 .1 .2 … 포함 가능)")
+    parser.add_argument("--json", action="store_true", help="표 대신 JSON 배열 출력")
+    args = parser.parse_args()
+
+    rows = summarize(read_records(args.files))
+    if args.json:
+        print(json.dumps(rows, ensure_ascii=False, indent=2))
+        return 0
+    if not rows:
+        print("레코드 없음")
+        return 1
+
+    header = (
+        f"{'host':<32} {'stage':<34} {'n':>6} {'ttfb p50':>9} {'p90':>7} {'p99':>7} "
+        f"{'total p50':>10} {'p90':>7} {'p99':>7} {'max':>7} {'conn':>5} {'retry':>5} {'MB':>7}  status"
+    )
+    print(header)
+    print("-" * len(header))
+    for r in rows:
+        statuses = " ".join(f"{k}:{v}" for k, v in sorted(r["statuses"].items()))
+        print(
+            f"{r['host'][:32]:<32} {r['stage'][:34]:<34} {r['count']:>6} "
+            f"{_fmt(r['ttfb_p50']):>9} {_fmt(r['ttfb_p90']):>7} {_fmt(r['ttfb_p99']):>7} "
+            f"{_fmt(r['total_p50']):>10} {_fmt(r['total_p90']):>7} {_fmt(r['total_p99']):>7} "
+            f"{_fmt(r['total_max']):>7} {r['new_connections']:>5} {r['retries']:>5} "
+            f"{r['bytes'] / 1_000_000:>7.2f}  {statuses}"
+        )
+    print()
+    print("단위: ms (ttfb = 응답 헤더까지, total = 본문 수신 완료까지), conn = 새 TCP 연결 수")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
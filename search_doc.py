@@ -0,0 +1,115 @@
+"""
+수집 시점 검색 문서 (한국어 2-gram 토큰)
+
+`--search-index`(또는 `CRAWL_SEARCH_INDEX=1`)일 때 크롤러가 행을 쓸 때 `search_tokens` 컬럼을 채운다.
+DB 쪽은 `search_tsv = to_tsvector('simple', search_tokens)` 생성 컬럼 + GIN 인덱스
+(migrations/20261019140000_search_tokens.sql)라서 검색이 HTML `ilike` 순차 스캔 대신 인덱스 조회가 된다.
+
+- 본문 HTML → 보이는 텍스트 (`html_to_text`, script/style 제외, 엔티티 해석)
+- NFKC·소문자 후 한글·한자 연속 구간은 글자 2-gram(한 글자 구간은 그대로), 영문·숫자는 단어 단위
+- 토큰은 중복 없이 등장 순서대로 공백으로 잇고 `MAX_TOKENS`개까지 (tsvector 크기 제한 여유)
+
+검색어도 같은 규칙으로 쪼개 AND 로 묶으면 된다. SQL 함수 `search_bigram_tsquery(text)`가
+같은 규칙의 tsquery 를 만든다 (한 글자·영문 단어는 접두 일치).
+"""
+
+from __future__ import annotations
+
+import logging
+import os
+import re
+import unicodedata
+from html.parser import HTMLParser
+
+logger = logging.getLogger("allyoung.search_doc")
+
+MAX_TOKENS = 4000
+
+_CJK_RE = r"[ᄀ-ᇿ㄰-㆏가-힣㐀-䶿一-鿿]+"
+_WORD_RE = re.compile(rf"({_CJK_RE})|([a-z0-9]+)")
+_SKIP_TAGS = frozenset({"script", "style", "noscript", "template"})
+_BLOCK_TAGS = frozenset({"br", "p", "div", "li", "tr", "td", "th", "h1", "h2", "h3", "h4", "h5", "h6", "dd", "dt"})
+
+
+class _TextExtractor(HTMLParser):
+    def __init__(self) -> None:
+        super().__init__(convert_charrefs=True)
+        self.parts: list[str] = []
+        self._skip = 0
+
+    def handle_starttag(self, tag, attrs):
+        if tag in _SKIP_TAGS:
+            self._skip += 1
+        elif tag in _BLOCK_TAGS:
+            self.parts.append("\n")
+        elif tag == "img":
+            alt = dict(attrs).get("alt")
+            if alt:
+                self.parts.append(f" {alt} ")
+
+    def handle_endtag(self, tag):
+        if tag in _SKIP_TAGS and self._skip:
+            self._skip -= 1
+
+    def handle_data(self, data):
+        if not self._skip:
+            self.parts.append(data)
+
+
+def html_to_text(html: str) -> str:
+    """HTML 조각 → 보이는 텍스트 (블록 경계는 줄바꿈, 연속 공백 1칸)."""
+    if not html:
+        return ""
+    p = _TextExtractor()
+    p.feed(html)
+    p.close()
+    lines = (" ".join(line.split()) for line in "".join(p.parts).splitlines())
+    return "\n".join(line for line in lines if line)
+
+
+def tokens(text: str) -> list[str]:
+    """텍스트 → 검색 토큰 (등장 순서, 중복 포함)."""
+    out: list[str] = []
+    norm = unicodedata.normalize("NFKC", text or "").lower()
+    for m in _WORD_RE.finditer(norm):
+        cjk = m.group(1)
+        if cjk is None:
+            out.append(m.group(2))
+        elif len(cjk) == 1:
+            out.append(cjk)
+        else:
+            out.extend(cjk[i : i + 2] for i in range(len(cjk) - 1))
+    return out
+
+
+def search_tokens(*parts: str | None, html: str | None = None) -> str:
+    """제목·주최 등 텍스트 필드와 본문 HTML → `search_tokens` 컬럼 값."""
+    seen: dict[str, None] = {}
+    texts = [p for p in parts if p]
+    if html:
+        texts.append(html_to_text(html))
+    for text in texts:
+        for tok in tokens(text):
+            seen.setdefault(tok, None)
+            if len(seen) >= MAX_TOKENS:
+                return " ".join(seen)
+    return " ".join(seen)
+
+
+_enabled = False
+
+
+def enable() -> None:
+    global _enabled
+    _enabled = True
+    logger.info("검색 토큰(search_tokens) 수집 시점 생성 사용")
+
+
+def enable_from_env() -> bool:
+    if os.getenv("CRAWL_SEARCH_INDEX", "").strip().lower() in ("1", "true", "yes", "on"):
+        enable()
+    return _enabled
+
+
+def active() -> bool:
+    return _enabled
@@ -1,10 +1,11 @@
 // Supabase Edge Function: contests 테이블에서 오래 갱신되지 않은 행 삭제
 // 크롤이 자주 돌면서 updated_at이 밀리므로, 목록에서 사라진 공고는 며칠 안에 삭제됨.
+// 크롤러가 생존 기록(--liveness)을 쓰는 출처는 updated_at 대신 missing_since(순회 목록에서 빠진 시각) 기준.
 // contests.manual_entry = true 제외 + DB에서 한국(KST) 달력 기준 실행일 당일 갱신분도 삭제 제외.
 //
 // 스케줄: 하루 1회 (시간 무관). Supabase Dashboard → Edge Functions → Cron 또는 외부 스케줄러.
 //
-// Query: ?days=3  — 오늘 기준 N일 이전(updated_at)까지 삭제. 범위 1~30, 기본 3.
+// Query: ?days=3  — 오늘 기준 N일 이전(updated_at 또는 missing_since)까지 삭제. 범위 1~30, 기본 3.
 // 보안: 환경변수 CRON_SECRET 이 있으면 Authorization: Bearer <CRON_SECRET> 또는 x-cron-secret 헤더 필요.
 //
 // npx supabase functions deploy prune-stale-contests --no-verify-jwt
@@ -75,7 +76,7 @@ Deno.serve(async (req) => {
         success: true,
         days,
         deleted_count: deleted,
-        message: `updated_at 기준 ${days}일 이전 contests ${deleted}건 삭제`,
+        message: `${days}일 이상 갱신·목록 노출 없는 contests ${deleted}건 삭제`,
       }),
       { status: 200, headers: { "Content-Type": "application/json" } },
     );
@@ -0,0 +1,20 @@
+-- 상세 본문 Storage 오프로드 (crawl_server.py --content-storage / CRAWL_CONTENT_STORAGE=1)
+-- 본문은 contest-content 버킷에 sha256 키(<앞 2자>/<hash>.html)로 한 번만 저장하고,
+-- contests 에는 키·해시만 둔다 (content 는 빈 문자열). 기존 인라인 content 행은 그대로 동작.
+
+ALTER TABLE public.contests ADD COLUMN IF NOT EXISTS content_key TEXT;
+ALTER TABLE public.contests ADD COLUMN IF NOT EXISTS content_hash TEXT;
+
+COMMENT ON COLUMN public.contests.content_key IS
+  'contest-content 버킷 객체 키. 값이 있으면 본문은 Storage 에서 읽는다 (content 는 비어 있음).';
+COMMENT ON COLUMN public.contests.content_hash IS
+  '본문 HTML sha256 (hex). 같은 본문은 같은 객체를 공유.';
+
+CREATE INDEX IF NOT EXISTS idx_contests_content_hash
+  ON public.contests (content_hash)
+  WHERE content_hash IS NOT NULL;
+
+-- 공개 읽기 버킷 (객체 키가 내용 해시라 변경 불가 → CDN 장기 캐시). 쓰기는 service_role 만.
+INSERT INTO storage.buckets (id, name, public)
+VALUES ('contest-content', 'contest-content', true)
+ON CONFLICT (id) DO NOTHING;
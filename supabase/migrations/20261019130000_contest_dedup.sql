@@ -0,0 +1,65 @@
+-- 출처 간 중복 공모전 색인 (crawl_server.py --dedup / CRAWL_DEDUP=1, contest_dedup.py)
+-- 제목+주최 MinHash 서명(64개)을 LSH 16밴드로 나눈 키를 contest_dedup_bands 에 두고,
+-- 새 배치의 밴드 키로 후보를 한 번에 찾는다. 같은 공모전으로 본 행들은 같은 canonical_group_id.
+
+ALTER TABLE public.contests ADD COLUMN IF NOT EXISTS canonical_group_id TEXT;
+ALTER TABLE public.contests ADD COLUMN IF NOT EXISTS dedup_signature BIGINT[];
+
+COMMENT ON COLUMN public.contests.canonical_group_id IS
+  '출처 간 중복 그룹 id (대표 행의 source:id). 같은 값이면 같은 공모전.';
+COMMENT ON COLUMN public.contests.dedup_signature IS
+  '제목+주최 MinHash 서명 (64개, 61비트). 후보 유사도 재확인용.';
+
+CREATE INDEX IF NOT EXISTS idx_contests_canonical_group_id
+  ON public.contests (canonical_group_id)
+  WHERE canonical_group_id IS NOT NULL;
+
+CREATE TABLE IF NOT EXISTS public.contest_dedup_bands (
+  band_key TEXT NOT NULL,
+  source TEXT NOT NULL,
+  contest_id TEXT NOT NULL,
+  PRIMARY KEY (band_key, source, contest_id),
+  FOREIGN KEY (source, contest_id) REFERENCES public.contests (source, id) ON DELETE CASCADE
+);
+
+COMMENT ON TABLE public.contest_dedup_bands IS
+  'LSH 밴드 키(밴드 번호 2자 + 해시) → 공모전. 크롤러(service_role)만 쓴다. prune 시 함께 삭제.';
+
+CREATE INDEX IF NOT EXISTS idx_contest_dedup_bands_contest
+  ON public.contest_dedup_bands (source, contest_id);
+
+ALTER TABLE public.contest_dedup_bands ENABLE ROW LEVEL SECURITY;
+
+CREATE OR REPLACE FUNCTION public.find_contest_dedup_candidates(p_band_keys text[])
+RETURNS TABLE (
+  source text,
+  contest_id text,
+  title text,
+  canonical_group_id text,
+  dedup_signature bigint[],
+  has_content boolean
+)
+LANGUAGE sql
+STABLE
+SECURITY DEFINER
+SET search_path = public
+AS $$
+  SELECT DISTINCT ON (c.source, c.id)
+    c.source,
+    c.id,
+    c.title,
+    c.canonical_group_id,
+    c.dedup_signature,
+    (COALESCE(c.content, '') <> '' OR c.content_key IS NOT NULL)
+  FROM public.contest_dedup_bands b
+  JOIN public.contests c ON c.source = b.source AND c.id = b.contest_id
+  WHERE b.band_key = ANY (p_band_keys)
+    AND c.dedup_signature IS NOT NULL
+  ORDER BY c.source, c.id;
+$$;
+
+COMMENT ON FUNCTION public.find_contest_dedup_candidates(text[]) IS
+  '밴드 키 중 하나라도 겹치는 공모전 (중복 후보). 유사도 판정은 크롤러가 서명으로 다시 한다.';
+
+REVOKE ALL ON FUNCTION public.find_contest_dedup_candidates(text[]) FROM PUBLIC;
+GRANT EXECUTE ON FUNCTION public.find_contest_dedup_candidates(text[]) TO service_role;
@@ -0,0 +1,80 @@
+-- 수집 시점 검색 문서 (crawl_server.py --search-index / CRAWL_SEARCH_INDEX=1, search_doc.py)
+-- 크롤러가 제목·주최·본문 텍스트를 한국어 2-gram 토큰(search_tokens)으로 넣고,
+-- search_tsv 생성 컬럼 + GIN 인덱스로 검색한다 (HTML content ilike 순차 스캔 대체).
+-- 생성 컬럼 추가는 테이블 재작성이 일어나므로 한가한 시간에 적용.
+-- 기존 행은 scripts/backfill_search_tokens.py 로 채운다.
+
+ALTER TABLE public.contests ADD COLUMN IF NOT EXISTS search_tokens TEXT;
+ALTER TABLE public.contests ADD COLUMN IF NOT EXISTS search_tsv tsvector
+  GENERATED ALWAYS AS (to_tsvector('simple', COALESCE(search_tokens, ''))) STORED;
+CREATE INDEX IF NOT EXISTS idx_contests_search_tsv ON public.contests USING GIN (search_tsv);
+
+ALTER TABLE public.startup_announcement ADD COLUMN IF NOT EXISTS search_tokens TEXT;
+ALTER TABLE public.startup_announcement ADD COLUMN IF NOT EXISTS search_tsv tsvector
+  GENERATED ALWAYS AS (to_tsvector('simple', COALESCE(search_tokens, ''))) STORED;
+CREATE INDEX IF NOT EXISTS idx_startup_announcement_search_tsv ON public.startup_announcement USING GIN (search_tsv);
+
+ALTER TABLE public.startup_business ADD COLUMN IF NOT EXISTS search_tokens TEXT;
+ALTER TABLE public.startup_business ADD COLUMN IF NOT EXISTS search_tsv tsvector
+  GENERATED ALWAYS AS (to_tsvector('simple', COALESCE(search_tokens, ''))) STORED;
+CREATE INDEX IF NOT EXISTS idx_startup_business_search_tsv ON public.startup_business USING GIN (search_tsv);
+
+COMMENT ON COLUMN public.contests.search_tokens IS
+  '검색 토큰 (한글·한자 2-gram, 영문·숫자 단어, 공백 구분). 크롤러가 본문을 새로 받을 때 채운다.';
+COMMENT ON COLUMN public.startup_announcement.search_tokens IS
+  '검색 토큰 (공고명·기관·지역·공고 내용 등). search_doc.py 규칙.';
+COMMENT ON COLUMN public.startup_business.search_tokens IS
+  '검색 토큰 (사업명·소개·지원 대상·지원 내용). search_doc.py 규칙.';
+
+-- 검색어 → tsquery (search_doc.tokens 와 같은 규칙, 모든 토큰 AND). 한 글자·영문/숫자 단어는 접두 일치.
+CREATE OR REPLACE FUNCTION public.search_bigram_tsquery(p_query text)
+RETURNS tsquery
+LANGUAGE plpgsql
+STABLE
+AS $$
+DECLARE
+  run text;
+  terms text[] := ARRAY[]::text[];
+  i integer;
+BEGIN
+  FOR run IN
+    SELECT (regexp_matches(
+      lower(normalize(COALESCE(p_query, ''), NFKC)),
+      '[ᄀ-ᇿ㄰-㆏가-힣㐀-䶿一-鿿]+|[a-z0-9]+',
+      'g'
+    ))[1]
+  LOOP
+    IF run ~ '^[a-z0-9]+$' OR char_length(run) = 1 THEN
+      terms := terms || (run || ':*');
+    ELSE
+      FOR i IN 1 .. char_length(run) - 1 LOOP
+        terms := terms || substr(run, i, 2);
+      END LOOP;
+    END IF;
+  END LOOP;
+  IF cardinality(terms) = 0 THEN
+    RETURN NULL;
+  END IF;
+  RETURN to_tsquery('simple', array_to_string(terms, ' & '));
+END;
+$$;
+
+COMMENT ON FUNCTION public.search_bigram_tsquery(text) IS
+  '검색어를 search_tsv 용 tsquery 로. 예: WHERE search_tsv @@ search_bigram_tsquery(''청년 창업'')';
+
+-- 공모전 검색 (RLS 그대로 적용되는 SECURITY INVOKER). 관련도 → 최근 갱신 순.
+CREATE OR REPLACE FUNCTION public.search_contests(p_query text, p_limit integer DEFAULT 50)
+RETURNS SETOF public.contests
+LANGUAGE sql
+STABLE
+SET search_path = public
+AS $$
+  SELECT c.*
+  FROM public.contests c
+  WHERE c.search_tsv @@ public.search_bigram_tsquery(p_query)
+  ORDER BY ts_rank(c.search_tsv, public.search_bigram_tsquery(p_query)) DESC, c.updated_at DESC
+  LIMIT GREATEST(1, LEAST(COALESCE(p_limit, 50), 200));
+$$;
+
+GRANT EXECUTE ON FUNCTION public.search_bigram_tsquery(text) TO anon, authenticated;
+GRANT EXECUTE ON FUNCTION public.search_contests(text, integer) TO anon, authenticated;
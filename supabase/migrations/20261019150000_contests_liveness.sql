@@ -0,0 +1,134 @@
+-- 목록 생존 기록 (crawl_server.py --liveness / CRAWL_LIVENESS=1, contest_liveness.py)
+-- 예전에는 prune 이 updated_at 만 보므로 크롤러가 매 사이클 모든 행의 updated_at 을 다시 썼다.
+-- 이제 전체 순회가 끝나면 본 id 집합을 record_contest_sweep 에 한 번 넘기고,
+-- DB 가 (목록에 있던 행) − (본 id) 에만 missing_since 를 찍는다. 상태가 바뀐 행만 쓰인다.
+
+ALTER TABLE public.contests ADD COLUMN IF NOT EXISTS missing_since TIMESTAMPTZ;
+
+COMMENT ON COLUMN public.contests.missing_since IS
+  '전체 순회 목록에서 처음 빠진 시각. NULL 이면 마지막 순회 목록에 있음 (다시 나타나면 NULL 로 복귀).';
+
+CREATE INDEX IF NOT EXISTS idx_contests_missing_since
+  ON public.contests (missing_since)
+  WHERE missing_since IS NOT NULL;
+
+CREATE TABLE IF NOT EXISTS public.contest_sweeps (
+  source TEXT PRIMARY KEY,
+  completed_at TIMESTAMPTZ NOT NULL,
+  seen_count INTEGER NOT NULL,
+  vanished_count INTEGER NOT NULL DEFAULT 0,
+  returned_count INTEGER NOT NULL DEFAULT 0
+);
+
+COMMENT ON TABLE public.contest_sweeps IS
+  '출처별 마지막 완료 순회. 최근 순회가 있는 출처는 prune 이 missing_since 기준으로 판단.';
+
+ALTER TABLE public.contest_sweeps ENABLE ROW LEVEL SECURITY;
+
+CREATE OR REPLACE FUNCTION public.record_contest_sweep(
+  p_source text,
+  p_seen_ids text[],
+  p_min_ratio numeric DEFAULT 0.5
+)
+RETURNS jsonb
+LANGUAGE plpgsql
+SECURITY DEFINER
+SET search_path = public
+AS $$
+DECLARE
+  seen_ids text[] := ARRAY(SELECT DISTINCT unnest(COALESCE(p_seen_ids, ARRAY[]::text[])));
+  seen_count bigint := cardinality(seen_ids);
+  live_count bigint;
+  vanished bigint;
+  returned bigint;
+BEGIN
+  SELECT count(*) INTO live_count
+  FROM public.contests c
+  WHERE c.source = p_source AND c.missing_since IS NULL AND c.manual_entry IS NOT TRUE;
+
+  -- 본 id 가 너무 적으면 차단·구조 변경으로 목록을 덜 읽은 것 — 멀쩡한 행을 사라진 것으로 찍지 않는다
+  IF live_count > 0 AND seen_count < live_count * COALESCE(p_min_ratio, 0.5) THEN
+    RETURN jsonb_build_object('skipped', true, 'seen', seen_count, 'live', live_count);
+  END IF;
+
+  WITH v AS (
+    UPDATE public.contests c
+    SET missing_since = now()
+    WHERE c.source = p_source
+      AND c.missing_since IS NULL
+      AND c.manual_entry IS NOT TRUE
+      AND NOT (c.id = ANY (seen_ids))
+    RETURNING 1
+  )
+  SELECT count(*) INTO vanished FROM v;
+
+  WITH r AS (
+    UPDATE public.contests c
+    SET missing_since = NULL
+    WHERE c.source = p_source
+      AND c.missing_since IS NOT NULL
+      AND c.id = ANY (seen_ids)
+    RETURNING 1
+  )
+  SELECT count(*) INTO returned FROM r;
+
+  INSERT INTO public.contest_sweeps (source, completed_at, seen_count, vanished_count, returned_count)
+  VALUES (p_source, now(), seen_count, vanished, returned)
+  ON CONFLICT (source) DO UPDATE
+    SET completed_at = EXCLUDED.completed_at,
+        seen_count = EXCLUDED.seen_count,
+        vanished_count = EXCLUDED.vanished_count,
+        returned_count = EXCLUDED.returned_count;
+
+  RETURN jsonb_build_object(
+    'skipped', false, 'seen', seen_count, 'live', live_count, 'vanished', vanished, 'returned', returned
+  );
+END;
+$$;
+
+COMMENT ON FUNCTION public.record_contest_sweep(text, text[], numeric) IS
+  '전체 순회에서 본 id 집합 기록. 빠진 행 missing_since=now(), 다시 나타난 행 NULL. 본 id 가 목록 행의 p_min_ratio 미만이면 거절.';
+
+REVOKE ALL ON FUNCTION public.record_contest_sweep(text, text[], numeric) FROM PUBLIC;
+GRANT EXECUTE ON FUNCTION public.record_contest_sweep(text, text[], numeric) TO service_role;
+
+-- prune: 최근 N일 안에 순회가 기록된 출처는 missing_since 가 N일 지난 행만,
+-- 그 밖의 출처(생존 기록을 안 쓰는 크롤러·수동 외 기타)는 예전처럼 updated_at 기준.
+-- 두 경우 모두 manual_entry 제외, KST 기준 실행일 당일 표시·갱신분 제외.
+CREATE OR REPLACE FUNCTION public.prune_stale_contests(p_days integer DEFAULT 3)
+RETURNS bigint
+LANGUAGE plpgsql
+SECURITY DEFINER
+SET search_path = public
+AS $$
+DECLARE
+  deleted_count bigint;
+  d integer := GREATEST(1, LEAST(COALESCE(p_days, 3), 90));
+  cutoff timestamptz := now() - (d || ' days')::interval;
+  today_kst date := (timezone('Asia/Seoul', now()))::date;
+BEGIN
+  WITH del AS (
+    DELETE FROM public.contests c
+    WHERE c.manual_entry IS NOT TRUE
+      AND CASE
+        WHEN EXISTS (
+          SELECT 1 FROM public.contest_sweeps s
+          WHERE s.source = c.source AND s.completed_at >= cutoff
+        ) THEN
+          c.missing_since IS NOT NULL
+          AND c.missing_since < cutoff
+          AND (timezone('Asia/Seoul', c.missing_since))::date < today_kst
+        ELSE
+          c.updated_at < cutoff
+          AND (timezone('Asia/Seoul', c.updated_at))::date < today_kst
+      END
+    RETURNING 1
+  )
+  SELECT count(*)::bigint INTO deleted_count FROM del;
+
+  RETURN COALESCE(deleted_count, 0);
+END;
+$$;
+
+COMMENT ON FUNCTION public.prune_stale_contests(integer) IS
+  'manual_entry 아님 + (최근 순회 출처: missing_since 가 N일 지남 / 그 외: updated_at 이 N일 지남), 한국 날짜 기준 당일분 제외.';
@@ -0,0 +1,240 @@
+-- 크롤 작업 큐 (crawl_server.py --work-queue, work_queue.py)
+-- 한 사이클을 목록 페이지 구간(list)·상세 id(detail) 항목으로 나눠 두고, 여러 워커(Actions 러너·로컬 PC 등)가
+-- 만료되는 임대(lease)로 나눠 가져간다. 가져가기는 FOR UPDATE SKIP LOCKED 라 같은 항목을 두 워커가 받지 않는다.
+-- 임대가 만료된 항목(워커 종료·네트워크 단절)은 다른 워커가 다시 가져간다.
+
+CREATE TABLE IF NOT EXISTS public.crawl_work_items (
+  id BIGSERIAL PRIMARY KEY,
+  cycle_id TEXT NOT NULL,
+  source TEXT NOT NULL,
+  kind TEXT NOT NULL CHECK (kind IN ('list', 'detail')),
+  item_key TEXT NOT NULL,
+  payload JSONB NOT NULL DEFAULT '{}'::jsonb,
+  status TEXT NOT NULL DEFAULT 'pending' CHECK (status IN ('pending', 'leased', 'done', 'failed', 'skipped')),
+  lease_owner TEXT,
+  lease_expires_at TIMESTAMPTZ,
+  attempts INTEGER NOT NULL DEFAULT 0,
+  result JSONB,
+  created_at TIMESTAMPTZ NOT NULL DEFAULT NOW(),
+  finished_at TIMESTAMPTZ,
+  UNIQUE (cycle_id, source, kind, item_key)
+);
+
+COMMENT ON TABLE public.crawl_work_items IS
+  '크롤 사이클 작업 항목. list: payload {from,to} 목록 페이지 구간, detail: 상세 본문을 채울 contests id.';
+
+CREATE INDEX IF NOT EXISTS idx_crawl_work_items_claim
+  ON public.crawl_work_items (cycle_id, source, kind, id)
+  WHERE status IN ('pending', 'leased');
+
+CREATE TABLE IF NOT EXISTS public.crawl_work_cycles (
+  cycle_id TEXT NOT NULL,
+  source TEXT NOT NULL,
+  finished_at TIMESTAMPTZ NOT NULL DEFAULT NOW(),
+  summary JSONB,
+  PRIMARY KEY (cycle_id, source)
+);
+
+COMMENT ON TABLE public.crawl_work_cycles IS
+  '목록 항목이 모두 끝난 사이클 (마무리 — 알림·생존 기록 — 을 한 워커만 하도록).';
+
+ALTER TABLE public.crawl_work_items ENABLE ROW LEVEL SECURITY;
+ALTER TABLE public.crawl_work_cycles ENABLE ROW LEVEL SECURITY;
+
+-- 항목 등록 (이미 있으면 무시 → 여러 워커가 동시에 등록해도 한 벌)
+CREATE OR REPLACE FUNCTION public.enqueue_crawl_work(
+  p_cycle_id text,
+  p_source text,
+  p_kind text,
+  p_items jsonb
+)
+RETURNS integer
+LANGUAGE sql
+SECURITY DEFINER
+SET search_path = public
+AS $$
+  WITH ins AS (
+    INSERT INTO public.crawl_work_items (cycle_id, source, kind, item_key, payload)
+    SELECT p_cycle_id, p_source, p_kind, e->>'key', COALESCE(e->'payload', '{}'::jsonb)
+    FROM jsonb_array_elements(COALESCE(p_items, '[]'::jsonb)) e
+    ON CONFLICT (cycle_id, source, kind, item_key) DO NOTHING
+    RETURNING 1
+  )
+  SELECT count(*)::integer FROM ins;
+$$;
+
+-- 항목 가져가기: 대기 중이거나 임대가 만료된 항목을 id 순으로 p_limit 개 임대
+CREATE OR REPLACE FUNCTION public.claim_crawl_work(
+  p_cycle_id text,
+  p_source text,
+  p_kind text,
+  p_owner text,
+  p_limit integer DEFAULT 1,
+  p_lease_seconds integer DEFAULT 600,
+  p_max_attempts integer DEFAULT 3
+)
+RETURNS SETOF public.crawl_work_items
+LANGUAGE sql
+SECURITY DEFINER
+SET search_path = public
+AS $$
+  UPDATE public.crawl_work_items w
+  SET status = 'leased',
+      lease_owner = p_owner,
+      lease_expires_at = now() + make_interval(secs => GREATEST(30, p_lease_seconds)),
+      attempts = w.attempts + 1
+  WHERE w.id IN (
+    SELECT c.id
+    FROM public.crawl_work_items c
+    WHERE c.cycle_id = p_cycle_id
+      AND c.source = p_source
+      AND c.kind = p_kind
+      AND (c.status = 'pending' OR (c.status = 'leased' AND c.lease_expires_at < now()))
+      AND c.attempts < p_max_attempts
+    ORDER BY c.id
+    LIMIT GREATEST(1, p_limit)
+    FOR UPDATE SKIP LOCKED
+  )
+  RETURNING w.*;
+$$;
+
+-- 임대 연장 (긴 목록 구간 처리 중)
+CREATE OR REPLACE FUNCTION public.renew_crawl_work(p_ids bigint[], p_owner text, p_lease_seconds integer DEFAULT 600)
+RETURNS integer
+LANGUAGE sql
+SECURITY DEFINER
+SET search_path = public
+AS $$
+  WITH u AS (
+    UPDATE public.crawl_work_items
+    SET lease_expires_at = now() + make_interval(secs => GREATEST(30, p_lease_seconds))
+    WHERE id = ANY (p_ids) AND lease_owner = p_owner AND status = 'leased'
+    RETURNING 1
+  )
+  SELECT count(*)::integer FROM u;
+$$;
+
+-- 완료/실패 보고. 임대를 가진 워커만 바꿀 수 있다 (만료 후 다른 워커가 가져갔으면 무시).
+-- 실패는 시도 횟수가 남았으면 pending 으로 되돌려 다른 워커가 다시 가져가게 한다.
+CREATE OR REPLACE FUNCTION public.complete_crawl_work(
+  p_id bigint,
+  p_owner text,
+  p_ok boolean,
+  p_result jsonb DEFAULT NULL,
+  p_max_attempts integer DEFAULT 3
+)
+RETURNS boolean
+LANGUAGE plpgsql
+SECURITY DEFINER
+SET search_path = public
+AS $$
+BEGIN
+  UPDATE public.crawl_work_items
+  SET status = CASE
+        WHEN p_ok THEN 'done'
+        WHEN attempts >= p_max_attempts THEN 'failed'
+        ELSE 'pending'
+      END,
+      result = COALESCE(p_result, result),
+      lease_owner = NULL,
+      lease_expires_at = NULL,
+      finished_at = CASE WHEN p_ok OR attempts >= p_max_attempts THEN now() ELSE NULL END
+  WHERE id = p_id AND lease_owner = p_owner AND status = 'leased';
+  RETURN FOUND;
+END;
+$$;
+
+-- 목록 끝(빈 페이지)을 만난 뒤의 구간은 건너뛴다
+CREATE OR REPLACE FUNCTION public.skip_crawl_list_after(p_cycle_id text, p_source text, p_last_page integer)
+RETURNS integer
+LANGUAGE sql
+SECURITY DEFINER
+SET search_path = public
+AS $$
+  WITH u AS (
+    UPDATE public.crawl_work_items
+    SET status = 'skipped', lease_owner = NULL, lease_expires_at = NULL, finished_at = now()
+    WHERE cycle_id = p_cycle_id
+      AND source = p_source
+      AND kind = 'list'
+      AND status = 'pending'
+      AND (payload->>'from')::integer > p_last_page
+    RETURNING 1
+  )
+  SELECT count(*)::integer FROM u;
+$$;
+
+-- 목록 항목이 모두 끝났으면 사이클을 한 번만 마무리하고 합계를 돌려준다 (다른 워커·두 번째 호출은 NULL).
+-- 실패 항목이 없고 p_record_sweep 이면 모든 list 결과의 ids 로 record_contest_sweep 을 부른다.
+CREATE OR REPLACE FUNCTION public.finish_crawl_cycle(
+  p_cycle_id text,
+  p_source text,
+  p_record_sweep boolean DEFAULT false,
+  p_min_ratio numeric DEFAULT 0.5
+)
+RETURNS jsonb
+LANGUAGE plpgsql
+SECURITY DEFINER
+SET search_path = public
+AS $$
+DECLARE
+  open_count bigint;
+  failed_count bigint;
+  ins bigint;
+  upd bigint;
+  ids text[];
+  sweep jsonb;
+  v_summary jsonb;
+BEGIN
+  SELECT count(*) FILTER (WHERE status IN ('pending', 'leased')),
+         count(*) FILTER (WHERE status = 'failed')
+  INTO open_count, failed_count
+  FROM public.crawl_work_items
+  WHERE cycle_id = p_cycle_id AND source = p_source AND kind = 'list';
+
+  IF open_count > 0 THEN
+    RETURN NULL;
+  END IF;
+
+  INSERT INTO public.crawl_work_cycles (cycle_id, source) VALUES (p_cycle_id, p_source)
+  ON CONFLICT DO NOTHING;
+  IF NOT FOUND THEN
+    RETURN NULL;
+  END IF;
+
+  SELECT COALESCE(sum((result->>'inserted')::bigint), 0),
+         COALESCE(sum((result->>'updated')::bigint), 0),
+         ARRAY(
+           SELECT DISTINCT x
+           FROM public.crawl_work_items i2, jsonb_array_elements_text(COALESCE(i2.result->'ids', '[]'::jsonb)) x
+           WHERE i2.cycle_id = p_cycle_id AND i2.source = p_source AND i2.kind = 'list' AND i2.status = 'done'
+         )
+  INTO ins, upd, ids
+  FROM public.crawl_work_items
+  WHERE cycle_id = p_cycle_id AND source = p_source AND kind = 'list' AND status = 'done';
+
+  IF p_record_sweep AND failed_count = 0 THEN
+    sweep := public.record_contest_sweep(p_source, ids, p_min_ratio);
+  END IF;
+
+  v_summary := jsonb_build_object(
+    'inserted', ins, 'updated', upd, 'seen', cardinality(ids), 'failed_items', failed_count, 'sweep', sweep
+  );
+  UPDATE public.crawl_work_cycles SET summary = v_summary
+  WHERE cycle_id = p_cycle_id AND source = p_source;
+  RETURN v_summary;
+END;
+$$;
+
+REVOKE ALL ON FUNCTION public.enqueue_crawl_work(text, text, text, jsonb) FROM PUBLIC;
+REVOKE ALL ON FUNCTION public.claim_crawl_work(text, text, text, text, integer, integer, integer) FROM PUBLIC;
+REVOKE ALL ON FUNCTION public.renew_crawl_work(bigint[], text, integer) FROM PUBLIC;
+REVOKE ALL ON FUNCTION public.complete_crawl_work(bigint, text, boolean, jsonb, integer) FROM PUBLIC;
+REVOKE ALL ON FUNCTION public.skip_crawl_list_after(text, text, integer) FROM PUBLIC;
+REVOKE ALL ON FUNCTION public.finish_crawl_cycle(text, text, boolean, numeric) FROM PUBLIC;
+GRANT EXECUTE ON FUNCTION public.enqueue_crawl_work(text, text, text, jsonb) TO service_role;
+GRANT EXECUTE ON FUNCTION public.claim_crawl_work(text, text, text, text, integer, integer, integer) TO service_role;
+GRANT EXECUTE ON FUNCTION public.renew_crawl_work(bigint[], text, integer) TO service_role;
+GRANT EXECUTE ON FUNCTION public.complete_crawl_work(bigint, text, boolean, jsonb, integer) TO service_role;
+GRANT EXECUTE ON FUNCTION public.skip_crawl_list_after(text, text, integer) TO service_role;
+GRANT EXECUTE ON FUNCTION public.finish_crawl_cycle(text, text, boolean, numeric) TO service_role;
@@ -0,0 +1,11 @@
+-- 단일 사이클 시간 예산 (crawl_server.py --single-cycle --time-budget MINUTES, cycle_budget.py)
+-- 잡 타임아웃 전에 배치 경계에서 멈춘 작업은 status = 'partial' 과 다음 페이지 체크포인트를 남긴다.
+-- 같은 날(KST) 다음 실행은 success 가 아니므로 다시 돌고, 체크포인트 페이지부터 이어 간다.
+
+ALTER TABLE public.crawl_logs ADD COLUMN IF NOT EXISTS checkpoint JSONB;
+
+COMMENT ON COLUMN public.crawl_logs.checkpoint IS
+  'status = partial 일 때 이어 갈 위치 (예: {"next_page": 12}). success 면 NULL. --time-budget 실행에서만 씀.';
+
+COMMENT ON COLUMN public.crawl_logs.status IS
+  'success · fail · partial(시간 예산으로 배치 경계에서 멈춤, checkpoint 참고).';
@@ -0,0 +1,119 @@
+-- 수집 변경 피드 (crawl_server.py --changes-table / CRAWL_CHANGES_TABLE=1, change_feed.py)
+-- 크롤러가 패스마다 새로 생긴·바뀐·사라진 행을 한 행씩 남긴다. 알림·프론트 캐시·분석은
+-- contests·startup_* 전체를 다시 읽지 않고 id 가 마지막으로 읽은 값보다 큰 행만 이어 읽는다.
+
+CREATE TABLE IF NOT EXISTS public.crawl_changes (
+  id BIGSERIAL PRIMARY KEY,
+  cycle_id TEXT NOT NULL,
+  changed_at TIMESTAMPTZ NOT NULL DEFAULT now(),
+  table_name TEXT NOT NULL,
+  source TEXT,
+  row_key TEXT NOT NULL,
+  op TEXT NOT NULL CHECK (op IN ('insert', 'update', 'remove', 'restore')),
+  changed TEXT[] NOT NULL DEFAULT '{}',
+  new_values JSONB NOT NULL DEFAULT '{}'::jsonb
+);
+
+COMMENT ON TABLE public.crawl_changes IS
+  '크롤 변경 피드. 소비자는 id 증가 순으로 이어 읽음. 30일 지난 행은 크롤러가 prune_crawl_changes 로 정리.';
+COMMENT ON COLUMN public.crawl_changes.cycle_id IS
+  '수집 패스 id ("출처@KST 시작 시각", 작업 큐 모드는 "출처@큐 사이클 id").';
+COMMENT ON COLUMN public.crawl_changes.row_key IS
+  '행 키: contests 는 (source, row_key), startup_business 는 id, startup_announcement 는 pbanc_sn.';
+COMMENT ON COLUMN public.crawl_changes.op IS
+  'insert 새 행 · update 목록 값·본문 변경 · remove 순회에서 빠짐(missing_since) · restore 다시 나타남.';
+COMMENT ON COLUMN public.crawl_changes.changed IS
+  '바뀐 컬럼 이름 (insert 는 값이 있는 컬럼 전부).';
+COMMENT ON COLUMN public.crawl_changes.new_values IS
+  'changed 중 짧은 값의 새 값. 본문·검색 토큰 등 큰 값은 이름만 있으므로 원본 행을 다시 읽는다.';
+
+CREATE INDEX IF NOT EXISTS idx_crawl_changes_row
+  ON public.crawl_changes (table_name, row_key);
+CREATE INDEX IF NOT EXISTS idx_crawl_changes_changed_at
+  ON public.crawl_changes (changed_at);
+
+ALTER TABLE public.crawl_changes ENABLE ROW LEVEL SECURITY;
+
+CREATE OR REPLACE FUNCTION public.prune_crawl_changes(p_days integer DEFAULT 30)
+RETURNS bigint
+LANGUAGE sql
+SECURITY DEFINER
+SET search_path = public
+AS $$
+  WITH del AS (
+    DELETE FROM public.crawl_changes
+    WHERE changed_at < now() - (GREATEST(1, COALESCE(p_days, 30)) || ' days')::interval
+    RETURNING 1
+  )
+  SELECT count(*)::bigint FROM del;
+$$;
+
+COMMENT ON FUNCTION public.prune_crawl_changes(integer) IS
+  'p_days 일 지난 변경 피드 행 삭제 → 지운 행 수.';
+
+REVOKE ALL ON FUNCTION public.prune_crawl_changes(integer) FROM PUBLIC;
+GRANT EXECUTE ON FUNCTION public.prune_crawl_changes(integer) TO service_role;
+
+-- 순회 생존 기록이 빠진·다시 나타난 id 도 돌려주도록 (변경 피드 remove/restore). 나머지 동작은 그대로.
+CREATE OR REPLACE FUNCTION public.record_contest_sweep(
+  p_source text,
+  p_seen_ids text[],
+  p_min_ratio numeric DEFAULT 0.5
+)
+RETURNS jsonb
+LANGUAGE plpgsql
+SECURITY DEFINER
+SET search_path = public
+AS $$
+DECLARE
+  seen_ids text[] := ARRAY(SELECT DISTINCT unnest(COALESCE(p_seen_ids, ARRAY[]::text[])));
+  seen_count bigint := cardinality(seen_ids);
+  live_count bigint;
+  vanished_ids text[];
+  returned_ids text[];
+BEGIN
+  SELECT count(*) INTO live_count
+  FROM public.contests c
+  WHERE c.source = p_source AND c.missing_since IS NULL AND c.manual_entry IS NOT TRUE;
+
+  -- 본 id 가 너무 적으면 차단·구조 변경으로 목록을 덜 읽은 것 — 멀쩡한 행을 사라진 것으로 찍지 않는다
+  IF live_count > 0 AND seen_count < live_count * COALESCE(p_min_ratio, 0.5) THEN
+    RETURN jsonb_build_object('skipped', true, 'seen', seen_count, 'live', live_count);
+  END IF;
+
+  WITH v AS (
+    UPDATE public.contests c
+    SET missing_since = now()
+    WHERE c.source = p_source
+      AND c.missing_since IS NULL
+      AND c.manual_entry IS NOT TRUE
+      AND NOT (c.id = ANY (seen_ids))
+    RETURNING c.id
+  )
+  SELECT COALESCE(array_agg(id), ARRAY[]::text[]) INTO vanished_ids FROM v;
+
+  WITH r AS (
+    UPDATE public.contests c
+    SET missing_since = NULL
+    WHERE c.source = p_source
+      AND c.missing_since IS NOT NULL
+      AND c.id = ANY (seen_ids)
+    RETURNING c.id
+  )
+  SELECT COALESCE(array_agg(id), ARRAY[]::text[]) INTO returned_ids FROM r;
+
+  INSERT INTO public.contest_sweeps (source, completed_at, seen_count, vanished_count, returned_count)
+  VALUES (p_source, now(), seen_count, cardinality(vanished_ids), cardinality(returned_ids))
+  ON CONFLICT (source) DO UPDATE
+    SET completed_at = EXCLUDED.completed_at,
+        seen_count = EXCLUDED.seen_count,
+        vanished_count = EXCLUDED.vanished_count,
+        returned_count = EXCLUDED.returned_count;
+
+  RETURN jsonb_build_object(
+    'skipped', false, 'seen', seen_count, 'live', live_count,
+    'vanished', cardinality(vanished_ids), 'returned', cardinality(returned_ids),
+    'vanished_ids', to_jsonb(vanished_ids), 'returned_ids', to_jsonb(returned_ids)
+  );
+END;
+$$;
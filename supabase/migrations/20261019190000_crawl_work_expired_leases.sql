@@ -0,0 +1,143 @@
+-- 작업 큐: 마지막 시도 중에 임대가 만료된 항목을 failed 로 (crawl_server.py --work-queue, work_queue.py)
+-- 워커가 마지막 시도(attempts = p_max_attempts)를 임대한 채 죽으면 그 항목은 claim 조건(attempts < p_max_attempts)에
+-- 다시 걸리지 않아 status='leased' 로 영영 남고, finish_crawl_cycle 이 열린 항목으로 세어 사이클이 끝나지 않았다
+-- (알림·생존 기록 순회가 남지 않음). 만료된 임대에 남은 시도가 없으면 failed 로 닫고 열린 항목에서 뺀다.
+
+-- 임대가 만료됐고 시도를 다 쓴 항목 → failed. 닫은 항목 수.
+CREATE OR REPLACE FUNCTION public.fail_expired_crawl_work(
+  p_cycle_id text,
+  p_source text,
+  p_max_attempts integer DEFAULT 3
+)
+RETURNS integer
+LANGUAGE sql
+SECURITY DEFINER
+SET search_path = public
+AS $$
+  WITH u AS (
+    UPDATE public.crawl_work_items
+    SET status = 'failed',
+        lease_owner = NULL,
+        lease_expires_at = NULL,
+        finished_at = now(),
+        result = COALESCE(result, '{}'::jsonb) || '{"error": "lease expired on last attempt"}'::jsonb
+    WHERE cycle_id = p_cycle_id
+      AND source = p_source
+      AND status = 'leased'
+      AND lease_expires_at < now()
+      AND attempts >= p_max_attempts
+    RETURNING 1
+  )
+  SELECT count(*)::integer FROM u;
+$$;
+
+COMMENT ON FUNCTION public.fail_expired_crawl_work(text, text, integer) IS
+  '시도를 다 쓴 채 임대가 만료된 작업 큐 항목을 failed 로 닫음 (claim_crawl_work·finish_crawl_cycle 이 먼저 부름)';
+
+-- 항목 가져가기: 먼저 다시 가져갈 수 없는 만료 항목을 닫고, 나머지는 20261019160000 과 같다
+CREATE OR REPLACE FUNCTION public.claim_crawl_work(
+  p_cycle_id text,
+  p_source text,
+  p_kind text,
+  p_owner text,
+  p_limit integer DEFAULT 1,
+  p_lease_seconds integer DEFAULT 600,
+  p_max_attempts integer DEFAULT 3
+)
+RETURNS SETOF public.crawl_work_items
+LANGUAGE sql
+SECURITY DEFINER
+SET search_path = public
+AS $$
+  SELECT public.fail_expired_crawl_work(p_cycle_id, p_source, p_max_attempts);
+
+  UPDATE public.crawl_work_items w
+  SET status = 'leased',
+      lease_owner = p_owner,
+      lease_expires_at = now() + make_interval(secs => GREATEST(30, p_lease_seconds)),
+      attempts = w.attempts + 1
+  WHERE w.id IN (
+    SELECT c.id
+    FROM public.crawl_work_items c
+    WHERE c.cycle_id = p_cycle_id
+      AND c.source = p_source
+      AND c.kind = p_kind
+      AND (c.status = 'pending' OR (c.status = 'leased' AND c.lease_expires_at < now()))
+      AND c.attempts < p_max_attempts
+    ORDER BY c.id
+    LIMIT GREATEST(1, p_limit)
+    FOR UPDATE SKIP LOCKED
+  )
+  RETURNING w.*;
+$$;
+
+-- 사이클 마무리: p_max_attempts 를 받아 열린 항목을 세기 전에 만료 항목을 닫는다. 나머지는 그대로.
+DROP FUNCTION IF EXISTS public.finish_crawl_cycle(text, text, boolean, numeric);
+
+CREATE OR REPLACE FUNCTION public.finish_crawl_cycle(
+  p_cycle_id text,
+  p_source text,
+  p_record_sweep boolean DEFAULT false,
+  p_min_ratio numeric DEFAULT 0.5,
+  p_max_attempts integer DEFAULT 3
+)
+RETURNS jsonb
+LANGUAGE plpgsql
+SECURITY DEFINER
+SET search_path = public
+AS $$
+DECLARE
+  open_count bigint;
+  failed_count bigint;
+  ins bigint;
+  upd bigint;
+  ids text[];
+  sweep jsonb;
+  v_summary jsonb;
+BEGIN
+  PERFORM public.fail_expired_crawl_work(p_cycle_id, p_source, p_max_attempts);
+
+  SELECT count(*) FILTER (WHERE status IN ('pending', 'leased')),
+         count(*) FILTER (WHERE status = 'failed')
+  INTO open_count, failed_count
+  FROM public.crawl_work_items
+  WHERE cycle_id = p_cycle_id AND source = p_source AND kind = 'list';
+
+  IF open_count > 0 THEN
+    RETURN NULL;
+  END IF;
+
+  INSERT INTO public.crawl_work_cycles (cycle_id, source) VALUES (p_cycle_id, p_source)
+  ON CONFLICT DO NOTHING;
+  IF NOT FOUND THEN
+    RETURN NULL;
+  END IF;
+
+  SELECT COALESCE(sum((result->>'inserted')::bigint), 0),
+         COALESCE(sum((result->>'updated')::bigint), 0),
+         ARRAY(
+           SELECT DISTINCT x
+           FROM public.crawl_work_items i2, jsonb_array_elements_text(COALESCE(i2.result->'ids', '[]'::jsonb)) x
+           WHERE i2.cycle_id = p_cycle_id AND i2.source = p_source AND i2.kind = 'list' AND i2.status = 'done'
+         )
+  INTO ins, upd, ids
+  FROM public.crawl_work_items
+  WHERE cycle_id = p_cycle_id AND source = p_source AND kind = 'list' AND status = 'done';
+
+  IF p_record_sweep AND failed_count = 0 THEN
+    sweep := public.record_contest_sweep(p_source, ids, p_min_ratio);
+  END IF;
+
+  v_summary := jsonb_build_object(
+    'inserted', ins, 'updated', upd, 'seen', cardinality(ids), 'failed_items', failed_count, 'sweep', sweep
+  );
+  UPDATE public.crawl_work_cycles SET summary = v_summary
+  WHERE cycle_id = p_cycle_id AND source = p_source;
+  RETURN v_summary;
+END;
+$$;
+
+REVOKE ALL ON FUNCTION public.fail_expired_crawl_work(text, text, integer) FROM PUBLIC;
+REVOKE ALL ON FUNCTION public.finish_crawl_cycle(text, text, boolean, numeric, integer) FROM PUBLIC;
+GRANT EXECUTE ON FUNCTION public.fail_expired_crawl_work(text, text, integer) TO service_role;
+GRANT EXECUTE ON FUNCTION public.finish_crawl_cycle(text, text, boolean, numeric, integer) TO service_role;
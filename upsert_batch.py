@@ -0,0 +1,170 @@
+"""
+PostgREST upsert 배치 나누기·합치기 (요청 바이트·행 수 기준)
+
+`--page-batch-size`를 키우면 본문(행당 수십 KB)이 든 contests 배치가 요청 하나에 수 MB 로 실려
+타임아웃·큰 재전송이 나고, K-Startup 처럼 작은 페이지는 요청마다 조금씩만 채워 보낸다.
+`BatchingWriter`는 행을 컬럼 구성별로 모아 JSON 크기가 `TARGET_BYTES`나 행 수가 `MAX_ROWS`에 닿으면 보낸다.
+
+- 나누기: 큰 배치는 여러 요청으로. 한 행이 목표보다 크면 그 행 하나만 보낸다.
+- 합치기: 여러 페이지의 작은 배치를 `add()`로 모았다가 `flush()`(또는 `with` 끝)에 한 번에.
+- 실패: PostgREST 요청 하나는 한 트랜잭션이라 실패한 요청의 행은 하나도 쓰이지 않는다. 크기·일시 오류
+  (타임아웃·연결 오류, HTTP 413·5xx, 문장 시간 초과 등 `_splittable`)만 그 요청을 반으로 나눠 다시 보내고(이미 성공한
+  요청은 다시 보내지 않음), 한 행까지 줄여도 실패하면 예외를 올린다. 없는 컬럼·RLS·제약 위반 같은 4xx 는 나눠도
+  똑같이 실패하고 일부만 쓰이므로 바로 올린다.
+- 압축: `SUPABASE_GZIP_MIN_KB`를 주면 그보다 큰 요청 본문을 gzip 으로 보낸다 (`config.get_shared_http_client`).
+  게이트웨이가 `Content-Encoding: gzip` 요청을 풀어 줄 때만 켠다.
+
+크기는 `records.dumps`로 행마다 한 번 인코딩해 재고, 그 조각을 이어 붙여 보낸다 (`records.EncodedRows`). 목표 크기는 `SUPABASE_UPSERT_TARGET_KB`(기본 1024),
+행 수는 `SUPABASE_UPSERT_MAX_ROWS`(기본 500).
+"""
+
+from __future__ import annotations
+
+import logging
+import os
+import threading
+from dataclasses import dataclass, field
+
+import httpx
+from postgrest.exceptions import APIError
+
+from records import EncodedRows, Record, dumps, to_payload
+
+logger = logging.getLogger("allyoung.upsert_batch")
+
+
+def _env_int(name: str, default: int) -> int:
+    try:
+        return int(os.getenv(name, str(default)).strip())
+    except ValueError:
+        return default
+
+
+TARGET_BYTES = max(1, _env_int("SUPABASE_UPSERT_TARGET_KB", 1024)) * 1024
+MAX_ROWS = max(1, _env_int("SUPABASE_UPSERT_MAX_ROWS", 500))
+
+
+@dataclass
+class BatchStats:
+    """upsert 요청 누적 (스레드 안전)."""
+
+    requests: int = 0
+    rows: int = 0
+    bytes: int = 0
+    split_retries: int = 0
+    _lock: threading.Lock = field(default_factory=threading.Lock, repr=False, compare=False)
+
+    def add(self, rows: int, nbytes: int) -> None:
+        with self._lock:
+            self.requests += 1
+            self.rows += rows
+            self.bytes += nbytes
+
+    def add_split(self) -> None:
+        with self._lock:
+            self.split_retries += 1
+
+    def reset(self) -> None:
+        with self._lock:
+            self.requests = self.rows = self.bytes = self.split_retries = 0
+
+    def summary(self) -> str:
+        with self._lock:
+            avg = self.bytes / self.requests / 1024 if self.requests else 0.0
+            return (
+                f"upsert 요청 {self.requests}건: {self.rows}행, {self.bytes / 1024:.0f}KB (요청당 평균 {avg:.0f}KB)"
+                + (f", 실패 요청 나눠 재전송 {self.split_retries}회" if self.split_retries else "")
+            )
+
+
+STATS = BatchStats()
+
+# 나눠 보내면 나을 수 있는 PostgreSQL/PostgREST 오류 코드 — 문장 시간 초과·자원 부족·연결·직렬화 충돌, 풀 연결 실패
+_TRANSIENT_SQLSTATE_PREFIXES = ("57014", "53", "08", "40", "PGRST000", "PGRST001", "PGRST002", "PGRST003")
+
+
+def _splittable(e: Exception) -> bool:
+    """반으로 나눠 다시 보낼 만한 실패면 True (크기·일시 오류). 4xx 등 같은 행이면 또 실패할 오류는 False."""
+    if isinstance(e, (httpx.TransportError, TimeoutError, ConnectionError)):
+        return True
+    if not isinstance(e, APIError):
+        return False
+    code = str(e.code or "")
+    if code.isdigit() and len(code) == 3:
+        # JSON 이 아닌 오류 응답(게이트웨이) — postgrest 가 HTTP 상태를 code 에 넣는다
+        status = int(code)
+        return status == 413 or status >= 500
+    return code.startswith(_TRANSIENT_SQLSTATE_PREFIXES)
+
+
+
+class BatchingWriter:
+    """한 테이블 upsert 를 바이트·행 수 기준으로 나누고 합쳐 보낸다. `with` 블록 끝에서 남은 행을 보낸다."""
+
+    def __init__(
+        self,
+        client,
+        table: str,
+        on_conflict: str,
+        target_bytes: int = TARGET_BYTES,
+        max_rows: int = MAX_ROWS,
+    ) -> None:
+        self.client = client
+        self.table = table
+        self.on_conflict = on_conflict
+        self.target_bytes = max(1, target_bytes)
+        self.max_rows = max(1, max_rows)
+        # 컬럼 구성 → [행, 행별 JSON 조각, 합계 크기]. PostgREST 일괄 upsert 는 빠진 컬럼을 NULL 로 채우므로 구성별로 따로 보낸다
+        self._groups: dict[tuple, list] = {}
+
+    def add(self, rows) -> None:
+        for row in rows:
+            key = row.columns() if isinstance(row, Record) else tuple(row)
+            part = dumps(row)
+            size = len(part) + 1
+            group = self._groups.get(key)
+            if group is not None and (group[2] + size > self.target_bytes or len(group[0]) >= self.max_rows):
+                self._send(group[0], group[1])
+                group = None
+            if group is None:
+                group = self._groups[key] = [[], [], 0]
+            group[0].append(row)
+            group[1].append(part)
+            group[2] += size
+
+    def flush(self) -> None:
+        groups, self._groups = self._groups, {}
+        for rows, parts, _total in groups.values():
+            self._send(rows, parts)
+
+    def _send(self, rows: list, parts: list[bytes]) -> None:
+        if not rows:
+            return
+        nbytes = sum(len(p) + 1 for p in parts) + 1
+        try:
+            self.client.table(self.table).upsert(
+                EncodedRows(to_payload(rows), parts), on_conflict=self.on_conflict
+            ).execute()
+        except Exception as e:
+            if len(rows) == 1 or not _splittable(e):
+                raise
+            mid = len(rows) // 2
+            STATS.add_split()
+            logger.warning(
+                "%s upsert %s행(%.0fKB) 실패 — 반으로 나눠 다시 보냄: %s",
+                self.table,
+                len(rows),
+                nbytes / 1024,
+                e,
+            )
+            self._send(rows[:mid], parts[:mid])
+            self._send(rows[mid:], parts[mid:])
+            return
+        STATS.add(len(rows), nbytes)
+
+    def __enter__(self) -> "BatchingWriter":
+        return self
+
+    def __exit__(self, exc_type, _exc, _tb) -> None:
+        if exc_type is None:
+            self.flush()
@@ -0,0 +1,175 @@
+"""
+여러 크롤러 인스턴스가 한 사이클을 나눠 처리하는 DB 작업 큐 (임대 lease 방식)
+
+`--work-queue`(또는 `CRAWL_WORK_QUEUE=1`)일 때 위비티·요즘것들 수집이 이 큐를 거친다.
+같은 `cycle_id`(기본: KST 날짜 + `--queue-cycle-hours` 구간 시작 시, `--queue-cycle`로 고정 가능)로
+뜬 워커끼리 같은 사이클을 공유한다.
+
+- list 항목: 목록 페이지 구간 `{from, to}` (`--page-batch-size` 단위). 처음 온 워커가 최대 페이지까지 등록하고
+  (중복 등록은 DB 가 무시), 빈 페이지를 만난 워커가 그 뒤 구간을 건너뜀(skipped)으로 표시한다.
+- detail 항목: 본문이 아직 없는 contests id. list 워커는 상세를 직접 받지 않고 등록만 하며,
+  목록 구간이 떨어지면 워커들이 detail 을 나눠 받아 본문을 채운다.
+- 가져가기는 RPC `claim_crawl_work`(FOR UPDATE SKIP LOCKED). 임대가 `LEASE_SECONDS` 안에 끝나지 않으면
+  (워커 종료 등) 다른 워커가 다시 가져간다. 실패한 항목은 `MAX_ATTEMPTS`번까지 재시도.
+  마지막 시도를 임대한 워커가 죽어 임대가 만료되면 그 항목은 failed 로 닫힌다 (열린 채 남아 사이클이 끝나지 않는 일 방지).
+- 목록 항목이 모두 끝나면 `finish_crawl_cycle`이 한 워커에게만 합계(신규·갱신·본 id 수)를 돌려준다 —
+  그 워커만 사이클 합계를 알림으로 보내고, 생존 기록 모드면 DB 안에서 순회 집합 차이(`record_contest_sweep`)까지 처리된다.
+  워커가 죽어 임대가 남은 항목은 같은 사이클의 다른 워커가 만료 후 가져가며, 사이클 id 가 바뀌면 버려진다.
+
+마이그레이션: supabase/migrations/20261019160000_crawl_work_queue.sql, 20261019190000_crawl_work_expired_leases.sql
+"""
+
+from __future__ import annotations
+
+import logging
+import os
+import socket
+import uuid
+from datetime import datetime, timedelta
+from zoneinfo import ZoneInfo
+
+logger = logging.getLogger("allyoung.work_queue")
+
+LEASE_SECONDS = 600
+MAX_ATTEMPTS = 3
+DETAIL_CLAIM_BATCH = 10
+
+_KST = ZoneInfo("Asia/Seoul")
+
+
+def default_cycle_id(now: datetime, hours: int) -> str:
+    """KST 시각 → 사이클 id (예: 2026-10-19T09, hours=3 이면 00·03·06… 구간 시작 시)."""
+    hours = max(1, min(24, hours))
+    start = now.replace(minute=0, second=0, microsecond=0) - timedelta(hours=now.hour % hours)
+    return start.strftime("%Y-%m-%dT%H")
+
+
+def page_ranges(max_pages: int, batch: int) -> list[dict]:
+    """1..max_pages 를 batch 개씩 끊은 list 항목."""
+    out = []
+    for start in range(1, max_pages + 1, max(1, batch)):
+        end = min(max_pages, start + max(1, batch) - 1)
+        out.append({"key": f"{start:04d}-{end:04d}", "payload": {"from": start, "to": end}})
+    return out
+
+
+class SourceCycle:
+    """한 출처의 한 사이클 작업 (`WorkQueue.start(source)`)."""
+
+    def __init__(self, queue: "WorkQueue", source: str, cycle_id: str) -> None:
+        self.queue = queue
+        self.source = source
+        self.cycle_id = cycle_id
+
+    def _rpc(self, name: str, params: dict):
+        data = self.queue.client.rpc(name, {"p_cycle_id": self.cycle_id, "p_source": self.source, **params}).execute().data
+        if isinstance(data, list) and name != "claim_crawl_work":
+            data = data[0] if data else None
+        return data
+
+    def enqueue(self, kind: str, items: list[dict]) -> int:
+        if not items:
+            return 0
+        return int(self._rpc("enqueue_crawl_work", {"p_kind": kind, "p_items": items}) or 0)
+
+    def ensure_list_ranges(self, max_pages: int, batch: int) -> int:
+        """목록 구간 항목 등록 (이미 있으면 무시) → 새로 등록된 수."""
+        return self.enqueue("list", page_ranges(max_pages, batch))
+
+    def claim(self, kind: str, limit: int = 1) -> list[dict]:
+        rows = self._rpc(
+            "claim_crawl_work",
+            {
+                "p_kind": kind,
+                "p_owner": self.queue.owner,
+                "p_limit": limit,
+                "p_lease_seconds": LEASE_SECONDS,
+                "p_max_attempts": MAX_ATTEMPTS,
+            },
+        ) or []
+        self.queue.claimed += len(rows)
+        return rows
+
+    def renew(self, items: list[dict]) -> None:
+        if items:
+            self.queue.client.rpc(
+                "renew_crawl_work",
+                {"p_ids": [i["id"] for i in items], "p_owner": self.queue.owner, "p_lease_seconds": LEASE_SECONDS},
+            ).execute()
+
+    def complete(self, item: dict, ok: bool = True, result: dict | None = None) -> bool:
+        """완료/실패 보고. 임대가 이미 만료돼 다른 워커 것이 됐으면 False."""
+        try:
+            data = self.queue.client.rpc(
+                "complete_crawl_work",
+                {
+                    "p_id": item["id"],
+                    "p_owner": self.queue.owner,
+                    "p_ok": ok,
+                    "p_result": result,
+                    "p_max_attempts": MAX_ATTEMPTS,
+                },
+            ).execute().data
+        except Exception as e:
+            logger.warning("작업 항목 %s/%s 보고 실패 (임대 만료 후 재처리됨): %s", self.source, item.get("item_key"), e)
+            return False
+        if isinstance(data, list):
+            data = data[0] if data else False
+        if ok:
+            self.queue.completed += 1
+        else:
+            self.queue.failed += 1
+        return bool(data)
+
+    def skip_list_after(self, last_page: int) -> int:
+        return int(self._rpc("skip_crawl_list_after", {"p_last_page": last_page}) or 0)
+
+    def finish(self, record_sweep: bool, min_ratio: float) -> dict | None:
+        """목록 항목이 모두 끝났고 이 워커가 처음 마무리하면 합계 dict, 아니면 None."""
+        data = self._rpc(
+            "finish_crawl_cycle", {"p_record_sweep": record_sweep, "p_min_ratio": min_ratio, "p_max_attempts": MAX_ATTEMPTS}
+        )
+        return data if isinstance(data, dict) else None
+
+
+class WorkQueue:
+    def __init__(self, client, cycle_hours: int = 3, cycle_id: str | None = None, owner: str | None = None) -> None:
+        self.client = client
+        self.cycle_hours = cycle_hours
+        self.fixed_cycle_id = cycle_id
+        self.owner = owner or f"{socket.gethostname()}:{os.getpid()}:{uuid.uuid4().hex[:6]}"
+        self.claimed = 0
+        self.completed = 0
+        self.failed = 0
+
+    def start(self, source: str) -> SourceCycle:
+        """이번 사이클 작업. `cycle_id` 미지정이면 지금(KST) 기준 구간 → 반복 모드에서도 사이클마다 바뀐다."""
+        cycle_id = self.fixed_cycle_id or default_cycle_id(datetime.now(_KST), self.cycle_hours)
+        return SourceCycle(self, source, cycle_id)
+
+    def summary(self) -> str:
+        return f"작업 큐 워커 {self.owner}: 가져감 {self.claimed}건, 완료 {self.completed}건, 실패 보고 {self.failed}건"
+
+
+_queue: WorkQueue | None = None
+
+
+def enable(client, cycle_hours: int = 3, cycle_id: str | None = None, owner: str | None = None) -> WorkQueue:
+    global _queue
+    _queue = WorkQueue(client, cycle_hours, cycle_id, owner)
+    logger.info(
+        "작업 큐 모드 — 워커 %s, 사이클 %s",
+        _queue.owner,
+        cycle_id or f"KST {max(1, min(24, cycle_hours))}시간 구간",
+    )
+    return _queue
+
+
+def enable_from_env(client, cycle_hours: int = 3, cycle_id: str | None = None) -> WorkQueue | None:
+    if os.getenv("CRAWL_WORK_QUEUE", "").strip().lower() in ("1", "true", "yes", "on"):
+        return enable(client, cycle_hours, cycle_id)
+    return None
+
+
+def active() -> WorkQueue | None:
+    return _queue